@@ -64,3 +64,8 @@ class ServerError(ApiError):
 
     def __init__(self, message: str = "Server error occurred", status_code: int = 500, details: Optional[str] = None):
         super().__init__(message, status_code=status_code, details=details)
+
+
+class JobCancelledError(Exception):
+    """Background job cancelled by the user."""
+    pass
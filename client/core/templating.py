@@ -0,0 +1,64 @@
+"""
+Compiled merge tag templates for the template preview.
+
+Fork of leadgenerator-standalone/core/templating.py (the two apps ship
+as separate trees) without the step template cache, which only the
+standalone sender uses; keep CompiledTemplate in sync with it.
+"""
+
+import re
+from functools import lru_cache
+from typing import Mapping
+
+# Merge tags are written {{Name}}
+MERGE_TAG_PATTERN = re.compile(r'\{\{(\w+)\}\}')
+
+# Template sources kept by compile_template()
+COMPILE_CACHE_SIZE = 256
+
+
+class CompiledTemplate:
+    """
+    A template parsed once into literal text and merge tag slots.
+
+    render() fills the slots from a mapping of tag name to text and joins
+    the parts in one pass; a tag missing from the mapping is left as written.
+    """
+
+    __slots__ = ('source', 'fields', '_parts', '_slots')
+
+    def __init__(self, source: str):
+        self.source = source
+        parts = []
+        slots = []
+        position = 0
+        for match in MERGE_TAG_PATTERN.finditer(source):
+            if match.start() > position:
+                parts.append(source[position:match.start()])
+            slots.append((len(parts), match.group(1)))
+            parts.append(match.group(0))
+            position = match.end()
+        if position < len(source):
+            parts.append(source[position:])
+
+        self._parts = parts
+        self._slots = tuple(slots)
+        self.fields = frozenset(name for _, name in slots)
+
+    def render(self, values: Mapping[str, str]) -> str:
+        """Render with the given tag values."""
+        if not self._slots:
+            return self.source
+        parts = self._parts.copy()
+        for slot, name in self._slots:
+            value = values.get(name)
+            if value is not None:
+                parts[slot] = value
+        return ''.join(parts)
+
+
+@lru_cache(maxsize=COMPILE_CACHE_SIZE)
+def compile_template(source: str) -> CompiledTemplate:
+    """Compile a template, reusing the result for recently seen sources."""
+    return CompiledTemplate(source)
+
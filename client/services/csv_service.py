@@ -1,5 +1,6 @@
 """CSV import/export service using pandas."""
 import logging
+import re
 from typing import List, Dict, Any, Optional, Tuple
 from io import BytesIO, StringIO
 from dataclasses import dataclass
@@ -10,6 +11,12 @@ from core.models import Contact
 
 logger = logging.getLogger(__name__)
 
+# Pragmatic address syntax check: one '@', no whitespace, a dot in the domain
+EMAIL_PATTERN = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
+
+# Maximum number of row errors returned by validate()
+MAX_VALIDATION_ERRORS = 100
+
 
 @dataclass
 class FieldMapping:
@@ -59,12 +66,14 @@ class CsvService:
     ) -> pd.DataFrame:
         """Read CSV file and return DataFrame."""
         try:
+            # Read every column as text so phone numbers and codes keep leading zeros
             if file_path:
-                self._current_df = pd.read_csv(file_path, encoding=encoding)
+                self._current_df = pd.read_csv(file_path, encoding=encoding, dtype=str)
             elif file_content:
                 self._current_df = pd.read_csv(
                     BytesIO(file_content),
-                    encoding=encoding
+                    encoding=encoding,
+                    dtype=str
                 )
             else:
                 raise ValueError("Either file_path or file_content must be provided")
@@ -148,11 +157,6 @@ class CsvService:
                 warnings=[]
             )
 
-        errors = []
-        warnings = []
-        valid_rows = 0
-        invalid_rows = 0
-
         # Check required fields
         email_mapping = next(
             (m for m in self._field_mappings if m.contact_field == "email"),
@@ -169,42 +173,45 @@ class CsvService:
                 warnings=[]
             )
 
-        # Validate each row
-        for idx, row in self._current_df.iterrows():
-            row_errors = []
-
-            # Check email
-            email = str(row.get(email_mapping.csv_column, "")).strip()
-            if not email or email == "nan":
-                row_errors.append("Missing email address")
-            elif "@" not in email:
-                row_errors.append(f"Invalid email format: {email}")
-
-            if row_errors:
-                invalid_rows += 1
-                errors.append({
-                    "row": idx + 2,  # +2 for 1-indexed and header row
-                    "error": "; ".join(row_errors)
-                })
-            else:
-                valid_rows += 1
+        warnings = []
+        frame = self._mapped_frame()
+        if "email" in frame.columns:
+            email = frame["email"]
+        else:
+            email = pd.Series(pd.NA, index=frame.index, dtype="string")
+
+        missing = email.isna()
+        invalid = ~missing & ~email.str.match(EMAIL_PATTERN.pattern, na=False)
+        invalid_rows = int(missing.sum() + invalid.sum())
+        valid_rows = len(frame) - invalid_rows
+
+        # Build messages only for the rows that will be reported
+        errors = []
+        for idx in frame.index[(missing | invalid).to_numpy()][:MAX_VALIDATION_ERRORS]:
+            message = (
+                "Missing email address" if missing[idx]
+                else f"Invalid email format: {email[idx]}"
+            )
+            errors.append({
+                "row": int(idx) + 2,  # +2 for 1-indexed and header row
+                "error": message
+            })
 
         # Check for potential issues
-        if valid_rows < len(self._current_df) * 0.9:
+        if valid_rows < len(frame) * 0.9:
             warnings.append(f"More than 10% of rows have validation errors")
 
         # Check for duplicates
-        if email_mapping:
-            duplicates = self._current_df[email_mapping.csv_column].duplicated().sum()
-            if duplicates > 0:
-                warnings.append(f"{duplicates} duplicate email addresses found")
+        duplicates = int(email[~missing].duplicated().sum())
+        if duplicates > 0:
+            warnings.append(f"{duplicates} duplicate email addresses found")
 
         return ValidationResult(
-            is_valid=len(errors) == 0,
-            total_rows=len(self._current_df),
+            is_valid=invalid_rows == 0,
+            total_rows=len(frame),
             valid_rows=valid_rows,
             invalid_rows=invalid_rows,
-            errors=errors[:100],  # Limit errors shown
+            errors=errors,
             warnings=warnings
         )
 
@@ -213,27 +220,50 @@ class CsvService:
         if self._current_df is None or not self._field_mappings:
             return []
 
-        contacts = []
-        for _, row in self._current_df.iterrows():
-            contact_data = {}
-            custom_fields = {}
-
-            for mapping in self._field_mappings:
-                value = str(row.get(mapping.csv_column, "")).strip()
-                if value and value != "nan":
-                    if mapping.is_custom:
-                        custom_fields[f"custom{mapping.custom_index}"] = value
-                    else:
-                        contact_data[mapping.contact_field] = value
+        frame = self._mapped_frame()
+        if "email" not in frame.columns:
+            return []
 
+        frame = frame[frame["email"].notna()].astype(object)
+        frame = frame.where(frame.notna(), None)
+        custom_columns = {
+            f"custom{m.custom_index}" for m in self._field_mappings if m.is_custom
+        }
+
+        contacts = []
+        for record in frame.to_dict("records"):
+            contact_data = {
+                key: value for key, value in record.items()
+                if value is not None and key not in custom_columns
+            }
+            custom_fields = {
+                key: value for key, value in record.items()
+                if value is not None and key in custom_columns
+            }
             if custom_fields:
                 contact_data["customFields"] = custom_fields
-
-            if contact_data.get("email"):
-                contacts.append(contact_data)
+            contacts.append(contact_data)
 
         return contacts
 
+    def _mapped_frame(self) -> pd.DataFrame:
+        """
+        Project the loaded data onto contact fields in one vectorized pass.
+
+        Values are trimmed, blanks become NA and emails are lower-cased.
+        """
+        frame = pd.DataFrame(index=self._current_df.index)
+        for mapping in self._field_mappings:
+            if mapping.csv_column not in self._current_df.columns:
+                continue
+            key = f"custom{mapping.custom_index}" if mapping.is_custom else mapping.contact_field
+            values = self._current_df[mapping.csv_column].astype("string").str.strip()
+            frame[key] = values.mask(values == "")
+
+        if "email" in frame.columns:
+            frame["email"] = frame["email"].str.lower()
+        return frame
+
     def to_csv_bytes(self) -> BytesIO:
         """Export current DataFrame to CSV bytes."""
         if self._current_df is None:
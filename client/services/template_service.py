@@ -1,10 +1,10 @@
 """Template rendering and management service."""
-import re
 import logging
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterable, List, Optional, Tuple, Union
 from dataclasses import dataclass
 
 from core.models import Contact, Campaign
+from core.templating import MERGE_TAG_PATTERN, CompiledTemplate, compile_template
 
 logger = logging.getLogger(__name__)
 
@@ -56,7 +56,7 @@ class TemplateService:
     ]
 
     # Pattern to match merge tags
-    MERGE_TAG_PATTERN = re.compile(r'\{\{(\w+)\}\}')
+    MERGE_TAG_PATTERN = MERGE_TAG_PATTERN
 
     def __init__(self):
         self._fallbacks: Dict[str, str] = {}
@@ -93,52 +93,96 @@ class TemplateService:
         sender: Optional[Dict[str, str]] = None,
         custom_values: Optional[Dict[str, str]] = None
     ) -> str:
-        """Render a template with merge tag values."""
-        result = template
+        """Render a template with merge tag values (compiled once per distinct source)."""
+        values = self._shared_values(campaign, sender)
+        if contact:
+            values.update(self._contact_values(contact))
+        return self._render(compile_template(template), values, custom_values)
 
-        # Build value map
+    def render_many(
+        self,
+        template: Union[str, CompiledTemplate],
+        contacts: Iterable[Contact],
+        campaign: Optional[Campaign] = None,
+        sender: Optional[Dict[str, str]] = None,
+        custom_values: Optional[Dict[str, str]] = None
+    ) -> List[str]:
+        """Render one template for many contacts, compiling it and building shared values once."""
+        compiled = template if isinstance(template, CompiledTemplate) else compile_template(template)
+        shared = self._shared_values(campaign, sender)
+        results = []
+        for contact in contacts:
+            values = dict(shared)
+            values.update(self._contact_values(contact))
+            results.append(self._render(compiled, values, custom_values))
+        return results
+
+    def _contact_values(self, contact: Contact) -> Dict[str, str]:
+        """Get contact merge tag values by tag name."""
+        values = {
+            "FirstName": contact.first_name or "",
+            "LastName": contact.last_name or "",
+            "Email": contact.email or "",
+            "Company": contact.company or "",
+            "Title": contact.title or "",
+            "Position": contact.position or "",
+            "Phone": contact.phone or "",
+        }
+        # Add custom fields
+        for i in range(1, 11):
+            values[f"Custom{i}"] = contact.custom_fields.get(f"custom{i}", "")
+        return values
+
+    def _shared_values(
+        self,
+        campaign: Optional[Campaign],
+        sender: Optional[Dict[str, str]]
+    ) -> Dict[str, str]:
+        """Get campaign and sender merge tag values by tag name."""
         values: Dict[str, str] = {}
 
-        if contact:
-            values.update({
-                "{{FirstName}}": contact.first_name or "",
-                "{{LastName}}": contact.last_name or "",
-                "{{Email}}": contact.email or "",
-                "{{Company}}": contact.company or "",
-                "{{Title}}": contact.title or "",
-                "{{Position}}": contact.position or "",
-                "{{Phone}}": contact.phone or "",
-            })
-            # Add custom fields
-            for i in range(1, 11):
-                key = f"custom{i}"
-                values[f"{{{{Custom{i}}}}}"] = contact.custom_fields.get(key, "")
-
         if campaign:
             values.update({
-                "{{CampaignName}}": campaign.name or "",
-                "{{CampaignRef}}": campaign.campaign_ref or "",
+                "CampaignName": campaign.name or "",
+                "CampaignRef": campaign.campaign_ref or "",
             })
 
         if sender:
             values.update({
-                "{{SenderName}}": sender.get("name", ""),
-                "{{SenderEmail}}": sender.get("email", ""),
-                "{{SenderTitle}}": sender.get("title", ""),
-                "{{SenderCompany}}": sender.get("company", ""),
+                "SenderName": sender.get("name", ""),
+                "SenderEmail": sender.get("email", ""),
+                "SenderTitle": sender.get("title", ""),
+                "SenderCompany": sender.get("company", ""),
             })
 
+        return values
+
+    def _render(
+        self,
+        compiled: CompiledTemplate,
+        values: Dict[str, str],
+        custom_values: Optional[Dict[str, str]]
+    ) -> str:
+        """Fill a compiled template; empty values use their fallback, unknown tags stay as written."""
+        other_values: Dict[str, str] = {}
         if custom_values:
-            values.update(custom_values)
-
-        # Replace merge tags
-        for tag, value in values.items():
-            if value:
-                result = result.replace(tag, value)
-            else:
-                # Use fallback if available
-                fallback = self._fallbacks.get(tag, "")
-                result = result.replace(tag, fallback)
+            for tag, value in custom_values.items():
+                match = MERGE_TAG_PATTERN.fullmatch(tag)
+                if match:
+                    values[match.group(1)] = value
+                else:
+                    other_values[tag] = value
+
+        filled = {
+            name: values[name] or self._fallbacks.get(f"{{{{{name}}}}}", "")
+            for name in compiled.fields
+            if name in values
+        }
+        result = compiled.render(filled)
+
+        # Custom values keyed by arbitrary text are replaced as before
+        for tag, value in other_values.items():
+            result = result.replace(tag, value or self._fallbacks.get(tag, ""))
 
         return result
 
@@ -8,6 +8,7 @@ from ttkbootstrap.constants import *
 from ttkbootstrap.tableview import Tableview
 
 from core.api_client import ApiClient
+from core.jobs import BackgroundJob
 from services.csv_service import CsvService, FieldMapping
 
 logger = logging.getLogger(__name__)
@@ -23,6 +24,7 @@ class CsvImportWizard(ttk.Toplevel):
         self.list_id = list_id
         self.result = None
         self.csv_service = CsvService()
+        self._job: Optional[BackgroundJob] = None
 
         self.title("Import Contacts from CSV")
         self.geometry("700x550")
@@ -246,6 +248,9 @@ class CsvImportWizard(ttk.Toplevel):
         )
         self.issues_text.pack(fill=BOTH, expand=True)
 
+        # Shown while the import is uploading
+        self.progress = ttk.Progressbar(self.step3_frame, mode="indeterminate", bootstyle="info")
+
     def _browse_file(self) -> None:
         """Browse for CSV file."""
         filepath = filedialog.askopenfilename(
@@ -489,25 +494,53 @@ class CsvImportWizard(ttk.Toplevel):
             self._update_step_display()
 
     def _do_import(self) -> None:
-        """Perform the import."""
-        try:
+        """Upload the import on a background thread so the dialog stays responsive."""
+        if self._job and self._job.running:
+            return
+
+        def task(report_progress, token):
             # Get CSV as bytes
             csv_bytes = self.csv_service.to_csv_bytes()
+            token.raise_if_cancelled()
 
             # Import via API
-            result = self.api.import_contacts(self.list_id, csv_bytes, "import.csv")
-
-            from tkinter import messagebox
-            count = result.get('count', 0)
-            messagebox.showinfo(
-                "Import Complete",
-                f"Successfully imported {count} contacts",
-                parent=self
-            )
+            return self.api.import_contacts(self.list_id, csv_bytes, "import.csv")
+
+        self.progress.pack(fill=X, pady=(10, 0))
+        self.progress.start()
+        self.back_btn.configure(state="disabled")
+        self.next_btn.configure(state="disabled")
+        self.cancel_btn.configure(state="disabled")
+
+        self._job = BackgroundJob(
+            self, task,
+            on_done=self._on_import_done,
+            on_error=self._on_import_error,
+            name="csv-import"
+        ).start()
+
+    def _on_import_done(self, result: Dict) -> None:
+        """Report a finished import and close the wizard."""
+        self.progress.stop()
+
+        from tkinter import messagebox
+        count = result.get('count', 0)
+        messagebox.showinfo(
+            "Import Complete",
+            f"Successfully imported {count} contacts",
+            parent=self
+        )
 
-            self.result = True
-            self.destroy()
+        self.result = True
+        self.destroy()
 
-        except Exception as e:
-            from tkinter import messagebox
-            messagebox.showerror("Import Error", str(e), parent=self)
+    def _on_import_error(self, error: Exception) -> None:
+        """Report a failed import and let the user retry."""
+        self.progress.stop()
+        self.progress.pack_forget()
+        self.back_btn.configure(state="normal")
+        self.next_btn.configure(state="normal")
+        self.cancel_btn.configure(state="normal")
+
+        from tkinter import messagebox
+        messagebox.showerror("Import Error", str(error), parent=self)
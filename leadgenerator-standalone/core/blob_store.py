@@ -0,0 +1,177 @@
+"""Content-addressed attachment file store for Lead Generator Standalone."""
+
+import hashlib
+import logging
+import os
+import shutil
+import stat
+import tempfile
+from pathlib import Path
+from typing import Iterable, Optional, Tuple, Union
+
+from .database import Database, get_db
+
+logger = logging.getLogger(__name__)
+
+# Bytes read at a time when hashing a file
+HASH_CHUNK_SIZE = 1024 * 1024
+
+# Permissions of stored blobs (and so of every hardlink to them)
+READ_ONLY_MODE = stat.S_IRUSR | stat.S_IRGRP | stat.S_IROTH
+
+
+def file_sha256(file_path: Union[str, Path]) -> str:
+    """Return the SHA-256 hex digest of a file's contents."""
+    digest = hashlib.sha256()
+    with open(file_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def link_or_copy(source: Union[str, Path], dest: Union[str, Path]) -> bool:
+    """
+    Hardlink source to dest, copying instead where links are not supported.
+
+    Returns:
+        True if a hardlink was made
+    """
+    try:
+        os.link(source, dest)
+        return True
+    except OSError:
+        shutil.copy2(source, dest)
+        return False
+
+
+def remove_file(path: Union[str, Path]) -> bool:
+    """
+    Delete a file, clearing its read-only flag if the platform refuses otherwise (Windows).
+
+    Returns:
+        True if the read-only flag had to be cleared
+    """
+    path = Path(path)
+    try:
+        path.unlink(missing_ok=True)
+        return False
+    except PermissionError:
+        os.chmod(path, stat.S_IREAD | stat.S_IWRITE)
+        path.unlink()
+        return True
+
+
+class BlobStore:
+    """
+    Files stored once by SHA-256 under <root>/<first two hex digits>/<hash>.
+
+    Each blob has a row in attachment_blobs whose ref_count the attachments
+    triggers maintain; blobs left without references are removed by
+    collect_garbage(). Attachments are hardlinks to their blob, so the same
+    file used by many steps or campaigns takes its disk space once; blobs are
+    read-only so an attachment cannot be edited in place under every other
+    step sharing it.
+    """
+
+    def __init__(self, root: Union[str, Path], db: Optional[Database] = None):
+        self.root = Path(root)
+        self.db = db or get_db()
+
+    def path_for(self, content_hash: str) -> Path:
+        """Get the path of a blob."""
+        return self.root / content_hash[:2] / content_hash
+
+    def put(self, source: Union[str, Path]) -> Tuple[str, int]:
+        """
+        Store a file (a no-op if identical content is already stored).
+
+        Returns:
+            Tuple of (content_hash, file_size)
+        """
+        source = Path(source)
+        content_hash = file_sha256(source)
+        size = source.stat().st_size
+        blob_path = self.path_for(content_hash)
+
+        if not blob_path.exists():
+            blob_path.parent.mkdir(parents=True, exist_ok=True)
+            # Copy under a temporary name so a half-written blob is never visible
+            fd, temp_path = tempfile.mkstemp(dir=blob_path.parent, prefix='.tmp-')
+            os.close(fd)
+            try:
+                shutil.copy2(source, temp_path)
+                os.chmod(temp_path, READ_ONLY_MODE)
+                os.replace(temp_path, blob_path)
+            except BaseException:
+                Path(temp_path).unlink(missing_ok=True)
+                raise
+
+        self.db.execute(
+            "INSERT OR IGNORE INTO attachment_blobs (content_hash, file_size) VALUES (?, ?)",
+            (content_hash, size)
+        )
+        return content_hash, size
+
+    def link(self, content_hash: str, dest: Union[str, Path]) -> Path:
+        """Materialize a blob at dest (a hardlink where possible)."""
+        dest = Path(dest)
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        if not link_or_copy(self.path_for(content_hash), dest):
+            logger.debug(f"Hardlinks not supported for {dest}, copied instead")
+        return dest
+
+    def relink(self, content_hash: str, dest: Union[str, Path]) -> Path:
+        """Replace an existing file at dest with its blob, without dest ever going missing."""
+        dest = Path(dest)
+        temp_path = dest.with_name(f".tmp-{content_hash[:16]}-{dest.name}")
+        self.link(content_hash, temp_path)
+        try:
+            os.replace(temp_path, dest)
+        except BaseException:
+            remove_file(temp_path)
+            raise
+        return dest
+
+    def unlink(self, path: Union[str, Path], content_hash: Optional[str] = None) -> None:
+        """Delete a file linked to a blob, keeping the blob read-only."""
+        if remove_file(path) and content_hash:
+            # The cleared flag belongs to the shared inode, so the blob lost it too
+            blob_path = self.path_for(content_hash)
+            if blob_path.exists():
+                os.chmod(blob_path, READ_ONLY_MODE)
+
+    def collect_garbage(self, content_hashes: Optional[Iterable[str]] = None) -> int:
+        """
+        Remove blobs no attachment refers to any more.
+
+        Args:
+            content_hashes: Only consider these blobs (default: all)
+
+        Returns:
+            Number of blobs removed
+        """
+        query = "SELECT content_hash FROM attachment_blobs WHERE ref_count <= 0"
+        params: tuple = ()
+        if content_hashes is not None:
+            hashes = [h for h in set(content_hashes) if h]
+            if not hashes:
+                return 0
+            query += f" AND content_hash IN ({', '.join('?' for _ in hashes)})"
+            params = tuple(hashes)
+
+        removed = 0
+        for row in self.db.fetchall(query, params):
+            content_hash = row['content_hash']
+            self.db.execute(
+                "DELETE FROM attachment_blobs WHERE content_hash = ? AND ref_count <= 0",
+                (content_hash,)
+            )
+            try:
+                remove_file(self.path_for(content_hash))
+            except OSError as e:
+                logger.warning(f"Failed to delete blob {content_hash}: {e}")
+            removed += 1
+
+        if removed:
+            logger.info(f"Removed {removed} unreferenced attachment blobs")
+        return removed
@@ -3,18 +3,26 @@
 import sqlite3
 import os
 import logging
+import threading
 from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
-from typing import Optional, Any, Generator
+from typing import Optional, Any, Generator, Iterator, List
 
 from .exceptions import DatabaseError
+from .identity import email_key, set_plus_addressing_folding
 
 logger = logging.getLogger(__name__)
 
 # Default database path
 DEFAULT_DB_PATH = "data/leadgen.db"
 
+# How long a connection waits for another thread's write lock
+BUSY_TIMEOUT_SECONDS = 30
+
+# RETURNING clauses need SQLite 3.35+; older Python builds bundle an older SQLite
+SQLITE_HAS_RETURNING = sqlite3.sqlite_version_info >= (3, 35, 0)
+
 # SQLite schema
 SCHEMA = """
 -- ============================================================
@@ -56,10 +64,18 @@ CREATE TABLE IF NOT EXISTS contact_lists (
     custom8_label TEXT,
     custom9_label TEXT,
     custom10_label TEXT,
+    contact_count INTEGER NOT NULL DEFAULT 0,  -- maintained by triggers on contacts
     created_at TEXT DEFAULT (datetime('now')),
     updated_at TEXT DEFAULT (datetime('now'))
 );
 
+-- Contact Identities (one row per normalized email address, shared across lists)
+CREATE TABLE IF NOT EXISTS contact_identities (
+    identity_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    email_key TEXT NOT NULL UNIQUE,
+    created_at TEXT DEFAULT (datetime('now'))
+);
+
 -- Contacts
 CREATE TABLE IF NOT EXISTS contacts (
     contact_id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -83,6 +99,7 @@ CREATE TABLE IF NOT EXISTS contacts (
     custom8 TEXT,
     custom9 TEXT,
     custom10 TEXT,
+    identity_id INTEGER REFERENCES contact_identities(identity_id),
     created_at TEXT DEFAULT (datetime('now')),
     updated_at TEXT DEFAULT (datetime('now')),
     UNIQUE(list_id, email)
@@ -130,10 +147,20 @@ CREATE TABLE IF NOT EXISTS attachments (
     file_name TEXT NOT NULL,
     file_path TEXT NOT NULL,
     file_size INTEGER NOT NULL,
+    file_mtime REAL,
+    content_hash TEXT REFERENCES attachment_blobs(content_hash),
     mime_type TEXT,
     created_at TEXT DEFAULT (datetime('now'))
 );
 
+-- Attachment Blobs (attachment contents stored once by SHA-256; ref_count kept by triggers)
+CREATE TABLE IF NOT EXISTS attachment_blobs (
+    content_hash TEXT PRIMARY KEY,
+    file_size INTEGER NOT NULL,
+    ref_count INTEGER NOT NULL DEFAULT 0,
+    created_at TEXT DEFAULT (datetime('now'))
+);
+
 -- Campaign Contacts (per-contact status tracking)
 CREATE TABLE IF NOT EXISTS campaign_contacts (
     campaign_id INTEGER NOT NULL REFERENCES campaigns(campaign_id) ON DELETE CASCADE,
@@ -143,6 +170,7 @@ CREATE TABLE IF NOT EXISTS campaign_contacts (
     last_email_sent_at TEXT,
     next_email_scheduled_at TEXT,
     responded_at TEXT,
+    unsubscribed_at TEXT,
     created_at TEXT DEFAULT (datetime('now')),
     updated_at TEXT DEFAULT (datetime('now')),
     PRIMARY KEY (campaign_id, contact_id)
@@ -161,6 +189,25 @@ CREATE TABLE IF NOT EXISTS email_logs (
     outlook_entry_id TEXT
 );
 
+-- Daily Send Stats (email_logs counted per day, campaign, step and status; kept by triggers)
+CREATE TABLE IF NOT EXISTS daily_send_stats (
+    day TEXT NOT NULL,
+    campaign_id INTEGER NOT NULL,
+    step_id INTEGER NOT NULL DEFAULT 0,
+    status TEXT NOT NULL,
+    count INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (campaign_id, day, step_id, status)
+);
+
+-- Daily Contact Stats (responded and unsubscribed campaign contacts per day; kept by triggers)
+CREATE TABLE IF NOT EXISTS daily_contact_stats (
+    day TEXT NOT NULL,
+    campaign_id INTEGER NOT NULL,
+    status TEXT NOT NULL CHECK(status IN ('Responded', 'Unsubscribed')),
+    count INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (campaign_id, day, status)
+);
+
 -- Suppression List
 CREATE TABLE IF NOT EXISTS suppression_list (
     email TEXT PRIMARY KEY,
@@ -168,9 +215,28 @@ CREATE TABLE IF NOT EXISTS suppression_list (
     source TEXT NOT NULL CHECK(source IN ('EmailReply', 'Manual', 'Bounce', 'Complaint')),
     campaign_id INTEGER REFERENCES campaigns(campaign_id),
     reason TEXT,
+    email_key TEXT,
     created_at TEXT DEFAULT (datetime('now'))
 );
 
+-- Suppression Rules (whole domains, subdomains and address patterns)
+CREATE TABLE IF NOT EXISTS suppression_rules (
+    rule_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    rule_type TEXT NOT NULL CHECK(rule_type IN ('Domain', 'Subdomain', 'Pattern')),
+    pattern TEXT NOT NULL UNIQUE,
+    reversed_domain TEXT,
+    source TEXT NOT NULL CHECK(source IN ('EmailReply', 'Manual', 'Bounce', 'Complaint')),
+    reason TEXT,
+    created_at TEXT DEFAULT (datetime('now'))
+);
+
+-- Suppression Changes (identity keys and rules touched, polled by in-memory suppression indexes)
+CREATE TABLE IF NOT EXISTS suppression_changes (
+    change_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    email_key TEXT,
+    rule_id INTEGER
+);
+
 -- Email Queue (pending emails to send)
 CREATE TABLE IF NOT EXISTS email_queue (
     queue_id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -185,6 +251,54 @@ CREATE TABLE IF NOT EXISTS email_queue (
     created_at TEXT DEFAULT (datetime('now'))
 );
 
+-- Rendered Message Contents (each distinct subject/body stored once, keyed by its SHA-256)
+CREATE TABLE IF NOT EXISTS rendered_contents (
+    content_hash TEXT PRIMARY KEY,
+    subject TEXT NOT NULL,
+    body TEXT NOT NULL,
+    created_at TEXT DEFAULT (datetime('now'))
+);
+
+-- Rendered Messages (queued emails pre-rendered when scheduled)
+CREATE TABLE IF NOT EXISTS rendered_messages (
+    queue_id INTEGER PRIMARY KEY REFERENCES email_queue(queue_id) ON DELETE CASCADE,
+    content_hash TEXT NOT NULL REFERENCES rendered_contents(content_hash),
+    rendered_at TEXT DEFAULT (datetime('now'))
+);
+
+-- Import Jobs (checkpointed contact imports that can be resumed)
+CREATE TABLE IF NOT EXISTS import_jobs (
+    job_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    list_id INTEGER NOT NULL REFERENCES contact_lists(list_id) ON DELETE CASCADE,
+    file_path TEXT NOT NULL,
+    file_size INTEGER NOT NULL,
+    file_fingerprint TEXT NOT NULL,
+    field_mapping TEXT NOT NULL,
+    skip_duplicates INTEGER DEFAULT 1,
+    skip_suppressed INTEGER DEFAULT 1,
+    chunk_size INTEGER NOT NULL,
+    status TEXT DEFAULT 'Running' CHECK(status IN ('Running', 'Cancelled', 'Failed', 'Completed')),
+    rows_total INTEGER DEFAULT 0,
+    rows_committed INTEGER DEFAULT 0,
+    imported_count INTEGER DEFAULT 0,
+    updated_count INTEGER DEFAULT 0,
+    skipped_count INTEGER DEFAULT 0,
+    suppressed_count INTEGER DEFAULT 0,
+    error_count INTEGER DEFAULT 0,
+    last_error TEXT,
+    created_at TEXT DEFAULT (datetime('now')),
+    updated_at TEXT DEFAULT (datetime('now'))
+);
+
+-- Import Job Errors (rejected rows, written with each checkpoint)
+CREATE TABLE IF NOT EXISTS import_job_errors (
+    error_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    job_id INTEGER NOT NULL REFERENCES import_jobs(job_id) ON DELETE CASCADE,
+    row_number INTEGER NOT NULL,
+    error TEXT NOT NULL,
+    row_data TEXT
+);
+
 -- Indexes
 CREATE INDEX IF NOT EXISTS idx_contacts_email ON contacts(email);
 CREATE INDEX IF NOT EXISTS idx_contacts_list ON contacts(list_id);
@@ -193,7 +307,281 @@ CREATE INDEX IF NOT EXISTS idx_campaign_contacts_status ON campaign_contacts(sta
 CREATE INDEX IF NOT EXISTS idx_campaign_contacts_next ON campaign_contacts(next_email_scheduled_at);
 CREATE INDEX IF NOT EXISTS idx_email_queue_status ON email_queue(status);
 CREATE INDEX IF NOT EXISTS idx_email_queue_scheduled ON email_queue(scheduled_at);
+CREATE INDEX IF NOT EXISTS idx_email_queue_contact ON email_queue(contact_id, status);
+CREATE INDEX IF NOT EXISTS idx_email_queue_step ON email_queue(step_id, status);
+CREATE INDEX IF NOT EXISTS idx_rendered_messages_content ON rendered_messages(content_hash);
 CREATE INDEX IF NOT EXISTS idx_suppression_email ON suppression_list(email);
+
+-- Keyset pagination indexes (sort key + unique tie-breaker)
+CREATE INDEX IF NOT EXISTS idx_contacts_list_name ON contacts(list_id, last_name, first_name, contact_id);
+CREATE INDEX IF NOT EXISTS idx_contacts_name ON contacts(last_name, first_name, contact_id);
+CREATE INDEX IF NOT EXISTS idx_campaign_contacts_campaign_status ON campaign_contacts(campaign_id, status);
+CREATE INDEX IF NOT EXISTS idx_email_logs_sent ON email_logs(sent_at, log_id);
+CREATE INDEX IF NOT EXISTS idx_email_logs_campaign_sent ON email_logs(campaign_id, sent_at, log_id);
+CREATE INDEX IF NOT EXISTS idx_daily_send_stats_day ON daily_send_stats(day, status);
+CREATE INDEX IF NOT EXISTS idx_daily_contact_stats_day ON daily_contact_stats(day, status);
+CREATE INDEX IF NOT EXISTS idx_suppression_created ON suppression_list(created_at, email);
+CREATE INDEX IF NOT EXISTS idx_suppression_rules_domain ON suppression_rules(reversed_domain);
+CREATE INDEX IF NOT EXISTS idx_import_jobs_status ON import_jobs(status);
+CREATE INDEX IF NOT EXISTS idx_import_job_errors_job ON import_job_errors(job_id, row_number);
+"""
+
+# Columns added after the first release: (table, column, definition).
+# Fresh databases get them from SCHEMA; older ones are upgraded by init_database().
+COLUMN_MIGRATIONS = [
+    ('contacts', 'identity_id', 'INTEGER REFERENCES contact_identities(identity_id)'),
+    ('suppression_list', 'email_key', 'TEXT'),
+    ('contact_lists', 'contact_count', 'INTEGER NOT NULL DEFAULT 0'),
+    ('attachments', 'file_mtime', 'REAL'),
+    ('attachments', 'content_hash', 'TEXT REFERENCES attachment_blobs(content_hash)'),
+    ('campaign_contacts', 'unsubscribed_at', 'TEXT'),
+]
+
+# Indexes on migrated columns (created once the columns exist)
+MIGRATION_INDEXES = """
+CREATE INDEX IF NOT EXISTS idx_contacts_identity ON contacts(identity_id);
+CREATE INDEX IF NOT EXISTS idx_suppression_email_key ON suppression_list(email_key);
+CREATE INDEX IF NOT EXISTS idx_attachments_content ON attachments(content_hash);
+"""
+
+# Keep contact_lists.contact_count in step with the contacts table
+LIST_COUNT_TRIGGERS = """
+CREATE TRIGGER IF NOT EXISTS contacts_count_ai AFTER INSERT ON contacts BEGIN
+    UPDATE contact_lists SET contact_count = contact_count + 1 WHERE list_id = new.list_id;
+END;
+
+CREATE TRIGGER IF NOT EXISTS contacts_count_ad AFTER DELETE ON contacts BEGIN
+    UPDATE contact_lists SET contact_count = contact_count - 1 WHERE list_id = old.list_id;
+END;
+
+CREATE TRIGGER IF NOT EXISTS contacts_count_au AFTER UPDATE OF list_id ON contacts
+WHEN old.list_id IS NOT new.list_id BEGIN
+    UPDATE contact_lists SET contact_count = contact_count - 1 WHERE list_id = old.list_id;
+    UPDATE contact_lists SET contact_count = contact_count + 1 WHERE list_id = new.list_id;
+END;
+"""
+
+# Log every identity key added to or removed from suppression_list, and every rule change
+SUPPRESSION_CHANGE_TRIGGERS = """
+CREATE TRIGGER IF NOT EXISTS suppression_changes_ai AFTER INSERT ON suppression_list BEGIN
+    INSERT INTO suppression_changes (email_key) VALUES (new.email_key);
+END;
+
+CREATE TRIGGER IF NOT EXISTS suppression_changes_ad AFTER DELETE ON suppression_list BEGIN
+    INSERT INTO suppression_changes (email_key) VALUES (old.email_key);
+END;
+
+CREATE TRIGGER IF NOT EXISTS suppression_changes_au AFTER UPDATE OF email_key ON suppression_list
+WHEN old.email_key IS NOT new.email_key BEGIN
+    INSERT INTO suppression_changes (email_key) VALUES (old.email_key), (new.email_key);
+END;
+
+CREATE TRIGGER IF NOT EXISTS suppression_rules_changes_ai AFTER INSERT ON suppression_rules BEGIN
+    INSERT INTO suppression_changes (rule_id) VALUES (new.rule_id);
+END;
+
+CREATE TRIGGER IF NOT EXISTS suppression_rules_changes_ad AFTER DELETE ON suppression_rules BEGIN
+    INSERT INTO suppression_changes (rule_id) VALUES (old.rule_id);
+END;
+"""
+
+# Drop pre-rendered messages of pending emails whose step, contact or campaign changed
+# (the worker renders those at send time instead)
+RENDERED_MESSAGE_TRIGGERS = """
+CREATE TRIGGER IF NOT EXISTS rendered_messages_step_au
+AFTER UPDATE OF subject_template, body_template ON email_steps BEGIN
+    DELETE FROM rendered_messages WHERE queue_id IN (
+        SELECT queue_id FROM email_queue WHERE step_id = new.step_id AND status = 'Pending'
+    );
+END;
+
+CREATE TRIGGER IF NOT EXISTS rendered_messages_contact_au
+AFTER UPDATE OF title, first_name, last_name, email, company, position, phone,
+    custom1, custom2, custom3, custom4, custom5, custom6, custom7, custom8, custom9, custom10
+ON contacts BEGIN
+    DELETE FROM rendered_messages WHERE queue_id IN (
+        SELECT queue_id FROM email_queue WHERE contact_id = new.contact_id AND status = 'Pending'
+    );
+END;
+
+CREATE TRIGGER IF NOT EXISTS rendered_messages_campaign_au
+AFTER UPDATE OF campaign_ref ON campaigns BEGIN
+    DELETE FROM rendered_messages WHERE queue_id IN (
+        SELECT queue_id FROM email_queue WHERE campaign_id = new.campaign_id AND status = 'Pending'
+    );
+END;
+"""
+
+# Count the attachments referring to each blob
+ATTACHMENT_BLOB_TRIGGERS = """
+CREATE TRIGGER IF NOT EXISTS attachment_blobs_ref_ai AFTER INSERT ON attachments
+WHEN new.content_hash IS NOT NULL BEGIN
+    UPDATE attachment_blobs SET ref_count = ref_count + 1 WHERE content_hash = new.content_hash;
+END;
+
+CREATE TRIGGER IF NOT EXISTS attachment_blobs_ref_ad AFTER DELETE ON attachments
+WHEN old.content_hash IS NOT NULL BEGIN
+    UPDATE attachment_blobs SET ref_count = ref_count - 1 WHERE content_hash = old.content_hash;
+END;
+
+CREATE TRIGGER IF NOT EXISTS attachment_blobs_ref_au AFTER UPDATE OF content_hash ON attachments
+WHEN old.content_hash IS NOT new.content_hash BEGIN
+    UPDATE attachment_blobs SET ref_count = ref_count - 1 WHERE content_hash = old.content_hash;
+    UPDATE attachment_blobs SET ref_count = ref_count + 1 WHERE content_hash = new.content_hash;
+END;
+"""
+
+# Roll email_logs and campaign contact outcomes up by day (see rebuild_daily_stats).
+# Dropped first so databases created by older releases get the current definitions.
+# A contact outcome is dated by responded_at or unsubscribed_at, never updated_at,
+# so later touches of the row do not move it to another day.
+DAILY_STATS_TRIGGERS = """
+DROP TRIGGER IF EXISTS daily_send_stats_ai;
+DROP TRIGGER IF EXISTS daily_send_stats_ad;
+DROP TRIGGER IF EXISTS daily_send_stats_au;
+DROP TRIGGER IF EXISTS daily_contact_stats_ai;
+DROP TRIGGER IF EXISTS daily_contact_stats_ad;
+DROP TRIGGER IF EXISTS daily_contact_stats_au;
+
+CREATE TRIGGER daily_send_stats_ai AFTER INSERT ON email_logs BEGIN
+    INSERT INTO daily_send_stats (day, campaign_id, step_id, status, count)
+    VALUES (COALESCE(date(new.sent_at), ''), COALESCE(new.campaign_id, 0), COALESCE(new.step_id, 0), new.status, 1)
+    ON CONFLICT (campaign_id, day, step_id, status) DO UPDATE SET count = count + 1;
+END;
+
+CREATE TRIGGER daily_send_stats_ad AFTER DELETE ON email_logs BEGIN
+    UPDATE daily_send_stats SET count = count - 1
+    WHERE campaign_id = COALESCE(old.campaign_id, 0) AND day = COALESCE(date(old.sent_at), '')
+      AND step_id = COALESCE(old.step_id, 0) AND status = old.status;
+    DELETE FROM daily_send_stats
+    WHERE campaign_id = COALESCE(old.campaign_id, 0) AND day = COALESCE(date(old.sent_at), '')
+      AND step_id = COALESCE(old.step_id, 0) AND status = old.status AND count <= 0;
+END;
+
+CREATE TRIGGER daily_send_stats_au
+AFTER UPDATE OF campaign_id, step_id, sent_at, status ON email_logs BEGIN
+    UPDATE daily_send_stats SET count = count - 1
+    WHERE campaign_id = COALESCE(old.campaign_id, 0) AND day = COALESCE(date(old.sent_at), '')
+      AND step_id = COALESCE(old.step_id, 0) AND status = old.status;
+    DELETE FROM daily_send_stats
+    WHERE campaign_id = COALESCE(old.campaign_id, 0) AND day = COALESCE(date(old.sent_at), '')
+      AND step_id = COALESCE(old.step_id, 0) AND status = old.status AND count <= 0;
+    INSERT INTO daily_send_stats (day, campaign_id, step_id, status, count)
+    VALUES (COALESCE(date(new.sent_at), ''), COALESCE(new.campaign_id, 0), COALESCE(new.step_id, 0), new.status, 1)
+    ON CONFLICT (campaign_id, day, step_id, status) DO UPDATE SET count = count + 1;
+END;
+
+CREATE TRIGGER daily_contact_stats_ai AFTER INSERT ON campaign_contacts
+WHEN new.status IN ('Responded', 'Unsubscribed') BEGIN
+    INSERT INTO daily_contact_stats (day, campaign_id, status, count)
+    VALUES (
+        COALESCE(date(CASE WHEN new.status = 'Responded'
+                           THEN COALESCE(new.responded_at, new.created_at)
+                           ELSE COALESCE(new.unsubscribed_at, new.created_at) END), ''),
+        new.campaign_id, new.status, 1
+    )
+    ON CONFLICT (campaign_id, day, status) DO UPDATE SET count = count + 1;
+END;
+
+CREATE TRIGGER daily_contact_stats_ad AFTER DELETE ON campaign_contacts
+WHEN old.status IN ('Responded', 'Unsubscribed') BEGIN
+    UPDATE daily_contact_stats SET count = count - 1
+    WHERE campaign_id = old.campaign_id AND status = old.status
+      AND day = COALESCE(date(CASE WHEN old.status = 'Responded'
+                                   THEN COALESCE(old.responded_at, old.created_at)
+                                   ELSE COALESCE(old.unsubscribed_at, old.created_at) END), '');
+    DELETE FROM daily_contact_stats
+    WHERE campaign_id = old.campaign_id AND status = old.status
+      AND day = COALESCE(date(CASE WHEN old.status = 'Responded'
+                                   THEN COALESCE(old.responded_at, old.created_at)
+                                   ELSE COALESCE(old.unsubscribed_at, old.created_at) END), '')
+      AND count <= 0;
+END;
+
+CREATE TRIGGER daily_contact_stats_au
+AFTER UPDATE OF campaign_id, status, responded_at, unsubscribed_at ON campaign_contacts
+WHEN old.status IN ('Responded', 'Unsubscribed') OR new.status IN ('Responded', 'Unsubscribed') BEGIN
+    UPDATE daily_contact_stats SET count = count - 1
+    WHERE campaign_id = old.campaign_id AND status = old.status
+      AND day = COALESCE(date(CASE WHEN old.status = 'Responded'
+                                   THEN COALESCE(old.responded_at, old.created_at)
+                                   ELSE COALESCE(old.unsubscribed_at, old.created_at) END), '');
+    DELETE FROM daily_contact_stats
+    WHERE campaign_id = old.campaign_id AND status = old.status
+      AND day = COALESCE(date(CASE WHEN old.status = 'Responded'
+                                   THEN COALESCE(old.responded_at, old.created_at)
+                                   ELSE COALESCE(old.unsubscribed_at, old.created_at) END), '')
+      AND count <= 0;
+    INSERT INTO daily_contact_stats (day, campaign_id, status, count)
+    SELECT COALESCE(date(CASE WHEN new.status = 'Responded'
+                              THEN COALESCE(new.responded_at, new.created_at)
+                              ELSE COALESCE(new.unsubscribed_at, new.created_at) END), ''),
+           new.campaign_id, new.status, 1
+    WHERE new.status IN ('Responded', 'Unsubscribed')
+    ON CONFLICT (campaign_id, day, status) DO UPDATE SET count = count + 1;
+END;
+"""
+
+# Full-text search over contacts (requires SQLite built with FTS5)
+FTS_SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS contacts_fts USING fts5(
+    first_name, last_name, email, company, position,
+    custom1, custom2, custom3, custom4, custom5,
+    custom6, custom7, custom8, custom9, custom10,
+    content='contacts',
+    content_rowid='contact_id',
+    tokenize='unicode61 remove_diacritics 2',
+    prefix='2 3'
+);
+
+CREATE TRIGGER IF NOT EXISTS contacts_fts_ai AFTER INSERT ON contacts BEGIN
+    INSERT INTO contacts_fts (
+        rowid, first_name, last_name, email, company, position,
+        custom1, custom2, custom3, custom4, custom5,
+        custom6, custom7, custom8, custom9, custom10
+    ) VALUES (
+        new.contact_id, new.first_name, new.last_name, new.email, new.company, new.position,
+        new.custom1, new.custom2, new.custom3, new.custom4, new.custom5,
+        new.custom6, new.custom7, new.custom8, new.custom9, new.custom10
+    );
+END;
+
+CREATE TRIGGER IF NOT EXISTS contacts_fts_ad AFTER DELETE ON contacts BEGIN
+    INSERT INTO contacts_fts (
+        contacts_fts, rowid, first_name, last_name, email, company, position,
+        custom1, custom2, custom3, custom4, custom5,
+        custom6, custom7, custom8, custom9, custom10
+    ) VALUES (
+        'delete', old.contact_id, old.first_name, old.last_name, old.email, old.company, old.position,
+        old.custom1, old.custom2, old.custom3, old.custom4, old.custom5,
+        old.custom6, old.custom7, old.custom8, old.custom9, old.custom10
+    );
+END;
+
+CREATE TRIGGER IF NOT EXISTS contacts_fts_au AFTER UPDATE OF
+    first_name, last_name, email, company, position,
+    custom1, custom2, custom3, custom4, custom5,
+    custom6, custom7, custom8, custom9, custom10
+ON contacts BEGIN
+    INSERT INTO contacts_fts (
+        contacts_fts, rowid, first_name, last_name, email, company, position,
+        custom1, custom2, custom3, custom4, custom5,
+        custom6, custom7, custom8, custom9, custom10
+    ) VALUES (
+        'delete', old.contact_id, old.first_name, old.last_name, old.email, old.company, old.position,
+        old.custom1, old.custom2, old.custom3, old.custom4, old.custom5,
+        old.custom6, old.custom7, old.custom8, old.custom9, old.custom10
+    );
+    INSERT INTO contacts_fts (
+        rowid, first_name, last_name, email, company, position,
+        custom1, custom2, custom3, custom4, custom5,
+        custom6, custom7, custom8, custom9, custom10
+    ) VALUES (
+        new.contact_id, new.first_name, new.last_name, new.email, new.company, new.position,
+        new.custom1, new.custom2, new.custom3, new.custom4, new.custom5,
+        new.custom6, new.custom7, new.custom8, new.custom9, new.custom10
+    );
+END;
 """
 
 # Initial settings
@@ -204,6 +592,8 @@ INITIAL_SETTINGS = [
     ('unsubscribe_keywords_en', 'UNSUBSCRIBE,STOP,REMOVE,OPT OUT,OPT-OUT'),
     ('unsubscribe_keywords_fr', 'DÉSINSCRIRE,DÉSINSCRIPTION,STOP,ARRÊTER,SUPPRIMER'),
     ('scan_folders', 'Inbox,Unsubscribe'),
+    ('email_fold_plus_addressing', '0'),
+    ('prerender_messages', '1'),
 ]
 
 
@@ -217,7 +607,11 @@ class Database:
         """Initialize database connection."""
         if db_path:
             self._db_path = db_path
-        self._connection: Optional[sqlite3.Connection] = None
+        # One connection per thread: the email worker and background jobs
+        # each get their own, so they never share a cursor with the UI
+        self._local = threading.local()
+        self._connections: List[sqlite3.Connection] = []
+        self._connections_lock = threading.Lock()
 
     @classmethod
     def set_path(cls, db_path: str) -> None:
@@ -232,21 +626,30 @@ class Database:
         return cls._instance
 
     def _get_connection(self) -> sqlite3.Connection:
-        """Get or create database connection."""
-        if self._connection is None:
+        """Get or create the calling thread's database connection."""
+        connection = getattr(self._local, 'connection', None)
+        if connection is None:
             # Ensure directory exists
             db_dir = os.path.dirname(self._db_path)
             if db_dir and not os.path.exists(db_dir):
-                os.makedirs(db_dir)
+                os.makedirs(db_dir, exist_ok=True)
 
-            self._connection = sqlite3.connect(
+            connection = sqlite3.connect(
                 self._db_path,
-                detect_types=sqlite3.PARSE_DECLTYPES | sqlite3.PARSE_COLNAMES
+                detect_types=sqlite3.PARSE_DECLTYPES | sqlite3.PARSE_COLNAMES,
+                timeout=BUSY_TIMEOUT_SECONDS,
+                check_same_thread=False  # only so close() can run from any thread
             )
-            self._connection.row_factory = sqlite3.Row
+            connection.row_factory = sqlite3.Row
             # Enable foreign keys
-            self._connection.execute("PRAGMA foreign_keys = ON")
-        return self._connection
+            connection.execute("PRAGMA foreign_keys = ON")
+            # WAL lets the UI keep reading while a background job writes
+            connection.execute("PRAGMA journal_mode = WAL")
+
+            self._local.connection = connection
+            with self._connections_lock:
+                self._connections.append(connection)
+        return connection
 
     @contextmanager
     def get_cursor(self) -> Generator[sqlite3.Cursor, None, None]:
@@ -260,6 +663,9 @@ class Database:
             conn.rollback()
             logger.error(f"Database error: {e}")
             raise DatabaseError(str(e)) from e
+        except BaseException:
+            conn.rollback()
+            raise
         finally:
             cursor.close()
 
@@ -298,11 +704,58 @@ class Database:
         cursor = conn.execute(query, params)
         return cursor.fetchall()
 
+    def iter_batches(
+        self,
+        query: str,
+        params: tuple = (),
+        batch_size: int = 5000,
+        raw: bool = False
+    ) -> Iterator[list]:
+        """
+        Execute a query and yield its rows in batches without loading them all.
+
+        With raw=True rows are plain tuples, which are much cheaper to build
+        than sqlite3.Row for bulk numeric reads.
+        """
+        cursor = self._get_connection().cursor()
+        if raw:
+            cursor.row_factory = None
+        cursor.execute(query, params)
+        try:
+            while True:
+                rows = cursor.fetchmany(batch_size)
+                if not rows:
+                    break
+                yield rows
+        finally:
+            cursor.close()
+
+    def table_exists(self, name: str) -> bool:
+        """Check whether a table (or virtual table) exists."""
+        row = self.fetchone(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?",
+            (name,)
+        )
+        return row is not None
+
+    def close_thread_connection(self) -> None:
+        """Close the calling thread's connection, e.g. at the end of a pooled task."""
+        connection = getattr(self._local, 'connection', None)
+        if connection is None:
+            return
+        with self._connections_lock:
+            if connection in self._connections:
+                self._connections.remove(connection)
+        self._local.connection = None
+        connection.close()
+
     def close(self) -> None:
-        """Close database connection."""
-        if self._connection:
-            self._connection.close()
-            self._connection = None
+        """Close every thread's database connection."""
+        with self._connections_lock:
+            connections, self._connections = self._connections, []
+        for connection in connections:
+            connection.close()
+        self._local = threading.local()
 
 
 def get_db() -> Database:
@@ -318,10 +771,33 @@ def init_database(db_path: Optional[str] = None) -> None:
     db = get_db()
 
     # Create schema
+    stats_built = db.table_exists('daily_send_stats')
     conn = db._get_connection()
     conn.executescript(SCHEMA)
     conn.commit()
 
+    added_columns = _apply_column_migrations(conn)
+    unsubscribed_added = ('campaign_contacts', 'unsubscribed_at') in added_columns
+    if unsubscribed_added:
+        # Older releases only kept updated_at; it is the best record of when they unsubscribed
+        conn.execute(
+            "UPDATE campaign_contacts SET unsubscribed_at = updated_at WHERE status = 'Unsubscribed'"
+        )
+    conn.executescript(MIGRATION_INDEXES)
+    conn.executescript(LIST_COUNT_TRIGGERS)
+    conn.executescript(SUPPRESSION_CHANGE_TRIGGERS)
+    conn.executescript(RENDERED_MESSAGE_TRIGGERS)
+    conn.executescript(ATTACHMENT_BLOB_TRIGGERS)
+    conn.executescript(DAILY_STATS_TRIGGERS)
+    conn.commit()
+
+    if ('contact_lists', 'contact_count') in added_columns:
+        refresh_list_counts()
+    if not stats_built or unsubscribed_added:
+        rebuild_daily_stats()
+
+    _init_full_text_search(db)
+
     # Insert initial settings if not exist
     for key, value in INITIAL_SETTINGS:
         db.execute(
@@ -329,9 +805,183 @@ def init_database(db_path: Optional[str] = None) -> None:
             (key, value)
         )
 
+    set_plus_addressing_folding(get_setting('email_fold_plus_addressing', '0') == '1')
+    backfill_email_keys()
+
     logger.info(f"Database initialized at {db._db_path}")
 
 
+def _apply_column_migrations(conn: sqlite3.Connection) -> set:
+    """
+    Add columns introduced after the first release to existing tables.
+
+    Returns:
+        Set of (table, column) pairs that were added
+    """
+    added = set()
+    for table, column, definition in COLUMN_MIGRATIONS:
+        existing = {row[1] for row in conn.execute(f"PRAGMA table_info({table})")}
+        if column not in existing:
+            conn.execute(f"ALTER TABLE {table} ADD COLUMN {column} {definition}")
+            logger.info(f"Added column {table}.{column}")
+            added.add((table, column))
+    conn.commit()
+    return added
+
+
+def refresh_list_counts() -> None:
+    """Recompute every cached contact_lists.contact_count from the contacts table."""
+    db = get_db()
+    db.execute("""
+        UPDATE contact_lists
+        SET contact_count = (SELECT COUNT(*) FROM contacts c WHERE c.list_id = contact_lists.list_id)
+    """)
+    logger.info("Refreshed contact list counts")
+
+
+def rebuild_daily_stats() -> int:
+    """
+    Recompute the daily send and contact rollups from email_logs and campaign_contacts.
+
+    The triggers keep them current; this is for databases upgraded from a
+    release without them, or to repair them after editing the tables by hand.
+
+    Returns:
+        Number of rollup rows written
+    """
+    db = get_db()
+    with db.get_cursor() as cursor:
+        cursor.execute("DELETE FROM daily_send_stats")
+        cursor.execute("DELETE FROM daily_contact_stats")
+        cursor.execute("""
+            INSERT INTO daily_send_stats (day, campaign_id, step_id, status, count)
+            SELECT COALESCE(date(sent_at), ''), COALESCE(campaign_id, 0), COALESCE(step_id, 0), status, COUNT(*)
+            FROM email_logs
+            GROUP BY 1, 2, 3, 4
+        """)
+        rows = cursor.rowcount
+        cursor.execute("""
+            INSERT INTO daily_contact_stats (day, campaign_id, status, count)
+            SELECT COALESCE(date(CASE WHEN status = 'Responded'
+                                      THEN COALESCE(responded_at, created_at)
+                                      ELSE COALESCE(unsubscribed_at, created_at) END), ''),
+                   campaign_id, status, COUNT(*)
+            FROM campaign_contacts
+            WHERE status IN ('Responded', 'Unsubscribed')
+            GROUP BY 1, 2, 3
+        """)
+        rows += cursor.rowcount
+
+    logger.info(f"Rebuilt daily statistics ({rows} rows)")
+    return rows
+
+
+def backfill_email_keys() -> int:
+    """
+    Link contacts to identities and key suppression entries where missing.
+
+    Returns:
+        Number of contacts linked
+    """
+    db = get_db()
+
+    contact_rows = db.fetchall("SELECT contact_id, email FROM contacts WHERE identity_id IS NULL")
+    suppression_rows = db.fetchall("SELECT email FROM suppression_list WHERE email_key IS NULL")
+    if not contact_rows and not suppression_rows:
+        return 0
+
+    links = [(email_key(row['email']), row['contact_id']) for row in contact_rows]
+
+    with db.get_cursor() as cursor:
+        cursor.executemany(
+            "INSERT OR IGNORE INTO contact_identities (email_key) VALUES (?)",
+            [(key,) for key in {key for key, _ in links}]
+        )
+        cursor.executemany(
+            """UPDATE contacts
+               SET identity_id = (SELECT identity_id FROM contact_identities WHERE email_key = ?)
+               WHERE contact_id = ?""",
+            links
+        )
+        cursor.executemany(
+            "UPDATE suppression_list SET email_key = ? WHERE email = ?",
+            [(email_key(row['email']), row['email']) for row in suppression_rows]
+        )
+
+    if suppression_rows:
+        from .suppression_index import get_suppression_index
+        get_suppression_index().invalidate()
+    if links:
+        logger.info(f"Linked {len(links)} contacts to email identities")
+    return len(links)
+
+
+def rebuild_email_keys(fold_plus_addressing: Optional[bool] = None) -> int:
+    """
+    Recompute every identity key, e.g. after changing plus-addressing folding.
+
+    Returns:
+        Number of contacts linked
+    """
+    if fold_plus_addressing is not None:
+        set_plus_addressing_folding(fold_plus_addressing)
+
+    db = get_db()
+    # Compute every key first, then swap them in with one transaction so no
+    # reader ever sees a contact or suppression entry without its key
+    links = [
+        (email_key(row['email']), row['contact_id'])
+        for row in db.fetchall("SELECT contact_id, email FROM contacts")
+    ]
+    suppression_keys = [
+        (email_key(row['email']), row['email'])
+        for row in db.fetchall("SELECT email FROM suppression_list")
+    ]
+
+    with db.get_cursor() as cursor:
+        if fold_plus_addressing is not None:
+            cursor.execute(
+                """INSERT INTO settings (key, value, updated_at)
+                   VALUES ('email_fold_plus_addressing', ?, datetime('now'))
+                   ON CONFLICT(key) DO UPDATE SET value = excluded.value, updated_at = datetime('now')""",
+                ('1' if fold_plus_addressing else '0',)
+            )
+        cursor.executemany(
+            "INSERT OR IGNORE INTO contact_identities (email_key) VALUES (?)",
+            [(key,) for key in {key for key, _ in links}]
+        )
+        cursor.executemany(
+            """UPDATE contacts
+               SET identity_id = (SELECT identity_id FROM contact_identities WHERE email_key = ?)
+               WHERE contact_id = ?""",
+            links
+        )
+        cursor.executemany("UPDATE suppression_list SET email_key = ? WHERE email = ?", suppression_keys)
+        cursor.execute("""
+            DELETE FROM contact_identities
+            WHERE identity_id NOT IN (SELECT identity_id FROM contacts WHERE identity_id IS NOT NULL)
+        """)
+
+    from .suppression_index import get_suppression_index
+    get_suppression_index().invalidate()
+    logger.info(f"Rebuilt identity keys of {len(links)} contacts")
+    return len(links)
+
+
+def _init_full_text_search(db: Database) -> None:
+    """Create the contacts FTS5 index, populating it on first creation."""
+    already_built = db.table_exists('contacts_fts')
+    conn = db._get_connection()
+    try:
+        conn.executescript(FTS_SCHEMA)
+        if not already_built:
+            conn.execute("INSERT INTO contacts_fts (contacts_fts) VALUES ('rebuild')")
+        conn.commit()
+    except sqlite3.OperationalError as e:
+        conn.rollback()
+        logger.warning(f"FTS5 not available, contact search will use LIKE: {e}")
+
+
 def get_setting(key: str, default: Any = None) -> Any:
     """Get setting value by key."""
     db = get_db()
@@ -61,3 +61,8 @@ class CSVImportError(LeadGeneratorError):
 class WorkerError(LeadGeneratorError):
     """Background worker error."""
     pass
+
+
+class JobCancelledError(LeadGeneratorError):
+    """Background job cancelled by the user."""
+    pass
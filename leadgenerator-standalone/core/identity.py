@@ -0,0 +1,47 @@
+"""Email normalization and identity keys for Lead Generator Standalone."""
+
+import re
+from typing import Optional
+
+# Pragmatic address syntax check: one '@', no whitespace, a dot in the domain
+EMAIL_PATTERN = re.compile(r'^[^@\s]+@[^@\s]+\.[^@\s]+$')
+
+# Whether "john+news@acme.com" and "john@acme.com" share one identity.
+# Loaded from the 'email_fold_plus_addressing' setting by init_database().
+_fold_plus_addressing = False
+
+
+def normalize_email(email: Optional[str]) -> str:
+    """Return the canonical stored form of an address (trimmed, lower-cased)."""
+    return (email or '').strip().lower()
+
+
+def is_valid_email(email: Optional[str]) -> bool:
+    """Check the syntax of an already-normalized address."""
+    return bool(email) and EMAIL_PATTERN.match(email) is not None
+
+
+def email_key(email: Optional[str]) -> str:
+    """
+    Return the identity key of an address.
+
+    The key is the normalized address, with the "+tag" part of the local
+    part removed when plus-addressing folding is enabled.
+    """
+    normalized = normalize_email(email)
+    if _fold_plus_addressing and '+' in normalized:
+        local, sep, domain = normalized.partition('@')
+        if sep:
+            normalized = f"{local.split('+', 1)[0]}@{domain}"
+    return normalized
+
+
+def set_plus_addressing_folding(enabled: bool) -> None:
+    """Enable or disable plus-addressing folding for email_key()."""
+    global _fold_plus_addressing
+    _fold_plus_addressing = bool(enabled)
+
+
+def is_plus_addressing_folded() -> bool:
+    """Whether email_key() currently folds plus-addressing."""
+    return _fold_plus_addressing
@@ -0,0 +1,151 @@
+"""Background jobs for long-running UI tasks in Lead Generator Standalone (the client keeps a fork)."""
+
+import logging
+import queue
+import threading
+from tkinter import TclError
+from typing import Any, Callable, Optional
+
+from core.database import get_db
+from core.exceptions import JobCancelledError
+
+logger = logging.getLogger(__name__)
+
+# How often the Tk main loop drains the job's progress queue
+POLL_INTERVAL_MS = 100
+
+
+class CancelToken:
+    """Thread-safe cancellation flag shared between the UI and a job."""
+
+    def __init__(self):
+        self._event = threading.Event()
+
+    def cancel(self) -> None:
+        """Request cancellation."""
+        self._event.set()
+
+    @property
+    def cancelled(self) -> bool:
+        """Whether cancellation was requested."""
+        return self._event.is_set()
+
+    def raise_if_cancelled(self) -> None:
+        """Raise JobCancelledError if cancellation was requested."""
+        if self._event.is_set():
+            raise JobCancelledError("Job cancelled")
+
+    def __call__(self) -> bool:
+        """Allow the token to be passed wherever a should_cancel callable is expected."""
+        return self._event.is_set()
+
+
+class BackgroundJob:
+    """
+    Run a task on a worker thread and report back on the Tk main loop.
+
+    The task is called as task(report_progress, token). It reports progress
+    with report_progress(done, total, message='') and should poll the token
+    between units of work. Callbacks always run on the main thread, driven by
+    widget.after(); only the latest progress update of each poll is shown.
+    """
+
+    def __init__(
+        self,
+        widget,
+        task: Callable[[Callable[..., None], CancelToken], Any],
+        on_progress: Optional[Callable[[int, int, str], None]] = None,
+        on_done: Optional[Callable[[Any], None]] = None,
+        on_error: Optional[Callable[[Exception], None]] = None,
+        on_cancelled: Optional[Callable[[], None]] = None,
+        name: str = "background-job"
+    ):
+        self.widget = widget
+        self.task = task
+        self.on_progress = on_progress
+        self.on_done = on_done
+        self.on_error = on_error
+        self.on_cancelled = on_cancelled
+        self.name = name
+
+        self.token = CancelToken()
+        self._queue: queue.Queue = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+        self._finished = False
+
+    @property
+    def running(self) -> bool:
+        """Whether the job has started and not yet reported back."""
+        return self._thread is not None and not self._finished
+
+    def start(self) -> 'BackgroundJob':
+        """Start the worker thread and begin polling for updates."""
+        self._thread = threading.Thread(target=self._run, name=self.name, daemon=True)
+        self._thread.start()
+        self.widget.after(POLL_INTERVAL_MS, self._poll)
+        logger.info(f"Started job '{self.name}'")
+        return self
+
+    def cancel(self) -> None:
+        """Ask the task to stop at its next cancellation check."""
+        if self.running:
+            self.token.cancel()
+            logger.info(f"Cancellation requested for job '{self.name}'")
+
+    def _report_progress(self, done: int, total: int, message: str = '') -> None:
+        """Queue a progress update (called from the worker thread)."""
+        self._queue.put(('progress', (done, total, message)))
+
+    def _run(self) -> None:
+        """Worker thread body."""
+        try:
+            result = self.task(self._report_progress, self.token)
+        except JobCancelledError:
+            self._queue.put(('cancelled', None))
+        except Exception as e:
+            logger.error(f"Job '{self.name}' failed: {e}")
+            self._queue.put(('error', e))
+        else:
+            self._queue.put(('done', result))
+        finally:
+            # The thread is about to exit; don't leave its connection open
+            get_db().close_thread_connection()
+
+    def _poll(self) -> None:
+        """Drain queued updates on the main thread."""
+        try:
+            if not self.widget.winfo_exists():
+                self.token.cancel()
+                return
+        except TclError:
+            self.token.cancel()
+            return
+
+        latest_progress = None
+        outcome = None
+        while True:
+            try:
+                kind, payload = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if kind == 'progress':
+                latest_progress = payload
+            else:
+                outcome = (kind, payload)
+
+        if latest_progress and self.on_progress:
+            self.on_progress(*latest_progress)
+
+        if outcome is None:
+            self.widget.after(POLL_INTERVAL_MS, self._poll)
+            return
+
+        self._finished = True
+        kind, payload = outcome
+        if kind == 'done' and self.on_done:
+            self.on_done(payload)
+        elif kind == 'error' and self.on_error:
+            self.on_error(payload)
+        elif kind == 'cancelled' and self.on_cancelled:
+            self.on_cancelled()
+        logger.info(f"Job '{self.name}' finished: {kind}")
@@ -2,7 +2,7 @@
 
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Optional, List
+from typing import Any, Dict, Optional, List
 from enum import Enum
 
 
@@ -51,6 +51,26 @@ class SuppressionSource(str, Enum):
     COMPLAINT = "Complaint"
 
 
+class ImportJobStatus(str, Enum):
+    RUNNING = "Running"
+    CANCELLED = "Cancelled"
+    FAILED = "Failed"
+    COMPLETED = "Completed"
+
+
+class SuppressionRuleType(str, Enum):
+    DOMAIN = "Domain"        # @acme.com
+    SUBDOMAIN = "Subdomain"  # *.acme.com (acme.com and every subdomain)
+    PATTERN = "Pattern"      # sales-*@acme.com
+
+
+class UpsertOutcome(str, Enum):
+    INSERTED = "inserted"
+    UPDATED = "updated"
+    SKIPPED = "skipped"
+    INVALID = "invalid"
+
+
 @dataclass
 class ContactList:
     """Contact list model."""
@@ -69,7 +89,7 @@ class ContactList:
     custom10_label: Optional[str] = None
     created_at: Optional[str] = None
     updated_at: Optional[str] = None
-    contact_count: int = 0  # Computed field
+    contact_count: int = 0  # Cached in contact_lists, maintained by triggers
 
     def get_custom_labels(self) -> dict:
         """Get dictionary of custom field labels."""
@@ -126,6 +146,96 @@ class Contact:
         return None
 
 
+@dataclass
+class UpsertResult:
+    """Per-row outcomes of a bulk contact upsert."""
+    outcomes: List[str] = field(default_factory=list)
+    errors: List[dict] = field(default_factory=list)  # {'index', 'email', 'error'}
+
+    def count(self, outcome: UpsertOutcome) -> int:
+        """Count rows with the given outcome."""
+        return sum(1 for o in self.outcomes if o == outcome.value)
+
+    @property
+    def inserted(self) -> int:
+        return self.count(UpsertOutcome.INSERTED)
+
+    @property
+    def updated(self) -> int:
+        return self.count(UpsertOutcome.UPDATED)
+
+    @property
+    def skipped(self) -> int:
+        return self.count(UpsertOutcome.SKIPPED)
+
+    @property
+    def invalid(self) -> int:
+        return self.count(UpsertOutcome.INVALID)
+
+
+@dataclass
+class CSVFileInfo:
+    """Encoding, delimiter and size of a CSV file, detected before reading it."""
+    encoding: str
+    delimiter: str
+    row_count: int  # data rows, header excluded
+    has_bom: bool = False
+    size_bytes: int = 0
+
+
+@dataclass
+class ImportResult:
+    """Outcome of a streaming contact import."""
+    imported: int = 0
+    updated: int = 0
+    skipped: int = 0
+    suppressed: int = 0  # Rows on the suppression list (skipped or flagged)
+    rows_processed: int = 0
+    errors: List[dict] = field(default_factory=list)  # {'row', 'error', 'data'}, first rejected rows only
+    error_count: int = 0  # All rejected rows
+    cancelled: bool = False
+    job_id: Optional[int] = None  # Import job to resume if cancelled
+
+
+@dataclass
+class ImportJob:
+    """Persistent, checkpointed contact import."""
+    job_id: Optional[int] = None
+    list_id: int = 0
+    file_path: str = ""
+    file_size: int = 0
+    file_fingerprint: str = ""
+    field_mapping: Dict[str, str] = field(default_factory=dict)
+    skip_duplicates: bool = True
+    skip_suppressed: bool = True  # Otherwise suppressed contacts are imported and flagged
+    chunk_size: int = 0
+    status: str = ImportJobStatus.RUNNING.value
+    rows_total: int = 0
+    rows_committed: int = 0  # Data rows fully written; resume starts after them
+    imported_count: int = 0
+    updated_count: int = 0
+    skipped_count: int = 0
+    suppressed_count: int = 0
+    error_count: int = 0
+    last_error: Optional[str] = None
+    created_at: Optional[str] = None
+    updated_at: Optional[str] = None
+
+    # Computed fields
+    list_name: Optional[str] = None
+
+
+@dataclass
+class ValidationSummary:
+    """Result of validating an import file without writing it."""
+    total_rows: int = 0
+    valid_rows: int = 0
+    invalid_rows: int = 0
+    duplicate_rows: int = 0
+    suppressed_rows: int = 0  # Valid rows whose email is on the suppression list
+    errors: List[dict] = field(default_factory=list)  # first errors only: {'row', 'error'}
+
+
 @dataclass
 class Campaign:
     """Campaign model."""
@@ -180,6 +290,8 @@ class Attachment:
     file_name: str = ""
     file_path: str = ""
     file_size: int = 0
+    file_mtime: Optional[float] = None
+    content_hash: Optional[str] = None  # Blob in the attachment store (None for legacy files)
     mime_type: Optional[str] = None
     created_at: Optional[str] = None
 
@@ -194,6 +306,7 @@ class CampaignContact:
     last_email_sent_at: Optional[str] = None
     next_email_scheduled_at: Optional[str] = None
     responded_at: Optional[str] = None
+    unsubscribed_at: Optional[str] = None
     created_at: Optional[str] = None
     updated_at: Optional[str] = None
     # Computed fields
@@ -228,6 +341,18 @@ class SuppressionEntry:
     created_at: Optional[str] = None
 
 
+@dataclass
+class SuppressionRule:
+    """Suppression rule covering a domain or an address pattern."""
+    rule_id: Optional[int] = None
+    rule_type: str = SuppressionRuleType.DOMAIN.value
+    pattern: str = ""
+    reversed_domain: Optional[str] = None  # 'com.acme' for acme.com
+    source: str = SuppressionSource.MANUAL.value
+    reason: Optional[str] = None
+    created_at: Optional[str] = None
+
+
 @dataclass
 class QueuedEmail:
     """Queued email model."""
@@ -245,6 +370,32 @@ class QueuedEmail:
     contact: Optional[Contact] = None
     step: Optional[EmailStep] = None
     campaign: Optional[Campaign] = None
+    rendered_subject: Optional[str] = None  # Set when pre-rendered
+    rendered_body: Optional[str] = None
+
+
+@dataclass
+class RenderedMessage:
+    """Pre-rendered message of a queued email."""
+    queue_id: int = 0
+    content_hash: str = ""
+    subject: str = ""
+    body: str = ""
+    rendered_at: Optional[str] = None
+
+
+@dataclass
+class CampaignAnalytics:
+    """Send and reply timing of a campaign (arrays are NumPy, see AnalyticsService)."""
+    campaign_id: int = 0
+    sends: int = 0
+    replies: int = 0
+    send_heatmap: Any = None  # 7 x 24 counts, Monday first, local hours
+    reply_heatmap: Any = None
+    latency_percentiles: Dict[int, float] = field(default_factory=dict)  # percentile -> hours
+    latency_histogram: List[Dict[str, Any]] = field(default_factory=list)
+    step_funnel: List[Dict[str, Any]] = field(default_factory=list)
+    computed_at: Optional[str] = None
 
 
 @dataclass
@@ -0,0 +1,65 @@
+"""Keyset (cursor) pagination helpers for Lead Generator Standalone."""
+
+import base64
+import json
+from dataclasses import dataclass, field
+from typing import Any, Generic, List, Optional, Sequence, TypeVar
+
+from .exceptions import ValidationError
+
+T = TypeVar('T')
+
+
+@dataclass
+class Page(Generic[T]):
+    """One page of results plus the cursor to fetch the next one."""
+    items: List[T] = field(default_factory=list)
+    next_cursor: Optional[str] = None
+
+    @property
+    def has_more(self) -> bool:
+        """Whether another page is available."""
+        return self.next_cursor is not None
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    """Encode the sort-key values of the last row into an opaque cursor."""
+    raw = json.dumps(list(values), separators=(',', ':'), default=str)
+    return base64.urlsafe_b64encode(raw.encode('utf-8')).decode('ascii').rstrip('=')
+
+
+def decode_cursor(cursor: str, key_count: int) -> List[Any]:
+    """Decode a cursor produced by encode_cursor()."""
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode('ascii')))
+    except (ValueError, TypeError) as e:
+        raise ValidationError(f"Invalid pagination cursor: {e}") from e
+
+    if not isinstance(values, list) or len(values) != key_count:
+        raise ValidationError("Invalid pagination cursor")
+    return values
+
+
+def keyset_condition(columns: Sequence[str], descending: bool = False) -> str:
+    """
+    Build the row-value predicate that resumes after the cursor row.
+
+    All columns share one direction so SQLite can walk a single index.
+    """
+    operator = '<' if descending else '>'
+    placeholders = ', '.join('?' for _ in columns)
+    return f"({', '.join(columns)}) {operator} ({placeholders})"
+
+
+def build_page(rows: list, limit: int, row_to_item, key_of) -> Page:
+    """
+    Turn limit + 1 fetched rows into a Page.
+
+    The extra row only signals that another page exists; it is not returned.
+    """
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+    items = [row_to_item(row) for row in rows]
+    next_cursor = encode_cursor(key_of(rows[-1])) if has_more and rows else None
+    return Page(items=items, next_cursor=next_cursor)
@@ -0,0 +1,364 @@
+"""In-memory suppression index for Lead Generator Standalone."""
+
+import fnmatch
+import hashlib
+import logging
+import math
+import re
+import threading
+import time
+from typing import Iterable, List, Optional, Set, Tuple
+
+from .database import Database, get_db
+from .exceptions import ValidationError
+from .identity import email_key, normalize_email
+from .models import SuppressionRuleType
+
+logger = logging.getLogger(__name__)
+
+# Above this many suppressed identities the index keeps a Bloom filter
+# instead of the key set, and confirms hits with a SQL lookup
+BLOOM_FILTER_THRESHOLD = 1_000_000
+BLOOM_FILTER_ERROR_RATE = 0.001
+
+# Changes applied one by one; a longer backlog triggers a full reload
+MAX_DELTA_CHANGES = 10000
+
+# Keys re-read per query when applying changes
+KEY_LOOKUP_BATCH_SIZE = 500
+
+# suppression_changes rows kept when the log is pruned at load time
+CHANGE_LOG_RETENTION = 100000
+
+# Minimum seconds between PRAGMA data_version polls on one thread
+DATA_VERSION_POLL_INTERVAL = 0.25
+
+
+DOMAIN_PATTERN = re.compile(r'^[a-z0-9-]+(\.[a-z0-9-]+)+$')
+
+
+def parse_suppression_rule(text: str) -> Tuple[str, str, Optional[str]]:
+    """
+    Parse a rule as typed by the user.
+
+    '@acme.com' (or 'acme.com') suppresses that domain, '*.acme.com' the
+    domain and all its subdomains, and an address pattern with * or ?
+    wildcards ('sales-*@acme.com') every address it matches.
+
+    Returns:
+        Tuple of (rule_type, pattern, reversed_domain)
+    """
+    text = normalize_email(text)
+    if text.startswith('@*.') or text.startswith('*.'):
+        domain = text.split('*.', 1)[1]
+        rule_type, pattern = SuppressionRuleType.SUBDOMAIN.value, f"*.{domain}"
+    elif '*' not in text and '?' not in text and text.count('@') <= 1 and text.split('@')[0] == '':
+        domain = text.lstrip('@')
+        rule_type, pattern = SuppressionRuleType.DOMAIN.value, f"@{domain}"
+    elif '@' not in text and '*' not in text and '?' not in text:
+        domain = text
+        rule_type, pattern = SuppressionRuleType.DOMAIN.value, f"@{domain}"
+    else:
+        if text.count('@') != 1 or not ('*' in text or '?' in text):
+            raise ValidationError("A pattern rule needs one '@' and at least one * or ? wildcard")
+        if '[' in text or ']' in text:
+            raise ValidationError("Only * and ? wildcards are supported in pattern rules")
+        if not text.replace('*', '').replace('?', '').replace('@', '').replace('.', ''):
+            raise ValidationError("A pattern rule cannot match every address")
+        domain = text.split('@')[1]
+        if '*' in domain or '?' in domain:
+            domain = None
+        rule_type, pattern = SuppressionRuleType.PATTERN.value, text
+
+    if domain is not None and not DOMAIN_PATTERN.match(domain):
+        raise ValidationError(f"Invalid domain: {domain}")
+    reversed_domain = '.'.join(reversed(domain.split('.'))) if domain else None
+    return rule_type, pattern, reversed_domain
+
+
+def rule_globs(rule_type: str, pattern: str) -> List[str]:
+    """Return SQLite GLOB patterns matching the addresses a rule covers."""
+    if rule_type == SuppressionRuleType.DOMAIN.value:
+        return [f"*{pattern}"]
+    if rule_type == SuppressionRuleType.SUBDOMAIN.value:
+        domain = pattern[2:]
+        return [f"*@{domain}", f"*@*.{domain}"]
+    return [pattern]
+
+
+class RuleMatcher:
+    """
+    Precompiled suppression rules.
+
+    Domain rules are a set lookup and subdomain rules walk the handful of
+    parent domains of an address; pattern rules share one compiled regex.
+    """
+
+    def __init__(self, rules: Iterable[Tuple[str, str]] = ()):
+        self.domains: Set[str] = set()
+        self.subdomains: Set[str] = set()
+        patterns = []
+        for rule_type, pattern in rules:
+            if rule_type == SuppressionRuleType.DOMAIN.value:
+                self.domains.add(pattern[1:])
+            elif rule_type == SuppressionRuleType.SUBDOMAIN.value:
+                self.subdomains.add(pattern[2:])
+            else:
+                patterns.append(fnmatch.translate(pattern))
+        self.pattern = re.compile('|'.join(patterns)) if patterns else None
+
+    def __bool__(self) -> bool:
+        return bool(self.domains or self.subdomains or self.pattern)
+
+    def matches(self, email: str) -> bool:
+        """Check a normalized address against every rule."""
+        domain = email.rpartition('@')[2]
+        if domain in self.domains:
+            return True
+        if self.subdomains:
+            while domain:
+                if domain in self.subdomains:
+                    return True
+                domain = domain.partition('.')[2]
+        return self.pattern is not None and self.pattern.match(email) is not None
+
+
+class BloomFilter:
+    """Fixed-size Bloom filter over strings (no false negatives)."""
+
+    def __init__(self, capacity: int, error_rate: float = BLOOM_FILTER_ERROR_RATE):
+        capacity = max(capacity, 1)
+        self.size = max(int(-capacity * math.log(error_rate) / math.log(2) ** 2), 8)
+        self.hash_count = max(round(self.size / capacity * math.log(2)), 1)
+        self.bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, value: str):
+        digest = hashlib.blake2b(value.encode('utf-8'), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], 'little')
+        h2 = int.from_bytes(digest[8:], 'little') | 1
+        return ((h1 + i * h2) % self.size for i in range(self.hash_count))
+
+    def add(self, value: str) -> None:
+        for position in self._positions(value):
+            self.bits[position >> 3] |= 1 << (position & 7)
+
+    def __contains__(self, value: str) -> bool:
+        return all(self.bits[position >> 3] & (1 << (position & 7)) for position in self._positions(value))
+
+
+class SuppressionIndex:
+    """
+    Process-wide set of suppressed identity keys.
+
+    Checks are answered from memory. Before a check the index compares
+    PRAGMA data_version of the calling thread's connection with the value
+    it last saw (at most every DATA_VERSION_POLL_INTERVAL seconds per
+    thread); when another connection (another thread or process) has
+    committed, or the app itself wrote to the suppression list and called
+    invalidate(), it replays the keys logged in suppression_changes since
+    its last load, re-reading only those keys. Bulk callers can refresh()
+    once and then check each address with refresh=False.
+    """
+
+    def __init__(self, db: Database):
+        self.db = db
+        self._keys: Set[str] = set()
+        self._bloom: Optional[BloomFilter] = None
+        self._rules = RuleMatcher()
+        self._last_change_id = 0
+        self._loaded = False
+        self._stale = False
+        self._lock = threading.RLock()
+        self._local = threading.local()
+
+    @property
+    def has_rules(self) -> bool:
+        """Whether any domain or pattern rule is defined."""
+        self.refresh()
+        return bool(self._rules)
+
+    @property
+    def uses_bloom_filter(self) -> bool:
+        """Whether hits are screened by a Bloom filter and confirmed in SQL."""
+        return self._bloom is not None
+
+    def load(self) -> int:
+        """
+        (Re)load every suppressed identity key.
+
+        Returns:
+            Number of keys loaded
+        """
+        with self._lock:
+            self._prune_change_log()
+            row = self.db.fetchone("SELECT COALESCE(MAX(change_id), 0) AS change_id FROM suppression_changes")
+            last_change_id = row['change_id']
+            count = self.db.fetchone(
+                "SELECT COUNT(DISTINCT email_key) AS count FROM suppression_list"
+            )['count']
+
+            query = "SELECT DISTINCT email_key FROM suppression_list WHERE email_key IS NOT NULL"
+            if count > BLOOM_FILTER_THRESHOLD:
+                bloom = BloomFilter(count * 2)
+                for rows in self.db.iter_batches(query):
+                    for key_row in rows:
+                        bloom.add(key_row['email_key'])
+                self._bloom, self._keys = bloom, set()
+            else:
+                keys = set()
+                for rows in self.db.iter_batches(query):
+                    keys.update(key_row['email_key'] for key_row in rows)
+                self._bloom, self._keys = None, keys
+
+            self._load_rules()
+
+            # Changes committed while loading are replayed by the next refresh
+            self._last_change_id = last_change_id
+            self._loaded = True
+            self._stale = True
+
+        logger.info(
+            f"Loaded suppression index: {count} identities"
+            + (" (Bloom filter)" if self._bloom is not None else "")
+        )
+        return count
+
+    def invalidate(self) -> None:
+        """Make the next check pick up writes made on this process's own connections."""
+        self._stale = True
+
+    def refresh(self, force: bool = False) -> None:
+        """
+        Apply suppression changes committed since the last check.
+
+        Unless force is set, other connections' commits are polled for at
+        most every DATA_VERSION_POLL_INTERVAL seconds on each thread; this
+        process's own writes (see invalidate()) are always applied.
+        """
+        now = time.monotonic()
+        if (self._loaded and not self._stale and not force
+                and now - getattr(self._local, 'polled_at', -math.inf) < DATA_VERSION_POLL_INTERVAL):
+            return
+        self._local.polled_at = now
+
+        data_version = self.db.fetchone("PRAGMA data_version")[0]
+        if (self._loaded and not self._stale
+                and getattr(self._local, 'data_version', None) == data_version):
+            return
+
+        with self._lock:
+            if not self._loaded:
+                self.load()
+            self._stale = False
+            self._local.data_version = data_version
+
+            rows = self.db.fetchall("""
+                SELECT change_id, email_key, rule_id FROM suppression_changes
+                WHERE change_id > ?
+                ORDER BY change_id
+                LIMIT ?
+            """, (self._last_change_id, MAX_DELTA_CHANGES + 1))
+            if not rows:
+                return
+
+            # A gap means the log was pruned past our position
+            if len(rows) > MAX_DELTA_CHANGES or rows[0]['change_id'] != self._last_change_id + 1:
+                self.load()
+                return
+
+            if any(row['rule_id'] is not None for row in rows):
+                self._load_rules()
+
+            changed = {row['email_key'] for row in rows if row['email_key']}
+            present = self._existing_keys(changed)
+            for key in changed:
+                if key in present:
+                    if self._bloom is not None:
+                        self._bloom.add(key)
+                    else:
+                        self._keys.add(key)
+                else:
+                    self._keys.discard(key)  # A Bloom filter keeps the bit; SQL confirms
+            self._last_change_id = rows[-1]['change_id']
+
+    def contains_key(self, key: str, refresh: bool = True) -> bool:
+        """Check an identity key (see core.identity.email_key)."""
+        if not key:
+            return False
+        if refresh:
+            self.refresh()
+        return self._contains(key)
+
+    def is_suppressed(self, email: Optional[str], refresh: bool = True) -> bool:
+        """Check an address (or another address of the same identity) and the rules."""
+        email = normalize_email(email)
+        if not email:
+            return False
+        if refresh:
+            self.refresh()
+        return self._contains(email_key(email)) or self._rules.matches(email)
+
+    def matches_rule(self, email: Optional[str], refresh: bool = True) -> bool:
+        """Check an address against the domain and pattern rules only."""
+        if refresh:
+            self.refresh()
+        return bool(self._rules) and self._rules.matches(normalize_email(email))
+
+    def filter_suppressed(self, emails: Iterable[str]) -> Set[str]:
+        """Return which of many addresses are suppressed, by address or rule."""
+        self.refresh()
+        rules = self._rules
+        return {
+            email for email in emails
+            if email and (self._contains(email_key(email)) or (rules and rules.matches(normalize_email(email))))
+        }
+
+    def _contains(self, key: str) -> bool:
+        """Look a key up without refreshing first."""
+        if self._bloom is None:
+            return key in self._keys
+        if key not in self._bloom:
+            return False
+        return self.db.fetchone(
+            "SELECT 1 FROM suppression_list WHERE email_key = ? LIMIT 1", (key,)
+        ) is not None
+
+    def _load_rules(self) -> None:
+        """Compile the suppression rules."""
+        rows = self.db.fetchall("SELECT rule_type, pattern FROM suppression_rules")
+        self._rules = RuleMatcher((row['rule_type'], row['pattern']) for row in rows)
+
+    def _existing_keys(self, keys: Set[str]) -> Set[str]:
+        """Return which keys are currently on the suppression list."""
+        present = set()
+        key_list = list(keys)
+        for start in range(0, len(key_list), KEY_LOOKUP_BATCH_SIZE):
+            batch = key_list[start:start + KEY_LOOKUP_BATCH_SIZE]
+            placeholders = ', '.join('?' for _ in batch)
+            rows = self.db.fetchall(
+                f"SELECT DISTINCT email_key FROM suppression_list WHERE email_key IN ({placeholders})",
+                tuple(batch)
+            )
+            present.update(row['email_key'] for row in rows)
+        return present
+
+    def _prune_change_log(self) -> None:
+        """Drop old suppression_changes rows, keeping the most recent ones."""
+        self.db.execute("""
+            DELETE FROM suppression_changes
+            WHERE change_id <= (SELECT MAX(change_id) FROM suppression_changes) - ?
+        """, (CHANGE_LOG_RETENTION,))
+
+
+_index: Optional[SuppressionIndex] = None
+_index_lock = threading.Lock()
+
+
+def get_suppression_index() -> SuppressionIndex:
+    """Get the suppression index of the current database (loaded on first use)."""
+    global _index
+    db = get_db()
+    with _index_lock:
+        if _index is None or _index.db is not db:
+            _index = SuppressionIndex(db)
+        return _index
@@ -0,0 +1,102 @@
+"""Compiled merge tag templates for Lead Generator Standalone (the client keeps a trimmed fork)."""
+
+import re
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Hashable, Mapping, Tuple
+
+# Merge tags are written {{Name}}
+MERGE_TAG_PATTERN = re.compile(r'\{\{(\w+)\}\}')
+
+# Template sources kept by compile_template()
+COMPILE_CACHE_SIZE = 256
+
+# Entries kept by a TemplateCache
+TEMPLATE_CACHE_SIZE = 1024
+
+
+class CompiledTemplate:
+    """
+    A template parsed once into literal text and merge tag slots.
+
+    render() fills the slots from a mapping of tag name to text and joins
+    the parts in one pass; a tag missing from the mapping is left as written.
+    """
+
+    __slots__ = ('source', 'fields', '_parts', '_slots')
+
+    def __init__(self, source: str):
+        self.source = source
+        parts = []
+        slots = []
+        position = 0
+        for match in MERGE_TAG_PATTERN.finditer(source):
+            if match.start() > position:
+                parts.append(source[position:match.start()])
+            slots.append((len(parts), match.group(1)))
+            parts.append(match.group(0))
+            position = match.end()
+        if position < len(source):
+            parts.append(source[position:])
+
+        self._parts = parts
+        self._slots = tuple(slots)
+        self.fields = frozenset(name for _, name in slots)
+
+    def render(self, values: Mapping[str, str]) -> str:
+        """Render with the given tag values."""
+        if not self._slots:
+            return self.source
+        parts = self._parts.copy()
+        for slot, name in self._slots:
+            value = values.get(name)
+            if value is not None:
+                parts[slot] = value
+        return ''.join(parts)
+
+
+@lru_cache(maxsize=COMPILE_CACHE_SIZE)
+def compile_template(source: str) -> CompiledTemplate:
+    """Compile a template, reusing the result for recently seen sources."""
+    return CompiledTemplate(source)
+
+
+class TemplateCache:
+    """
+    Compiled templates by caller key, e.g. (step_id, updated_at, 'body').
+
+    The source is compared on every hit, so an edit that keeps the key
+    (updated_at has one-second resolution) recompiles instead of serving
+    a stale template.
+    """
+
+    def __init__(self, max_size: int = TEMPLATE_CACHE_SIZE):
+        self.max_size = max_size
+        self._entries: 'OrderedDict[Hashable, CompiledTemplate]' = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, source: str) -> CompiledTemplate:
+        """Get the compiled template for a key, compiling it on a miss."""
+        with self._lock:
+            compiled = self._entries.get(key)
+            if compiled is not None and compiled.source == source:
+                self._entries.move_to_end(key)
+                return compiled
+
+        compiled = CompiledTemplate(source)
+        with self._lock:
+            self._entries[key] = compiled
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+        return compiled
+
+    def get_pair(self, key: Hashable, subject: str, body: str) -> Tuple[CompiledTemplate, CompiledTemplate]:
+        """Get compiled subject and body templates of one step."""
+        return self.get((key, 'subject'), subject), self.get((key, 'body'), body)
+
+    def clear(self) -> None:
+        """Drop every cached template."""
+        with self._lock:
+            self._entries.clear()
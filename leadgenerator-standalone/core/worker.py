@@ -7,7 +7,7 @@ from datetime import datetime
 from typing import Callable, Optional, Dict, Any, List
 
 from core.database import get_db, get_setting
-from core.models import QueuedEmail, Campaign
+from core.models import QueuedEmail, Campaign, Attachment
 from core.exceptions import WorkerError
 from services.email_service import EmailService
 from services.template_service import TemplateService
@@ -51,6 +51,9 @@ class EmailWorker:
         self._scan_interval = int(get_setting('outlook_scan_interval_seconds', 60))
         self._batch_size = 10  # Emails to process per cycle
 
+        # Attachment check results of the current cycle: {attachment_id: problem or None}
+        self._attachment_checks: Dict[int, Optional[str]] = {}
+
     def start(self) -> bool:
         """Start the background worker thread."""
         if self._running:
@@ -143,6 +146,9 @@ class EmailWorker:
         # Get pending emails
         pending_emails = self.email_service.get_pending_emails(limit=self._batch_size)
 
+        # Attachment files are checked once per cycle
+        self._attachment_checks = {}
+
         for queued_email in pending_emails:
             if not self._running or self._paused:
                 break
@@ -177,15 +183,22 @@ class EmailWorker:
             self.email_service.mark_email_failed(queued_email.queue_id, "Missing contact or step data")
             return
 
-        # Apply merge tags
-        subject = self.template_service.apply_merge_tags(step.subject_template, contact, campaign)
-        body = self.template_service.apply_merge_tags(step.body_template, contact, campaign)
+        # Get attachments (cached per campaign) and make sure their files are intact
+        step_attachments = self.template_service.get_campaign_attachments(queued_email.campaign_id).get(step.step_id, [])
+        problem = self._check_attachments(step_attachments)
+        if problem:
+            self.email_service.mark_email_failed(queued_email.queue_id, problem)
+            return
 
-        # Get attachments
-        attachments = []
-        step_with_attachments = self.template_service.get_step(step.step_id)
-        if step_with_attachments:
-            attachments = [a.file_path for a in step_with_attachments.attachments]
+        # Use the pre-rendered message, or apply merge tags now
+        if queued_email.rendered_subject is not None:
+            subject, body = queued_email.rendered_subject, queued_email.rendered_body
+        else:
+            subject_template, body_template = self.template_service.compile_step(step)
+            subject = self.template_service.apply_merge_tags(subject_template, contact, campaign)
+            body = self.template_service.apply_merge_tags(body_template, contact, campaign)
+
+        attachments = [a.file_path for a in step_attachments]
 
         # Send email via Outlook
         entry_id = self.outlook_service.send_email(
@@ -207,6 +220,20 @@ class EmailWorker:
 
         logger.info(f"Email sent to {contact.email} (campaign {campaign.campaign_ref if campaign else queued_email.campaign_id})")
 
+    def _check_attachments(self, attachments: List[Attachment]) -> Optional[str]:
+        """Check attachment files, each at most once per cycle; return the first problem found."""
+        for attachment in attachments:
+            if attachment.attachment_id not in self._attachment_checks:
+                problem = self.template_service.check_attachment(attachment)
+                self._attachment_checks[attachment.attachment_id] = problem
+                if problem:
+                    logger.error(problem)
+                    self._notify_error(problem)
+            problem = self._attachment_checks[attachment.attachment_id]
+            if problem:
+                return problem
+        return None
+
     def _scan_inbox(self) -> None:
         """Scan inbox for replies and unsubscribes."""
         if not self.outlook_service.is_outlook_running():
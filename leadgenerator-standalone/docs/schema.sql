@@ -37,10 +37,18 @@ CREATE TABLE IF NOT EXISTS contact_lists (
     custom8_label TEXT,
     custom9_label TEXT,
     custom10_label TEXT,
+    contact_count INTEGER NOT NULL DEFAULT 0,  -- maintained by triggers on contacts
     created_at TEXT DEFAULT (datetime('now')),
     updated_at TEXT DEFAULT (datetime('now'))
 );
 
+-- Contact Identities (one row per normalized email address, shared across lists)
+CREATE TABLE IF NOT EXISTS contact_identities (
+    identity_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    email_key TEXT NOT NULL UNIQUE,
+    created_at TEXT DEFAULT (datetime('now'))
+);
+
 -- Contacts
 CREATE TABLE IF NOT EXISTS contacts (
     contact_id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -64,6 +72,7 @@ CREATE TABLE IF NOT EXISTS contacts (
     custom8 TEXT,
     custom9 TEXT,
     custom10 TEXT,
+    identity_id INTEGER REFERENCES contact_identities(identity_id),
     created_at TEXT DEFAULT (datetime('now')),
     updated_at TEXT DEFAULT (datetime('now')),
     UNIQUE(list_id, email)
@@ -111,10 +120,20 @@ CREATE TABLE IF NOT EXISTS attachments (
     file_name TEXT NOT NULL,
     file_path TEXT NOT NULL,
     file_size INTEGER NOT NULL,
+    file_mtime REAL,
+    content_hash TEXT REFERENCES attachment_blobs(content_hash),
     mime_type TEXT,
     created_at TEXT DEFAULT (datetime('now'))
 );
 
+-- Attachment Blobs (attachment contents stored once by SHA-256; ref_count kept by triggers)
+CREATE TABLE IF NOT EXISTS attachment_blobs (
+    content_hash TEXT PRIMARY KEY,
+    file_size INTEGER NOT NULL,
+    ref_count INTEGER NOT NULL DEFAULT 0,
+    created_at TEXT DEFAULT (datetime('now'))
+);
+
 -- Campaign Contacts (per-contact status tracking)
 CREATE TABLE IF NOT EXISTS campaign_contacts (
     campaign_id INTEGER NOT NULL REFERENCES campaigns(campaign_id) ON DELETE CASCADE,
@@ -124,6 +143,7 @@ CREATE TABLE IF NOT EXISTS campaign_contacts (
     last_email_sent_at TEXT,
     next_email_scheduled_at TEXT,
     responded_at TEXT,
+    unsubscribed_at TEXT,
     created_at TEXT DEFAULT (datetime('now')),
     updated_at TEXT DEFAULT (datetime('now')),
     PRIMARY KEY (campaign_id, contact_id)
@@ -142,6 +162,25 @@ CREATE TABLE IF NOT EXISTS email_logs (
     outlook_entry_id TEXT
 );
 
+-- Daily Send Stats (email_logs counted per day, campaign, step and status; kept by triggers)
+CREATE TABLE IF NOT EXISTS daily_send_stats (
+    day TEXT NOT NULL,
+    campaign_id INTEGER NOT NULL,
+    step_id INTEGER NOT NULL DEFAULT 0,
+    status TEXT NOT NULL,
+    count INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (campaign_id, day, step_id, status)
+);
+
+-- Daily Contact Stats (responded and unsubscribed campaign contacts per day; kept by triggers)
+CREATE TABLE IF NOT EXISTS daily_contact_stats (
+    day TEXT NOT NULL,
+    campaign_id INTEGER NOT NULL,
+    status TEXT NOT NULL CHECK(status IN ('Responded', 'Unsubscribed')),
+    count INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (campaign_id, day, status)
+);
+
 -- Suppression List
 CREATE TABLE IF NOT EXISTS suppression_list (
     email TEXT PRIMARY KEY,
@@ -149,9 +188,28 @@ CREATE TABLE IF NOT EXISTS suppression_list (
     source TEXT NOT NULL CHECK(source IN ('EmailReply', 'Manual', 'Bounce', 'Complaint')),
     campaign_id INTEGER REFERENCES campaigns(campaign_id),
     reason TEXT,
+    email_key TEXT,
+    created_at TEXT DEFAULT (datetime('now'))
+);
+
+-- Suppression Rules (whole domains, subdomains and address patterns)
+CREATE TABLE IF NOT EXISTS suppression_rules (
+    rule_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    rule_type TEXT NOT NULL CHECK(rule_type IN ('Domain', 'Subdomain', 'Pattern')),
+    pattern TEXT NOT NULL UNIQUE,
+    reversed_domain TEXT,
+    source TEXT NOT NULL CHECK(source IN ('EmailReply', 'Manual', 'Bounce', 'Complaint')),
+    reason TEXT,
     created_at TEXT DEFAULT (datetime('now'))
 );
 
+-- Suppression Changes (identity keys and rules touched, polled by in-memory suppression indexes)
+CREATE TABLE IF NOT EXISTS suppression_changes (
+    change_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    email_key TEXT,
+    rule_id INTEGER
+);
+
 -- Email Queue (pending emails to send)
 CREATE TABLE IF NOT EXISTS email_queue (
     queue_id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -166,6 +224,54 @@ CREATE TABLE IF NOT EXISTS email_queue (
     created_at TEXT DEFAULT (datetime('now'))
 );
 
+-- Rendered Message Contents (each distinct subject/body stored once, keyed by its SHA-256)
+CREATE TABLE IF NOT EXISTS rendered_contents (
+    content_hash TEXT PRIMARY KEY,
+    subject TEXT NOT NULL,
+    body TEXT NOT NULL,
+    created_at TEXT DEFAULT (datetime('now'))
+);
+
+-- Rendered Messages (queued emails pre-rendered when scheduled)
+CREATE TABLE IF NOT EXISTS rendered_messages (
+    queue_id INTEGER PRIMARY KEY REFERENCES email_queue(queue_id) ON DELETE CASCADE,
+    content_hash TEXT NOT NULL REFERENCES rendered_contents(content_hash),
+    rendered_at TEXT DEFAULT (datetime('now'))
+);
+
+-- Import Jobs (checkpointed contact imports that can be resumed)
+CREATE TABLE IF NOT EXISTS import_jobs (
+    job_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    list_id INTEGER NOT NULL REFERENCES contact_lists(list_id) ON DELETE CASCADE,
+    file_path TEXT NOT NULL,
+    file_size INTEGER NOT NULL,
+    file_fingerprint TEXT NOT NULL,
+    field_mapping TEXT NOT NULL,
+    skip_duplicates INTEGER DEFAULT 1,
+    skip_suppressed INTEGER DEFAULT 1,
+    chunk_size INTEGER NOT NULL,
+    status TEXT DEFAULT 'Running' CHECK(status IN ('Running', 'Cancelled', 'Failed', 'Completed')),
+    rows_total INTEGER DEFAULT 0,
+    rows_committed INTEGER DEFAULT 0,
+    imported_count INTEGER DEFAULT 0,
+    updated_count INTEGER DEFAULT 0,
+    skipped_count INTEGER DEFAULT 0,
+    suppressed_count INTEGER DEFAULT 0,
+    error_count INTEGER DEFAULT 0,
+    last_error TEXT,
+    created_at TEXT DEFAULT (datetime('now')),
+    updated_at TEXT DEFAULT (datetime('now'))
+);
+
+-- Import Job Errors (rejected rows, written with each checkpoint)
+CREATE TABLE IF NOT EXISTS import_job_errors (
+    error_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    job_id INTEGER NOT NULL REFERENCES import_jobs(job_id) ON DELETE CASCADE,
+    row_number INTEGER NOT NULL,
+    error TEXT NOT NULL,
+    row_data TEXT
+);
+
 -- Indexes
 CREATE INDEX IF NOT EXISTS idx_contacts_email ON contacts(email);
 CREATE INDEX IF NOT EXISTS idx_contacts_list ON contacts(list_id);
@@ -174,8 +280,253 @@ CREATE INDEX IF NOT EXISTS idx_campaign_contacts_status ON campaign_contacts(sta
 CREATE INDEX IF NOT EXISTS idx_campaign_contacts_next ON campaign_contacts(next_email_scheduled_at);
 CREATE INDEX IF NOT EXISTS idx_email_queue_status ON email_queue(status);
 CREATE INDEX IF NOT EXISTS idx_email_queue_scheduled ON email_queue(scheduled_at);
+CREATE INDEX IF NOT EXISTS idx_email_queue_contact ON email_queue(contact_id, status);
+CREATE INDEX IF NOT EXISTS idx_email_queue_step ON email_queue(step_id, status);
+CREATE INDEX IF NOT EXISTS idx_rendered_messages_content ON rendered_messages(content_hash);
 CREATE INDEX IF NOT EXISTS idx_suppression_email ON suppression_list(email);
 
+-- Keyset pagination indexes (sort key + unique tie-breaker)
+CREATE INDEX IF NOT EXISTS idx_contacts_list_name ON contacts(list_id, last_name, first_name, contact_id);
+CREATE INDEX IF NOT EXISTS idx_contacts_name ON contacts(last_name, first_name, contact_id);
+CREATE INDEX IF NOT EXISTS idx_campaign_contacts_campaign_status ON campaign_contacts(campaign_id, status);
+CREATE INDEX IF NOT EXISTS idx_email_logs_sent ON email_logs(sent_at, log_id);
+CREATE INDEX IF NOT EXISTS idx_email_logs_campaign_sent ON email_logs(campaign_id, sent_at, log_id);
+CREATE INDEX IF NOT EXISTS idx_daily_send_stats_day ON daily_send_stats(day, status);
+CREATE INDEX IF NOT EXISTS idx_daily_contact_stats_day ON daily_contact_stats(day, status);
+CREATE INDEX IF NOT EXISTS idx_suppression_created ON suppression_list(created_at, email);
+CREATE INDEX IF NOT EXISTS idx_suppression_rules_domain ON suppression_rules(reversed_domain);
+CREATE INDEX IF NOT EXISTS idx_import_jobs_status ON import_jobs(status);
+CREATE INDEX IF NOT EXISTS idx_import_job_errors_job ON import_job_errors(job_id, row_number);
+
+-- Indexes on columns added after the first release
+CREATE INDEX IF NOT EXISTS idx_contacts_identity ON contacts(identity_id);
+CREATE INDEX IF NOT EXISTS idx_suppression_email_key ON suppression_list(email_key);
+CREATE INDEX IF NOT EXISTS idx_attachments_content ON attachments(content_hash);
+
+-- Keep contact_lists.contact_count in step with the contacts table
+CREATE TRIGGER IF NOT EXISTS contacts_count_ai AFTER INSERT ON contacts BEGIN
+    UPDATE contact_lists SET contact_count = contact_count + 1 WHERE list_id = new.list_id;
+END;
+
+CREATE TRIGGER IF NOT EXISTS contacts_count_ad AFTER DELETE ON contacts BEGIN
+    UPDATE contact_lists SET contact_count = contact_count - 1 WHERE list_id = old.list_id;
+END;
+
+CREATE TRIGGER IF NOT EXISTS contacts_count_au AFTER UPDATE OF list_id ON contacts
+WHEN old.list_id IS NOT new.list_id BEGIN
+    UPDATE contact_lists SET contact_count = contact_count - 1 WHERE list_id = old.list_id;
+    UPDATE contact_lists SET contact_count = contact_count + 1 WHERE list_id = new.list_id;
+END;
+
+-- Log every identity key added to or removed from suppression_list, and every rule change
+CREATE TRIGGER IF NOT EXISTS suppression_changes_ai AFTER INSERT ON suppression_list BEGIN
+    INSERT INTO suppression_changes (email_key) VALUES (new.email_key);
+END;
+
+CREATE TRIGGER IF NOT EXISTS suppression_changes_ad AFTER DELETE ON suppression_list BEGIN
+    INSERT INTO suppression_changes (email_key) VALUES (old.email_key);
+END;
+
+CREATE TRIGGER IF NOT EXISTS suppression_changes_au AFTER UPDATE OF email_key ON suppression_list
+WHEN old.email_key IS NOT new.email_key BEGIN
+    INSERT INTO suppression_changes (email_key) VALUES (old.email_key), (new.email_key);
+END;
+
+CREATE TRIGGER IF NOT EXISTS suppression_rules_changes_ai AFTER INSERT ON suppression_rules BEGIN
+    INSERT INTO suppression_changes (rule_id) VALUES (new.rule_id);
+END;
+
+CREATE TRIGGER IF NOT EXISTS suppression_rules_changes_ad AFTER DELETE ON suppression_rules BEGIN
+    INSERT INTO suppression_changes (rule_id) VALUES (old.rule_id);
+END;
+
+-- Drop pre-rendered messages of pending emails whose step, contact or campaign changed
+CREATE TRIGGER IF NOT EXISTS rendered_messages_step_au
+AFTER UPDATE OF subject_template, body_template ON email_steps BEGIN
+    DELETE FROM rendered_messages WHERE queue_id IN (
+        SELECT queue_id FROM email_queue WHERE step_id = new.step_id AND status = 'Pending'
+    );
+END;
+
+CREATE TRIGGER IF NOT EXISTS rendered_messages_contact_au
+AFTER UPDATE OF title, first_name, last_name, email, company, position, phone,
+    custom1, custom2, custom3, custom4, custom5, custom6, custom7, custom8, custom9, custom10
+ON contacts BEGIN
+    DELETE FROM rendered_messages WHERE queue_id IN (
+        SELECT queue_id FROM email_queue WHERE contact_id = new.contact_id AND status = 'Pending'
+    );
+END;
+
+CREATE TRIGGER IF NOT EXISTS rendered_messages_campaign_au
+AFTER UPDATE OF campaign_ref ON campaigns BEGIN
+    DELETE FROM rendered_messages WHERE queue_id IN (
+        SELECT queue_id FROM email_queue WHERE campaign_id = new.campaign_id AND status = 'Pending'
+    );
+END;
+
+-- Count the attachments referring to each blob
+CREATE TRIGGER IF NOT EXISTS attachment_blobs_ref_ai AFTER INSERT ON attachments
+WHEN new.content_hash IS NOT NULL BEGIN
+    UPDATE attachment_blobs SET ref_count = ref_count + 1 WHERE content_hash = new.content_hash;
+END;
+
+CREATE TRIGGER IF NOT EXISTS attachment_blobs_ref_ad AFTER DELETE ON attachments
+WHEN old.content_hash IS NOT NULL BEGIN
+    UPDATE attachment_blobs SET ref_count = ref_count - 1 WHERE content_hash = old.content_hash;
+END;
+
+CREATE TRIGGER IF NOT EXISTS attachment_blobs_ref_au AFTER UPDATE OF content_hash ON attachments
+WHEN old.content_hash IS NOT new.content_hash BEGIN
+    UPDATE attachment_blobs SET ref_count = ref_count - 1 WHERE content_hash = old.content_hash;
+    UPDATE attachment_blobs SET ref_count = ref_count + 1 WHERE content_hash = new.content_hash;
+END;
+
+-- Roll email_logs and campaign contact outcomes up by day
+DROP TRIGGER IF EXISTS daily_send_stats_ai;
+DROP TRIGGER IF EXISTS daily_send_stats_ad;
+DROP TRIGGER IF EXISTS daily_send_stats_au;
+DROP TRIGGER IF EXISTS daily_contact_stats_ai;
+DROP TRIGGER IF EXISTS daily_contact_stats_ad;
+DROP TRIGGER IF EXISTS daily_contact_stats_au;
+
+CREATE TRIGGER daily_send_stats_ai AFTER INSERT ON email_logs BEGIN
+    INSERT INTO daily_send_stats (day, campaign_id, step_id, status, count)
+    VALUES (COALESCE(date(new.sent_at), ''), COALESCE(new.campaign_id, 0), COALESCE(new.step_id, 0), new.status, 1)
+    ON CONFLICT (campaign_id, day, step_id, status) DO UPDATE SET count = count + 1;
+END;
+
+CREATE TRIGGER daily_send_stats_ad AFTER DELETE ON email_logs BEGIN
+    UPDATE daily_send_stats SET count = count - 1
+    WHERE campaign_id = COALESCE(old.campaign_id, 0) AND day = COALESCE(date(old.sent_at), '')
+      AND step_id = COALESCE(old.step_id, 0) AND status = old.status;
+    DELETE FROM daily_send_stats
+    WHERE campaign_id = COALESCE(old.campaign_id, 0) AND day = COALESCE(date(old.sent_at), '')
+      AND step_id = COALESCE(old.step_id, 0) AND status = old.status AND count <= 0;
+END;
+
+CREATE TRIGGER daily_send_stats_au
+AFTER UPDATE OF campaign_id, step_id, sent_at, status ON email_logs BEGIN
+    UPDATE daily_send_stats SET count = count - 1
+    WHERE campaign_id = COALESCE(old.campaign_id, 0) AND day = COALESCE(date(old.sent_at), '')
+      AND step_id = COALESCE(old.step_id, 0) AND status = old.status;
+    DELETE FROM daily_send_stats
+    WHERE campaign_id = COALESCE(old.campaign_id, 0) AND day = COALESCE(date(old.sent_at), '')
+      AND step_id = COALESCE(old.step_id, 0) AND status = old.status AND count <= 0;
+    INSERT INTO daily_send_stats (day, campaign_id, step_id, status, count)
+    VALUES (COALESCE(date(new.sent_at), ''), COALESCE(new.campaign_id, 0), COALESCE(new.step_id, 0), new.status, 1)
+    ON CONFLICT (campaign_id, day, step_id, status) DO UPDATE SET count = count + 1;
+END;
+
+CREATE TRIGGER daily_contact_stats_ai AFTER INSERT ON campaign_contacts
+WHEN new.status IN ('Responded', 'Unsubscribed') BEGIN
+    INSERT INTO daily_contact_stats (day, campaign_id, status, count)
+    VALUES (
+        COALESCE(date(CASE WHEN new.status = 'Responded'
+                           THEN COALESCE(new.responded_at, new.created_at)
+                           ELSE COALESCE(new.unsubscribed_at, new.created_at) END), ''),
+        new.campaign_id, new.status, 1
+    )
+    ON CONFLICT (campaign_id, day, status) DO UPDATE SET count = count + 1;
+END;
+
+CREATE TRIGGER daily_contact_stats_ad AFTER DELETE ON campaign_contacts
+WHEN old.status IN ('Responded', 'Unsubscribed') BEGIN
+    UPDATE daily_contact_stats SET count = count - 1
+    WHERE campaign_id = old.campaign_id AND status = old.status
+      AND day = COALESCE(date(CASE WHEN old.status = 'Responded'
+                                   THEN COALESCE(old.responded_at, old.created_at)
+                                   ELSE COALESCE(old.unsubscribed_at, old.created_at) END), '');
+    DELETE FROM daily_contact_stats
+    WHERE campaign_id = old.campaign_id AND status = old.status
+      AND day = COALESCE(date(CASE WHEN old.status = 'Responded'
+                                   THEN COALESCE(old.responded_at, old.created_at)
+                                   ELSE COALESCE(old.unsubscribed_at, old.created_at) END), '')
+      AND count <= 0;
+END;
+
+CREATE TRIGGER daily_contact_stats_au
+AFTER UPDATE OF campaign_id, status, responded_at, unsubscribed_at ON campaign_contacts
+WHEN old.status IN ('Responded', 'Unsubscribed') OR new.status IN ('Responded', 'Unsubscribed') BEGIN
+    UPDATE daily_contact_stats SET count = count - 1
+    WHERE campaign_id = old.campaign_id AND status = old.status
+      AND day = COALESCE(date(CASE WHEN old.status = 'Responded'
+                                   THEN COALESCE(old.responded_at, old.created_at)
+                                   ELSE COALESCE(old.unsubscribed_at, old.created_at) END), '');
+    DELETE FROM daily_contact_stats
+    WHERE campaign_id = old.campaign_id AND status = old.status
+      AND day = COALESCE(date(CASE WHEN old.status = 'Responded'
+                                   THEN COALESCE(old.responded_at, old.created_at)
+                                   ELSE COALESCE(old.unsubscribed_at, old.created_at) END), '')
+      AND count <= 0;
+    INSERT INTO daily_contact_stats (day, campaign_id, status, count)
+    SELECT COALESCE(date(CASE WHEN new.status = 'Responded'
+                              THEN COALESCE(new.responded_at, new.created_at)
+                              ELSE COALESCE(new.unsubscribed_at, new.created_at) END), ''),
+           new.campaign_id, new.status, 1
+    WHERE new.status IN ('Responded', 'Unsubscribed')
+    ON CONFLICT (campaign_id, day, status) DO UPDATE SET count = count + 1;
+END;
+
+-- Full-text search over contacts (requires SQLite built with FTS5)
+CREATE VIRTUAL TABLE IF NOT EXISTS contacts_fts USING fts5(
+    first_name, last_name, email, company, position,
+    custom1, custom2, custom3, custom4, custom5,
+    custom6, custom7, custom8, custom9, custom10,
+    content='contacts',
+    content_rowid='contact_id',
+    tokenize='unicode61 remove_diacritics 2',
+    prefix='2 3'
+);
+
+CREATE TRIGGER IF NOT EXISTS contacts_fts_ai AFTER INSERT ON contacts BEGIN
+    INSERT INTO contacts_fts (
+        rowid, first_name, last_name, email, company, position,
+        custom1, custom2, custom3, custom4, custom5,
+        custom6, custom7, custom8, custom9, custom10
+    ) VALUES (
+        new.contact_id, new.first_name, new.last_name, new.email, new.company, new.position,
+        new.custom1, new.custom2, new.custom3, new.custom4, new.custom5,
+        new.custom6, new.custom7, new.custom8, new.custom9, new.custom10
+    );
+END;
+
+CREATE TRIGGER IF NOT EXISTS contacts_fts_ad AFTER DELETE ON contacts BEGIN
+    INSERT INTO contacts_fts (
+        contacts_fts, rowid, first_name, last_name, email, company, position,
+        custom1, custom2, custom3, custom4, custom5,
+        custom6, custom7, custom8, custom9, custom10
+    ) VALUES (
+        'delete', old.contact_id, old.first_name, old.last_name, old.email, old.company, old.position,
+        old.custom1, old.custom2, old.custom3, old.custom4, old.custom5,
+        old.custom6, old.custom7, old.custom8, old.custom9, old.custom10
+    );
+END;
+
+CREATE TRIGGER IF NOT EXISTS contacts_fts_au AFTER UPDATE OF
+    first_name, last_name, email, company, position,
+    custom1, custom2, custom3, custom4, custom5,
+    custom6, custom7, custom8, custom9, custom10
+ON contacts BEGIN
+    INSERT INTO contacts_fts (
+        contacts_fts, rowid, first_name, last_name, email, company, position,
+        custom1, custom2, custom3, custom4, custom5,
+        custom6, custom7, custom8, custom9, custom10
+    ) VALUES (
+        'delete', old.contact_id, old.first_name, old.last_name, old.email, old.company, old.position,
+        old.custom1, old.custom2, old.custom3, old.custom4, old.custom5,
+        old.custom6, old.custom7, old.custom8, old.custom9, old.custom10
+    );
+    INSERT INTO contacts_fts (
+        rowid, first_name, last_name, email, company, position,
+        custom1, custom2, custom3, custom4, custom5,
+        custom6, custom7, custom8, custom9, custom10
+    ) VALUES (
+        new.contact_id, new.first_name, new.last_name, new.email, new.company, new.position,
+        new.custom1, new.custom2, new.custom3, new.custom4, new.custom5,
+        new.custom6, new.custom7, new.custom8, new.custom9, new.custom10
+    );
+END;
+
 -- Initial Settings
 INSERT OR IGNORE INTO settings (key, value) VALUES
     ('app_version', '1.0.0'),
@@ -183,4 +534,6 @@ INSERT OR IGNORE INTO settings (key, value) VALUES
     ('outlook_scan_interval_seconds', '60'),
     ('unsubscribe_keywords_en', 'UNSUBSCRIBE,STOP,REMOVE,OPT OUT,OPT-OUT'),
     ('unsubscribe_keywords_fr', 'DÉSINSCRIRE,DÉSINSCRIPTION,STOP,ARRÊTER,SUPPRIMER'),
-    ('scan_folders', 'Inbox,Unsubscribe');
+    ('scan_folders', 'Inbox,Unsubscribe'),
+    ('email_fold_plus_addressing', '0'),
+    ('prerender_messages', '1');
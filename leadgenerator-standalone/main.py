@@ -15,6 +15,8 @@ PROJECT_ROOT = Path(__file__).parent
 sys.path.insert(0, str(PROJECT_ROOT))
 
 from core.database import init_database, Database
+from core.suppression_index import get_suppression_index
+from services.template_service import TemplateService
 
 
 def setup_logging() -> None:
@@ -70,6 +72,12 @@ def main() -> None:
     init_database(db_path)
     logger.info(f"Database initialized at {db_path}")
 
+    # Suppression checks on the send and import paths are answered from memory
+    get_suppression_index().load()
+
+    # Attachments added before the blob store existed share its storage too
+    TemplateService().relink_legacy_attachments()
+
     # Import UI after database is ready
     try:
         from ui.app import MainApplication
@@ -5,26 +5,47 @@ import logging
 import shutil
 from datetime import datetime
 from pathlib import Path
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Callable
 
+from core.blob_store import link_or_copy
 from core.database import get_db, get_setting
+from core.exceptions import JobCancelledError
 
 logger = logging.getLogger(__name__)
 
+# Tables exported by export_to_json(), in order (used for progress reporting)
+EXPORT_TABLES = [
+    'contact_lists', 'contacts', 'campaigns', 'email_steps', 'attachments',
+    'campaign_contacts', 'email_logs', 'suppression_list'
+]
 
-def export_to_json(output_path: str, campaign_ids: Optional[List[int]] = None) -> str:
+
+def export_to_json(
+    output_path: str,
+    campaign_ids: Optional[List[int]] = None,
+    progress_callback: Optional[Callable[[int, int, str], None]] = None,
+    should_cancel: Optional[Callable[[], bool]] = None
+) -> str:
     """
     Export data to JSON file for migration.
 
     Args:
         output_path: Path for output JSON file
         campaign_ids: Optional list of campaign IDs to export (None = all)
+        progress_callback: Called with (tables_done, total_tables, table_name)
+        should_cancel: Polled after each table; return True to abort before writing
 
     Returns:
         Path to the exported file
     """
     db = get_db()
 
+    def table_done(table: str) -> None:
+        if should_cancel and should_cancel():
+            raise JobCancelledError("Migration export cancelled")
+        if progress_callback:
+            progress_callback(EXPORT_TABLES.index(table) + 1, len(EXPORT_TABLES), table)
+
     export_data = {
         "export_version": "1.0",
         "exported_at": datetime.now().isoformat(),
@@ -50,6 +71,7 @@ def export_to_json(output_path: str, campaign_ids: Optional[List[int]] = None) -
         lists = [dict(row) for row in db.fetchall("SELECT * FROM contact_lists")]
 
     export_data["data"]["contact_lists"] = lists
+    table_done('contact_lists')
 
     # Export contacts
     if campaign_ids:
@@ -61,6 +83,7 @@ def export_to_json(output_path: str, campaign_ids: Optional[List[int]] = None) -
         contacts = [dict(row) for row in db.fetchall("SELECT * FROM contacts")]
 
     export_data["data"]["contacts"] = contacts
+    table_done('contacts')
 
     # Export campaigns
     if campaign_ids:
@@ -72,6 +95,7 @@ def export_to_json(output_path: str, campaign_ids: Optional[List[int]] = None) -
         campaigns = [dict(row) for row in db.fetchall("SELECT * FROM campaigns")]
 
     export_data["data"]["campaigns"] = campaigns
+    table_done('campaigns')
 
     # Get campaign IDs for related data
     if campaign_ids:
@@ -86,6 +110,7 @@ def export_to_json(output_path: str, campaign_ids: Optional[List[int]] = None) -
         steps.extend([dict(row) for row in rows])
 
     export_data["data"]["email_steps"] = steps
+    table_done('email_steps')
 
     # Export attachments
     step_ids = [s['step_id'] for s in steps]
@@ -95,6 +120,7 @@ def export_to_json(output_path: str, campaign_ids: Optional[List[int]] = None) -
         attachments.extend([dict(row) for row in rows])
 
     export_data["data"]["attachments"] = attachments
+    table_done('attachments')
 
     # Export campaign contacts
     campaign_contacts = []
@@ -103,6 +129,7 @@ def export_to_json(output_path: str, campaign_ids: Optional[List[int]] = None) -
         campaign_contacts.extend([dict(row) for row in rows])
 
     export_data["data"]["campaign_contacts"] = campaign_contacts
+    table_done('campaign_contacts')
 
     # Export email logs
     email_logs = []
@@ -111,10 +138,12 @@ def export_to_json(output_path: str, campaign_ids: Optional[List[int]] = None) -
         email_logs.extend([dict(row) for row in rows])
 
     export_data["data"]["email_logs"] = email_logs
+    table_done('email_logs')
 
     # Export suppression list (always export all)
     suppression_list = [dict(row) for row in db.fetchall("SELECT * FROM suppression_list")]
     export_data["data"]["suppression_list"] = suppression_list
+    table_done('suppression_list')
 
     # Write JSON file
     with open(output_path, 'w', encoding='utf-8') as f:
@@ -135,6 +164,9 @@ def copy_attachment_files(output_folder: str, attachments_path: str = "data/file
     """
     Copy attachment files to output folder.
 
+    Step files that are links to the same stored blob are copied once and
+    linked to that copy in the output folder; the blob store itself is skipped.
+
     Args:
         output_folder: Destination folder
         attachments_path: Source attachments folder
@@ -147,14 +179,25 @@ def copy_attachment_files(output_folder: str, attachments_path: str = "data/file
     dest.mkdir(parents=True, exist_ok=True)
 
     count = 0
+    linked = 0
+    copies: Dict[tuple, Path] = {}  # (device, inode) of a source file -> its copy
     if source.exists():
         for file in source.rglob('*'):
-            if file.is_file():
-                rel_path = file.relative_to(source)
-                dest_file = dest / rel_path
-                dest_file.parent.mkdir(parents=True, exist_ok=True)
+            rel_path = file.relative_to(source)
+            if rel_path.parts[0] == '.blobs' or not file.is_file():
+                continue
+
+            dest_file = dest / rel_path
+            dest_file.parent.mkdir(parents=True, exist_ok=True)
+            stat = file.stat()
+            inode = (stat.st_dev, stat.st_ino)
+            if inode in copies:
+                link_or_copy(copies[inode], dest_file)
+                linked += 1
+            else:
                 shutil.copy2(file, dest_file)
+                copies[inode] = dest_file
                 count += 1
 
-    logger.info(f"Copied {count} attachment files to {output_folder}")
+    logger.info(f"Copied {count} attachment files to {output_folder} ({linked} duplicates linked)")
     return count
@@ -6,6 +6,7 @@ from datetime import datetime, timedelta
 from typing import Optional, List, Tuple
 
 from core.database import get_db
+from core.identity import email_key
 from core.models import Contact, OutlookEmail
 from outlook.outlook_service import OutlookService
 
@@ -85,15 +86,15 @@ class ReplyDetector:
         if not sender_email:
             return None
 
-        sender_email = sender_email.lower().strip()
-
-        # Query for matching contact
+        # Single indexed lookup on the sender's identity key
         query = """
-            SELECT * FROM contacts
-            WHERE email = ?
+            SELECT c.* FROM contact_identities ci
+            JOIN contacts c ON c.identity_id = ci.identity_id
+            WHERE ci.email_key = ?
+            ORDER BY c.contact_id DESC
             LIMIT 1
         """
-        row = self.db.fetchone(query, (sender_email,))
+        row = self.db.fetchone(query, (email_key(sender_email),))
 
         if row:
             return Contact(
@@ -6,6 +6,7 @@ from datetime import datetime, timedelta
 from typing import Optional, List, Tuple
 
 from core.database import get_db, get_setting
+from core.identity import normalize_email
 from core.models import OutlookEmail
 from services.suppression_service import SuppressionService
 from outlook.outlook_service import OutlookService
@@ -134,7 +135,7 @@ class UnsubscribeDetector:
         if not email_address:
             return None
 
-        email_address = email_address.lower().strip()
+        email_address = normalize_email(email_address)
 
         # Check if already suppressed
         if self.suppression_service.is_suppressed(email_address):
@@ -2,18 +2,24 @@
 
 from .contact_service import ContactService
 from .csv_service import CSVService
+from .import_job_service import ImportJobService
 from .campaign_service import CampaignService
 from .template_service import TemplateService
 from .email_service import EmailService
+from .message_render_service import MessageRenderService
 from .suppression_service import SuppressionService
 from .report_service import ReportService
+from .analytics_service import AnalyticsService
 
 __all__ = [
     'ContactService',
     'CSVService',
+    'ImportJobService',
     'CampaignService',
     'TemplateService',
     'EmailService',
+    'MessageRenderService',
     'SuppressionService',
     'ReportService',
+    'AnalyticsService',
 ]
@@ -0,0 +1,270 @@
+"""Send and reply timing analytics for Lead Generator Standalone."""
+
+import itertools
+import logging
+import threading
+import time
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from core.database import Database, get_db
+from core.models import CampaignAnalytics
+
+logger = logging.getLogger(__name__)
+
+# Reply latency percentiles reported
+LATENCY_PERCENTILES = (25, 50, 75, 90, 95)
+
+# Reply latency histogram bucket edges, in hours
+LATENCY_BUCKETS = (0, 1, 4, 12, 24, 48, 72, 168, np.inf)
+
+# Rows fetched from SQLite per batch when loading columns
+ANALYTICS_BATCH_SIZE = 50000
+
+HOURS_PER_WEEK = 7 * 24
+
+# Sent emails of a campaign: contact, step, send time (epoch seconds), log ID
+# (ordered by log ID in NumPy, cheaper than sorting in SQLite)
+SENDS_QUERY = """
+    SELECT COALESCE(contact_id, 0), COALESCE(step_id, 0), CAST(strftime('%s', sent_at) AS INTEGER), log_id
+    FROM email_logs
+    WHERE campaign_id = ? AND status = 'Sent' AND strftime('%s', sent_at) IS NOT NULL
+"""
+
+# Responded contacts of a campaign: contact, response time (epoch seconds)
+REPLIES_QUERY = """
+    SELECT contact_id, CAST(strftime('%s', responded_at) AS INTEGER)
+    FROM campaign_contacts
+    WHERE campaign_id = ? AND status = 'Responded' AND strftime('%s', responded_at) IS NOT NULL
+"""
+
+# Cheap fingerprint of everything the analytics depend on, read from the
+# daily rollups and the campaign's steps
+SIGNATURE_QUERY = """
+    SELECT
+        (SELECT COALESCE(SUM(count), 0) FROM daily_send_stats
+         WHERE campaign_id = :campaign_id AND status = 'Sent'),
+        (SELECT COALESCE(group_concat(day || ':' || count), '') FROM (
+            SELECT day, count FROM daily_contact_stats
+            WHERE campaign_id = :campaign_id AND status = 'Responded'
+            ORDER BY day
+         )),
+        (SELECT MAX(updated_at) || ':' || COUNT(*) FROM email_steps WHERE campaign_id = :campaign_id)
+"""
+
+# Analytics by campaign: (signature, utc_offset_hours, result), for _analytics_cache_db
+_analytics_cache: Dict[int, Tuple[tuple, float, CampaignAnalytics]] = {}
+_analytics_cache_db: Optional[Database] = None
+_analytics_cache_lock = threading.Lock()
+
+
+def local_utc_offset_hours() -> float:
+    """Return the current local UTC offset in hours."""
+    return time.localtime().tm_gmtoff / 3600
+
+
+def hour_of_week(epoch_seconds: np.ndarray, utc_offset_hours: float) -> np.ndarray:
+    """Map epoch seconds to 0..167 (Monday 00:00 is 0) in the given UTC offset."""
+    local = epoch_seconds + int(round(utc_offset_hours * 3600))
+    days = local // 86400
+    weekday = (days + 3) % 7  # 1970-01-01 was a Thursday
+    return weekday * 24 + (local // 3600) % 24
+
+
+def heatmap(epoch_seconds: np.ndarray, utc_offset_hours: float) -> np.ndarray:
+    """Count timestamps per weekday (rows, Monday first) and hour (columns)."""
+    counts = np.bincount(hour_of_week(epoch_seconds, utc_offset_hours), minlength=HOURS_PER_WEEK)
+    return counts.reshape(7, 24)
+
+
+def attribute_replies(
+    send_contacts: np.ndarray,
+    send_times: np.ndarray,
+    reply_contacts: np.ndarray,
+    reply_times: np.ndarray
+) -> np.ndarray:
+    """
+    Find the last send to the same contact at or before each reply.
+
+    Sends and replies are keyed by (contact, time) as one int64, so a single
+    sort and searchsorted pass attributes every reply.
+
+    Returns:
+        Index into the send arrays per reply, -1 where no send precedes it
+    """
+    if not len(reply_contacts) or not len(send_contacts):
+        return np.full(len(reply_contacts), -1, dtype=np.int64)
+
+    _, ranks = np.unique(np.concatenate([send_contacts, reply_contacts]), return_inverse=True)
+    send_ranks, reply_ranks = ranks[:len(send_contacts)], ranks[len(send_contacts):]
+    start = min(send_times.min(), reply_times.min())
+    span = max(send_times.max(), reply_times.max()) - start + 1
+
+    send_keys = send_ranks * span + (send_times - start)
+    reply_keys = reply_ranks * span + (reply_times - start)
+    # Stable, so among equal keys the last logged send comes last
+    order = np.argsort(send_keys, kind='stable')
+    positions = np.searchsorted(send_keys[order], reply_keys, side='right') - 1
+
+    matched = positions >= 0
+    indexes = np.where(matched, order[np.maximum(positions, 0)], -1)
+    matched &= send_ranks[np.maximum(indexes, 0)] == reply_ranks
+    return np.where(matched, indexes, -1)
+
+
+class AnalyticsService:
+    """
+    Service for campaign timing analytics: when emails go out, when replies
+    come in and how long after which step.
+
+    The campaign's sends and responses are read once into NumPy arrays and
+    every figure is computed from them without per-row Python loops. Results
+    are cached per campaign and reused until the daily rollups or the steps
+    of the campaign change.
+    """
+
+    def __init__(self):
+        self.db = get_db()
+
+    def get_campaign_analytics(
+        self,
+        campaign_id: int,
+        utc_offset_hours: Optional[float] = None
+    ) -> CampaignAnalytics:
+        """
+        Get the timing analytics of a campaign.
+
+        Args:
+            campaign_id: Campaign to analyse
+            utc_offset_hours: Offset of the heatmap hours from UTC (default: local time,
+                the time sending windows are set in)
+        """
+        global _analytics_cache_db
+        if utc_offset_hours is None:
+            utc_offset_hours = local_utc_offset_hours()
+        signature = tuple(self.db.fetchone(SIGNATURE_QUERY, {'campaign_id': campaign_id}))
+
+        with _analytics_cache_lock:
+            if _analytics_cache_db is not self.db:
+                _analytics_cache.clear()
+                _analytics_cache_db = self.db
+            cached = _analytics_cache.get(campaign_id)
+        if cached and cached[0] == signature and cached[1] == utc_offset_hours:
+            return cached[2]
+
+        analytics = self._compute(campaign_id, utc_offset_hours)
+        with _analytics_cache_lock:
+            if _analytics_cache_db is self.db:
+                _analytics_cache[campaign_id] = (signature, utc_offset_hours, analytics)
+        return analytics
+
+    def _compute(self, campaign_id: int, utc_offset_hours: float) -> CampaignAnalytics:
+        """Load the campaign's columns and compute every figure."""
+        sends = self._load_columns(SENDS_QUERY, campaign_id, 4)
+        sends = sends[np.argsort(sends[:, 3], kind='stable')]
+        replies = self._load_columns(REPLIES_QUERY, campaign_id, 2)
+        send_contacts, send_steps, send_times = sends[:, 0], sends[:, 1], sends[:, 2]
+        reply_contacts, reply_times = replies[:, 0], replies[:, 1]
+
+        attributed = attribute_replies(send_contacts, send_times, reply_contacts, reply_times)
+        matched = attributed >= 0
+        latency_hours = (reply_times[matched] - send_times[attributed[matched]]) / 3600
+        reply_steps = send_steps[attributed[matched]]
+
+        analytics = CampaignAnalytics(
+            campaign_id=campaign_id,
+            sends=len(send_times),
+            replies=len(reply_times),
+            send_heatmap=heatmap(send_times, utc_offset_hours),
+            reply_heatmap=heatmap(reply_times, utc_offset_hours),
+            latency_percentiles=self._percentiles(latency_hours),
+            latency_histogram=self._histogram(latency_hours),
+            step_funnel=self._step_funnel(campaign_id, send_contacts, send_steps, reply_steps, latency_hours),
+            computed_at=datetime.now().isoformat()
+        )
+        logger.debug(f"Computed analytics for campaign {campaign_id}: {analytics.sends} sends")
+        return analytics
+
+    def _load_columns(self, query: str, campaign_id: int, width: int) -> np.ndarray:
+        """Read an all-integer query into an (n, width) int64 array."""
+        batches = [
+            np.fromiter(itertools.chain.from_iterable(rows), dtype=np.int64, count=len(rows) * width)
+            for rows in self.db.iter_batches(query, (campaign_id,), ANALYTICS_BATCH_SIZE, raw=True)
+        ]
+        if not batches:
+            return np.empty((0, width), dtype=np.int64)
+        return np.concatenate(batches).reshape(-1, width)
+
+    def _percentiles(self, latency_hours: np.ndarray) -> Dict[int, float]:
+        """Get reply latency percentiles in hours."""
+        if not len(latency_hours):
+            return {}
+        values = np.percentile(latency_hours, LATENCY_PERCENTILES)
+        return {p: round(float(v), 1) for p, v in zip(LATENCY_PERCENTILES, values)}
+
+    def _histogram(self, latency_hours: np.ndarray) -> List[Dict[str, Any]]:
+        """Count replies per latency bucket."""
+        counts, _ = np.histogram(latency_hours, bins=LATENCY_BUCKETS)
+        return [
+            {'from_hours': LATENCY_BUCKETS[i], 'to_hours': LATENCY_BUCKETS[i + 1], 'replies': int(count)}
+            for i, count in enumerate(counts)
+        ]
+
+    def _step_funnel(
+        self,
+        campaign_id: int,
+        send_contacts: np.ndarray,
+        send_steps: np.ndarray,
+        reply_steps: np.ndarray,
+        latency_hours: np.ndarray
+    ) -> List[Dict[str, Any]]:
+        """Get contacts reached, replies and reply latency per step, in step order."""
+        steps = self.db.fetchall("""
+            SELECT step_id, step_number, subject_template FROM email_steps
+            WHERE campaign_id = ?
+            ORDER BY step_number
+        """, (campaign_id,))
+        step_ids = np.array([row['step_id'] for row in steps], dtype=np.int64)
+        if not len(step_ids):
+            return []
+
+        # Distinct (step, contact) pairs as one int64 key, then counts per step position
+        contact_span = int(send_contacts.max()) + 1 if len(send_contacts) else 1
+        pair_keys = np.unique(send_steps * contact_span + send_contacts)
+        order = np.argsort(step_ids)
+        reached = self._count_by_step(pair_keys // contact_span, step_ids, order)
+        replied = self._count_by_step(reply_steps, step_ids, order)
+        first_reached = reached[0] if reached[0] else None
+
+        funnel = []
+        for i, row in enumerate(steps):
+            step_latency = latency_hours[reply_steps == step_ids[i]]
+            funnel.append({
+                'step_id': row['step_id'],
+                'step_number': row['step_number'],
+                'subject_template': row['subject_template'],
+                'reached': int(reached[i]),
+                'replies': int(replied[i]),
+                'reply_rate': round(replied[i] / reached[i] * 100, 1) if reached[i] else 0.0,
+                'reach_rate': round(reached[i] / first_reached * 100, 1) if first_reached else 0.0,
+                'median_reply_hours': round(float(np.median(step_latency)), 1) if len(step_latency) else None,
+            })
+        return funnel
+
+    def _count_by_step(self, values: np.ndarray, step_ids: np.ndarray, order: np.ndarray) -> np.ndarray:
+        """Count occurrences of each step ID in values, aligned with step_ids."""
+        sorted_ids = step_ids[order]
+        positions = np.searchsorted(sorted_ids, values)
+        known = (positions < len(sorted_ids)) & (sorted_ids[np.minimum(positions, len(sorted_ids) - 1)] == values)
+        counts_sorted = np.bincount(positions[known], minlength=len(sorted_ids))
+        counts = np.empty_like(counts_sorted)
+        counts[order] = counts_sorted
+        return counts
+
+
+def invalidate_analytics_cache() -> None:
+    """Forget every cached campaign analytics result."""
+    with _analytics_cache_lock:
+        _analytics_cache.clear()
@@ -5,8 +5,12 @@ from datetime import datetime, timedelta
 from typing import List, Optional, Dict, Any
 
 from core.database import get_db, generate_campaign_ref
+from core.suppression_index import get_suppression_index
 from core.models import Campaign, EmailStep, CampaignContact, CampaignStatus, ContactStatus
-from core.exceptions import ValidationError, CampaignError
+from core.pagination import Page, decode_cursor, keyset_condition, build_page
+from core.exceptions import ValidationError, CampaignError, DatabaseError
+from services.message_render_service import MessageRenderService
+from services.template_service import TemplateService
 
 logger = logging.getLogger(__name__)
 
@@ -158,7 +162,11 @@ class CampaignService:
         if campaign.status == CampaignStatus.ACTIVE.value:
             raise CampaignError("Cannot delete an active campaign. Pause it first.")
 
+        template_service = TemplateService()
+        attachments = template_service.get_campaign_attachments(campaign_id)
+
         self.db.execute("DELETE FROM campaigns WHERE campaign_id = ?", (campaign_id,))
+        template_service.release_attachments([a for step in attachments.values() for a in step])
         logger.info(f"Deleted campaign {campaign_id}")
 
     def duplicate_campaign(self, campaign_id: int, new_name: Optional[str] = None) -> Campaign:
@@ -183,15 +191,17 @@ class CampaignService:
 
         new_campaign = self.create_campaign(new_data)
 
-        # Duplicate steps
+        # Duplicate steps, linking their attachment files rather than copying them
+        template_service = TemplateService()
         for step in campaign.steps:
-            self._create_step(
+            new_step_id = self._create_step(
                 new_campaign.campaign_id,
                 step.step_number,
                 step.subject_template,
                 step.body_template,
                 step.delay_days
             )
+            template_service.copy_attachments(step.step_id, new_step_id)
 
         logger.info(f"Duplicated campaign {campaign_id} to {new_campaign.campaign_id}")
         return self.get_campaign(new_campaign.campaign_id)
@@ -249,6 +259,14 @@ class CampaignService:
         """, (CampaignStatus.ACTIVE.value, campaign_id))
 
         logger.info(f"Activated campaign {campaign_id} with {len(valid_contacts)} contacts")
+
+        render_service = MessageRenderService()
+        if render_service.enabled:
+            try:
+                render_service.prerender_pending(campaign_id)
+            except DatabaseError as e:
+                logger.warning(f"Could not pre-render campaign {campaign_id}, emails will be rendered when sent: {e}")
+
         return self.get_campaign(campaign_id)
 
     def pause_campaign(self, campaign_id: int) -> Campaign:
@@ -351,10 +369,10 @@ class CampaignService:
                 stats[status] = row['count']
             stats['total_contacts'] += row['count']
 
-        # Email counts
+        # Email counts (from the daily rollup)
         email_query = """
-            SELECT status, COUNT(*) as count
-            FROM email_logs
+            SELECT status, SUM(count) as count
+            FROM daily_send_stats
             WHERE campaign_id = ?
             GROUP BY status
         """
@@ -399,6 +417,50 @@ class CampaignService:
 
         return [self._row_to_campaign_contact(row) for row in rows]
 
+    def get_campaign_contacts_page(
+        self,
+        campaign_id: int,
+        status_filter: Optional[str] = None,
+        limit: int = 100,
+        cursor: Optional[str] = None
+    ) -> Page[CampaignContact]:
+        """
+        Get one page of campaign contacts using keyset pagination.
+
+        Rows are ordered by (last_name, first_name, contact_id); pass the
+        returned page's next_cursor to fetch the following page. The campaign's
+        rows are read from its campaign_id index and joined to contacts by
+        primary key, so a page costs time in proportion to the campaign, not
+        to every contact in the database; SQLite keeps only the first
+        limit + 1 rows while sorting.
+        """
+        conditions = ["cc.campaign_id = ?"]
+        params: List[Any] = [campaign_id]
+
+        if status_filter:
+            conditions.append("cc.status = ?")
+            params.append(status_filter)
+
+        if cursor:
+            conditions.append(keyset_condition(['c.last_name', 'c.first_name', 'c.contact_id']))
+            params.extend(decode_cursor(cursor, 3))
+
+        query = f"""
+            SELECT cc.*, c.first_name, c.last_name, c.email, c.company
+            FROM campaign_contacts cc
+            CROSS JOIN contacts c ON c.contact_id = cc.contact_id
+            WHERE {' AND '.join(conditions)}
+            ORDER BY c.last_name, c.first_name, c.contact_id
+            LIMIT ?
+        """
+        params.append(limit + 1)
+
+        rows = self.db.fetchall(query, tuple(params))
+        return build_page(
+            rows, limit, self._row_to_campaign_contact,
+            lambda row: (row['last_name'], row['first_name'], row['contact_id'])
+        )
+
     def update_contact_status(
         self,
         campaign_id: int,
@@ -413,6 +475,10 @@ class CampaignService:
         if responded_at:
             updates.append("responded_at = ?")
             params.append(responded_at)
+        elif status == ContactStatus.RESPONDED.value:
+            updates.append("responded_at = COALESCE(responded_at, datetime('now'))")
+        if status == ContactStatus.UNSUBSCRIBED.value:
+            updates.append("unsubscribed_at = COALESCE(unsubscribed_at, datetime('now'))")
 
         params.extend([campaign_id, contact_id])
 
@@ -450,18 +516,26 @@ class CampaignService:
         return cursor.lastrowid
 
     def _get_valid_contacts(self, campaign_id: int) -> List[int]:
-        """Get contact IDs not in suppression list."""
+        """Get contact IDs not in suppression list nor matched by a suppression rule."""
         campaign = self.get_campaign(campaign_id)
         if not campaign or not campaign.contact_list_id:
             return []
 
         query = """
-            SELECT c.contact_id
+            SELECT c.contact_id, c.email
             FROM contacts c
             WHERE c.list_id = ?
-              AND c.email NOT IN (SELECT email FROM suppression_list)
+              AND NOT EXISTS (
+                  SELECT 1 FROM contact_identities ci
+                  JOIN suppression_list s ON s.email_key = ci.email_key
+                  WHERE ci.identity_id = c.identity_id
+              )
         """
         rows = self.db.fetchall(query, (campaign.contact_list_id,))
+
+        index = get_suppression_index()
+        if index.has_rules:  # Refreshes once for the whole list
+            return [row['contact_id'] for row in rows if not index.matches_rule(row['email'], refresh=False)]
         return [row['contact_id'] for row in rows]
 
     def _schedule_email(
@@ -527,6 +601,7 @@ class CampaignService:
             last_email_sent_at=row['last_email_sent_at'],
             next_email_scheduled_at=row['next_email_scheduled_at'],
             responded_at=row['responded_at'],
+            unsubscribed_at=row['unsubscribed_at'],
             created_at=row['created_at'],
             updated_at=row['updated_at']
         )
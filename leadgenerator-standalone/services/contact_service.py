@@ -1,15 +1,41 @@
 """Contact management service for Lead Generator Standalone."""
 
 import logging
+import re
 from datetime import datetime
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Iterator, Callable
 
 from core.database import get_db
-from core.models import Contact, ContactList
+from core.identity import normalize_email, email_key, is_valid_email
+from core.models import Contact, ContactList, UpsertOutcome, UpsertResult
+from core.pagination import Page, decode_cursor, keyset_condition, build_page
 from core.exceptions import ValidationError, DuplicateContactError, DatabaseError
 
 logger = logging.getLogger(__name__)
 
+# Words extracted from a search box entry (punctuation such as '@' and '.' splits words)
+SEARCH_TOKEN_PATTERN = re.compile(r'\w+', re.UNICODE)
+
+# BM25 weights, in contacts_fts column order: names and email rank above
+# company/position, which rank above custom fields
+SEARCH_COLUMN_WEIGHTS = ', '.join(
+    ['10.0', '10.0', '8.0', '5.0', '3.0'] + ['1.0'] * 10
+)
+
+# Contact columns written by bulk upserts, in INSERT order (after list_id)
+UPSERT_FIELDS = [
+    'title', 'first_name', 'last_name', 'email', 'company', 'position',
+    'phone', 'linkedin_url', 'source',
+    'custom1', 'custom2', 'custom3', 'custom4', 'custom5',
+    'custom6', 'custom7', 'custom8', 'custom9', 'custom10'
+]
+
+# NOT NULL columns that default to an empty string
+REQUIRED_TEXT_FIELDS = ('first_name', 'last_name', 'company')
+
+# Stay well below SQLite's bound-parameter limit for IN (...) lookups
+LOOKUP_BATCH_SIZE = 500
+
 
 class ContactService:
     """Service for managing contacts and contact lists."""
@@ -21,24 +47,12 @@ class ContactService:
 
     def get_all_lists(self) -> List[ContactList]:
         """Get all contact lists with contact counts."""
-        query = """
-            SELECT cl.*,
-                   (SELECT COUNT(*) FROM contacts c WHERE c.list_id = cl.list_id) as contact_count
-            FROM contact_lists cl
-            ORDER BY cl.name
-        """
-        rows = self.db.fetchall(query)
+        rows = self.db.fetchall("SELECT * FROM contact_lists ORDER BY name")
         return [self._row_to_contact_list(row) for row in rows]
 
     def get_list(self, list_id: int) -> Optional[ContactList]:
         """Get a contact list by ID."""
-        query = """
-            SELECT cl.*,
-                   (SELECT COUNT(*) FROM contacts c WHERE c.list_id = cl.list_id) as contact_count
-            FROM contact_lists cl
-            WHERE cl.list_id = ?
-        """
-        row = self.db.fetchone(query, (list_id,))
+        row = self.db.fetchone("SELECT * FROM contact_lists WHERE list_id = ?", (list_id,))
         if row:
             return self._row_to_contact_list(row)
         return None
@@ -135,6 +149,49 @@ class ContactService:
         rows = self.db.fetchall(query, (list_id, limit, offset))
         return [self._row_to_contact(row) for row in rows]
 
+    def get_contacts_page(
+        self,
+        list_id: int,
+        limit: int = 500,
+        cursor: Optional[str] = None
+    ) -> Page[Contact]:
+        """
+        Get one page of contacts in a list using keyset pagination.
+
+        Contacts are ordered by (last_name, first_name, contact_id). Pass the
+        returned page's next_cursor to fetch the following page.
+        """
+        conditions = ["list_id = ?"]
+        params: List[Any] = [list_id]
+
+        if cursor:
+            conditions.append(keyset_condition(['last_name', 'first_name', 'contact_id']))
+            params.extend(decode_cursor(cursor, 3))
+
+        query = f"""
+            SELECT * FROM contacts
+            WHERE {' AND '.join(conditions)}
+            ORDER BY last_name, first_name, contact_id
+            LIMIT ?
+        """
+        params.append(limit + 1)
+
+        rows = self.db.fetchall(query, tuple(params))
+        return build_page(
+            rows, limit, self._row_to_contact,
+            lambda row: (row['last_name'], row['first_name'], row['contact_id'])
+        )
+
+    def iter_contacts(self, list_id: int, page_size: int = 5000) -> Iterator[Contact]:
+        """Iterate over every contact in a list page by page."""
+        cursor = None
+        while True:
+            page = self.get_contacts_page(list_id, limit=page_size, cursor=cursor)
+            yield from page.items
+            if not page.has_more:
+                break
+            cursor = page.next_cursor
+
     def get_contact(self, contact_id: int) -> Optional[Contact]:
         """Get a contact by ID."""
         query = "SELECT * FROM contacts WHERE contact_id = ?"
@@ -146,14 +203,14 @@ class ContactService:
     def get_contact_by_email(self, list_id: int, email: str) -> Optional[Contact]:
         """Get a contact by email in a specific list."""
         query = "SELECT * FROM contacts WHERE list_id = ? AND email = ?"
-        row = self.db.fetchone(query, (list_id, email.lower()))
+        row = self.db.fetchone(query, (list_id, normalize_email(email)))
         if row:
             return self._row_to_contact(row)
         return None
 
     def create_contact(self, list_id: int, contact_data: Dict[str, Any]) -> Contact:
         """Create a new contact."""
-        email = contact_data.get('email', '').strip().lower()
+        email = normalize_email(contact_data.get('email'))
 
         if not email:
             raise ValidationError("Email is required")
@@ -162,13 +219,15 @@ class ContactService:
         if self.check_duplicate(list_id, email):
             raise DuplicateContactError(email, list_id)
 
+        identity_id = self.get_or_create_identity(email)
+
         query = """
             INSERT INTO contacts (
                 list_id, title, first_name, last_name, email, company, position,
                 phone, linkedin_url, source,
                 custom1, custom2, custom3, custom4, custom5,
-                custom6, custom7, custom8, custom9, custom10
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                custom6, custom7, custom8, custom9, custom10, identity_id
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
         """
         params = (
             list_id,
@@ -191,6 +250,7 @@ class ContactService:
             contact_data.get('custom8'),
             contact_data.get('custom9'),
             contact_data.get('custom10'),
+            identity_id,
         )
 
         cursor = self.db.execute(query, params)
@@ -206,13 +266,15 @@ class ContactService:
             raise ValidationError(f"Contact {contact_id} not found")
 
         # If email is being changed, check for duplicate
-        new_email = contact_data.get('email', '').strip().lower()
+        new_email = normalize_email(contact_data.get('email'))
+        updates = []
+        params = []
+
         if new_email and new_email != contact.email:
             if self.check_duplicate(contact.list_id, new_email):
                 raise DuplicateContactError(new_email, contact.list_id)
-
-        updates = []
-        params = []
+            updates.append("identity_id = ?")
+            params.append(self.get_or_create_identity(new_email))
 
         field_mapping = {
             'title': 'title', 'first_name': 'first_name', 'last_name': 'last_name',
@@ -228,7 +290,7 @@ class ContactService:
             if data_key in contact_data:
                 value = contact_data[data_key]
                 if data_key == 'email' and value:
-                    value = value.strip().lower()
+                    value = normalize_email(value)
                 updates.append(f"{db_field} = ?")
                 params.append(value)
 
@@ -247,37 +309,267 @@ class ContactService:
         self.db.execute("DELETE FROM contacts WHERE contact_id = ?", (contact_id,))
         logger.info(f"Deleted contact {contact_id}")
 
-    def search_contacts(self, list_id: int, query: str, limit: int = 100) -> List[Contact]:
-        """Search contacts by name, email, or company."""
+    def upsert_contacts(
+        self,
+        list_id: int,
+        rows: List[Dict[str, Any]],
+        on_conflict: str = 'skip',
+        before_commit: Optional[Callable[[Any, UpsertResult], None]] = None
+    ) -> UpsertResult:
+        """
+        Insert many contacts into a list in a single transaction.
+
+        Rows whose email already exists in the list (or earlier in the batch)
+        are skipped when on_conflict is 'skip', or merged when it is 'update';
+        an update keeps the stored value of any field left empty in the row.
+
+        Args:
+            list_id: Target contact list
+            rows: Contact dicts keyed like create_contact()
+            on_conflict: 'skip' or 'update'
+            before_commit: Called as before_commit(cursor, result) inside the
+                write transaction, to record related state atomically
+
+        Returns:
+            UpsertResult with one outcome per input row, in input order
+        """
+        if on_conflict not in ('skip', 'update'):
+            raise ValidationError(f"Invalid on_conflict mode: {on_conflict}")
+
+        result = UpsertResult(outcomes=[UpsertOutcome.INVALID.value] * len(rows))
+        valid_rows = []
+
+        for index, row in enumerate(rows):
+            email = normalize_email(row.get('email'))
+            if not email:
+                result.errors.append({'index': index, 'email': email, 'error': "Email is required"})
+                continue
+            if not is_valid_email(email):
+                result.errors.append({'index': index, 'email': email, 'error': "Invalid email address"})
+                continue
+            valid_rows.append((index, email, row))
+
+        existing = self._existing_emails(list_id, [email for _, email, _ in valid_rows])
+        conflict_outcome = (
+            UpsertOutcome.UPDATED if on_conflict == 'update' else UpsertOutcome.SKIPPED
+        )
+
+        params = []
+        identity_keys = set()
+        for index, email, row in valid_rows:
+            if email in existing:
+                result.outcomes[index] = conflict_outcome.value
+                if on_conflict == 'skip':
+                    continue
+            else:
+                existing.add(email)
+                result.outcomes[index] = UpsertOutcome.INSERTED.value
+
+            key = email_key(email)
+            identity_keys.add(key)
+            values = []
+            for field_name in UPSERT_FIELDS:
+                value = email if field_name == 'email' else row.get(field_name)
+                if value is None and field_name in REQUIRED_TEXT_FIELDS:
+                    value = ''
+                values.append(value)
+            params.append((list_id, *values, key))
+
+        if not params and before_commit is None:
+            return result
+
+        columns = ', '.join(UPSERT_FIELDS)
+        placeholders = ', '.join('?' for _ in UPSERT_FIELDS)
+        if on_conflict == 'update':
+            assignments = ', '.join(
+                f"{name} = COALESCE(NULLIF(excluded.{name}, ''), {name})"
+                for name in UPSERT_FIELDS if name != 'email'
+            )
+            conflict_clause = f"DO UPDATE SET {assignments}, updated_at = datetime('now')"
+        else:
+            conflict_clause = "DO NOTHING"
+
+        query = f"""
+            INSERT INTO contacts (list_id, {columns}, identity_id)
+            VALUES (?, {placeholders},
+                    (SELECT identity_id FROM contact_identities WHERE email_key = ?))
+            ON CONFLICT(list_id, email) {conflict_clause}
+        """
+
+        with self.db.get_cursor() as cursor:
+            if params:
+                cursor.executemany(
+                    "INSERT OR IGNORE INTO contact_identities (email_key) VALUES (?)",
+                    [(key,) for key in identity_keys]
+                )
+                cursor.executemany(query, params)
+            if before_commit:
+                before_commit(cursor, result)
+
+        logger.info(
+            f"Upserted contacts into list {list_id}: {result.inserted} inserted, "
+            f"{result.updated} updated, {result.skipped} skipped, {result.invalid} invalid"
+        )
+        return result
+
+    def _existing_emails(self, list_id: int, emails: List[str]) -> set:
+        """Return which of the given (normalized) emails already exist in a list."""
+        existing = set()
+        unique = list(dict.fromkeys(emails))
+        for start in range(0, len(unique), LOOKUP_BATCH_SIZE):
+            batch = unique[start:start + LOOKUP_BATCH_SIZE]
+            placeholders = ', '.join('?' for _ in batch)
+            rows = self.db.fetchall(
+                f"SELECT email FROM contacts WHERE list_id = ? AND email IN ({placeholders})",
+                (list_id, *batch)
+            )
+            existing.update(row['email'] for row in rows)
+        return existing
+
+    def search_contacts(
+        self,
+        list_id: Optional[int],
+        query: str,
+        limit: int = 100
+    ) -> List[Contact]:
+        """
+        Search contacts by name, email, company, position or custom fields.
+
+        Every word in the query is matched as a prefix and results are ranked
+        by relevance (BM25). Pass list_id=None to search across all lists.
+        """
+        tokens = SEARCH_TOKEN_PATTERN.findall(query or '')
+        if not tokens:
+            return []
+
+        if not self.db.table_exists('contacts_fts'):
+            return self._search_contacts_like(list_id, query, limit)
+
+        match_query = ' '.join(f'"{token}"*' for token in tokens)
+        conditions = ["contacts_fts MATCH ?"]
+        params: List[Any] = [match_query]
+
+        if list_id is not None:
+            conditions.append("c.list_id = ?")
+            params.append(list_id)
+
+        sql = f"""
+            SELECT c.*
+            FROM contacts_fts
+            JOIN contacts c ON c.contact_id = contacts_fts.rowid
+            WHERE {' AND '.join(conditions)}
+            ORDER BY bm25(contacts_fts, {SEARCH_COLUMN_WEIGHTS})
+            LIMIT ?
+        """
+        params.append(limit)
+
+        rows = self.db.fetchall(sql, tuple(params))
+        return [self._row_to_contact(row) for row in rows]
+
+    def search_all_contacts(self, query: str, limit: int = 100) -> List[Contact]:
+        """Search contacts across every contact list."""
+        return self.search_contacts(None, query, limit)
+
+    def _search_contacts_like(
+        self,
+        list_id: Optional[int],
+        query: str,
+        limit: int
+    ) -> List[Contact]:
+        """Fallback substring search when FTS5 is unavailable."""
         search_term = f"%{query}%"
-        sql = """
+        conditions = ["(first_name LIKE ? OR last_name LIKE ? OR email LIKE ? OR company LIKE ?)"]
+        params: List[Any] = [search_term, search_term, search_term, search_term]
+
+        if list_id is not None:
+            conditions.append("list_id = ?")
+            params.append(list_id)
+
+        sql = f"""
             SELECT * FROM contacts
-            WHERE list_id = ?
-              AND (first_name LIKE ? OR last_name LIKE ? OR email LIKE ? OR company LIKE ?)
+            WHERE {' AND '.join(conditions)}
             ORDER BY last_name, first_name
             LIMIT ?
         """
-        rows = self.db.fetchall(sql, (list_id, search_term, search_term, search_term, search_term, limit))
+        params.append(limit)
+
+        rows = self.db.fetchall(sql, tuple(params))
         return [self._row_to_contact(row) for row in rows]
 
     def check_duplicate(self, list_id: int, email: str) -> bool:
         """Check if a contact with the given email exists in the list."""
         query = "SELECT 1 FROM contacts WHERE list_id = ? AND email = ? LIMIT 1"
-        row = self.db.fetchone(query, (list_id, email.lower()))
+        row = self.db.fetchone(query, (list_id, normalize_email(email)))
         return row is not None
 
     def get_contact_count(self, list_id: int) -> int:
         """Get total contact count for a list."""
-        query = "SELECT COUNT(*) as count FROM contacts WHERE list_id = ?"
+        query = "SELECT contact_count FROM contact_lists WHERE list_id = ?"
         row = self.db.fetchone(query, (list_id,))
-        return row['count'] if row else 0
+        return row['contact_count'] if row else 0
 
     def get_all_contacts_by_email(self, email: str) -> List[Contact]:
-        """Get all contacts with the given email across all lists."""
-        query = "SELECT * FROM contacts WHERE email = ?"
-        rows = self.db.fetchall(query, (email.lower(),))
+        """Get all contacts sharing the identity of the given email across all lists."""
+        query = """
+            SELECT c.* FROM contact_identities ci
+            JOIN contacts c ON c.identity_id = ci.identity_id
+            WHERE ci.email_key = ?
+            ORDER BY c.contact_id
+        """
+        rows = self.db.fetchall(query, (email_key(email),))
         return [self._row_to_contact(row) for row in rows]
 
+    # Identity Methods
+
+    def get_identity_id(self, email: str) -> Optional[int]:
+        """Get the identity ID for an email address, if one exists."""
+        row = self.db.fetchone(
+            "SELECT identity_id FROM contact_identities WHERE email_key = ?",
+            (email_key(email),)
+        )
+        return row['identity_id'] if row else None
+
+    def get_or_create_identity(self, email: str) -> int:
+        """Get the identity ID for an email address, creating it if needed."""
+        key = email_key(email)
+        self.db.execute(
+            "INSERT OR IGNORE INTO contact_identities (email_key) VALUES (?)",
+            (key,)
+        )
+        row = self.db.fetchone(
+            "SELECT identity_id FROM contact_identities WHERE email_key = ?",
+            (key,)
+        )
+        return row['identity_id']
+
+    def find_cross_list_duplicates(self, limit: int = 1000) -> List[Dict[str, Any]]:
+        """
+        Find people who appear in more than one contact list.
+
+        Returns:
+            List of dicts with email_key, contact_count and list_ids
+        """
+        rows = self.db.fetchall("""
+            SELECT ci.email_key,
+                   COUNT(*) as contact_count,
+                   GROUP_CONCAT(c.list_id) as list_ids
+            FROM contacts c
+            JOIN contact_identities ci ON ci.identity_id = c.identity_id
+            GROUP BY c.identity_id
+            HAVING COUNT(*) > 1
+            ORDER BY contact_count DESC, ci.email_key
+            LIMIT ?
+        """, (limit,))
+
+        return [
+            {
+                'email_key': row['email_key'],
+                'contact_count': row['contact_count'],
+                'list_ids': [int(list_id) for list_id in row['list_ids'].split(',')]
+            }
+            for row in rows
+        ]
+
     # Helper methods
 
     def _row_to_contact_list(self, row) -> ContactList:
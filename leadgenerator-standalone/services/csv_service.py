@@ -1,16 +1,42 @@
 """CSV import/export service for Lead Generator Standalone."""
 
 import csv
+import gzip
+import io
 import logging
 import re
+import zipfile
+from contextlib import contextmanager
 from pathlib import Path
-from typing import List, Dict, Tuple, Optional, Any
+from typing import List, Dict, Tuple, Optional, Any, Callable
 
 import pandas as pd
 
+# Optional columnar formats
+try:
+    import pyarrow as pa
+    import pyarrow.ipc
+    import pyarrow.parquet as pq
+    ARROW_AVAILABLE = True
+except ImportError:
+    ARROW_AVAILABLE = False
+
+try:
+    import openpyxl
+    XLSX_AVAILABLE = True
+except ImportError:
+    XLSX_AVAILABLE = False
+
 from core.database import get_db
-from core.exceptions import CSVImportError, ValidationError
+from core.exceptions import CSVImportError, JobCancelledError, ValidationError
+from core.identity import EMAIL_PATTERN
+from core.models import (
+    ImportJob, ImportJobStatus, ImportResult, UpsertOutcome, UpsertResult, ValidationSummary
+)
 from services.contact_service import ContactService
+from services.csv_sniffer import sniff_csv
+from services.import_job_service import ImportJobService
+from services.suppression_service import SuppressionService
 
 logger = logging.getLogger(__name__)
 
@@ -102,12 +128,55 @@ STANDARD_FIELDS = [
 # Custom fields
 CUSTOM_FIELDS = [f'custom{i}' for i in range(1, 11)]
 
+# Rows read, normalized and written per transaction during import
+IMPORT_CHUNK_SIZE = 5000
+
+# Fields that must be present for a row to be imported
+REQUIRED_FIELDS = ('email',)
+
+DUPLICATE_IN_FILE_ERROR = 'Duplicate email in file (skipped)'
+
+# Row error for bytes the sniffed encoding could not decode. The sniffer only
+# samples large files, so such bytes are replaced while reading (U+FFFD) and
+# their rows rejected, rather than the read failing part-way through an import
+UNDECODABLE_CHAR = '\ufffd'
+UNDECODABLE_ERROR = 'Contains bytes that are not valid in the file encoding'
+
+# Row note for contacts already on the suppression list
+SUPPRESSED_ERROR = 'Suppressed email (skipped)'
+
+# Skipped rows that are only counted, not reported as errors
+SKIP_NOTES = (DUPLICATE_IN_FILE_ERROR, SUPPRESSED_ERROR)
+
+# Rejected rows kept per import, in memory and in import_job_errors
+# (the job's error_count still counts all of them)
+MAX_IMPORT_ERRORS = 1000
+
+# Supported import/export files by extension
+FILE_FORMATS = {
+    '.csv': 'csv', '.txt': 'csv', '.tsv': 'csv',
+    '.parquet': 'parquet', '.pq': 'parquet',
+    '.arrow': 'arrow', '.feather': 'arrow', '.ipc': 'arrow',
+    '.xlsx': 'xlsx', '.xlsm': 'xlsx',
+}
+
+# Formats export_contacts() can write
+EXPORT_FORMATS = ('csv', 'parquet', 'arrow')
+
+# Rows fetched from SQLite per batch when exporting
+EXPORT_BATCH_SIZE = 10000
+
+# CSV export compression chosen by file extension
+EXPORT_COMPRESSION = {'.gz': 'gzip', '.zip': 'zip'}
+
 
 class CSVService:
     """Service for CSV import/export operations."""
 
     def __init__(self):
         self.contact_service = ContactService()
+        self.job_service = ImportJobService()
+        self.suppression_service = SuppressionService()
 
     def read_csv_preview(
         self,
@@ -124,22 +193,23 @@ class CSVService:
         if not file_path.exists():
             raise CSVImportError(f"File not found: {file_path}")
 
+        if self._file_format(file_path) != 'csv':
+            return self._read_columnar_preview(file_path, max_rows)
+
         try:
-            # Detect encoding and delimiter
-            encoding = self._detect_encoding(file_path)
-            delimiter = self._detect_delimiter(file_path, encoding)
+            # Detect encoding, delimiter and row count in one pass over the raw bytes
+            info = sniff_csv(file_path)
 
             # Read with pandas for robust handling
-            df = pd.read_csv(file_path, encoding=encoding, sep=delimiter, nrows=max_rows + 1)
+            df = pd.read_csv(
+                file_path, encoding=info.encoding, encoding_errors='replace',
+                sep=info.delimiter, nrows=max_rows + 1
+            )
 
             headers = list(df.columns)
             preview_rows = df.head(max_rows).fillna('').values.tolist()
 
-            # Count total rows
-            with open(file_path, 'r', encoding=encoding) as f:
-                total_count = sum(1 for _ in f) - 1  # Subtract header row
-
-            return headers, preview_rows, total_count
+            return headers, preview_rows, info.row_count
 
         except Exception as e:
             logger.error(f"Error reading CSV: {e}")
@@ -155,6 +225,11 @@ class CSVService:
         mappings = {}
 
         for header in csv_headers:
+            # Our own export column names map to themselves
+            if header in STANDARD_FIELDS or header in CUSTOM_FIELDS:
+                mappings[header] = header
+                continue
+
             # Normalize header for matching
             normalized = header.lower().strip()
             normalized = re.sub(r'[_\-\s]+', ' ', normalized)
@@ -196,6 +271,48 @@ class CSVService:
         Returns:
             Tuple of (imported_count, errors_list)
         """
+        result = self.import_contacts(
+            file_path, list_id, field_mapping,
+            custom_labels=custom_labels,
+            skip_duplicates=skip_duplicates
+        )
+        return result.imported + result.updated, result.errors
+
+    def import_contacts(
+        self,
+        file_path: str,
+        list_id: int,
+        field_mapping: Dict[str, str],
+        custom_labels: Optional[Dict[str, str]] = None,
+        skip_duplicates: bool = True,
+        skip_suppressed: bool = True,
+        chunk_size: int = IMPORT_CHUNK_SIZE,
+        progress_callback: Optional[Callable[[int, int], None]] = None,
+        should_cancel: Optional[Callable[[], bool]] = None
+    ) -> ImportResult:
+        """
+        Stream contacts from a CSV file into a list, one chunk at a time.
+
+        Each chunk is normalized column-wise and written in its own
+        transaction, together with a checkpoint of the import job, so memory
+        stays flat and a cancelled or interrupted import can be continued
+        with resume_import_job(). Every chunk is matched against the
+        suppression list in one query before it is written.
+
+        Args:
+            file_path: Path to CSV file
+            list_id: ID of contact list to import into
+            field_mapping: Dict mapping CSV headers to field names
+            custom_labels: Optional dict of custom field labels
+            skip_duplicates: Skip emails already in the list (otherwise merge them)
+            skip_suppressed: Skip suppressed emails (otherwise import and flag them)
+            chunk_size: Rows read and written per batch
+            progress_callback: Called with (rows_processed, total_rows) after each chunk
+            should_cancel: Polled before each chunk; return True to stop
+
+        Returns:
+            ImportResult with counts, per-row errors and the import job ID
+        """
         file_path = Path(file_path)
         if not file_path.exists():
             raise CSVImportError(f"File not found: {file_path}")
@@ -205,179 +322,718 @@ class CSVService:
         if not contact_list:
             raise CSVImportError(f"Contact list {list_id} not found")
 
+        self._reverse_mapping(field_mapping)
+
         # Update custom labels if provided
         if custom_labels:
             self.contact_service.update_list(list_id, custom_labels=custom_labels)
 
+        job = self.job_service.create_job(
+            list_id, file_path, field_mapping, skip_duplicates, skip_suppressed, chunk_size
+        )
+        return self._run_import_job(job, progress_callback, should_cancel)
+
+    def resume_import_job(
+        self,
+        job_id: int,
+        progress_callback: Optional[Callable[[int, int], None]] = None,
+        should_cancel: Optional[Callable[[], bool]] = None
+    ) -> ImportResult:
+        """
+        Continue an interrupted import job after its last committed chunk.
+
+        Counts and errors in the result cover the whole job, including the
+        rows imported before the interruption.
+
+        Raises:
+            CSVImportError: If the job is unknown or finished, or its file
+                is missing or changed since the job started
+        """
+        job = self.job_service.get_job(job_id)
+        if not job:
+            raise CSVImportError(f"Import job {job_id} not found")
+        if job.status == ImportJobStatus.COMPLETED.value:
+            raise CSVImportError(f"Import job {job_id} is already completed")
+        if not self.job_service.file_matches(job):
+            raise CSVImportError(f"File is missing or has changed since the import started: {job.file_path}")
+
+        logger.info(f"Resuming import job {job_id} after {job.rows_committed} rows")
+        return self._run_import_job(job, progress_callback, should_cancel)
+
+    def _run_import_job(
+        self,
+        job: ImportJob,
+        progress_callback: Optional[Callable[[int, int], None]],
+        should_cancel: Optional[Callable[[], bool]]
+    ) -> ImportResult:
+        """Stream a job's file from its checkpoint and record how the run ended."""
+        reverse_mapping = self._reverse_mapping(job.field_mapping)
+        on_conflict = 'skip' if job.skip_duplicates else 'update'
+        seen_emails = set()
+        result = ImportResult(
+            imported=job.imported_count,
+            updated=job.updated_count,
+            skipped=job.skipped_count,
+            suppressed=job.suppressed_count,
+            errors=self.job_service.get_errors(job.job_id, limit=MAX_IMPORT_ERRORS),
+            error_count=job.error_count,
+            job_id=job.job_id
+        )
+
+        self.job_service.claim_job(job.job_id)
+        status = ImportJobStatus.FAILED.value
+        last_error = None
+        reader = None
         try:
-            encoding = self._detect_encoding(file_path)
-            delimiter = self._detect_delimiter(file_path, encoding)
-            df = pd.read_csv(file_path, encoding=encoding, sep=delimiter)
+            reader, total_rows = self._open_chunk_reader(Path(job.file_path), reverse_mapping, job.chunk_size)
+            self.job_service.set_rows_total(job.job_id, total_rows)
+
+            for chunk in reader:
+                done = result.rows_processed + len(chunk)
+                if done <= job.rows_committed:
+                    # Committed before the interruption: only replay in-file duplicate tracking
+                    self.validate_frame(self._normalize_chunk(chunk, reverse_mapping), seen_emails=seen_emails)
+                    result.rows_processed = done
+                    continue
+
+                if should_cancel and should_cancel():
+                    result.cancelled = True
+                    logger.info(f"CSV import cancelled after {result.rows_processed} rows")
+                    break
+
+                frame = self._normalize_chunk(chunk, reverse_mapping)
+                clean, invalid = self.validate_frame(frame, seen_emails=seen_emails)
+                suppressed = self._suppressed_rows(clean)
+                if job.skip_suppressed and len(suppressed):
+                    invalid = pd.concat([invalid, pd.Series(SUPPRESSED_ERROR, index=suppressed)])
+                    clean = clean.drop(suppressed)
+                    suppressed = suppressed[:0]
+                chunk_result = self._write_chunk(
+                    job, chunk, clean, invalid, suppressed, on_conflict, done,
+                    max_errors=MAX_IMPORT_ERRORS - len(result.errors)
+                )
+
+                result.imported += chunk_result.imported
+                result.updated += chunk_result.updated
+                result.skipped += chunk_result.skipped
+                result.suppressed += chunk_result.suppressed
+                result.error_count += chunk_result.error_count
+                result.errors.extend(chunk_result.errors)
+                result.rows_processed = done
+                if progress_callback:
+                    progress_callback(result.rows_processed, total_rows)
+
+            status = (ImportJobStatus.CANCELLED if result.cancelled else ImportJobStatus.COMPLETED).value
+        except (ValueError, UnicodeDecodeError, pd.errors.ParserError) as e:
+            last_error = f"Failed to read CSV file after {result.rows_processed} rows: {e}"
+            raise CSVImportError(last_error)
         except Exception as e:
-            raise CSVImportError(f"Failed to read CSV file: {e}")
+            last_error = str(e)
+            raise
+        finally:
+            if reader is not None:
+                reader.close()
+            self.job_service.release_job(job.job_id, status, last_error)
+
+        logger.info(
+            f"CSV import completed: {result.imported} imported, {result.updated} updated, "
+            f"{result.skipped} skipped, {result.suppressed} suppressed, {result.error_count} errors"
+        )
+        return result
+
+    def _write_chunk(
+        self,
+        job: ImportJob,
+        chunk: pd.DataFrame,
+        clean: pd.DataFrame,
+        invalid: pd.Series,
+        flagged: pd.Index,
+        on_conflict: str,
+        rows_committed: int,
+        max_errors: Optional[int] = None
+    ) -> ImportResult:
+        """Upsert one validated chunk and checkpoint its job in the same transaction."""
+        chunk_result = ImportResult()
+
+        def checkpoint(cursor, upsert: UpsertResult) -> None:
+            self._collect_chunk_result(chunk_result, upsert, clean.index, invalid, chunk, flagged, max_errors)
+            self.job_service.record_checkpoint(cursor, job.job_id, rows_committed, chunk_result)
+
+        self.contact_service.upsert_contacts(
+            job.list_id, clean.to_dict('records'),
+            on_conflict=on_conflict, before_commit=checkpoint
+        )
+        return chunk_result
+
+    def _suppressed_rows(self, frame: pd.DataFrame) -> pd.Index:
+        """Return the index of rows whose email is on the suppression list."""
+        if frame.empty or 'email' not in frame.columns:
+            return frame.index[:0]
+        suppressed = self.suppression_service.find_suppressed(frame['email'])
+        return frame.index[frame['email'].isin(suppressed)]
+
+    def _normalize_chunk(
+        self,
+        chunk: pd.DataFrame,
+        reverse_mapping: Dict[str, str]
+    ) -> pd.DataFrame:
+        """Project a raw chunk onto contact fields with trimmed values (blank -> None)."""
+        frame = pd.DataFrame(index=chunk.index)
+        for field_name, csv_header in reverse_mapping.items():
+            if csv_header in chunk.columns:
+                frame[field_name] = chunk[csv_header].str.strip()
+
+        if 'email' in frame.columns:
+            frame['email'] = frame['email'].str.lower()
+
+        frame = frame.astype(object)
+        return frame.where(frame.notna() & (frame != ''), None)
+
+    def validate_csv(
+        self,
+        file_path: str,
+        field_mapping: Dict[str, str],
+        required_fields: Tuple[str, ...] = REQUIRED_FIELDS,
+        chunk_size: int = IMPORT_CHUNK_SIZE,
+        max_errors: int = 100,
+        progress_callback: Optional[Callable[[int, int], None]] = None,
+        should_cancel: Optional[Callable[[], bool]] = None
+    ) -> ValidationSummary:
+        """
+        Validate a CSV file against a field mapping without importing it.
+
+        Args:
+            file_path: Path to CSV file
+            field_mapping: Dict mapping CSV headers to field names
+            required_fields: Fields that must be non-empty
+            chunk_size: Rows validated per batch
+            max_errors: Maximum number of row errors to report
+            progress_callback: Optional callback(rows_validated, total_rows) after each chunk
+            should_cancel: Optional callable checked before each chunk; raises
+                JobCancelledError when it returns True
+
+        Returns:
+            ValidationSummary with counts and the first row errors
+        """
+        file_path = Path(file_path)
+        if not file_path.exists():
+            raise CSVImportError(f"File not found: {file_path}")
+
+        reverse_mapping = self._reverse_mapping(field_mapping)
+        reader, total_rows = self._open_chunk_reader(file_path, reverse_mapping, chunk_size)
+        seen_emails = set()
+        summary = ValidationSummary()
+
+        try:
+            for chunk in reader:
+                if should_cancel and should_cancel():
+                    raise JobCancelledError(f"Validation cancelled after {summary.total_rows} rows")
+                frame = self._normalize_chunk(chunk, reverse_mapping)
+                clean, invalid = self.validate_frame(frame, required_fields, seen_emails)
+
+                summary.total_rows += len(frame)
+                summary.valid_rows += len(clean)
+                summary.duplicate_rows += int((invalid == DUPLICATE_IN_FILE_ERROR).sum())
+                summary.suppressed_rows += len(self._suppressed_rows(clean))
+                for index, error in invalid.items():
+                    if len(summary.errors) >= max_errors:
+                        break
+                    summary.errors.append({'row': int(index) + 2, 'error': error})
+                if progress_callback:
+                    progress_callback(summary.total_rows, max(total_rows, summary.total_rows))
+        except (ValueError, UnicodeDecodeError, pd.errors.ParserError) as e:
+            raise CSVImportError(
+                f"Failed to read CSV file after {summary.total_rows} rows: {e}"
+            )
+        finally:
+            reader.close()
+
+        summary.invalid_rows = summary.total_rows - summary.valid_rows
+        return summary
+
+    def validate_frame(
+        self,
+        frame: pd.DataFrame,
+        required_fields: Tuple[str, ...] = REQUIRED_FIELDS,
+        seen_emails: Optional[set] = None
+    ) -> Tuple[pd.DataFrame, pd.Series]:
+        """
+        Validate a normalized contact frame in one vectorized pass.
+
+        Checks for undecodable bytes, required fields, email syntax and
+        emails repeated in the file.
+        Pass the same seen_emails set for every chunk of a file to catch
+        repeats across chunks; emails of valid rows are added to it.
+
+        Returns:
+            Tuple of (clean_frame, errors) where errors maps the index of
+            each rejected row to its first error message
+        """
+        errors = pd.Series(None, index=frame.index, dtype=object)
+
+        def flag(mask: pd.Series, message: str) -> pd.Series:
+            return errors.mask(errors.isna() & mask, message)
 
-        imported_count = 0
-        errors = []
+        for column in frame.columns:
+            errors = flag(frame[column].str.contains(UNDECODABLE_CHAR, regex=False, na=False), UNDECODABLE_ERROR)
 
-        # Reverse mapping: field_name -> csv_header
+        for field_name in required_fields:
+            if field_name in frame.columns:
+                missing = frame[field_name].isna()
+            else:
+                missing = pd.Series(True, index=frame.index)
+            errors = flag(missing, f"{field_name.replace('_', ' ').capitalize()} is required")
+
+        if 'email' in frame.columns:
+            email = frame['email']
+            present = email.notna()
+            errors = flag(present & ~email.str.match(EMAIL_PATTERN.pattern, na=False),
+                          "Invalid email address")
+
+            # Only rows still valid count, so a rejected first occurrence does not
+            # reject a later valid one (matching seen_emails, which holds valid rows only)
+            candidate = present & errors.isna()
+            duplicate = candidate & email.where(candidate).duplicated(keep='first')
+            if seen_emails:
+                # Set membership per value: isin() would copy the whole set each chunk
+                duplicate |= candidate & pd.Series([value in seen_emails for value in email], index=email.index)
+            errors = flag(duplicate, DUPLICATE_IN_FILE_ERROR)
+
+        valid = errors.isna()
+        if seen_emails is not None and 'email' in frame.columns:
+            seen_emails.update(frame.loc[valid, 'email'])
+
+        return frame[valid], errors[~valid]
+
+    def _reverse_mapping(self, field_mapping: Dict[str, str]) -> Dict[str, str]:
+        """Return field_name -> csv_header (last header wins), requiring an email column."""
         reverse_mapping = {v: k for k, v in field_mapping.items()}
+        if 'email' not in reverse_mapping:
+            raise CSVImportError("No column is mapped to the email field")
+        return reverse_mapping
 
-        for row_idx, row in df.iterrows():
-            row_num = row_idx + 2  # Account for 0-index and header row
+    def _open_chunk_reader(
+        self,
+        file_path: Path,
+        reverse_mapping: Optional[Dict[str, str]],
+        chunk_size: int
+    ) -> Tuple[Any, int]:
+        """
+        Open a chunked reader over the mapped columns, read as text.
 
-            try:
-                contact_data = self._row_to_contact_data(row, field_mapping, reverse_mapping)
-
-                # Validate required fields
-                if not contact_data.get('email'):
-                    errors.append({
-                        'row': row_num,
-                        'error': 'Email is required',
-                        'data': dict(row)
-                    })
-                    continue
+        CSV, Parquet, Arrow and XLSX files all yield DataFrames of strings
+        ('' for missing values) indexed by data row number.
 
-                # Check for duplicate
-                if skip_duplicates and self.contact_service.check_duplicate(list_id, contact_data['email']):
-                    errors.append({
-                        'row': row_num,
-                        'error': 'Duplicate email (skipped)',
-                        'data': dict(row)
-                    })
-                    continue
+        Returns:
+            Tuple of (reader, total_rows); the reader supports close()
+        """
+        columns = set(reverse_mapping.values()) if reverse_mapping else None
+        file_format = self._file_format(file_path)
+        try:
+            if file_format == 'parquet':
+                return self._parquet_chunks(file_path, columns, chunk_size)
+            if file_format == 'arrow':
+                return self._arrow_chunks(file_path, columns, chunk_size)
+            if file_format == 'xlsx':
+                return self._xlsx_chunks(file_path, columns, chunk_size)
+
+            info = sniff_csv(file_path)
+            reader = pd.read_csv(
+                file_path, encoding=info.encoding, encoding_errors='replace', sep=info.delimiter,
+                dtype=str, keep_default_na=False,
+                usecols=(lambda column: column in columns) if columns else None,
+                chunksize=chunk_size
+            )
+        except CSVImportError:
+            raise
+        except Exception as e:
+            raise CSVImportError(f"Failed to read {file_format.upper()} file: {e}")
+        return reader, info.row_count
 
-                # Create contact
-                self.contact_service.create_contact(list_id, contact_data)
-                imported_count += 1
+    def _file_format(self, file_path: Path) -> str:
+        """Return the import format for a file, by extension (CSV by default)."""
+        return FILE_FORMATS.get(Path(file_path).suffix.lower(), 'csv')
 
-            except Exception as e:
-                errors.append({
-                    'row': row_num,
-                    'error': str(e),
-                    'data': dict(row)
+    def _read_columnar_preview(
+        self,
+        file_path: Path,
+        max_rows: int
+    ) -> Tuple[List[str], List[List[str]], int]:
+        """Preview a Parquet, Arrow or XLSX file like read_csv_preview()."""
+        reader, total_count = self._open_chunk_reader(file_path, None, max_rows)
+        try:
+            first = next(iter(reader), pd.DataFrame())
+        except Exception as e:
+            raise CSVImportError(f"Failed to read file: {e}")
+        finally:
+            reader.close()
+        return list(first.columns), first.head(max_rows).values.tolist(), total_count
+
+    def _require_arrow(self, format_name: str) -> None:
+        """Fail clearly when pyarrow is not installed."""
+        if not ARROW_AVAILABLE:
+            raise CSVImportError(f"{format_name} files require pyarrow (pip install pyarrow)")
+
+    def _parquet_chunks(
+        self,
+        file_path: Path,
+        columns: Optional[set],
+        chunk_size: int
+    ) -> Tuple[Any, int]:
+        """Stream a Parquet file in row batches, reading only the needed columns."""
+        self._require_arrow('Parquet')
+        parquet_file = pq.ParquetFile(file_path)
+        names = parquet_file.schema_arrow.names
+        selected = [name for name in names if columns is None or name in columns]
+        batches = parquet_file.iter_batches(batch_size=chunk_size, columns=selected)
+
+        def chunks():
+            try:
+                yield from self._frames_from_batches(batches, chunk_size)
+            finally:
+                parquet_file.close()
+
+        return chunks(), parquet_file.metadata.num_rows
+
+    def _arrow_chunks(
+        self,
+        file_path: Path,
+        columns: Optional[set],
+        chunk_size: int
+    ) -> Tuple[Any, int]:
+        """Stream an Arrow IPC (Feather v2) file through a memory map."""
+        self._require_arrow('Arrow')
+        source = pa.memory_map(str(file_path), 'r')
+        try:
+            try:
+                reader = pa.ipc.open_file(source)
+                batches = [reader.get_batch(i) for i in range(reader.num_record_batches)]
+            except pa.ArrowInvalid:
+                # Streaming format: batches are read on demand, total unknown up front
+                source.seek(0)
+                batches = pa.ipc.open_stream(source)
+        except BaseException:
+            source.close()
+            raise
+        total_rows = sum(batch.num_rows for batch in batches) if isinstance(batches, list) else 0
+
+        def selected():
+            for batch in batches:
+                names = [n for n in batch.schema.names if columns is None or n in columns]
+                yield batch.select(names)
+
+        def chunks():
+            # The map stays open while batches are read; closing it also unlocks the file on Windows
+            try:
+                yield from self._frames_from_batches(selected(), chunk_size)
+            finally:
+                source.close()
+
+        return chunks(), total_rows
+
+    def _frames_from_batches(self, batches, chunk_size: int):
+        """Turn Arrow record batches into text DataFrames of at most chunk_size rows."""
+        start = 0
+        for batch in batches:
+            for offset in range(0, batch.num_rows, chunk_size):
+                part = batch.slice(offset, chunk_size)
+                text = pa.table({
+                    name: part.column(i).cast(pa.string())
+                    for i, name in enumerate(part.schema.names)
                 })
+                frame = text.to_pandas().fillna('')
+                frame.index = pd.RangeIndex(start, start + len(frame))
+                start += len(frame)
+                yield frame
+
+    def _xlsx_chunks(
+        self,
+        file_path: Path,
+        columns: Optional[set],
+        chunk_size: int
+    ) -> Tuple[Any, int]:
+        """Stream the first worksheet of an XLSX workbook in read-only mode."""
+        if not XLSX_AVAILABLE:
+            raise CSVImportError("XLSX files require openpyxl (pip install openpyxl)")
+
+        workbook = openpyxl.load_workbook(file_path, read_only=True, data_only=True)
+        sheet = workbook.active
+        total_rows = max((sheet.max_row or 1) - 1, 0)
+
+        def chunks():
+            try:
+                rows = sheet.iter_rows(values_only=True)
+                headers = [self._cell_text(value) for value in next(rows, ())]
+                keep = [i for i, h in enumerate(headers) if columns is None or h in columns]
+                names = [headers[i] for i in keep]
+
+                start = 0
+                buffer = []
+                for row in rows:
+                    buffer.append([self._cell_text(row[i]) if i < len(row) else '' for i in keep])
+                    if len(buffer) == chunk_size:
+                        yield pd.DataFrame(buffer, columns=names, index=pd.RangeIndex(start, start + len(buffer)))
+                        start += len(buffer)
+                        buffer = []
+                if buffer:
+                    yield pd.DataFrame(buffer, columns=names, index=pd.RangeIndex(start, start + len(buffer)))
+            finally:
+                workbook.close()
+
+        return chunks(), total_rows
+
+    def _cell_text(self, value: Any) -> str:
+        """Convert a spreadsheet cell to import text (whole numbers without '.0')."""
+        if value is None:
+            return ''
+        if isinstance(value, float) and value.is_integer():
+            return str(int(value))
+        return str(value)
+
+    def _collect_chunk_result(
+        self,
+        result: ImportResult,
+        upsert: UpsertResult,
+        written_index: pd.Index,
+        invalid: pd.Series,
+        chunk: pd.DataFrame,
+        flagged: Optional[pd.Index] = None,
+        max_errors: Optional[int] = None
+    ) -> None:
+        """
+        Add one chunk's validation errors and upsert outcomes to the running result.
 
-        logger.info(f"CSV import completed: {imported_count} imported, {len(errors)} errors")
-        return imported_count, errors
+        Skipped duplicates and suppressed rows (including those in flagged,
+        written despite being suppressed) are only counted. Every other
+        rejected row counts towards error_count, and at most max_errors of
+        them are kept with their data.
+        """
+        result.imported += upsert.inserted
+        result.updated += upsert.updated
+        result.skipped += upsert.skipped + int((invalid == DUPLICATE_IN_FILE_ERROR).sum())
+        result.suppressed += int((invalid == SUPPRESSED_ERROR).sum())
+        if flagged is not None:
+            result.suppressed += len(flagged)
+
+        row_errors = dict(invalid[~invalid.isin(SKIP_NOTES)].items())
+        upsert_errors = {error['index']: error['error'] for error in upsert.errors}
+        for position, outcome in enumerate(upsert.outcomes):
+            if outcome == UpsertOutcome.INVALID.value:
+                row_errors[written_index[position]] = upsert_errors[position]
+
+        result.error_count += len(row_errors)
+        kept = sorted(row_errors)
+        if max_errors is not None:
+            kept = kept[:max(max_errors, 0)]
+        for index in kept:
+            result.errors.append({
+                'row': int(index) + 2,  # Account for 0-index and header row
+                'error': row_errors[index],
+                'data': chunk.loc[index].to_dict()
+            })
 
     def export_csv(
         self,
         list_id: int,
         file_path: str,
         fields: Optional[List[str]] = None,
-        include_custom: bool = True
+        include_custom: bool = True,
+        compression: Optional[str] = None,
+        progress_callback: Optional[Callable[[int, int], None]] = None,
+        should_cancel: Optional[Callable[[], bool]] = None
     ) -> int:
         """
         Export contacts to CSV file.
 
+        Rows are streamed from a SQLite cursor through csv.writer, so memory
+        use does not grow with the size of the list.
+
         Args:
             list_id: ID of contact list to export
             file_path: Path for output file
-            fields: Optional list of specific fields to include
+            fields: Optional list of specific fields (or export headers) to include
             include_custom: Whether to include custom fields
+            compression: None, 'gzip' or 'zip'; by default chosen from the
+                file extension (.gz or .zip)
+            progress_callback: Called with (rows_exported, total_rows) after each batch
+            should_cancel: Polled before each batch; return True to stop
 
         Returns:
             Number of contacts exported
+
+        Raises:
+            JobCancelledError: If cancelled; the partial file is removed
         """
         contact_list = self.contact_service.get_list(list_id)
         if not contact_list:
             raise ValidationError(f"Contact list {list_id} not found")
 
-        contacts = self.contact_service.get_contacts(list_id, limit=100000)
-
-        if not contacts:
-            # Create empty file with headers
-            with open(file_path, 'w', newline='', encoding='utf-8') as f:
-                writer = csv.writer(f)
-                writer.writerow(self._get_export_headers(contact_list, fields, include_custom))
-            return 0
+        if compression is None:
+            compression = EXPORT_COMPRESSION.get(Path(file_path).suffix.lower())
+        if compression not in (None, 'gzip', 'zip'):
+            raise ValidationError(f"Unsupported compression: {compression}")
 
-        # Build rows
-        rows = []
         headers = self._get_export_headers(contact_list, fields, include_custom)
+        projection = self._export_projection(headers, contact_list)
+        query = f"""
+            SELECT {projection} FROM contacts
+            WHERE list_id = ?
+            ORDER BY last_name, first_name, contact_id
+        """
 
-        for contact in contacts:
-            row = []
-            for header in headers:
-                field = self._header_to_field(header, contact_list)
-                value = getattr(contact, field, '') or ''
-                row.append(value)
-            rows.append(row)
-
-        # Write CSV
-        with open(file_path, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.writer(f)
-            writer.writerow(headers)
-            writer.writerows(rows)
-
-        logger.info(f"Exported {len(contacts)} contacts to {file_path}")
-        return len(contacts)
-
-    def _detect_encoding(self, file_path: Path) -> str:
-        """Detect file encoding."""
-        encodings = ['utf-8', 'utf-8-sig', 'latin-1', 'cp1252', 'iso-8859-1']
-
-        for encoding in encodings:
-            try:
-                with open(file_path, 'r', encoding=encoding) as f:
-                    f.read(1024)
-                return encoding
-            except (UnicodeDecodeError, LookupError):
-                continue
-
-        return 'utf-8'  # Default fallback
-
-    def _detect_delimiter(self, file_path: Path, encoding: str) -> str:
-        """Detect CSV delimiter (comma, semicolon, or tab)."""
+        count = 0
+        batches = self._export_batches(
+            query, list_id, contact_list.contact_count, progress_callback, should_cancel
+        )
         try:
-            with open(file_path, 'r', encoding=encoding) as f:
-                # Read first few lines to detect delimiter
-                sample = f.read(4096)
+            with self._open_export_file(file_path, compression) as f:
+                writer = csv.writer(f)
+                writer.writerow(headers)
+                for rows in batches:
+                    writer.writerows(rows)
+                    count += len(rows)
+        except JobCancelledError:
+            Path(file_path).unlink(missing_ok=True)
+            raise
+
+        logger.info(f"Exported {count} contacts to {file_path}")
+        return count
+
+    def _export_batches(
+        self,
+        query: str,
+        list_id: int,
+        total_rows: int,
+        progress_callback: Optional[Callable[[int, int], None]],
+        should_cancel: Optional[Callable[[], bool]]
+    ):
+        """Yield export row batches, reporting progress and stopping when cancelled."""
+        done = 0
+        for rows in get_db().iter_batches(query, (list_id,), EXPORT_BATCH_SIZE):
+            if should_cancel and should_cancel():
+                logger.info(f"Export cancelled after {done} rows")
+                raise JobCancelledError(f"Export cancelled after {done} rows")
+            yield rows
+            done += len(rows)
+            if progress_callback:
+                progress_callback(done, max(total_rows, done))
+
+    def _export_projection(self, headers: List[str], contact_list: Any) -> str:
+        """
+        Build the SELECT list for export headers, resolved once per export.
 
-            # Use csv.Sniffer to detect delimiter
-            try:
-                dialect = csv.Sniffer().sniff(sample, delimiters=',;\t|')
-                return dialect.delimiter
-            except csv.Error:
-                pass
+        Empty values are written as ''; headers that match no contact
+        column export as an empty column.
+        """
+        columns = {
+            row['name'] for row in get_db().fetchall("PRAGMA table_info(contacts)")
+        }
+        projection = []
+        for header in headers:
+            field_name = self._header_to_field(header, contact_list)
+            projection.append(f"COALESCE({field_name}, '')" if field_name in columns else "''")
+        return ', '.join(projection)
+
+    @contextmanager
+    def _open_export_file(self, file_path: str, compression: Optional[str]):
+        """Open a text stream for CSV export, optionally gzip- or zip-compressed."""
+        if compression == 'gzip':
+            with gzip.open(file_path, 'wt', newline='', encoding='utf-8') as f:
+                yield f
+        elif compression == 'zip':
+            member = Path(file_path).stem
+            if not member.lower().endswith('.csv'):
+                member += '.csv'
+            with zipfile.ZipFile(file_path, 'w', compression=zipfile.ZIP_DEFLATED) as archive:
+                with archive.open(member, 'w', force_zip64=True) as raw:
+                    with io.TextIOWrapper(raw, encoding='utf-8', newline='') as f:
+                        yield f
+        else:
+            with open(file_path, 'w', newline='', encoding='utf-8') as f:
+                yield f
 
-            # Fallback: count occurrences in first line
-            first_line = sample.split('\n')[0] if sample else ''
-            delimiters = {',': 0, ';': 0, '\t': 0, '|': 0}
+    def export_contacts(
+        self,
+        list_id: int,
+        file_path: str,
+        fields: Optional[List[str]] = None,
+        include_custom: bool = True,
+        progress_callback: Optional[Callable[[int, int], None]] = None,
+        should_cancel: Optional[Callable[[], bool]] = None
+    ) -> int:
+        """
+        Export contacts as CSV, Parquet or Arrow, chosen by file extension.
 
-            for delim in delimiters:
-                delimiters[delim] = first_line.count(delim)
+        Columnar exports use field names as column names (so they re-import
+        with automatic mapping) and are written batch by batch straight
+        from a SQLite cursor, selecting only the requested columns.
+        progress_callback and should_cancel work as in export_csv.
 
-            # Return delimiter with most occurrences (minimum 1)
-            best_delim = max(delimiters, key=delimiters.get)
-            if delimiters[best_delim] > 0:
-                return best_delim
+        Returns:
+            Number of contacts exported
+        """
+        file_format = self._file_format(file_path)
+        if file_format not in EXPORT_FORMATS:
+            raise ValidationError(f"Unsupported export format: {Path(file_path).suffix}")
+        if file_format == 'csv':
+            return self.export_csv(
+                list_id, file_path, fields, include_custom,
+                progress_callback=progress_callback, should_cancel=should_cancel
+            )
+
+        if not ARROW_AVAILABLE:
+            raise ValidationError(f"{file_format.title()} export requires pyarrow (pip install pyarrow)")
+        contact_list = self.contact_service.get_list(list_id)
+        if not contact_list:
+            raise ValidationError(f"Contact list {list_id} not found")
 
-        except Exception as e:
-            logger.warning(f"Delimiter detection failed: {e}")
+        columns = fields or STANDARD_FIELDS + (CUSTOM_FIELDS if include_custom else [])
+        unknown = [c for c in columns if c not in STANDARD_FIELDS and c not in CUSTOM_FIELDS]
+        if unknown:
+            raise ValidationError(f"Unknown contact fields: {', '.join(unknown)}")
 
-        return ','  # Default to comma
+        schema = pa.schema([(column, pa.string()) for column in columns])
+        query = f"""
+            SELECT {', '.join(columns)} FROM contacts
+            WHERE list_id = ?
+            ORDER BY last_name, first_name, contact_id
+        """
 
-    def _row_to_contact_data(
-        self,
-        row: pd.Series,
-        field_mapping: Dict[str, str],
-        reverse_mapping: Dict[str, str]
-    ) -> Dict[str, Any]:
-        """Convert CSV row to contact data dict."""
-        contact_data = {}
-
-        for csv_header, field_name in field_mapping.items():
-            if csv_header in row.index:
-                value = row[csv_header]
-                # Handle NaN values
-                if pd.isna(value):
-                    value = None
+        if file_format == 'parquet':
+            writer = pq.ParquetWriter(file_path, schema, compression='zstd')
+        else:
+            sink = pa.OSFile(str(file_path), 'wb')
+            writer = pa.ipc.new_file(sink, schema)
+
+        count = 0
+        cancelled = False
+        batches = self._export_batches(
+            query, list_id, contact_list.contact_count, progress_callback, should_cancel
+        )
+        try:
+            for rows in batches:
+                arrays = [
+                    pa.array([row[i] for row in rows], type=pa.string())
+                    for i in range(len(columns))
+                ]
+                batch = pa.RecordBatch.from_arrays(arrays, schema=schema)
+                if file_format == 'parquet':
+                    writer.write_table(pa.Table.from_batches([batch]))
                 else:
-                    value = str(value).strip() if value else None
-                contact_data[field_name] = value
-
-        return contact_data
+                    writer.write_batch(batch)
+                count += len(rows)
+        except JobCancelledError:
+            cancelled = True
+            raise
+        finally:
+            writer.close()
+            if file_format == 'arrow':
+                sink.close()
+            if cancelled:
+                Path(file_path).unlink(missing_ok=True)
+
+        logger.info(f"Exported {count} contacts to {file_path}")
+        return count
 
     def _get_export_headers(
         self,
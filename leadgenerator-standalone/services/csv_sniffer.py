@@ -0,0 +1,198 @@
+"""Single-pass CSV file sniffing (encoding, delimiter, row count) for Lead Generator Standalone."""
+
+import codecs
+import csv
+import logging
+import mmap
+import re
+from pathlib import Path
+from typing import Union
+
+from core.models import CSVFileInfo
+
+logger = logging.getLogger(__name__)
+
+# Bytes scanned per step when counting rows
+COUNT_BLOCK_SIZE = 16 * 1024 * 1024
+
+# Encoding detection reads the whole file below this size, otherwise
+# ENCODING_SAMPLE_WINDOWS evenly spaced windows of ENCODING_WINDOW_SIZE bytes
+ENCODING_FULL_SCAN_LIMIT = 8 * 1024 * 1024
+ENCODING_SAMPLE_WINDOWS = 32
+ENCODING_WINDOW_SIZE = 256 * 1024
+
+# Bytes decoded to detect the delimiter
+DELIMITER_SAMPLE_SIZE = 64 * 1024
+
+CANDIDATE_DELIMITERS = ',;\t|'
+
+# Runs of non-ASCII bytes; in UTF-8 every multi-byte character is such a run
+HIGH_BYTE_RUN = re.compile(rb'[\x80-\xff]+')
+
+BOMS = [
+    (codecs.BOM_UTF8, 'utf-8-sig'),
+    (codecs.BOM_UTF16_LE, 'utf-16'),
+    (codecs.BOM_UTF16_BE, 'utf-16'),
+]
+
+
+def sniff_csv(file_path: Union[str, Path]) -> CSVFileInfo:
+    """
+    Detect encoding, delimiter and data row count of a CSV file.
+
+    The file is memory-mapped once; rows are counted on raw bytes, ignoring
+    line breaks inside quoted fields, so even very large files open quickly.
+    """
+    file_path = Path(file_path)
+    size = file_path.stat().st_size
+    if size == 0:
+        return CSVFileInfo(encoding='utf-8', delimiter=',', row_count=0, size_bytes=0)
+
+    with open(file_path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+        bom_encoding, bom_length = _detect_bom(data)
+        if bom_encoding == 'utf-16':
+            # Newlines are two bytes wide, so records are counted on decoded blocks (rare for CSV exports)
+            sample = data[:bom_length + DELIMITER_SAMPLE_SIZE * 2].decode('utf-16', errors='replace')
+            return CSVFileInfo(
+                encoding='utf-16',
+                delimiter=_detect_delimiter(sample),
+                row_count=max(_count_utf16_records(data) - 1, 0),
+                has_bom=True,
+                size_bytes=size
+            )
+
+        encoding = bom_encoding or _detect_encoding(data, bom_length)
+        sample = data[bom_length:bom_length + DELIMITER_SAMPLE_SIZE]
+        delimiter = _detect_delimiter(sample.decode(encoding.replace('-sig', ''), errors='replace'))
+        row_count = max(_count_records(data, bom_length) - 1, 0)  # Subtract header row
+
+    return CSVFileInfo(
+        encoding=encoding,
+        delimiter=delimiter,
+        row_count=row_count,
+        has_bom=bom_encoding is not None,
+        size_bytes=size
+    )
+
+
+def _detect_bom(data) -> tuple:
+    """Return (encoding, bom_length) for a leading byte order mark, or (None, 0)."""
+    head = data[:4]
+    for bom, encoding in BOMS:
+        if head.startswith(bom):
+            return encoding, len(bom)
+    return None, 0
+
+
+def _detect_encoding(data, start: int) -> str:
+    """
+    Pick utf-8, cp1252 or latin-1 from the non-ASCII byte runs of a sample.
+
+    Windows are spread over the whole file so accented rows far from the
+    header are still seen. Runs cut by a window edge are ignored.
+    """
+    size = len(data)
+    if size - start <= ENCODING_FULL_SCAN_LIMIT:
+        windows = [(start, size)]
+    else:
+        step = (size - start) // ENCODING_SAMPLE_WINDOWS
+        windows = [
+            (offset, min(offset + ENCODING_WINDOW_SIZE, size))
+            for offset in range(start, size, step)
+        ][:ENCODING_SAMPLE_WINDOWS]
+
+    runs = []
+    for window_start, window_end in windows:
+        window = data[window_start:window_end]
+        for match in HIGH_BYTE_RUN.finditer(window):
+            at_edge = (
+                (match.start() == 0 and window_start > start)
+                or (match.end() == len(window) and window_end < size)
+            )
+            if not at_edge:
+                runs.append(match.group())
+
+    if not runs:
+        return 'utf-8'
+
+    for encoding in ('utf-8', 'cp1252'):
+        try:
+            for run in runs:
+                run.decode(encoding)
+            return encoding
+        except UnicodeDecodeError:
+            continue
+    return 'latin-1'
+
+
+def _detect_delimiter(sample: str) -> str:
+    """Detect CSV delimiter (comma, semicolon, tab or pipe) from decoded text."""
+    # Only sniff complete lines
+    if '\n' in sample:
+        sample = sample[:sample.rindex('\n')]
+
+    try:
+        return csv.Sniffer().sniff(sample, delimiters=CANDIDATE_DELIMITERS).delimiter
+    except csv.Error:
+        pass
+
+    # Fallback: count occurrences in first line
+    first_line = sample.split('\n')[0] if sample else ''
+    counts = {delim: first_line.count(delim) for delim in CANDIDATE_DELIMITERS}
+    best_delim = max(counts, key=counts.get)
+    return best_delim if counts[best_delim] > 0 else ','
+
+
+def _count_records(data, start: int) -> int:
+    """
+    Count CSV records (header included) on raw bytes.
+
+    Line breaks inside quoted fields are skipped by tracking quote parity:
+    after splitting a block on '"', every other piece is inside quotes.
+    Escaped quotes ("") toggle twice and cancel out.
+    """
+    size = len(data)
+    records = 0
+    in_quotes = False
+
+    for offset in range(start, size, COUNT_BLOCK_SIZE):
+        block_records, in_quotes = _count_block(data[offset:offset + COUNT_BLOCK_SIZE], in_quotes, b'\n', b'"')
+        records += block_records
+
+    if size > start and data[size - 1:size] != b'\n':
+        records += 1  # Final record without trailing newline
+    return records
+
+
+def _count_utf16_records(data) -> int:
+    """Count CSV records (header included) of a UTF-16 file, decoding one block at a time."""
+    decoder = codecs.getincrementaldecoder('utf-16')(errors='replace')
+    size = len(data)
+    records = 0
+    in_quotes = False
+    last_char = ''
+
+    for offset in range(0, size, COUNT_BLOCK_SIZE):
+        block_end = min(offset + COUNT_BLOCK_SIZE, size)
+        text = decoder.decode(data[offset:block_end], final=block_end == size)
+        if text:
+            block_records, in_quotes = _count_block(text, in_quotes, '\n', '"')
+            records += block_records
+            last_char = text[-1]
+
+    if last_char and last_char != '\n':
+        records += 1  # Final record without trailing newline
+    return records
+
+
+def _count_block(block, in_quotes: bool, newline, quote) -> tuple:
+    """Count line breaks outside quotes in a block of bytes or text; return (count, in_quotes after it)."""
+    if not in_quotes and quote not in block:
+        return block.count(newline), False
+
+    pieces = block.split(quote)
+    first_outside = 1 if in_quotes else 0
+    records = sum(piece.count(newline) for piece in pieces[first_outside::2])
+    if (len(pieces) - 1) % 2:
+        in_quotes = not in_quotes
+    return records, in_quotes
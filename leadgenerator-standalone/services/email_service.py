@@ -6,8 +6,10 @@ from datetime import datetime, timedelta
 from typing import List, Optional, Dict, Any
 
 from core.database import get_db
+from core.suppression_index import get_suppression_index
 from core.models import QueuedEmail, QueueStatus, ContactStatus, Campaign, Contact, EmailStep
-from core.exceptions import ValidationError
+from core.exceptions import DatabaseError, ValidationError
+from services.message_render_service import MessageRenderService
 
 logger = logging.getLogger(__name__)
 
@@ -31,12 +33,16 @@ class EmailService:
                    c.custom1, c.custom2, c.custom3, c.custom4, c.custom5,
                    c.custom6, c.custom7, c.custom8, c.custom9, c.custom10,
                    es.step_number, es.subject_template, es.body_template, es.delay_days,
+                   es.updated_at AS step_updated_at,
                    cam.name as campaign_name, cam.campaign_ref,
-                   cam.inter_email_delay_minutes, cam.randomization_minutes
+                   cam.inter_email_delay_minutes, cam.randomization_minutes,
+                   rc.subject AS rendered_subject, rc.body AS rendered_body
             FROM email_queue eq
             JOIN contacts c ON eq.contact_id = c.contact_id
             JOIN email_steps es ON eq.step_id = es.step_id
             JOIN campaigns cam ON eq.campaign_id = cam.campaign_id
+            LEFT JOIN rendered_messages rm ON rm.queue_id = eq.queue_id
+            LEFT JOIN rendered_contents rc ON rc.content_hash = rm.content_hash
             WHERE eq.status = 'Pending'
               AND eq.scheduled_at <= datetime('now')
               AND cam.status = 'Active'
@@ -207,7 +213,15 @@ class EmailService:
         """, (scheduled_at.isoformat(), campaign_id, contact_id))
 
         logger.info(f"Scheduled step {next_step_row['step_number']} for contact {contact_id}")
-        return cursor.lastrowid
+
+        queue_id = cursor.lastrowid
+        render_service = MessageRenderService()
+        if render_service.enabled:
+            try:
+                render_service.prerender_pending(campaign_id, queue_id=queue_id)
+            except DatabaseError as e:
+                logger.warning(f"Could not pre-render queue {queue_id}, it will be rendered when sent: {e}")
+        return queue_id
 
     def process_queue_item(self, queued_email: QueuedEmail) -> bool:
         """
@@ -215,12 +229,9 @@ class EmailService:
 
         Returns True if email should be sent, False if should be skipped.
         """
-        # Check suppression list
-        suppressed = self.db.fetchone("""
-            SELECT 1 FROM suppression_list WHERE email = ?
-        """, (queued_email.contact.email if queued_email.contact else '',))
-
-        if suppressed:
+        # Check suppression list (matched in memory on the contact's identity key)
+        contact_email = queued_email.contact.email if queued_email.contact else ''
+        if get_suppression_index().is_suppressed(contact_email):
             self.mark_email_skipped(queued_email.queue_id, "Contact is in suppression list")
             return False
 
@@ -292,6 +303,7 @@ class EmailService:
               AND created_at < ?
         """, (cutoff,))
         count = cursor.rowcount
+        MessageRenderService().prune_contents()
         logger.info(f"Cleared {count} old queue items")
         return count
 
@@ -302,7 +314,7 @@ class EmailService:
         query = """
             SELECT eq.*,
                    c.first_name, c.last_name, c.email as contact_email,
-                   es.subject_template, es.body_template
+                   es.subject_template, es.body_template, es.updated_at AS step_updated_at
             FROM email_queue eq
             LEFT JOIN contacts c ON eq.contact_id = c.contact_id
             LEFT JOIN email_steps es ON eq.step_id = es.step_id
@@ -325,7 +337,9 @@ class EmailService:
             attempts=row['attempts'],
             last_attempt_at=row['last_attempt_at'],
             error_message=row['error_message'],
-            created_at=row['created_at']
+            created_at=row['created_at'],
+            rendered_subject=row['rendered_subject'] if 'rendered_subject' in row.keys() else None,
+            rendered_body=row['rendered_body'] if 'rendered_body' in row.keys() else None
         )
 
         # Add contact if available
@@ -361,7 +375,8 @@ class EmailService:
                 step_number=row['step_number'] if 'step_number' in row.keys() else 1,
                 subject_template=row['subject_template'],
                 body_template=row['body_template'] if 'body_template' in row.keys() else '',
-                delay_days=row['delay_days'] if 'delay_days' in row.keys() else 0
+                delay_days=row['delay_days'] if 'delay_days' in row.keys() else 0,
+                updated_at=row['step_updated_at'] if 'step_updated_at' in row.keys() else None
             )
 
         # Add campaign info if available
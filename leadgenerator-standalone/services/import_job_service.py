@@ -0,0 +1,260 @@
+"""Persistent, resumable import jobs for Lead Generator Standalone."""
+
+import hashlib
+import json
+import logging
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from core.database import get_db
+from core.exceptions import CSVImportError
+from core.models import ImportJob, ImportJobStatus, ImportResult
+
+logger = logging.getLogger(__name__)
+
+# Bytes hashed at each end of the file for its fingerprint
+FINGERPRINT_SAMPLE_SIZE = 64 * 1024
+
+# Completed jobs (and their error rows) are purged after this many days
+COMPLETED_JOB_RETENTION_DAYS = 7
+
+# Jobs being run by this process; anything else left 'Running' was interrupted
+_active_jobs = set()
+_active_lock = threading.Lock()
+
+
+def file_fingerprint(file_path: Union[str, Path]) -> Tuple[int, str]:
+    """
+    Return (size, fingerprint) of an import file.
+
+    The fingerprint hashes the size and modification time with the first
+    and last 64 KB, which is enough to notice a replaced or edited file
+    without reading all of it. The mtime catches a same-size edit in the
+    middle, which would otherwise make a resume skip the wrong rows.
+    """
+    file_path = Path(file_path)
+    stat = file_path.stat()
+    size = stat.st_size
+    digest = hashlib.sha256(f"{size}:{stat.st_mtime_ns}".encode('ascii'))
+    with open(file_path, 'rb') as f:
+        digest.update(f.read(FINGERPRINT_SAMPLE_SIZE))
+        if size > FINGERPRINT_SAMPLE_SIZE:
+            f.seek(max(size - FINGERPRINT_SAMPLE_SIZE, FINGERPRINT_SAMPLE_SIZE))
+            digest.update(f.read())
+    return size, digest.hexdigest()
+
+
+class ImportJobService:
+    """Service for recording and checkpointing contact import jobs."""
+
+    def __init__(self):
+        self.db = get_db()
+
+    def create_job(
+        self,
+        list_id: int,
+        file_path: Union[str, Path],
+        field_mapping: Dict[str, str],
+        skip_duplicates: bool,
+        skip_suppressed: bool,
+        chunk_size: int
+    ) -> ImportJob:
+        """Record a new import job for a file, purging old completed jobs first."""
+        self.purge_completed_jobs()
+        file_path = Path(file_path).resolve()
+        size, fingerprint = file_fingerprint(file_path)
+        query = """
+            INSERT INTO import_jobs (
+                list_id, file_path, file_size, file_fingerprint, field_mapping,
+                skip_duplicates, skip_suppressed, chunk_size
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+        """
+        cursor = self.db.execute(query, (
+            list_id, str(file_path), size, fingerprint, json.dumps(field_mapping),
+            1 if skip_duplicates else 0, 1 if skip_suppressed else 0, chunk_size
+        ))
+        logger.info(f"Created import job {cursor.lastrowid} for {file_path}")
+        return self.get_job(cursor.lastrowid)
+
+    def get_job(self, job_id: int) -> Optional[ImportJob]:
+        """Get an import job by ID."""
+        query = """
+            SELECT j.*, l.name AS list_name
+            FROM import_jobs j
+            LEFT JOIN contact_lists l ON l.list_id = j.list_id
+            WHERE j.job_id = ?
+        """
+        row = self.db.fetchone(query, (job_id,))
+        return self._row_to_job(row) if row else None
+
+    def get_interrupted_jobs(self) -> List[ImportJob]:
+        """
+        Get jobs that stopped before completing and can be resumed.
+
+        Includes cancelled and failed jobs, and jobs still marked running
+        that no thread of this process is running (the app was closed or
+        crashed mid-import).
+        """
+        query = """
+            SELECT j.*, l.name AS list_name
+            FROM import_jobs j
+            LEFT JOIN contact_lists l ON l.list_id = j.list_id
+            WHERE j.status != ?
+            ORDER BY j.updated_at DESC, j.job_id DESC
+        """
+        rows = self.db.fetchall(query, (ImportJobStatus.COMPLETED.value,))
+        with _active_lock:
+            return [self._row_to_job(row) for row in rows if row['job_id'] not in _active_jobs]
+
+    def claim_job(self, job_id: int) -> None:
+        """Mark a job as run by this process; raises if it already is."""
+        with _active_lock:
+            if job_id in _active_jobs:
+                raise CSVImportError(f"Import job {job_id} is already running")
+            _active_jobs.add(job_id)
+        self.set_status(job_id, ImportJobStatus.RUNNING.value)
+
+    def release_job(self, job_id: int, status: str, last_error: Optional[str] = None) -> None:
+        """Record how a claimed job stopped and release it."""
+        try:
+            self.set_status(job_id, status, last_error)
+        finally:
+            with _active_lock:
+                _active_jobs.discard(job_id)
+
+    def set_rows_total(self, job_id: int, rows_total: int) -> None:
+        """Record the number of data rows in a job's file."""
+        self.db.execute("UPDATE import_jobs SET rows_total = ? WHERE job_id = ?", (rows_total, job_id))
+
+    def set_status(self, job_id: int, status: str, last_error: Optional[str] = None) -> None:
+        """Update the status of a job."""
+        query = """
+            UPDATE import_jobs
+            SET status = ?, last_error = ?, updated_at = datetime('now')
+            WHERE job_id = ?
+        """
+        self.db.execute(query, (status, last_error, job_id))
+
+    def record_checkpoint(
+        self,
+        cursor,
+        job_id: int,
+        rows_committed: int,
+        chunk_result: ImportResult
+    ) -> None:
+        """
+        Advance a job past one written chunk.
+
+        Call with the cursor of the transaction that wrote the chunk, so the
+        contacts, the offset and the rejected rows commit (or roll back) together.
+
+        Args:
+            cursor: Cursor of the open write transaction
+            job_id: Import job
+            rows_committed: Data rows done once this chunk commits
+            chunk_result: Counts and rejected rows of this chunk only
+        """
+        cursor.execute("""
+            UPDATE import_jobs
+            SET rows_committed = ?,
+                imported_count = imported_count + ?,
+                updated_count = updated_count + ?,
+                skipped_count = skipped_count + ?,
+                suppressed_count = suppressed_count + ?,
+                error_count = error_count + ?,
+                updated_at = datetime('now')
+            WHERE job_id = ?
+        """, (
+            rows_committed, chunk_result.imported, chunk_result.updated, chunk_result.skipped,
+            chunk_result.suppressed, chunk_result.error_count, job_id
+        ))
+
+        if chunk_result.errors:
+            cursor.executemany(
+                "INSERT INTO import_job_errors (job_id, row_number, error, row_data) VALUES (?, ?, ?, ?)",
+                [
+                    (job_id, error['row'], error['error'], json.dumps(error.get('data'), default=str))
+                    for error in chunk_result.errors
+                ]
+            )
+
+    def get_errors(self, job_id: int, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Get the rejected rows of a job, in file order."""
+        query = """
+            SELECT row_number, error, row_data FROM import_job_errors
+            WHERE job_id = ?
+            ORDER BY row_number
+        """
+        params: tuple = (job_id,)
+        if limit is not None:
+            query += " LIMIT ?"
+            params += (limit,)
+
+        return [
+            {
+                'row': row['row_number'],
+                'error': row['error'],
+                'data': json.loads(row['row_data']) if row['row_data'] else {}
+            }
+            for row in self.db.fetchall(query, params)
+        ]
+
+    def file_matches(self, job: ImportJob) -> bool:
+        """Check that a job's file still exists and is unchanged."""
+        try:
+            return file_fingerprint(job.file_path) == (job.file_size, job.file_fingerprint)
+        except OSError:
+            return False
+
+    def purge_completed_jobs(self, older_than_days: int = COMPLETED_JOB_RETENTION_DAYS) -> int:
+        """
+        Delete completed jobs last updated more than older_than_days ago.
+
+        Their error rows go with them (ON DELETE CASCADE); completed jobs
+        cannot be resumed, so nothing else refers to them.
+
+        Returns:
+            Number of jobs deleted
+        """
+        cursor = self.db.execute(
+            "DELETE FROM import_jobs WHERE status = ? AND updated_at < datetime('now', ?)",
+            (ImportJobStatus.COMPLETED.value, f'-{older_than_days} days')
+        )
+        if cursor.rowcount:
+            logger.info(f"Purged {cursor.rowcount} completed import jobs")
+        return cursor.rowcount
+
+    def discard_job(self, job_id: int) -> None:
+        """Forget a job and its error rows (contacts already imported are kept)."""
+        with _active_lock:
+            if job_id in _active_jobs:
+                raise CSVImportError(f"Import job {job_id} is still running")
+        self.db.execute("DELETE FROM import_jobs WHERE job_id = ?", (job_id,))
+        logger.info(f"Discarded import job {job_id}")
+
+    def _row_to_job(self, row) -> ImportJob:
+        """Convert database row to ImportJob model."""
+        return ImportJob(
+            job_id=row['job_id'],
+            list_id=row['list_id'],
+            file_path=row['file_path'],
+            file_size=row['file_size'],
+            file_fingerprint=row['file_fingerprint'],
+            field_mapping=json.loads(row['field_mapping']),
+            skip_duplicates=bool(row['skip_duplicates']),
+            skip_suppressed=bool(row['skip_suppressed']),
+            chunk_size=row['chunk_size'],
+            status=row['status'],
+            rows_total=row['rows_total'],
+            rows_committed=row['rows_committed'],
+            imported_count=row['imported_count'],
+            updated_count=row['updated_count'],
+            skipped_count=row['skipped_count'],
+            suppressed_count=row['suppressed_count'],
+            error_count=row['error_count'],
+            last_error=row['last_error'],
+            created_at=row['created_at'],
+            updated_at=row['updated_at'],
+            list_name=row['list_name']
+        )
@@ -0,0 +1,189 @@
+"""Pre-rendered message store for Lead Generator Standalone."""
+
+import hashlib
+import logging
+from collections import defaultdict
+from typing import Optional
+
+from core.database import get_db, get_setting
+from core.models import Campaign, Contact, EmailStep, RenderedMessage
+from services.template_service import TemplateService
+
+logger = logging.getLogger(__name__)
+
+# Queued emails rendered per transaction
+PRERENDER_BATCH_SIZE = 1000
+
+# Pending emails of a campaign that have no rendered message yet
+UNRENDERED_QUERY = """
+    SELECT eq.queue_id, eq.step_id,
+           c.title, c.first_name, c.last_name, c.email, c.company, c.position, c.phone,
+           c.custom1, c.custom2, c.custom3, c.custom4, c.custom5,
+           c.custom6, c.custom7, c.custom8, c.custom9, c.custom10,
+           es.subject_template, es.body_template, es.updated_at AS step_updated_at,
+           cam.campaign_ref
+    FROM email_queue eq
+    JOIN contacts c ON c.contact_id = eq.contact_id
+    JOIN email_steps es ON es.step_id = eq.step_id
+    JOIN campaigns cam ON cam.campaign_id = eq.campaign_id
+    WHERE eq.campaign_id = ?
+      AND eq.status = 'Pending'
+      AND eq.queue_id > ?
+      {queue_filter}
+      AND NOT EXISTS (SELECT 1 FROM rendered_messages rm WHERE rm.queue_id = eq.queue_id)
+    ORDER BY eq.queue_id
+    LIMIT ?
+"""
+
+
+def content_hash(subject: str, body: str) -> str:
+    """Return the content address of a rendered subject and body."""
+    return hashlib.sha256(f"{subject}\0{body}".encode('utf-8')).hexdigest()
+
+
+class MessageRenderService:
+    """
+    Service for rendering queued emails ahead of sending.
+
+    Messages are rendered when their step is scheduled and stored by content
+    hash, so a step without per-contact tags is stored once for the whole
+    campaign. The worker reads them back with the queue row and only renders
+    at send time when no (still valid) rendered message exists.
+    """
+
+    def __init__(self):
+        self.db = get_db()
+        self.template_service = TemplateService()
+
+    @property
+    def enabled(self) -> bool:
+        """Whether messages are pre-rendered when scheduled (setting prerender_messages)."""
+        return get_setting('prerender_messages', '1') == '1'
+
+    def prerender_pending(self, campaign_id: int, queue_id: Optional[int] = None) -> int:
+        """
+        Render pending emails of a campaign that have no rendered message.
+
+        Args:
+            campaign_id: Campaign whose queue is rendered
+            queue_id: Only render this queued email
+
+        Returns:
+            Number of messages rendered
+        """
+        queue_filter = "AND eq.queue_id = ?" if queue_id is not None else ""
+        query = UNRENDERED_QUERY.format(queue_filter=queue_filter)
+
+        rendered = 0
+        last_queue_id = 0
+        while True:
+            params = (campaign_id, last_queue_id)
+            if queue_id is not None:
+                params += (queue_id,)
+            params += (PRERENDER_BATCH_SIZE,)
+
+            with self.db.get_cursor() as cursor:
+                # Hold the write lock while reading, so a contact or step edited
+                # meanwhile cannot leave a stale message behind
+                cursor.execute("BEGIN IMMEDIATE")
+                cursor.execute(query, params)
+                rows = cursor.fetchall()
+                if not rows:
+                    break
+                rendered += self._store_batch(cursor, rows)
+                last_queue_id = rows[-1]['queue_id']
+
+            if len(rows) < PRERENDER_BATCH_SIZE:
+                break
+
+        if rendered:
+            logger.info(f"Pre-rendered {rendered} messages for campaign {campaign_id}")
+        return rendered
+
+    def get_rendered_message(self, queue_id: int) -> Optional[RenderedMessage]:
+        """Get the pre-rendered message of a queued email, e.g. to review it before sending."""
+        query = """
+            SELECT rm.queue_id, rm.content_hash, rm.rendered_at, rc.subject, rc.body
+            FROM rendered_messages rm
+            JOIN rendered_contents rc ON rc.content_hash = rm.content_hash
+            WHERE rm.queue_id = ?
+        """
+        row = self.db.fetchone(query, (queue_id,))
+        if not row:
+            return None
+        return RenderedMessage(
+            queue_id=row['queue_id'],
+            content_hash=row['content_hash'],
+            subject=row['subject'],
+            body=row['body'],
+            rendered_at=row['rendered_at']
+        )
+
+    def prune_contents(self) -> int:
+        """Delete rendered contents no queued email refers to any more."""
+        cursor = self.db.execute("""
+            DELETE FROM rendered_contents
+            WHERE NOT EXISTS (
+                SELECT 1 FROM rendered_messages rm WHERE rm.content_hash = rendered_contents.content_hash
+            )
+        """)
+        return cursor.rowcount
+
+    def _store_batch(self, cursor, rows) -> int:
+        """Render a batch of queue rows and store the messages."""
+        rows_by_step = defaultdict(list)
+        for row in rows:
+            rows_by_step[row['step_id']].append(row)
+
+        contents = {}
+        messages = []
+        for step_rows in rows_by_step.values():
+            first = step_rows[0]
+            step = EmailStep(
+                step_id=first['step_id'],
+                subject_template=first['subject_template'],
+                body_template=first['body_template'],
+                updated_at=first['step_updated_at']
+            )
+            campaign = Campaign(campaign_ref=first['campaign_ref'])
+            subject_template, body_template = self.template_service.compile_step(step)
+            contacts = [self._row_to_contact(row) for row in step_rows]
+
+            subjects = self.template_service.render_many(subject_template, contacts, campaign)
+            bodies = self.template_service.render_many(body_template, contacts, campaign)
+            for row, subject, body in zip(step_rows, subjects, bodies):
+                digest = content_hash(subject, body)
+                contents[digest] = (digest, subject, body)
+                messages.append((row['queue_id'], digest))
+
+        cursor.executemany(
+            "INSERT OR IGNORE INTO rendered_contents (content_hash, subject, body) VALUES (?, ?, ?)",
+            list(contents.values())
+        )
+        cursor.executemany(
+            "INSERT OR REPLACE INTO rendered_messages (queue_id, content_hash) VALUES (?, ?)",
+            messages
+        )
+        return len(messages)
+
+    def _row_to_contact(self, row) -> Contact:
+        """Build the Contact used for merge tags from a queue row."""
+        return Contact(
+            title=row['title'],
+            first_name=row['first_name'],
+            last_name=row['last_name'],
+            email=row['email'],
+            company=row['company'],
+            position=row['position'],
+            phone=row['phone'],
+            custom1=row['custom1'],
+            custom2=row['custom2'],
+            custom3=row['custom3'],
+            custom4=row['custom4'],
+            custom5=row['custom5'],
+            custom6=row['custom6'],
+            custom7=row['custom7'],
+            custom8=row['custom8'],
+            custom9=row['custom9'],
+            custom10=row['custom10'],
+        )
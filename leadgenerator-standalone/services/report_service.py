@@ -1,14 +1,79 @@
 """Report generation service for Lead Generator Standalone."""
 
+import csv
 import logging
+import os
+import re
+import tempfile
+import threading
+import time
+import zipfile
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta
-from typing import List, Dict, Optional, Any
-
-from core.database import get_db
+from pathlib import Path
+from typing import Any, Callable, Dict, Hashable, Iterator, List, Optional, Tuple
+
+# Optional report export formats
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    ARROW_AVAILABLE = True
+except ImportError:
+    ARROW_AVAILABLE = False
+
+try:
+    import openpyxl
+    XLSX_AVAILABLE = True
+except ImportError:
+    XLSX_AVAILABLE = False
+
+from core.database import Database, get_db
+from core.exceptions import JobCancelledError, ValidationError
 from core.models import EmailLog, Campaign
+from core.pagination import Page, decode_cursor, keyset_condition, build_page
+from services.campaign_service import CampaignService
 
 logger = logging.getLogger(__name__)
 
+# Seconds a cached dashboard result is served before it is recomputed
+REPORT_CACHE_TTL_SECONDS = 120
+
+# Cached results each worker event can make stale (by cache key kind)
+EVENT_INVALIDATIONS = {
+    'email_sent': ('dashboard_stats', 'campaign_summaries', 'activity_feed'),
+    'reply_detected': ('dashboard_stats', 'campaign_summaries', 'activity_feed'),
+    'unsubscribe_detected': ('campaign_summaries',),
+}
+
+# Report export formats, by file extension
+REPORT_EXPORT_FORMATS = {'.csv': 'csv', '.xlsx': 'xlsx', '.parquet': 'parquet'}
+
+# Email log rows fetched from SQLite per batch when exporting
+REPORT_EXPORT_BATCH_SIZE = 10000
+
+# Campaign reports written at once by export_all_campaign_reports()
+REPORT_EXPORT_WORKERS = 4
+
+REPORT_LOG_HEADERS = ['date', 'contact_name', 'contact_email', 'subject', 'status', 'error']
+
+# Every email log row of a campaign, newest first, in REPORT_LOG_HEADERS order
+REPORT_LOG_QUERY = """
+    SELECT el.sent_at,
+           TRIM(COALESCE(c.first_name, '') || ' ' || COALESCE(c.last_name, '')),
+           COALESCE(c.email, ''), COALESCE(el.subject, ''), el.status, COALESCE(el.error_message, '')
+    FROM email_logs el
+    LEFT JOIN contacts c ON el.contact_id = c.contact_id
+    WHERE el.campaign_id = ?
+    ORDER BY el.sent_at DESC, el.log_id DESC
+"""
+
+# Cached dashboard results by key, (kind, *args): (expires_at, value), for _report_cache_db
+_report_cache: Dict[Tuple[Hashable, ...], Tuple[float, Any]] = {}
+_report_cache_db: Optional[Database] = None
+_report_cache_lock = threading.Lock()
+# Bumped by every invalidation, so a result computed across one is not stored
+_report_cache_generation = 0
+
 
 class ReportService:
     """Service for generating campaign reports."""
@@ -17,7 +82,22 @@ class ReportService:
         self.db = get_db()
 
     def get_dashboard_stats(self) -> Dict[str, Any]:
-        """Get overview statistics for dashboard."""
+        """Get overview statistics for dashboard (cached, see invalidate_report_cache)."""
+        return _cached(self.db, ('dashboard_stats',), self._compute_dashboard_stats)
+
+    def get_campaign_summaries(self, status_filter: Optional[str] = 'Active') -> List[Campaign]:
+        """Get campaigns with their stats for the dashboard (cached)."""
+        return _cached(
+            self.db, ('campaign_summaries', status_filter),
+            lambda: CampaignService().get_all_campaigns(status_filter=status_filter)
+        )
+
+    def get_activity_feed(self, limit: int = 20) -> List[Dict[str, Any]]:
+        """Get recent activity feed for dashboard (cached)."""
+        return _cached(self.db, ('activity_feed', limit), lambda: self._compute_activity_feed(limit))
+
+    def _compute_dashboard_stats(self) -> Dict[str, Any]:
+        """Compute overview statistics for dashboard."""
         stats = {
             'active_campaigns': 0,
             'total_contacts': 0,
@@ -37,12 +117,12 @@ class ReportService:
         """)
         stats['total_contacts'] = row['count'] if row else 0
 
-        # Emails sent in last 30 days
-        thirty_days_ago = (datetime.now() - timedelta(days=30)).isoformat()
+        # Emails sent in last 30 days (from the daily rollup)
+        start_day = (datetime.now() - timedelta(days=30)).strftime('%Y-%m-%d')
         row = self.db.fetchone("""
-            SELECT COUNT(*) as count FROM email_logs
-            WHERE status = 'Sent' AND sent_at >= ?
-        """, (thirty_days_ago,))
+            SELECT COALESCE(SUM(count), 0) as count FROM daily_send_stats
+            WHERE status = 'Sent' AND day >= ?
+        """, (start_day,))
         stats['emails_sent_30d'] = row['count'] if row else 0
 
         # Response rate (responded / total sent in active + completed campaigns)
@@ -91,7 +171,7 @@ class ReportService:
         return report
 
     def _get_campaign_stats(self, campaign_id: int) -> Dict[str, int]:
-        """Get campaign contact statistics."""
+        """Get campaign contact and email statistics."""
         stats = {
             'total': 0,
             'pending': 0,
@@ -99,7 +179,9 @@ class ReportService:
             'responded': 0,
             'completed': 0,
             'bounced': 0,
-            'unsubscribed': 0
+            'unsubscribed': 0,
+            'emails_sent': 0,
+            'emails_failed': 0
         }
 
         rows = self.db.fetchall("""
@@ -117,53 +199,107 @@ class ReportService:
                 stats[status] = row['count']
             stats['total'] += row['count']
 
+        rows = self.db.fetchall("""
+            SELECT status, SUM(count) as count
+            FROM daily_send_stats
+            WHERE campaign_id = ?
+            GROUP BY status
+        """, (campaign_id,))
+
+        for row in rows:
+            if row['status'] == 'Sent':
+                stats['emails_sent'] = row['count']
+            elif row['status'] == 'Failed':
+                stats['emails_failed'] = row['count']
+
         return stats
 
     def _get_daily_send_stats(self, campaign_id: int, days: int = 14) -> List[Dict[str, Any]]:
-        """Get daily email send statistics."""
+        """Get daily email send, response and unsubscribe counts (from the daily rollups)."""
         start_date = (datetime.now() - timedelta(days=days)).strftime('%Y-%m-%d')
 
         rows = self.db.fetchall("""
-            SELECT DATE(sent_at) as date, status, COUNT(*) as count
-            FROM email_logs
-            WHERE campaign_id = ? AND sent_at >= ?
-            GROUP BY DATE(sent_at), status
-            ORDER BY date
-        """, (campaign_id, start_date))
+            SELECT day, status, SUM(count) as count
+            FROM daily_send_stats
+            WHERE campaign_id = ? AND day >= ?
+            GROUP BY day, status
+            UNION ALL
+            SELECT day, status, count
+            FROM daily_contact_stats
+            WHERE campaign_id = ? AND day >= ?
+            ORDER BY day
+        """, (campaign_id, start_date, campaign_id, start_date))
 
         # Aggregate by date
         daily_stats = {}
+        columns = {'Sent': 'sent', 'Failed': 'failed', 'Responded': 'responses', 'Unsubscribed': 'unsubscribes'}
         for row in rows:
-            date = row['date']
+            date = row['day']
             if date not in daily_stats:
-                daily_stats[date] = {'date': date, 'sent': 0, 'failed': 0}
+                daily_stats[date] = {'date': date, 'sent': 0, 'failed': 0, 'responses': 0, 'unsubscribes': 0}
 
-            if row['status'] == 'Sent':
-                daily_stats[date]['sent'] = row['count']
-            elif row['status'] == 'Failed':
-                daily_stats[date]['failed'] = row['count']
+            column = columns.get(row['status'])
+            if column:
+                daily_stats[date][column] = row['count']
 
         return list(daily_stats.values())
 
     def _get_step_performance(self, campaign_id: int) -> List[Dict[str, Any]]:
-        """Get performance metrics for each email step."""
+        """
+        Get performance metrics for each email step.
+
+        Each response is attributed to the last step sent to the contact
+        before responded_at; reply latency is measured from that send.
+        """
         rows = self.db.fetchall("""
-            SELECT
-                es.step_number,
-                es.subject_template,
-                COUNT(DISTINCT el.contact_id) as sent_count,
-                (SELECT COUNT(*) FROM campaign_contacts cc
-                 WHERE cc.campaign_id = es.campaign_id
-                   AND cc.status = 'Responded'
-                   AND cc.current_step >= es.step_number) as responses_after
+            WITH sends AS (
+                SELECT log_id, contact_id, step_id, sent_at
+                FROM email_logs
+                WHERE campaign_id = ? AND status = 'Sent'
+            ),
+            attributed AS (
+                SELECT s.step_id,
+                       (julianday(cc.responded_at) - julianday(s.sent_at)) * 24 AS reply_hours,
+                       ROW_NUMBER() OVER (
+                           PARTITION BY cc.contact_id ORDER BY s.sent_at DESC, s.log_id DESC
+                       ) AS recency
+                FROM campaign_contacts cc
+                JOIN sends s ON s.contact_id = cc.contact_id
+                            AND julianday(s.sent_at) <= julianday(cc.responded_at)
+                WHERE cc.campaign_id = ? AND cc.status = 'Responded' AND cc.responded_at IS NOT NULL
+            ),
+            step_sends AS (
+                SELECT step_id, COUNT(DISTINCT contact_id) AS sent_count
+                FROM sends
+                GROUP BY step_id
+            ),
+            step_responses AS (
+                SELECT step_id, COUNT(*) AS responses, AVG(reply_hours) AS avg_reply_hours
+                FROM attributed
+                WHERE recency = 1
+                GROUP BY step_id
+            )
+            SELECT es.step_id, es.step_number, es.subject_template,
+                   COALESCE(ss.sent_count, 0) AS sent_count,
+                   COALESCE(sr.responses, 0) AS responses,
+                   sr.avg_reply_hours
             FROM email_steps es
-            LEFT JOIN email_logs el ON es.step_id = el.step_id AND el.status = 'Sent'
+            LEFT JOIN step_sends ss ON ss.step_id = es.step_id
+            LEFT JOIN step_responses sr ON sr.step_id = es.step_id
             WHERE es.campaign_id = ?
-            GROUP BY es.step_id
             ORDER BY es.step_number
-        """, (campaign_id,))
+        """, (campaign_id, campaign_id, campaign_id))
 
-        return [dict(row) for row in rows]
+        performance = []
+        for row in rows:
+            step = dict(row)
+            step['response_rate'] = (
+                round(step['responses'] / step['sent_count'] * 100, 1) if step['sent_count'] else 0.0
+            )
+            if step['avg_reply_hours'] is not None:
+                step['avg_reply_hours'] = round(step['avg_reply_hours'], 1)
+            performance.append(step)
+        return performance
 
     def get_email_logs(
         self,
@@ -211,51 +347,304 @@ class ReportService:
         rows = self.db.fetchall(query, tuple(params))
         return [self._row_to_email_log(row) for row in rows]
 
-    def export_campaign_report(self, campaign_id: int, file_path: str) -> None:
-        """Export campaign report to CSV file."""
-        report = self.get_campaign_report(campaign_id)
-
-        with open(file_path, 'w', encoding='utf-8') as f:
-            # Header
-            f.write(f"Campaign Report: {report['campaign']['name']}\n")
-            f.write(f"Reference: {report['campaign']['ref']}\n")
-            f.write(f"Status: {report['campaign']['status']}\n")
-            f.write(f"Generated: {datetime.now().isoformat()}\n\n")
-
-            # Stats
-            f.write("Statistics\n")
-            f.write("-" * 40 + "\n")
-            stats = report['stats']
-            f.write(f"Total Contacts: {stats['total']}\n")
-            f.write(f"Pending: {stats['pending']}\n")
-            f.write(f"In Progress: {stats['in_progress']}\n")
-            f.write(f"Responded: {stats['responded']}\n")
-            f.write(f"Completed: {stats['completed']}\n")
-            f.write(f"Bounced: {stats['bounced']}\n")
-            f.write(f"Unsubscribed: {stats['unsubscribed']}\n\n")
-
-            # Response rate
-            if stats['total'] > 0:
-                response_rate = (stats['responded'] / stats['total']) * 100
-                f.write(f"Response Rate: {response_rate:.1f}%\n\n")
-
-            # Email logs
-            f.write("Email Log\n")
-            f.write("-" * 40 + "\n")
-            f.write("date,contact_name,contact_email,subject,status,error\n")
-
-            logs = self.get_email_logs(campaign_id=campaign_id, days=365, limit=10000)
-            for log in logs:
-                name = f"{log.contact_name or ''}"
-                email = log.contact_email or ''
-                subject = (log.subject or '').replace(',', ';')
-                error = (log.error_message or '').replace(',', ';')
-                f.write(f"{log.sent_at},{name},{email},{subject},{log.status},{error}\n")
+    def get_email_logs_page(
+        self,
+        campaign_id: Optional[int] = None,
+        contact_id: Optional[int] = None,
+        status: Optional[str] = None,
+        days: Optional[int] = None,
+        limit: int = 100,
+        cursor: Optional[str] = None
+    ) -> Page[EmailLog]:
+        """
+        Get one page of email logs, newest first, using keyset pagination.
+
+        Rows are ordered by (sent_at, log_id) descending; pass the returned
+        page's next_cursor to fetch the following page.
+        """
+        conditions = []
+        params: List[Any] = []
+
+        if campaign_id:
+            conditions.append("el.campaign_id = ?")
+            params.append(campaign_id)
+
+        if contact_id:
+            conditions.append("el.contact_id = ?")
+            params.append(contact_id)
+
+        if status:
+            conditions.append("el.status = ?")
+            params.append(status)
+
+        if days:
+            start_date = (datetime.now() - timedelta(days=days)).isoformat()
+            conditions.append("el.sent_at >= ?")
+            params.append(start_date)
+
+        if cursor:
+            conditions.append(keyset_condition(['el.sent_at', 'el.log_id'], descending=True))
+            params.extend(decode_cursor(cursor, 2))
+
+        where_clause = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+
+        query = f"""
+            SELECT el.*,
+                   c.first_name, c.last_name, c.email as contact_email
+            FROM email_logs el
+            LEFT JOIN contacts c ON el.contact_id = c.contact_id
+            {where_clause}
+            ORDER BY el.sent_at DESC, el.log_id DESC
+            LIMIT ?
+        """
+        params.append(limit + 1)
+
+        rows = self.db.fetchall(query, tuple(params))
+        return build_page(
+            rows, limit, self._row_to_email_log,
+            lambda row: (row['sent_at'], row['log_id'])
+        )
+
+    def export_campaign_report(
+        self,
+        campaign_id: int,
+        file_path: str,
+        progress_callback: Optional[Callable[[int, int], None]] = None,
+        should_cancel: Optional[Callable[[], bool]] = None
+    ) -> int:
+        """
+        Export a campaign report as CSV, XLSX or Parquet, chosen by file extension.
+
+        The whole email log is streamed from a SQLite cursor, so memory use
+        does not grow with the campaign. CSV and XLSX reports start with
+        the campaign summary; Parquet holds the email log only.
+
+        Args:
+            campaign_id: Campaign to report on
+            file_path: Path for the output file
+            progress_callback: Called with (rows_exported, total_rows) after each batch
+            should_cancel: Polled before each batch; return True to stop
+
+        Returns:
+            Number of email log rows exported
+
+        Raises:
+            JobCancelledError: If cancelled; the partial file is removed,
+                as it is on any other error
+        """
+        file_format = REPORT_EXPORT_FORMATS.get(Path(file_path).suffix.lower())
+        if file_format is None:
+            raise ValidationError(f"Unsupported report format: {Path(file_path).suffix}")
+
+        summary = self._report_summary(campaign_id)
+        batches = self._iter_report_logs(campaign_id, progress_callback, should_cancel)
+        try:
+            if file_format == 'xlsx':
+                count = self._write_report_xlsx(summary, batches, file_path)
+            elif file_format == 'parquet':
+                count = self._write_report_parquet(batches, file_path)
+            else:
+                count = self._write_report_csv(summary, batches, file_path)
+        except BaseException:
+            # Never leave a partial report behind
+            Path(file_path).unlink(missing_ok=True)
+            raise
 
         logger.info(f"Exported campaign report to {file_path}")
+        return count
 
-    def get_activity_feed(self, limit: int = 20) -> List[Dict[str, Any]]:
-        """Get recent activity feed for dashboard."""
+    def export_all_campaign_reports(
+        self,
+        file_path: str,
+        file_format: str = 'csv',
+        max_workers: int = REPORT_EXPORT_WORKERS,
+        progress_callback: Optional[Callable[[int, int], None]] = None,
+        should_cancel: Optional[Callable[[], bool]] = None
+    ) -> int:
+        """
+        Export the report of every campaign into one zip file.
+
+        Reports are written in parallel to temporary files, each thread on
+        its own SQLite connection, and added to the archive as they finish.
+
+        Args:
+            file_path: Path of the zip file
+            file_format: 'csv', 'xlsx' or 'parquet'
+            max_workers: Reports written at once
+            progress_callback: Called with (reports_done, total_reports) as reports finish
+            should_cancel: Polled by every report between batches; return True to stop
+
+        Returns:
+            Number of campaign reports exported
+
+        Raises:
+            JobCancelledError: If cancelled; the partial zip file is removed,
+                as it is when any report fails
+        """
+        extension = f".{file_format}"
+        if extension not in REPORT_EXPORT_FORMATS:
+            raise ValidationError(f"Unsupported report format: {file_format}")
+
+        campaigns = self.db.fetchall("SELECT campaign_id, campaign_ref, name FROM campaigns ORDER BY campaign_id")
+        try:
+            with tempfile.TemporaryDirectory() as temp_dir, \
+                    zipfile.ZipFile(file_path, 'w', compression=zipfile.ZIP_DEFLATED) as archive:
+                with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                    futures = {}
+                    for row in campaigns:
+                        member = self._report_member_name(row) + extension
+                        temp_path = os.path.join(temp_dir, member)
+                        future = executor.submit(
+                            self._export_in_worker, row['campaign_id'], temp_path, should_cancel
+                        )
+                        futures[future] = (member, temp_path)
+
+                    try:
+                        for done, future in enumerate(as_completed(futures), 1):
+                            future.result()
+                            member, temp_path = futures[future]
+                            archive.write(temp_path, member)
+                            os.unlink(temp_path)
+                            if progress_callback:
+                                progress_callback(done, len(campaigns))
+                    except BaseException:
+                        # Don't start the reports still queued
+                        executor.shutdown(cancel_futures=True)
+                        raise
+        except BaseException as e:
+            # Never leave a partial zip behind
+            Path(file_path).unlink(missing_ok=True)
+            if isinstance(e, JobCancelledError):
+                logger.info("Export of all campaign reports cancelled")
+            raise
+
+        logger.info(f"Exported {len(campaigns)} campaign reports to {file_path}")
+        return len(campaigns)
+
+    def _export_in_worker(
+        self,
+        campaign_id: int,
+        file_path: str,
+        should_cancel: Optional[Callable[[], bool]] = None
+    ) -> int:
+        """Export one report from a pool thread, closing its connection afterwards."""
+        try:
+            return self.export_campaign_report(campaign_id, file_path, should_cancel=should_cancel)
+        finally:
+            self.db.close_thread_connection()
+
+    def _report_member_name(self, row) -> str:
+        """Build a safe archive file name for a campaign report."""
+        name = re.sub(r'[^\w.-]+', '_', f"{row['campaign_ref']} {row['name']}").strip('_.')
+        return name or f"campaign_{row['campaign_id']}"
+
+    def _report_summary(self, campaign_id: int) -> List[List[Any]]:
+        """Get the campaign summary rows (label, value) written above the email log."""
+        campaign_row = self.db.fetchone(
+            "SELECT name, campaign_ref, status FROM campaigns WHERE campaign_id = ?", (campaign_id,)
+        )
+        if not campaign_row:
+            raise ValidationError(f"Campaign {campaign_id} not found")
+
+        stats = self._get_campaign_stats(campaign_id)
+        summary = [
+            ['Campaign Report', campaign_row['name']],
+            ['Reference', campaign_row['campaign_ref']],
+            ['Status', campaign_row['status']],
+            ['Generated', datetime.now().isoformat()],
+            [],
+            ['Statistics'],
+            ['Total Contacts', stats['total']],
+            ['Pending', stats['pending']],
+            ['In Progress', stats['in_progress']],
+            ['Responded', stats['responded']],
+            ['Completed', stats['completed']],
+            ['Bounced', stats['bounced']],
+            ['Unsubscribed', stats['unsubscribed']],
+            ['Emails Sent', stats['emails_sent']],
+            ['Emails Failed', stats['emails_failed']],
+        ]
+        if stats['total'] > 0:
+            summary.append(['Response Rate', f"{stats['responded'] / stats['total'] * 100:.1f}%"])
+        return summary
+
+    def _iter_report_logs(
+        self,
+        campaign_id: int,
+        progress_callback: Optional[Callable[[int, int], None]] = None,
+        should_cancel: Optional[Callable[[], bool]] = None
+    ) -> Iterator[list]:
+        """Yield a campaign's email log rows in batches straight from the cursor."""
+        total = 0
+        if progress_callback:
+            total = self.db.fetchone(
+                "SELECT COALESCE(SUM(count), 0) FROM daily_send_stats WHERE campaign_id = ?", (campaign_id,)
+            )[0]
+        done = 0
+        for rows in self.db.iter_batches(REPORT_LOG_QUERY, (campaign_id,), REPORT_EXPORT_BATCH_SIZE):
+            if should_cancel and should_cancel():
+                raise JobCancelledError(f"Report export cancelled after {done} rows")
+            yield rows
+            done += len(rows)
+            if progress_callback:
+                progress_callback(done, max(total, done))
+
+    def _write_report_csv(self, summary: List[List[Any]], batches: Iterator[list], file_path: str) -> int:
+        """Write a CSV report; every field is quoted by csv.writer as needed."""
+        count = 0
+        with open(file_path, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f)
+            writer.writerows(summary)
+            writer.writerows([[], ['Email Log'], REPORT_LOG_HEADERS])
+            for rows in batches:
+                writer.writerows(rows)
+                count += len(rows)
+        return count
+
+    def _write_report_xlsx(self, summary: List[List[Any]], batches: Iterator[list], file_path: str) -> int:
+        """Write an XLSX report with a summary sheet and an email log sheet."""
+        if not XLSX_AVAILABLE:
+            raise ValidationError("XLSX export requires openpyxl (pip install openpyxl)")
+
+        # Write-only workbooks stream rows to disk instead of keeping them in memory
+        workbook = openpyxl.Workbook(write_only=True)
+        summary_sheet = workbook.create_sheet('Summary')
+        for row in summary:
+            summary_sheet.append(row)
+
+        log_sheet = workbook.create_sheet('Email Log')
+        log_sheet.append(REPORT_LOG_HEADERS)
+        count = 0
+        for rows in batches:
+            for row in rows:
+                log_sheet.append(list(row))
+            count += len(rows)
+
+        workbook.save(file_path)
+        return count
+
+    def _write_report_parquet(self, batches: Iterator[list], file_path: str) -> int:
+        """Write a campaign's email log as Parquet, one row group per batch."""
+        if not ARROW_AVAILABLE:
+            raise ValidationError("Parquet export requires pyarrow (pip install pyarrow)")
+
+        schema = pa.schema([(name, pa.string()) for name in REPORT_LOG_HEADERS])
+        writer = pq.ParquetWriter(file_path, schema, compression='zstd')
+        count = 0
+        try:
+            for rows in batches:
+                arrays = [
+                    pa.array([row[i] for row in rows], type=pa.string())
+                    for i in range(len(REPORT_LOG_HEADERS))
+                ]
+                writer.write_table(pa.Table.from_batches([pa.RecordBatch.from_arrays(arrays, schema=schema)]))
+                count += len(rows)
+        finally:
+            writer.close()
+        return count
+
+    def _compute_activity_feed(self, limit: int) -> List[Dict[str, Any]]:
+        """Compute recent activity feed for dashboard."""
         activities = []
 
         # Recent emails sent
@@ -316,3 +705,45 @@ class ReportService:
             contact_name=f"{row['first_name'] or ''} {row['last_name'] or ''}".strip() if 'first_name' in row.keys() else None,
             contact_email=row['contact_email'] if 'contact_email' in row.keys() else None
         )
+
+
+def _cached(db: Database, key: Tuple[Hashable, ...], compute: Callable[[], Any]) -> Any:
+    """Return a cached report result, computing it when missing or expired."""
+    global _report_cache_db
+    now = time.monotonic()
+    with _report_cache_lock:
+        if _report_cache_db is not db:
+            _report_cache.clear()
+            _report_cache_db = db
+        entry = _report_cache.get(key)
+        if entry is not None and entry[0] > now:
+            return entry[1]
+        generation = _report_cache_generation
+
+    value = compute()
+    with _report_cache_lock:
+        if generation == _report_cache_generation and _report_cache_db is db:
+            _report_cache[key] = (now + REPORT_CACHE_TTL_SECONDS, value)
+    return value
+
+
+def invalidate_report_cache(*kinds: str) -> None:
+    """
+    Forget cached dashboard results.
+
+    Args:
+        kinds: Key kinds to drop, e.g. 'dashboard_stats' (default: all)
+    """
+    global _report_cache_generation
+    with _report_cache_lock:
+        _report_cache_generation += 1
+        if not kinds:
+            _report_cache.clear()
+            return
+        for key in [key for key in _report_cache if key[0] in kinds]:
+            del _report_cache[key]
+
+
+def invalidate_for_event(event: str) -> None:
+    """Forget the cached results a worker event (see EVENT_INVALIDATIONS) makes stale."""
+    invalidate_report_cache(*EVENT_INVALIDATIONS[event])
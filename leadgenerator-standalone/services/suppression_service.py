@@ -2,14 +2,51 @@
 
 import logging
 from datetime import datetime
-from typing import List, Optional
+from typing import List, Optional, Any, Iterator, Iterable, Callable, Set
 
-from core.database import get_db
-from core.models import SuppressionEntry, SuppressionScope, SuppressionSource
-from core.exceptions import ValidationError, SuppressionError
+from core.database import SQLITE_HAS_RETURNING, get_db
+from core.identity import normalize_email, email_key
+from core.suppression_index import get_suppression_index, parse_suppression_rule, rule_globs
+from core.models import SuppressionEntry, SuppressionRule, SuppressionScope, SuppressionSource
+from core.pagination import Page, decode_cursor, keyset_condition, build_page
+from core.exceptions import ValidationError, SuppressionError, JobCancelledError
 
 logger = logging.getLogger(__name__)
 
+# Emails staged between progress/cancel checks during imports
+IMPORT_BATCH_SIZE = 10000
+
+# Per-connection staging table for bulk imports
+STAGING_TABLE = """
+    CREATE TEMP TABLE IF NOT EXISTS suppression_import (
+        email TEXT PRIMARY KEY,
+        email_key TEXT NOT NULL
+    )
+"""
+
+# Contacts sharing an identity with a staged address
+STAGED_IDENTITY_CONTACTS = """
+    SELECT c.contact_id FROM contacts c
+    JOIN contact_identities ci ON ci.identity_id = c.identity_id
+    WHERE ci.email_key IN (SELECT email_key FROM temp.suppression_import)
+"""
+
+
+def _insert_or_ignore(cursor: Any, table: str, insert: str, params: tuple) -> Optional[Any]:
+    """
+    Run an INSERT OR IGNORE into table and return the inserted row, or None if it was ignored.
+
+    Uses RETURNING where SQLite supports it and reads the row back by rowid otherwise.
+    """
+    if SQLITE_HAS_RETURNING:
+        cursor.execute(f"{insert} RETURNING *", params)
+        return cursor.fetchone()
+    cursor.execute(insert, params)
+    if cursor.rowcount == 0:
+        return None
+    cursor.execute(f"SELECT * FROM {table} WHERE rowid = ?", (cursor.lastrowid,))
+    return cursor.fetchone()
+
 
 class SuppressionService:
     """Service for managing the suppression (unsubscribe) list."""
@@ -18,10 +55,17 @@ class SuppressionService:
         self.db = get_db()
 
     def is_suppressed(self, email: str) -> bool:
-        """Check if an email is in the suppression list."""
-        query = "SELECT 1 FROM suppression_list WHERE email = ? LIMIT 1"
-        row = self.db.fetchone(query, (email.lower(),))
-        return row is not None
+        """Check if an email (or another address of the same identity) is suppressed."""
+        return get_suppression_index().is_suppressed(email)
+
+    def find_suppressed(self, emails: Iterable[str]) -> Set[str]:
+        """
+        Return which of many addresses are suppressed.
+
+        Addresses are matched by identity key like is_suppressed(); the
+        result holds the addresses as given.
+        """
+        return get_suppression_index().filter_suppressed(emails)
 
     def get_suppression_list(
         self,
@@ -55,6 +99,60 @@ class SuppressionService:
         rows = self.db.fetchall(query, tuple(params))
         return [self._row_to_entry(row) for row in rows]
 
+    def get_suppression_page(
+        self,
+        scope: Optional[str] = None,
+        campaign_id: Optional[int] = None,
+        limit: int = 1000,
+        cursor: Optional[str] = None
+    ) -> Page[SuppressionEntry]:
+        """
+        Get one page of suppression entries, newest first, using keyset pagination.
+
+        Rows are ordered by (created_at, email) descending; pass the returned
+        page's next_cursor to fetch the following page.
+        """
+        conditions = []
+        params: List[Any] = []
+
+        if scope:
+            conditions.append("scope = ?")
+            params.append(scope)
+
+        if campaign_id:
+            conditions.append("campaign_id = ?")
+            params.append(campaign_id)
+
+        if cursor:
+            conditions.append(keyset_condition(['created_at', 'email'], descending=True))
+            params.extend(decode_cursor(cursor, 2))
+
+        where_clause = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+
+        query = f"""
+            SELECT * FROM suppression_list
+            {where_clause}
+            ORDER BY created_at DESC, email DESC
+            LIMIT ?
+        """
+        params.append(limit + 1)
+
+        rows = self.db.fetchall(query, tuple(params))
+        return build_page(
+            rows, limit, self._row_to_entry,
+            lambda row: (row['created_at'], row['email'])
+        )
+
+    def iter_suppression_list(self, page_size: int = 5000) -> Iterator[SuppressionEntry]:
+        """Iterate over the whole suppression list page by page."""
+        cursor = None
+        while True:
+            page = self.get_suppression_page(limit=page_size, cursor=cursor)
+            yield from page.items
+            if not page.has_more:
+                break
+            cursor = page.next_cursor
+
     def get_suppression_count(self) -> int:
         """Get total count of suppressed emails."""
         row = self.db.fetchone("SELECT COUNT(*) as count FROM suppression_list")
@@ -78,7 +176,7 @@ class SuppressionService:
             campaign_id: Campaign ID if scope is Campaign
             reason: Optional reason for suppression
         """
-        email = email.lower().strip()
+        email = normalize_email(email)
         if not email:
             raise ValidationError("Email is required")
 
@@ -92,38 +190,40 @@ class SuppressionService:
         if scope not in valid_scopes:
             raise ValidationError(f"Invalid scope. Must be one of: {valid_scopes}")
 
-        # Check if already suppressed
-        if self.is_suppressed(email):
+        # Insert entry, unless the address is already suppressed
+        with self.db.get_cursor() as cursor:
+            row = _insert_or_ignore(cursor, 'suppression_list', """
+                INSERT OR IGNORE INTO suppression_list (email, scope, source, campaign_id, reason, email_key)
+                VALUES (?, ?, ?, ?, ?, ?)
+            """, (email, scope, source, campaign_id, reason, email_key(email)))
+
+        if row is None:
             logger.debug(f"Email {email} already in suppression list")
-            # Return existing entry
             return self.get_entry(email)
 
-        # Insert entry
-        self.db.execute("""
-            INSERT INTO suppression_list (email, scope, source, campaign_id, reason)
-            VALUES (?, ?, ?, ?, ?)
-        """, (email, scope, source, campaign_id, reason))
+        get_suppression_index().invalidate()
 
         # Update campaign_contacts if exists
         self._update_campaign_contacts(email, campaign_id)
 
         logger.info(f"Added {email} to suppression list (source: {source})")
-        return self.get_entry(email)
+        return self._row_to_entry(row)
 
     def remove_from_suppression(self, email: str) -> None:
         """Remove an email from the suppression list."""
-        email = email.lower().strip()
+        email = normalize_email(email)
 
-        if not self.is_suppressed(email):
+        cursor = self.db.execute("DELETE FROM suppression_list WHERE email = ?", (email,))
+        if cursor.rowcount == 0:
             raise SuppressionError(f"Email {email} is not in suppression list")
 
-        self.db.execute("DELETE FROM suppression_list WHERE email = ?", (email,))
+        get_suppression_index().invalidate()
         logger.info(f"Removed {email} from suppression list")
 
     def get_entry(self, email: str) -> Optional[SuppressionEntry]:
         """Get a specific suppression entry by email."""
         query = "SELECT * FROM suppression_list WHERE email = ?"
-        row = self.db.fetchone(query, (email.lower(),))
+        row = self.db.fetchone(query, (normalize_email(email),))
         if row:
             return self._row_to_entry(row)
         return None
@@ -131,33 +231,140 @@ class SuppressionService:
     def import_suppression_list(
         self,
         emails: List[str],
-        source: str = SuppressionSource.MANUAL.value
+        source: str = SuppressionSource.MANUAL.value,
+        progress_callback: Optional[Callable[[int, int], None]] = None,
+        should_cancel: Optional[Callable[[], bool]] = None
     ) -> int:
         """
-        Import multiple emails to suppression list.
+        Import multiple emails to suppression list in one transaction.
+
+        The addresses are staged in a temporary table, inserted with a single
+        INSERT OR IGNORE, and every contact sharing an identity with one of
+        them is unsubscribed from its campaigns and has its pending emails
+        skipped, all with set-based updates. Cancelling rolls everything back.
+
+        Args:
+            emails: Addresses to suppress
+            source: Suppression source recorded for new entries
+            progress_callback: Called with (staged, total) after each staging batch
+            should_cancel: Polled after each staging batch; return True to stop
 
         Returns:
             Number of emails added (duplicates are skipped)
+
+        Raises:
+            JobCancelledError: If should_cancel returned True
         """
-        added = 0
-        for email in emails:
-            email = email.lower().strip()
-            if not email:
-                continue
-
-            if not self.is_suppressed(email):
-                try:
-                    self.db.execute("""
-                        INSERT INTO suppression_list (email, scope, source)
-                        VALUES (?, 'Global', ?)
-                    """, (email, source))
-                    added += 1
-                except Exception as e:
-                    logger.warning(f"Failed to add {email} to suppression list: {e}")
-
-        logger.info(f"Imported {added} emails to suppression list")
+        valid_sources = [s.value for s in SuppressionSource]
+        if source not in valid_sources:
+            raise ValidationError(f"Invalid source. Must be one of: {valid_sources}")
+
+        total = len(emails)
+        with self.db.get_cursor() as cursor:
+            cursor.execute(STAGING_TABLE)
+            cursor.execute("DELETE FROM temp.suppression_import")
+
+            for start in range(0, total, IMPORT_BATCH_SIZE):
+                staged = []
+                for email in emails[start:start + IMPORT_BATCH_SIZE]:
+                    email = normalize_email(email)
+                    if email:
+                        staged.append((email, email_key(email)))
+                cursor.executemany(
+                    "INSERT OR IGNORE INTO temp.suppression_import (email, email_key) VALUES (?, ?)",
+                    staged
+                )
+
+                if should_cancel and should_cancel():
+                    logger.info("Suppression import cancelled; nothing was imported")
+                    raise JobCancelledError("Suppression import cancelled")
+                if progress_callback:
+                    progress_callback(min(start + IMPORT_BATCH_SIZE, total), total)
+
+            cursor.execute("""
+                INSERT OR IGNORE INTO suppression_list (email, scope, source, email_key)
+                SELECT email, 'Global', ?, email_key FROM temp.suppression_import
+            """, (source,))
+            added = cursor.rowcount
+
+            # Propagate to every contact of the imported identities
+            unsubscribed, skipped = self._propagate(cursor, STAGED_IDENTITY_CONTACTS)
+
+            cursor.execute("DELETE FROM temp.suppression_import")
+
+        if added:
+            get_suppression_index().invalidate()
+        logger.info(
+            f"Imported {added} emails to suppression list "
+            f"({unsubscribed} campaign contacts unsubscribed, {skipped} queued emails skipped)"
+        )
         return added
 
+    def add_rule(
+        self,
+        pattern: str,
+        source: str = SuppressionSource.MANUAL.value,
+        reason: Optional[str] = None
+    ) -> SuppressionRule:
+        """
+        Add a domain or wildcard suppression rule.
+
+        Args:
+            pattern: '@acme.com' (one domain), '*.acme.com' (a domain and its
+                subdomains) or an address pattern like 'sales-*@acme.com'
+            source: Source of suppression (EmailReply, Manual, Bounce, Complaint)
+            reason: Optional reason for suppression
+
+        Contacts already matching the rule are unsubscribed from their
+        campaigns and their pending emails skipped.
+        """
+        valid_sources = [s.value for s in SuppressionSource]
+        if source not in valid_sources:
+            raise ValidationError(f"Invalid source. Must be one of: {valid_sources}")
+
+        rule_type, pattern, reversed_domain = parse_suppression_rule(pattern or '')
+        globs = rule_globs(rule_type, pattern)
+        matching_contacts = (
+            "SELECT contact_id FROM contacts WHERE "
+            + " OR ".join("lower(email) GLOB ?" for _ in globs)
+        )
+
+        with self.db.get_cursor() as cursor:
+            row = _insert_or_ignore(cursor, 'suppression_rules', """
+                INSERT OR IGNORE INTO suppression_rules (rule_type, pattern, reversed_domain, source, reason)
+                VALUES (?, ?, ?, ?, ?)
+            """, (rule_type, pattern, reversed_domain, source, reason))
+            if row is None:
+                raise SuppressionError(f"Rule {pattern} already exists")
+
+            unsubscribed, skipped = self._propagate(cursor, matching_contacts, tuple(globs))
+
+        get_suppression_index().invalidate()
+        logger.info(
+            f"Added suppression rule {pattern} "
+            f"({unsubscribed} campaign contacts unsubscribed, {skipped} queued emails skipped)"
+        )
+        return self._row_to_rule(row)
+
+    def remove_rule(self, rule_id: int) -> None:
+        """Remove a domain or wildcard suppression rule."""
+        cursor = self.db.execute("DELETE FROM suppression_rules WHERE rule_id = ?", (rule_id,))
+        if cursor.rowcount == 0:
+            raise SuppressionError(f"Suppression rule {rule_id} not found")
+
+        get_suppression_index().invalidate()
+        logger.info(f"Removed suppression rule {rule_id}")
+
+    def get_rules(self) -> List[SuppressionRule]:
+        """Get all suppression rules, grouped by domain."""
+        rows = self.db.fetchall("SELECT * FROM suppression_rules ORDER BY reversed_domain, pattern")
+        return [self._row_to_rule(row) for row in rows]
+
+    def get_rule_count(self) -> int:
+        """Get total count of suppression rules."""
+        row = self.db.fetchone("SELECT COUNT(*) as count FROM suppression_rules")
+        return row['count'] if row else 0
+
     def export_suppression_list(self, file_path: str) -> int:
         """
         Export suppression list to a file.
@@ -165,16 +372,16 @@ class SuppressionService:
         Returns:
             Number of emails exported
         """
-        entries = self.get_suppression_list(limit=100000)
-
+        count = 0
         with open(file_path, 'w', encoding='utf-8') as f:
             f.write("email,scope,source,reason,created_at\n")
-            for entry in entries:
+            for entry in self.iter_suppression_list():
                 reason = (entry.reason or '').replace(',', ';')
                 f.write(f"{entry.email},{entry.scope},{entry.source},{reason},{entry.created_at}\n")
+                count += 1
 
-        logger.info(f"Exported {len(entries)} suppression entries to {file_path}")
-        return len(entries)
+        logger.info(f"Exported {count} suppression entries to {file_path}")
+        return count
 
     def search_suppression_list(self, query: str, limit: int = 100) -> List[SuppressionEntry]:
         """Search suppression list by email pattern."""
@@ -188,33 +395,67 @@ class SuppressionService:
         rows = self.db.fetchall(sql, (search_term, limit))
         return [self._row_to_entry(row) for row in rows]
 
+    def _propagate(self, cursor, contacts_query: str, params: tuple = ()) -> tuple:
+        """
+        Unsubscribe contacts from their campaigns and skip their pending emails.
+
+        Args:
+            cursor: Cursor of the open write transaction
+            contacts_query: SELECT returning the contact_id of every contact to suppress
+            params: Parameters of contacts_query
+
+        Returns:
+            Tuple of (campaign contacts unsubscribed, queued emails skipped)
+        """
+        cursor.execute(f"""
+            UPDATE campaign_contacts
+            SET status = 'Unsubscribed', unsubscribed_at = datetime('now'), updated_at = datetime('now')
+            WHERE contact_id IN ({contacts_query})
+              AND status NOT IN ('Completed', 'Responded', 'Unsubscribed')
+        """, params)
+        unsubscribed = cursor.rowcount
+        cursor.execute(f"""
+            UPDATE email_queue
+            SET status = 'Skipped', error_message = 'Contact unsubscribed'
+            WHERE contact_id IN ({contacts_query})
+              AND status = 'Pending'
+        """, params)
+        return unsubscribed, cursor.rowcount
+
     def _update_campaign_contacts(self, email: str, campaign_id: Optional[int] = None) -> None:
-        """Update campaign_contacts status when email is suppressed."""
+        """Update campaign_contacts status for every contact sharing the email's identity."""
+        identity_contacts = """
+            SELECT c.contact_id FROM contacts c
+            JOIN contact_identities ci ON ci.identity_id = c.identity_id
+            WHERE ci.email_key = ?
+        """
+        key = email_key(email)
+
         if campaign_id:
             # Update specific campaign
-            self.db.execute("""
+            self.db.execute(f"""
                 UPDATE campaign_contacts
-                SET status = 'Unsubscribed', updated_at = datetime('now')
-                WHERE contact_id IN (SELECT contact_id FROM contacts WHERE email = ?)
+                SET status = 'Unsubscribed', unsubscribed_at = datetime('now'), updated_at = datetime('now')
+                WHERE contact_id IN ({identity_contacts})
                   AND campaign_id = ?
                   AND status NOT IN ('Completed', 'Responded')
-            """, (email, campaign_id))
+            """, (key, campaign_id))
         else:
             # Update all campaigns
-            self.db.execute("""
+            self.db.execute(f"""
                 UPDATE campaign_contacts
-                SET status = 'Unsubscribed', updated_at = datetime('now')
-                WHERE contact_id IN (SELECT contact_id FROM contacts WHERE email = ?)
+                SET status = 'Unsubscribed', unsubscribed_at = datetime('now'), updated_at = datetime('now')
+                WHERE contact_id IN ({identity_contacts})
                   AND status NOT IN ('Completed', 'Responded')
-            """, (email,))
+            """, (key,))
 
         # Also skip any pending queue items
-        self.db.execute("""
+        self.db.execute(f"""
             UPDATE email_queue
             SET status = 'Skipped', error_message = 'Contact unsubscribed'
-            WHERE contact_id IN (SELECT contact_id FROM contacts WHERE email = ?)
+            WHERE contact_id IN ({identity_contacts})
               AND status = 'Pending'
-        """, (email,))
+        """, (key,))
 
     def _row_to_entry(self, row) -> SuppressionEntry:
         """Convert database row to SuppressionEntry model."""
@@ -226,3 +467,15 @@ class SuppressionService:
             reason=row['reason'],
             created_at=row['created_at']
         )
+
+    def _row_to_rule(self, row) -> SuppressionRule:
+        """Convert database row to SuppressionRule model."""
+        return SuppressionRule(
+            rule_id=row['rule_id'],
+            rule_type=row['rule_type'],
+            pattern=row['pattern'],
+            reversed_domain=row['reversed_domain'],
+            source=row['source'],
+            reason=row['reason'],
+            created_at=row['created_at']
+        )
@@ -2,21 +2,19 @@
 
 import logging
 import os
-import re
-import shutil
+import threading
 import mimetypes
 from pathlib import Path
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Iterable, Tuple, Union
 
 from core.database import get_db
+from core.blob_store import BlobStore
 from core.models import EmailStep, Attachment, Contact, Campaign
 from core.exceptions import ValidationError, TemplateError
+from core.templating import MERGE_TAG_PATTERN, CompiledTemplate, TemplateCache, compile_template
 
 logger = logging.getLogger(__name__)
 
-# Merge tag patterns
-MERGE_TAG_PATTERN = re.compile(r'\{\{(\w+)\}\}')
-
 # Supported merge tags
 MERGE_TAGS = {
     # Contact fields
@@ -43,9 +41,25 @@ MERGE_TAGS = {
 
     # Campaign fields
     'CampaignRef': lambda _, campaign=None, **__: campaign.campaign_ref if campaign else '',
-    'UnsubscribeText': lambda **_: 'To unsubscribe, reply with "UNSUBSCRIBE" in the subject line.',
+    'UnsubscribeText': lambda *_, **__: 'To unsubscribe, reply with "UNSUBSCRIBE" in the subject line.',
 }
 
+# Compiled step templates, keyed by (step_id, updated_at)
+_step_templates = TemplateCache()
+
+# Attachments of each campaign's steps: {campaign_id: {step_id: [Attachment]}}.
+# Shared by every TemplateService of the process and cleared on any attachment edit.
+_campaign_attachments: Dict[int, Dict[int, List[Attachment]]] = {}
+_campaign_attachments_lock = threading.Lock()
+
+# Allowed difference between the recorded and current mtime of an attachment
+MTIME_TOLERANCE_SECONDS = 2.0
+
+# The mtime each attachment was last reported modified at: {attachment_id: mtime},
+# so the send loop warns once per change instead of on every cycle
+_modified_warnings: Dict[int, float] = {}
+_modified_warnings_lock = threading.Lock()
+
 
 class TemplateService:
     """Service for managing email templates and steps."""
@@ -54,6 +68,8 @@ class TemplateService:
         self.db = get_db()
         self.attachments_path = Path(attachments_path)
         self.attachments_path.mkdir(parents=True, exist_ok=True)
+        # Step attachment files are hardlinks to these blobs
+        self.blob_store = BlobStore(self.attachments_path / '.blobs', self.db)
 
     # Step CRUD Methods
 
@@ -65,10 +81,11 @@ class TemplateService:
             ORDER BY step_number
         """
         rows = self.db.fetchall(query, (campaign_id,))
+        attachments = self._load_campaign_attachments(campaign_id)
         steps = []
         for row in rows:
             step = self._row_to_step(row)
-            step.attachments = self.get_attachments(step.step_id)
+            step.attachments = attachments.get(step.step_id, [])
             steps.append(step)
         return steps
 
@@ -155,11 +172,8 @@ class TemplateService:
         if not step:
             raise ValidationError(f"Step {step_id} not found")
 
-        # Delete attachment files
-        for attachment in step.attachments:
-            self._delete_attachment_file(attachment.file_path)
-
         self.db.execute("DELETE FROM email_steps WHERE step_id = ?", (step_id,))
+        self.release_attachments(step.attachments)
         logger.info(f"Deleted step {step_id}")
 
     def reorder_steps(self, campaign_id: int, step_ids_in_order: List[int]) -> None:
@@ -188,17 +202,135 @@ class TemplateService:
         rows = self.db.fetchall(query, (step_id,))
         return [self._row_to_attachment(row) for row in rows]
 
+    def get_campaign_attachments(self, campaign_id: int) -> Dict[int, List[Attachment]]:
+        """
+        Get the attachments of every step of a campaign, by step ID.
+
+        Served from a process-wide cache that attachment edits clear, so the
+        send loop reads the database once per campaign rather than per email.
+        """
+        with _campaign_attachments_lock:
+            cached = _campaign_attachments.get(campaign_id)
+        if cached is not None:
+            return cached
+
+        attachments = self._load_campaign_attachments(campaign_id)
+        with _campaign_attachments_lock:
+            _campaign_attachments[campaign_id] = attachments
+        return attachments
+
+    def check_attachment(self, attachment: Attachment) -> Optional[str]:
+        """
+        Check that an attachment file is still as it was when attached.
+
+        Returns:
+            A description of the problem, or None if the file can be sent
+        """
+        try:
+            stat = os.stat(attachment.file_path)
+        except OSError:
+            return f"Attachment '{attachment.file_name}' is missing ({attachment.file_path})"
+
+        if stat.st_size != attachment.file_size:
+            return (
+                f"Attachment '{attachment.file_name}' changed size "
+                f"({attachment.file_size} bytes when attached, {stat.st_size} now)"
+            )
+
+        if attachment.file_mtime is not None and abs(stat.st_mtime - attachment.file_mtime) > MTIME_TOLERANCE_SECONDS:
+            with _modified_warnings_lock:
+                already_warned = _modified_warnings.get(attachment.attachment_id) == stat.st_mtime
+                _modified_warnings[attachment.attachment_id] = stat.st_mtime
+            if not already_warned:
+                logger.warning(f"Attachment '{attachment.file_name}' was modified after it was attached")
+        return None
+
     def add_attachment(self, step_id: int, file_path: str) -> Attachment:
-        """Add an attachment to a step (copies file to storage)."""
+        """Add an attachment to a step (stored once by content, linked into the step folder)."""
         source_path = Path(file_path)
         if not source_path.exists():
             raise ValidationError(f"File not found: {file_path}")
 
-        # Get file info
-        file_name = source_path.name
-        file_size = source_path.stat().st_size
         mime_type, _ = mimetypes.guess_type(str(source_path))
+        content_hash, file_size = self.blob_store.put(source_path)
+
+        attachment = self._link_attachment(step_id, source_path.name, content_hash, file_size, mime_type)
+        logger.info(f"Added attachment '{source_path.name}' to step {step_id}")
+        return attachment
+
+    def copy_attachments(self, source_step_id: int, target_step_id: int) -> List[Attachment]:
+        """Give a step the attachments of another step, linking the stored files instead of copying them."""
+        copies = []
+        for attachment in self.get_attachments(source_step_id):
+            content_hash = attachment.content_hash
+            if content_hash is None:
+                # Attached before the blob store existed: store it now
+                content_hash = self._relink_attachment(attachment)
+            copies.append(self._link_attachment(
+                target_step_id, attachment.file_name, content_hash, attachment.file_size, attachment.mime_type
+            ))
+        return copies
+
+    def relink_legacy_attachments(self) -> int:
+        """
+        Move attachments added before the blob store into it.
+
+        Files that changed since they were attached are left alone, so
+        check_attachment() still reports them.
+
+        Returns:
+            Number of attachments relinked
+        """
+        rows = self.db.fetchall("SELECT * FROM attachments WHERE content_hash IS NULL")
+        relinked = 0
+        for row in rows:
+            attachment = self._row_to_attachment(row)
+            problem = self.check_attachment(attachment)
+            if problem:
+                logger.warning(f"Not moving attachment into the blob store: {problem}")
+                continue
+            try:
+                self._relink_attachment(attachment)
+            except OSError as e:
+                logger.warning(f"Failed to move attachment {attachment.file_path} into the blob store: {e}")
+                continue
+            relinked += 1
+
+        if relinked:
+            invalidate_attachment_cache()
+            logger.info(f"Moved {relinked} attachments into the blob store")
+        return relinked
+
+    def remove_attachment(self, attachment_id: int) -> None:
+        """Remove an attachment."""
+        attachment = self._get_attachment(attachment_id)
+        if not attachment:
+            raise ValidationError(f"Attachment {attachment_id} not found")
 
+        # Remove from database, then its file
+        self.db.execute("DELETE FROM attachments WHERE attachment_id = ?", (attachment_id,))
+        self.release_attachments([attachment])
+        logger.info(f"Removed attachment {attachment_id}")
+
+    def release_attachments(self, attachments: List[Attachment]) -> None:
+        """Delete the files of attachments whose rows are gone, and blobs nothing refers to any more."""
+        for attachment in attachments:
+            self._delete_attachment_file(attachment.file_path, attachment.content_hash)
+        with _modified_warnings_lock:
+            for attachment in attachments:
+                _modified_warnings.pop(attachment.attachment_id, None)
+        self.blob_store.collect_garbage(a.content_hash for a in attachments)
+        invalidate_attachment_cache()
+
+    def _link_attachment(
+        self,
+        step_id: int,
+        file_name: str,
+        content_hash: str,
+        file_size: int,
+        mime_type: Optional[str]
+    ) -> Attachment:
+        """Link a stored blob into a step's folder and record the attachment."""
         # Generate unique destination path
         dest_dir = self.attachments_path / str(step_id)
         dest_dir.mkdir(parents=True, exist_ok=True)
@@ -211,32 +343,40 @@ class TemplateService:
             dest_path = dest_dir / f"{name}_{counter}{ext}"
             counter += 1
 
-        # Copy file
-        shutil.copy2(source_path, dest_path)
+        self.blob_store.link(content_hash, dest_path)
+        file_mtime = dest_path.stat().st_mtime
 
         # Save to database
         cursor = self.db.execute("""
-            INSERT INTO attachments (step_id, file_name, file_path, file_size, mime_type)
-            VALUES (?, ?, ?, ?, ?)
-        """, (step_id, dest_path.name, str(dest_path), file_size, mime_type))
-
-        attachment_id = cursor.lastrowid
-        logger.info(f"Added attachment '{file_name}' to step {step_id}")
-
-        return self._get_attachment(attachment_id)
-
-    def remove_attachment(self, attachment_id: int) -> None:
-        """Remove an attachment."""
-        attachment = self._get_attachment(attachment_id)
-        if not attachment:
-            raise ValidationError(f"Attachment {attachment_id} not found")
-
-        # Delete file
-        self._delete_attachment_file(attachment.file_path)
-
-        # Remove from database
-        self.db.execute("DELETE FROM attachments WHERE attachment_id = ?", (attachment_id,))
-        logger.info(f"Removed attachment {attachment_id}")
+            INSERT INTO attachments (step_id, file_name, file_path, file_size, file_mtime, content_hash, mime_type)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+        """, (step_id, dest_path.name, str(dest_path), file_size, file_mtime, content_hash, mime_type))
+        invalidate_attachment_cache()
+
+        return self._get_attachment(cursor.lastrowid)
+
+    def _relink_attachment(self, attachment: Attachment) -> str:
+        """Store a legacy attachment's file and replace it with a link to the blob."""
+        content_hash, _ = self.blob_store.put(attachment.file_path)
+        self.blob_store.relink(content_hash, attachment.file_path)
+        self.db.execute("""
+            UPDATE attachments SET content_hash = ?, file_mtime = COALESCE(file_mtime, ?)
+            WHERE attachment_id = ?
+        """, (content_hash, os.stat(attachment.file_path).st_mtime, attachment.attachment_id))
+        return content_hash
+
+    def _load_campaign_attachments(self, campaign_id: int) -> Dict[int, List[Attachment]]:
+        """Read the attachments of every step of a campaign in one query."""
+        query = """
+            SELECT a.* FROM attachments a
+            JOIN email_steps es ON es.step_id = a.step_id
+            WHERE es.campaign_id = ?
+            ORDER BY a.step_id, a.file_name
+        """
+        attachments: Dict[int, List[Attachment]] = {}
+        for row in self.db.fetchall(query, (campaign_id,)):
+            attachments.setdefault(row['step_id'], []).append(self._row_to_attachment(row))
+        return attachments
 
     def _get_attachment(self, attachment_id: int) -> Optional[Attachment]:
         """Get an attachment by ID."""
@@ -246,35 +386,61 @@ class TemplateService:
             return self._row_to_attachment(row)
         return None
 
-    def _delete_attachment_file(self, file_path: str) -> None:
+    def _delete_attachment_file(self, file_path: str, content_hash: Optional[str] = None) -> None:
         """Delete an attachment file if it exists."""
         try:
-            path = Path(file_path)
-            if path.exists():
-                path.unlink()
+            self.blob_store.unlink(file_path, content_hash)
         except Exception as e:
             logger.warning(f"Failed to delete attachment file {file_path}: {e}")
 
     # Merge Tag Methods
 
+    def compile_step(self, step: EmailStep) -> Tuple[CompiledTemplate, CompiledTemplate]:
+        """Get the compiled subject and body templates of a step (cached per step version)."""
+        return _step_templates.get_pair(
+            (step.step_id, step.updated_at), step.subject_template or '', step.body_template or ''
+        )
+
     def apply_merge_tags(
         self,
-        template: str,
+        template: Union[str, CompiledTemplate],
         contact: Contact,
         campaign: Optional[Campaign] = None
     ) -> str:
-        """Apply merge tags to a template string."""
-        def replace_tag(match):
-            tag_name = match.group(1)
-            if tag_name in MERGE_TAGS:
-                try:
-                    return str(MERGE_TAGS[tag_name](contact, campaign=campaign))
-                except Exception as e:
-                    logger.warning(f"Error applying merge tag {tag_name}: {e}")
-                    return ''
-            return match.group(0)  # Return original if tag not found
+        """Apply merge tags to a template string or compiled template."""
+        compiled = template if isinstance(template, CompiledTemplate) else compile_template(template)
+        return compiled.render(self._merge_values(self._resolvers(compiled), contact, campaign))
 
-        return MERGE_TAG_PATTERN.sub(replace_tag, template)
+    def render_many(
+        self,
+        template: Union[str, CompiledTemplate],
+        contacts: Iterable[Contact],
+        campaign: Optional[Campaign] = None
+    ) -> List[str]:
+        """Apply merge tags to one template for many contacts."""
+        compiled = template if isinstance(template, CompiledTemplate) else compile_template(template)
+        resolvers = self._resolvers(compiled)
+        return [compiled.render(self._merge_values(resolvers, contact, campaign)) for contact in contacts]
+
+    def _resolvers(self, compiled: CompiledTemplate) -> List[Tuple[str, Any]]:
+        """Get the value functions of the known tags a template uses (unknown tags stay as written)."""
+        return [(tag_name, MERGE_TAGS[tag_name]) for tag_name in compiled.fields if tag_name in MERGE_TAGS]
+
+    def _merge_values(
+        self,
+        resolvers: List[Tuple[str, Any]],
+        contact: Contact,
+        campaign: Optional[Campaign]
+    ) -> Dict[str, str]:
+        """Compute the tag values of one contact."""
+        values = {}
+        for tag_name, resolve in resolvers:
+            try:
+                values[tag_name] = str(resolve(contact, campaign=campaign))
+            except Exception as e:
+                logger.warning(f"Error applying merge tag {tag_name}: {e}")
+                values[tag_name] = ''
+        return values
 
     def get_available_merge_tags(self) -> Dict[str, List[str]]:
         """Get categorized list of available merge tags."""
@@ -356,6 +522,14 @@ class TemplateService:
             file_name=row['file_name'],
             file_path=row['file_path'],
             file_size=row['file_size'],
+            file_mtime=row['file_mtime'],
+            content_hash=row['content_hash'],
             mime_type=row['mime_type'],
             created_at=row['created_at']
         )
+
+
+def invalidate_attachment_cache() -> None:
+    """Forget cached step attachments (after any attachment or step edit)."""
+    with _campaign_attachments_lock:
+        _campaign_attachments.clear()
@@ -0,0 +1,148 @@
+"""Tests for send and reply timing analytics."""
+
+import os
+import sys
+import tempfile
+import unittest
+
+import numpy as np
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.database import Database, init_database
+from services.analytics_service import AnalyticsService, attribute_replies
+
+
+def _ints(*values):
+    """Build an int64 array."""
+    return np.array(values, dtype=np.int64)
+
+
+class TestAnalytics(unittest.TestCase):
+    """Test cases for the vectorized campaign analytics."""
+
+    def setUp(self):
+        """Set up test database."""
+        self.temp_db = tempfile.NamedTemporaryFile(suffix='.db', delete=False)
+        self.temp_db.close()
+        Database.set_path(self.temp_db.name)
+        Database._instance = None
+        init_database(self.temp_db.name)
+        self.service = AnalyticsService()
+
+    def tearDown(self):
+        """Clean up test database."""
+        db = Database.get_instance()
+        db.close()
+        Database._instance = None
+        os.unlink(self.temp_db.name)
+
+    def test_attribute_replies_edge_cases(self):
+        """Test attribution without sends, before any send, across contacts and on tied times."""
+        empty = _ints()
+
+        self.assertEqual(attribute_replies(empty, empty, _ints(1, 2), _ints(10, 20)).tolist(), [-1, -1])
+        self.assertEqual(attribute_replies(_ints(1), _ints(10), empty, empty).tolist(), [])
+
+        # Replies before the contact's first send, or from a contact only others were sent to
+        self.assertEqual(
+            attribute_replies(_ints(1, 2), _ints(100, 10), _ints(1, 3), _ints(50, 500)).tolist(),
+            [-1, -1]
+        )
+
+        # A reply at the send time counts; of two sends at the same time the last logged wins
+        send_contacts = _ints(5, 5, 5, 7)
+        send_times = _ints(100, 100, 200, 150)
+        self.assertEqual(
+            attribute_replies(send_contacts, send_times, _ints(5, 5, 7), _ints(100, 199, 1000)).tolist(),
+            [1, 1, 3]
+        )
+
+    def test_count_by_step_edge_cases(self):
+        """Test per-step counts with unknown step IDs, unsorted steps and no values."""
+        step_ids = _ints(30, 10, 20)
+        order = np.argsort(step_ids)
+
+        counts = self.service._count_by_step(_ints(10, 20, 20, 99, 0, 30, 5), step_ids, order)
+        self.assertEqual(counts.tolist(), [1, 1, 2])
+        self.assertEqual(self.service._count_by_step(_ints(), step_ids, order).tolist(), [0, 0, 0])
+
+    def test_campaign_analytics(self):
+        """Test that analytics attribute replies like the step report and are cached."""
+        from services.campaign_service import CampaignService
+        from services.contact_service import ContactService
+
+        contact_service = ContactService()
+        campaign_service = CampaignService()
+        contact_list = contact_service.create_list("Prospects")
+        contact_service.upsert_contacts(contact_list.list_id, [
+            {'email': f'user{i}@example.com'} for i in range(3)
+        ])
+        campaign = campaign_service.create_campaign({'name': 'Launch', 'contact_list_id': contact_list.list_id})
+        step_ids = [campaign_service._create_step(campaign.campaign_id, n, f'Step {n}', 'Hello') for n in (1, 2)]
+        campaign_service.activate_campaign(campaign.campaign_id)
+        ann, bob, cat = [c.contact_id for c in contact_service.get_contacts(contact_list.list_id)]
+
+        db = Database.get_instance()
+        sends = [
+            (ann, step_ids[0], '2026-01-01 09:00:00'), (ann, step_ids[1], '2026-01-04 09:00:00'),
+            (bob, step_ids[0], '2026-01-01 09:00:00'), (bob, step_ids[1], '2026-01-04 09:00:00'),
+            (cat, step_ids[0], '2026-01-01 09:00:00'),
+        ]
+        for contact_id, step_id, sent_at in sends:
+            db.execute(
+                "INSERT INTO email_logs (campaign_id, contact_id, step_id, subject, status, sent_at) "
+                "VALUES (?, ?, ?, 'Hi', 'Sent', ?)",
+                (campaign.campaign_id, contact_id, step_id, sent_at)
+            )
+        # Ann replied to step 1 (before step 2 went out), Bob to step 2
+        for contact_id, responded_at in [(ann, '2026-01-02 09:00:00'), (bob, '2026-01-04 15:00:00')]:
+            db.execute(
+                "UPDATE campaign_contacts SET status = 'Responded', responded_at = ? WHERE contact_id = ?",
+                (responded_at, contact_id)
+            )
+
+        analytics = self.service.get_campaign_analytics(campaign.campaign_id, utc_offset_hours=0)
+        self.assertEqual((analytics.sends, analytics.replies), (5, 2))
+        self.assertEqual(
+            [(s['step_number'], s['reached'], s['replies'], s['median_reply_hours']) for s in analytics.step_funnel],
+            [(1, 3, 1, 24.0), (2, 2, 1, 6.0)]
+        )
+        self.assertEqual(analytics.step_funnel[1]['reach_rate'], 66.7)
+        # 2026-01-01 was a Thursday; sends went out at 09:00 UTC
+        self.assertEqual(analytics.send_heatmap[3, 9], 3)
+        self.assertEqual(analytics.send_heatmap[6, 9], 2)
+        self.assertEqual(analytics.reply_heatmap.sum(), 2)
+        self.assertEqual(analytics.latency_percentiles[50], 15.0)
+        self.assertEqual([b['replies'] for b in analytics.latency_histogram if b['replies']], [1, 1])
+
+        # Cached until the campaign's logs change
+        self.assertIs(AnalyticsService().get_campaign_analytics(campaign.campaign_id, utc_offset_hours=0), analytics)
+        db.execute(
+            "INSERT INTO email_logs (campaign_id, contact_id, step_id, subject, status, sent_at) "
+            "VALUES (?, ?, ?, 'Hi', 'Sent', '2026-01-05 09:00:00')",
+            (campaign.campaign_id, cat, step_ids[1])
+        )
+        self.assertEqual(AnalyticsService().get_campaign_analytics(campaign.campaign_id, utc_offset_hours=0).sends, 6)
+
+    def test_campaign_without_activity(self):
+        """Test that a campaign with steps but no sends or replies yields empty figures."""
+        from services.campaign_service import CampaignService
+
+        campaign_service = CampaignService()
+        campaign = campaign_service.create_campaign({'name': 'Quiet'})
+        campaign_service._create_step(campaign.campaign_id, 1, 'Hi', 'Hello')
+
+        analytics = self.service.get_campaign_analytics(campaign.campaign_id, utc_offset_hours=0)
+        self.assertEqual((analytics.sends, analytics.replies), (0, 0))
+        self.assertEqual(analytics.latency_percentiles, {})
+        self.assertEqual(analytics.reply_heatmap.shape, (7, 24))
+        self.assertEqual(
+            [(s['reached'], s['replies'], s['median_reply_hours']) for s in analytics.step_funnel],
+            [(0, 0, None)]
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
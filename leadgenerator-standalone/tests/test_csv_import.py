@@ -0,0 +1,455 @@
+"""Tests for CSV import."""
+
+import os
+import sys
+import tempfile
+import unittest
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.database import Database, init_database
+from services.csv_service import ARROW_AVAILABLE, XLSX_AVAILABLE
+
+
+class TestCSVImport(unittest.TestCase):
+    """Test cases for the streaming CSV import."""
+
+    def setUp(self):
+        """Set up test database and a contact list."""
+        from services.contact_service import ContactService
+        from services.csv_service import CSVService
+
+        self.temp_db = tempfile.NamedTemporaryFile(suffix='.db', delete=False)
+        self.temp_db.close()
+        Database.set_path(self.temp_db.name)
+        Database._instance = None
+        init_database(self.temp_db.name)
+
+        self.contact_service = ContactService()
+        self.csv_service = CSVService()
+        self.contact_list = self.contact_service.create_list("Import")
+        self.temp_files = []
+
+    def tearDown(self):
+        """Clean up test database and CSV files."""
+        db = Database.get_instance()
+        db.close()
+        Database._instance = None
+        os.unlink(self.temp_db.name)
+        for path in self.temp_files:
+            if os.path.exists(path):
+                os.unlink(path)
+
+    def _write_csv(self, content: str) -> str:
+        """Write CSV content to a temporary file."""
+        handle = tempfile.NamedTemporaryFile('w', suffix='.csv', delete=False, encoding='utf-8')
+        handle.write(content)
+        handle.close()
+        self.temp_files.append(handle.name)
+        return handle.name
+
+    def _temp_path(self, suffix: str) -> str:
+        """Reserve a temporary file path with the given extension."""
+        handle = tempfile.NamedTemporaryFile(suffix=suffix, delete=False)
+        handle.close()
+        self.temp_files.append(handle.name)
+        return handle.name
+
+    def test_import_in_chunks(self):
+        """Test that a multi-chunk import reports rows, duplicates and progress."""
+        lines = ["Email;First Name;Zip"]
+        lines += [f" User{i}@Example.com ;First{i};0{i}" for i in range(10)]
+        lines += ["user3@example.com;Again;1", ";Nobody;2"]
+        path = self._write_csv('\n'.join(lines) + '\n')
+
+        progress = []
+        result = self.csv_service.import_contacts(
+            path, self.contact_list.list_id,
+            {'Email': 'email', 'First Name': 'first_name', 'Zip': 'custom1'},
+            chunk_size=4,
+            progress_callback=lambda done, total: progress.append((done, total))
+        )
+
+        self.assertEqual(result.imported, 10)
+        self.assertEqual(result.skipped, 1)
+        self.assertEqual([(e['row'], e['error']) for e in result.errors], [(13, 'Email is required')])
+        self.assertEqual(result.error_count, 1)
+        self.assertEqual(progress, [(4, 12), (8, 12), (12, 12)])
+
+        contact = self.contact_service.get_contact_by_email(self.contact_list.list_id, 'user0@example.com')
+        self.assertEqual(contact.first_name, 'First0')
+        self.assertEqual(contact.custom1, '00')  # values are read as text
+
+    def test_validate_csv(self):
+        """Test the vectorized validation preview."""
+        path = self._write_csv(
+            "email,first_name\n"
+            "a@example.com,A\n"
+            "not-an-email,B\n"
+            "A@Example.com ,C\n"
+            ",D\n"
+            "b@example.com,\n"
+        )
+
+        summary = self.csv_service.validate_csv(
+            path, {'email': 'email', 'first_name': 'first_name'},
+            required_fields=('email', 'first_name'), chunk_size=2
+        )
+
+        self.assertEqual((summary.total_rows, summary.valid_rows, summary.duplicate_rows), (5, 1, 1))
+        self.assertEqual(summary.errors, [
+            {'row': 3, 'error': 'Invalid email address'},
+            {'row': 4, 'error': 'Duplicate email in file (skipped)'},
+            {'row': 5, 'error': 'Email is required'},
+            {'row': 6, 'error': 'First name is required'},
+        ])
+
+    def test_rejected_row_does_not_make_a_duplicate(self):
+        """Test that only valid rows count as the first occurrence of an email, within and across chunks."""
+        path = self._write_csv(
+            "email,first_name\n"
+            "a@example.com,\n"
+            "a@example.com,A\n"
+            "b@example.com,\n"
+            "c@example.com,C\n"
+            "b@example.com,B\n"
+            "a@example.com,Again\n"
+        )
+
+        for chunk_size in (6, 2):
+            summary = self.csv_service.validate_csv(
+                path, {'email': 'email', 'first_name': 'first_name'},
+                required_fields=('email', 'first_name'), chunk_size=chunk_size
+            )
+            self.assertEqual((summary.valid_rows, summary.duplicate_rows), (3, 1))
+            self.assertEqual(summary.errors, [
+                {'row': 2, 'error': 'First name is required'},
+                {'row': 4, 'error': 'First name is required'},
+                {'row': 7, 'error': 'Duplicate email in file (skipped)'},
+            ])
+
+    def test_validate_csv_progress_and_cancel(self):
+        """Test that validation reports progress per chunk and stops when cancelled."""
+        from core.exceptions import JobCancelledError
+
+        lines = ["email"] + [f"user{i}@example.com" for i in range(5)]
+        path = self._write_csv('\n'.join(lines) + '\n')
+
+        progress = []
+        summary = self.csv_service.validate_csv(
+            path, {'email': 'email'}, chunk_size=2,
+            progress_callback=lambda done, total: progress.append((done, total))
+        )
+        self.assertEqual(summary.valid_rows, 5)
+        self.assertEqual(progress, [(2, 5), (4, 5), (5, 5)])
+
+        with self.assertRaises(JobCancelledError):
+            self.csv_service.validate_csv(
+                path, {'email': 'email'}, chunk_size=2, should_cancel=lambda: len(progress) > 3,
+                progress_callback=lambda done, total: progress.append((done, total))
+            )
+        self.assertEqual(len(progress), 4)
+
+    def test_undecodable_rows_rejected(self):
+        """Test that bytes the sniffed encoding cannot decode reject their row instead of the import."""
+        from unittest import mock
+        from core.models import CSVFileInfo
+        from services.csv_service import UNDECODABLE_ERROR
+
+        path = self._write_csv("email,first_name\nann@example.com,Zoë\nbob@example.com,B\n")
+        with open(path, 'ab') as f:
+            f.write('cat@example.com,Zoé\n'.encode('cp1252'))
+
+        # As if sampling had missed the stray byte
+        with mock.patch('services.csv_service.sniff_csv') as sniff:
+            sniff.return_value = CSVFileInfo(encoding='utf-8', delimiter=',', row_count=3)
+            summary = self.csv_service.validate_csv(path, {'email': 'email', 'first_name': 'first_name'})
+            result = self.csv_service.import_contacts(
+                path, self.contact_list.list_id, {'email': 'email', 'first_name': 'first_name'}
+            )
+
+        self.assertEqual(summary.errors, [{'row': 4, 'error': UNDECODABLE_ERROR}])
+        self.assertEqual((result.imported, result.error_count), (2, 1))
+        self.assertEqual(result.errors[0]['row'], 4)
+
+    def test_cancel_keeps_committed_chunks(self):
+        """Test that cancelling stops between chunks."""
+        lines = ["email"] + [f"user{i}@example.com" for i in range(10)]
+        path = self._write_csv('\n'.join(lines))
+
+        calls = []
+
+        def should_cancel():
+            calls.append(1)
+            return len(calls) > 2
+
+        result = self.csv_service.import_contacts(
+            path, self.contact_list.list_id, {'email': 'email'},
+            chunk_size=3, should_cancel=should_cancel
+        )
+
+        self.assertTrue(result.cancelled)
+        self.assertEqual(result.rows_processed, 6)
+        self.assertEqual(self.contact_service.get_contact_count(self.contact_list.list_id), 6)
+
+    def test_suppressed_rows_skipped_or_flagged(self):
+        """Test that each chunk is checked against the suppression list before writing."""
+        from services.suppression_service import SuppressionService
+
+        suppression_service = SuppressionService()
+        suppression_service.add_to_suppression('user1@example.com', 'Manual')
+        suppression_service.add_to_suppression('user4@example.com', 'Manual')
+
+        lines = ["email"] + [f"User{i}@Example.com" for i in range(6)]
+        path = self._write_csv('\n'.join(lines) + '\n')
+
+        result = self.csv_service.import_contacts(
+            path, self.contact_list.list_id, {'email': 'email'}, chunk_size=4
+        )
+        self.assertEqual((result.imported, result.suppressed), (4, 2))
+        self.assertEqual((result.errors, result.error_count), ([], 0))
+        self.assertIsNone(
+            self.contact_service.get_contact_by_email(self.contact_list.list_id, 'user1@example.com')
+        )
+
+        flagged_list = self.contact_service.create_list("Flagged")
+        result = self.csv_service.import_contacts(
+            path, flagged_list.list_id, {'email': 'email'}, skip_suppressed=False, chunk_size=4
+        )
+        self.assertEqual((result.imported, result.suppressed), (6, 2))
+        self.assertEqual((result.errors, result.error_count), ([], 0))
+
+        summary = self.csv_service.validate_csv(path, {'email': 'email'})
+        self.assertEqual(summary.suppressed_rows, 2)
+
+    def test_resume_cancelled_import(self):
+        """Test that a cancelled import resumes after its last committed chunk."""
+        from core.exceptions import CSVImportError
+
+        lines = ["email"] + [f"user{i}@example.com" for i in range(10)]
+        lines += ["user1@example.com", "bad-address"]
+        path = self._write_csv('\n'.join(lines) + '\n')
+
+        first = self.csv_service.import_contacts(
+            path, self.contact_list.list_id, {'email': 'email'},
+            chunk_size=4, should_cancel=lambda: self.contact_service.get_contact_count(
+                self.contact_list.list_id) >= 4
+        )
+        self.assertTrue(first.cancelled)
+        interrupted = self.csv_service.job_service.get_interrupted_jobs()
+        self.assertEqual([job.job_id for job in interrupted], [first.job_id])
+        self.assertEqual(interrupted[0].rows_committed, 4)
+
+        progress = []
+        result = self.csv_service.resume_import_job(
+            first.job_id, progress_callback=lambda done, total: progress.append((done, total))
+        )
+
+        self.assertFalse(result.cancelled)
+        self.assertEqual((result.imported, result.skipped), (10, 1))
+        self.assertEqual([(e['row'], e['error']) for e in result.errors], [(13, 'Invalid email address')])
+        self.assertEqual(progress, [(8, 12), (12, 12)])
+        self.assertEqual(self.contact_service.get_contact_count(self.contact_list.list_id), 10)
+        self.assertEqual(self.csv_service.job_service.get_interrupted_jobs(), [])
+
+        with self.assertRaises(CSVImportError):
+            self.csv_service.resume_import_job(first.job_id)
+
+    def test_import_errors_capped_and_jobs_purged(self):
+        """Test that only the first rejected rows are kept and old completed jobs are purged."""
+        from core.database import get_db
+        from services import csv_service
+
+        lines = ["email"] + [f"bad-{i}" for i in range(7)] + ["ok@example.com"]
+        path = self._write_csv('\n'.join(lines) + '\n')
+
+        original_limit = csv_service.MAX_IMPORT_ERRORS
+        csv_service.MAX_IMPORT_ERRORS = 5
+        try:
+            result = self.csv_service.import_contacts(
+                path, self.contact_list.list_id, {'email': 'email'}, chunk_size=3
+            )
+        finally:
+            csv_service.MAX_IMPORT_ERRORS = original_limit
+
+        self.assertEqual((result.imported, result.error_count), (1, 7))
+        self.assertEqual([e['row'] for e in result.errors], [2, 3, 4, 5, 6])
+        job_service = self.csv_service.job_service
+        self.assertEqual(len(job_service.get_errors(result.job_id)), 5)
+        self.assertEqual([e['row'] for e in job_service.get_errors(result.job_id, limit=2)], [2, 3])
+        self.assertEqual(job_service.get_job(result.job_id).error_count, 7)
+
+        self.assertEqual(job_service.purge_completed_jobs(), 0)
+        get_db().execute(
+            "UPDATE import_jobs SET updated_at = datetime('now', '-30 days') WHERE job_id = ?",
+            (result.job_id,)
+        )
+        self.assertEqual(job_service.purge_completed_jobs(), 1)
+        self.assertIsNone(job_service.get_job(result.job_id))
+        self.assertEqual(job_service.get_errors(result.job_id), [])
+
+    def test_resume_rejects_changed_file(self):
+        """Test that a job whose file changed cannot be resumed."""
+        from core.exceptions import CSVImportError
+
+        path = self._write_csv("email\na@example.com\nb@example.com\n")
+        result = self.csv_service.import_contacts(
+            path, self.contact_list.list_id, {'email': 'email'},
+            chunk_size=1, should_cancel=lambda: True
+        )
+        with open(path, 'a', encoding='utf-8') as f:
+            f.write("c@example.com\n")
+
+        with self.assertRaises(CSVImportError):
+            self.csv_service.resume_import_job(result.job_id)
+
+        self.csv_service.job_service.discard_job(result.job_id)
+        self.assertIsNone(self.csv_service.job_service.get_job(result.job_id))
+
+        # A same-size edit between the hashed ends is caught by the modification time
+        from services.import_job_service import file_fingerprint
+
+        path = self._write_csv("email\n" + "".join(f"user{i:05d}@example.com\n" for i in range(20000)))
+        before = file_fingerprint(path)
+        with open(path, 'r+b') as f:
+            f.seek(os.path.getsize(path) // 2)
+            f.write(b'X')
+        stat = os.stat(path)
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+        self.assertNotEqual(file_fingerprint(path), before)
+
+    def test_compressed_csv_export(self):
+        """Test streaming CSV export to plain, gzip and zip files."""
+        import csv
+        import gzip
+        import io
+        import zipfile
+
+        self.contact_service.update_list(self.contact_list.list_id, custom_labels={'custom1': 'Zip'})
+        self.contact_service.upsert_contacts(self.contact_list.list_id, [
+            {'email': f'user{i}@example.com', 'first_name': f'First{i}', 'custom1': f'0{i}'}
+            for i in range(12)
+        ])
+
+        for suffix in ('.csv', '.csv.gz', '.zip'):
+            path = self._temp_path(suffix)
+            count = self.csv_service.export_contacts(self.contact_list.list_id, path)
+            self.assertEqual(count, 12)
+
+            if suffix == '.csv.gz':
+                with gzip.open(path, 'rt', encoding='utf-8', newline='') as f:
+                    rows = list(csv.reader(f))
+            elif suffix == '.zip':
+                with zipfile.ZipFile(path) as archive:
+                    [name] = archive.namelist()
+                    self.assertTrue(name.endswith('.csv'))
+                    rows = list(csv.reader(io.TextIOWrapper(archive.open(name), encoding='utf-8', newline='')))
+            else:
+                with open(path, encoding='utf-8', newline='') as f:
+                    rows = list(csv.reader(f))
+
+            self.assertEqual(rows[0][:4], ['Title', 'First Name', 'Last Name', 'Email'])
+            self.assertEqual(rows[0][9], 'Zip')
+            self.assertEqual(len(rows), 13)
+            self.assertEqual(rows[1][1], 'First0')
+            self.assertEqual(rows[1][3], 'user0@example.com')
+            self.assertEqual(rows[1][9], '00')
+            self.assertEqual(rows[1][0], '')
+
+        selected = self._temp_path('.csv')
+        self.csv_service.export_csv(self.contact_list.list_id, selected, fields=['email', 'Zip'])
+        with open(selected, encoding='utf-8', newline='') as f:
+            self.assertEqual(next(csv.reader(f)), ['email', 'Zip'])
+
+    def test_export_progress_and_cancel(self):
+        """Test that exports report progress per batch and remove the file when cancelled."""
+        from core.exceptions import JobCancelledError
+        from services import csv_service
+
+        self.contact_service.upsert_contacts(self.contact_list.list_id, [
+            {'email': f'user{i}@example.com'} for i in range(5)
+        ])
+        original_batch_size = csv_service.EXPORT_BATCH_SIZE
+        csv_service.EXPORT_BATCH_SIZE = 2
+        try:
+            progress = []
+            path = self._temp_path('.csv')
+            self.csv_service.export_contacts(
+                self.contact_list.list_id, path,
+                progress_callback=lambda done, total: progress.append((done, total))
+            )
+            self.assertEqual(progress, [(2, 5), (4, 5), (5, 5)])
+
+            for suffix in ('.csv', '.zip') + (('.parquet',) if ARROW_AVAILABLE else ()):
+                path = self._temp_path(suffix)
+                with self.assertRaises(JobCancelledError):
+                    self.csv_service.export_contacts(
+                        self.contact_list.list_id, path,
+                        should_cancel=lambda: len(progress) > 3,
+                        progress_callback=lambda done, total: progress.append((done, total))
+                    )
+                self.assertFalse(os.path.exists(path))
+        finally:
+            csv_service.EXPORT_BATCH_SIZE = original_batch_size
+
+    @unittest.skipUnless(ARROW_AVAILABLE, "pyarrow not installed")
+    def test_columnar_round_trip(self):
+        """Test exporting a list to Parquet/Arrow and importing it into another list."""
+        self.contact_service.upsert_contacts(self.contact_list.list_id, [
+            {'email': f'user{i}@example.com', 'first_name': f'First{i}', 'custom2': f'0{i}'}
+            for i in range(25)
+        ])
+        target = self.contact_service.create_list("Copy")
+
+        for suffix in ('.parquet', '.arrow'):
+            path = self._temp_path(suffix)
+
+            exported = self.csv_service.export_contacts(self.contact_list.list_id, path)
+            headers, preview, total = self.csv_service.read_csv_preview(path)
+            result = self.csv_service.import_contacts(
+                path, target.list_id, self.csv_service.auto_map_fields(headers), chunk_size=10
+            )
+
+            self.assertEqual((exported, total, len(preview)), (25, 25, 5))
+            self.assertEqual(result.imported + result.skipped, 25)
+
+        copy = self.contact_service.get_contact_by_email(target.list_id, 'user7@example.com')
+        self.assertEqual((copy.first_name, copy.custom2), ('First7', '07'))
+
+        # The Arrow file's memory map is closed once the import has read it
+        from unittest import mock
+        import pyarrow as pa
+
+        opened = []
+        memory_map = pa.memory_map
+        with mock.patch.object(pa, 'memory_map', side_effect=lambda *args: opened.append(memory_map(*args)) or opened[-1]):
+            self.csv_service.import_contacts(path, target.list_id, self.csv_service.auto_map_fields(headers))
+        self.assertEqual(len(opened), 1)
+        self.assertTrue(opened[0].closed)
+
+    @unittest.skipUnless(XLSX_AVAILABLE, "openpyxl not installed")
+    def test_xlsx_import(self):
+        """Test importing the first worksheet of a workbook."""
+        import openpyxl
+
+        workbook = openpyxl.Workbook()
+        sheet = workbook.active
+        sheet.append(['E-mail', 'Prénom', 'Zip'])
+        sheet.append(['a@example.com', 'Ann', 7501.0])
+        sheet.append(['b@example.com', None, None])
+        path = self._temp_path('.xlsx')
+        workbook.save(path)
+
+        headers, _, total = self.csv_service.read_csv_preview(path)
+        mapping = self.csv_service.auto_map_fields(headers)
+        mapping['Zip'] = 'custom1'
+        result = self.csv_service.import_contacts(path, self.contact_list.list_id, mapping)
+
+        self.assertEqual((total, result.imported), (2, 2))
+        contact = self.contact_service.get_contact_by_email(self.contact_list.list_id, 'a@example.com')
+        self.assertEqual((contact.first_name, contact.custom1), ('Ann', '7501'))
+
+
+if __name__ == '__main__':
+    unittest.main()
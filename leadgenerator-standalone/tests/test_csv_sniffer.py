@@ -0,0 +1,83 @@
+"""Tests for CSV sniffing."""
+
+import os
+import sys
+import tempfile
+import unittest
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services import csv_sniffer
+from services.csv_sniffer import sniff_csv
+
+
+class TestCSVSniffer(unittest.TestCase):
+    """Test cases for encoding, delimiter and row count detection."""
+
+    def setUp(self):
+        self.temp_files = []
+
+    def tearDown(self):
+        for path in self.temp_files:
+            os.unlink(path)
+
+    def _write(self, content: bytes) -> str:
+        handle = tempfile.NamedTemporaryFile(suffix='.csv', delete=False)
+        handle.write(content)
+        handle.close()
+        self.temp_files.append(handle.name)
+        return handle.name
+
+    def test_quoted_newlines_and_bom(self):
+        """Test that line breaks inside quoted fields are not counted as rows."""
+        content = (
+            '\ufeffemail;note\r\n'
+            'a@example.com;"line one\r\nline two"\r\n'
+            'b@example.com;"say ""hi""\nthere"\r\n'
+            'c@example.com;plain'
+        ).encode('utf-8')
+        info = sniff_csv(self._write(content))
+
+        self.assertEqual(info.encoding, 'utf-8-sig')
+        self.assertTrue(info.has_bom)
+        self.assertEqual(info.delimiter, ';')
+        self.assertEqual(info.row_count, 3)
+
+    def test_late_accents_pick_legacy_encoding(self):
+        """Test that accented rows far from the header still decide the encoding."""
+        rows = ['email,first_name'] + [f'user{i}@example.com,Plain' for i in range(200000)]
+        rows.append('zoe@example.com,Zoé')
+        path = self._write('\n'.join(rows).encode('cp1252'))
+
+        info = sniff_csv(path)
+        self.assertEqual(info.encoding, 'cp1252')
+        self.assertEqual(info.delimiter, ',')
+        self.assertEqual(info.row_count, 200001)
+
+    def test_utf16_counted_in_blocks(self):
+        """Test that UTF-16 files are counted block by block, and a header alone is zero rows."""
+        self.assertEqual(sniff_csv(self._write('email;name\r\n'.encode('utf-16'))).row_count, 0)
+
+        content = 'email;note\r\na@example.com;"Zoé\nsays hi"\r\nb@example.com;ok'.encode('utf-16')
+        original = csv_sniffer.COUNT_BLOCK_SIZE
+        csv_sniffer.COUNT_BLOCK_SIZE = 7
+        try:
+            info = sniff_csv(self._write(content))
+        finally:
+            csv_sniffer.COUNT_BLOCK_SIZE = original
+        self.assertEqual((info.encoding, info.delimiter, info.row_count), ('utf-16', ';', 2))
+
+    def test_quote_state_across_blocks(self):
+        """Test quote parity carried over block boundaries."""
+        original = csv_sniffer.COUNT_BLOCK_SIZE
+        csv_sniffer.COUNT_BLOCK_SIZE = 7
+        try:
+            info = sniff_csv(self._write(b'h1,h2\n1,"a\nb\nc"\n2,"x"\n3,y\n'))
+        finally:
+            csv_sniffer.COUNT_BLOCK_SIZE = original
+        self.assertEqual(info.row_count, 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
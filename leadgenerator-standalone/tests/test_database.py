@@ -149,6 +149,380 @@ class TestContactService(unittest.TestCase):
                 'company': 'Other'
             })
 
+    def test_search_contacts(self):
+        """Test full-text search with prefixes, custom fields and cross-list mode."""
+        from services.contact_service import ContactService
+
+        service = ContactService()
+        list_a = service.create_list("List A")
+        list_b = service.create_list("List B")
+
+        service.create_contact(list_a.list_id, {
+            'first_name': 'Hélène',
+            'last_name': 'Martin',
+            'email': 'helene.martin@acme.com',
+            'company': 'Acme',
+            'custom1': 'Lyon'
+        })
+        service.create_contact(list_b.list_id, {
+            'first_name': 'John',
+            'last_name': 'Acme',
+            'email': 'john@other.com',
+            'company': 'Other'
+        })
+
+        results = service.search_contacts(list_a.list_id, 'hel mart')
+        self.assertEqual([c.email for c in results], ['helene.martin@acme.com'])
+
+        results = service.search_contacts(list_a.list_id, 'lyon')
+        self.assertEqual(len(results), 1)
+
+        results = service.search_all_contacts('acme')
+        self.assertEqual(len(results), 2)
+
+        # Updated rows are re-indexed by triggers
+        service.update_contact(results[0].contact_id, {'company': 'Globex'})
+        self.assertEqual(len(service.search_contacts(None, 'globex')), 1)
+
+    def test_identity_shared_across_lists(self):
+        """Test that the same person in several lists resolves to one identity."""
+        from core.database import rebuild_email_keys
+        from services.contact_service import ContactService
+
+        service = ContactService()
+        list_a = service.create_list("List A")
+        list_b = service.create_list("List B")
+
+        first = service.create_contact(list_a.list_id, {
+            'first_name': 'John', 'last_name': 'Doe',
+            'email': ' John@Example.com ', 'company': 'Acme'
+        })
+        service.create_contact(list_b.list_id, {
+            'first_name': 'John', 'last_name': 'Doe',
+            'email': 'john+news@example.com', 'company': 'Acme'
+        })
+
+        self.assertEqual(first.email, 'john@example.com')
+        self.assertEqual(len(service.get_all_contacts_by_email('JOHN@example.com')), 1)
+        self.assertEqual(service.find_cross_list_duplicates(), [])
+
+        try:
+            rebuild_email_keys(fold_plus_addressing=True)
+            self.assertEqual(len(service.get_all_contacts_by_email('john@example.com')), 2)
+            duplicates = service.find_cross_list_duplicates()
+            self.assertEqual(duplicates[0]['email_key'], 'john@example.com')
+            self.assertEqual(sorted(duplicates[0]['list_ids']), [list_a.list_id, list_b.list_id])
+            # Keys are swapped in place: every contact stays linked and no identity is left over
+            db = Database.get_instance()
+            self.assertIsNone(db.fetchone("SELECT 1 FROM contacts WHERE identity_id IS NULL"))
+            self.assertEqual(db.fetchone("SELECT COUNT(*) AS n FROM contact_identities")['n'], 1)
+            self.assertEqual(get_setting('email_fold_plus_addressing'), '1')
+        finally:
+            rebuild_email_keys(fold_plus_addressing=False)
+
+    def test_upsert_contacts(self):
+        """Test bulk upsert outcomes for skip and update modes."""
+        from services.contact_service import ContactService
+        from core.exceptions import ValidationError
+
+        service = ContactService()
+        contact_list = service.create_list("Bulk")
+        service.create_contact(contact_list.list_id, {
+            'first_name': 'John', 'last_name': 'Doe',
+            'email': 'john@example.com', 'company': 'Acme'
+        })
+
+        rows = [
+            {'first_name': 'Jane', 'email': 'jane@example.com'},
+            {'first_name': 'Johnny', 'email': 'JOHN@example.com', 'company': ''},
+            {'first_name': 'Jane again', 'email': 'jane@example.com'},
+            {'first_name': 'Nobody', 'email': ''},
+            {'first_name': 'Broken', 'email': 'not-an-email'},
+        ]
+
+        result = service.upsert_contacts(contact_list.list_id, rows)
+        self.assertEqual(result.outcomes, ['inserted', 'skipped', 'skipped', 'invalid', 'invalid'])
+        self.assertEqual([e['index'] for e in result.errors], [3, 4])
+        self.assertEqual(service.get_contact_count(contact_list.list_id), 2)
+
+        result = service.upsert_contacts(contact_list.list_id, rows[:2], on_conflict='update')
+        self.assertEqual((result.inserted, result.updated), (0, 2))
+        john = service.get_contact_by_email(contact_list.list_id, 'john@example.com')
+        self.assertEqual(john.first_name, 'Johnny')
+        self.assertEqual(john.company, 'Acme')  # empty values keep stored data
+        self.assertIsNotNone(service.get_identity_id('jane@example.com'))
+
+        with self.assertRaises(ValidationError):
+            service.upsert_contacts(contact_list.list_id, rows, on_conflict='replace')
+
+    def test_list_counts_follow_contacts(self):
+        """Test that cached list counts track inserts, moves, upserts and deletes."""
+        from services.contact_service import ContactService
+
+        service = ContactService()
+        list_a = service.create_list("List A")
+        list_b = service.create_list("List B")
+
+        contact = service.create_contact(list_a.list_id, {'email': 'one@example.com'})
+        service.upsert_contacts(list_a.list_id, [
+            {'email': 'two@example.com'}, {'email': 'one@example.com'}
+        ], on_conflict='update')
+        self.assertEqual(service.get_list(list_a.list_id).contact_count, 2)
+
+        service.db.execute(
+            "UPDATE contacts SET list_id = ? WHERE contact_id = ?",
+            (list_b.list_id, contact.contact_id)
+        )
+        counts = {l.name: l.contact_count for l in service.get_all_lists()}
+        self.assertEqual(counts, {"List A": 1, "List B": 1})
+
+        service.delete_contact(contact.contact_id)
+        self.assertEqual(service.get_contact_count(list_b.list_id), 0)
+
+    def test_daily_stats_follow_logs_and_outcomes(self):
+        """Test that the daily rollups track email logs and contact outcomes and match a rebuild."""
+        from datetime import datetime
+        from core.database import rebuild_daily_stats
+        from services.campaign_service import CampaignService
+        from services.contact_service import ContactService
+        from services.report_service import ReportService
+
+        contact_service = ContactService()
+        campaign_service = CampaignService()
+        contact_list = contact_service.create_list("Prospects")
+        contact_service.upsert_contacts(contact_list.list_id, [
+            {'email': f'user{i}@example.com'} for i in range(3)
+        ])
+        campaign = campaign_service.create_campaign({'name': 'Launch', 'contact_list_id': contact_list.list_id})
+        step_id = campaign_service._create_step(campaign.campaign_id, 1, 'Hi', 'Hello')
+        campaign_service.activate_campaign(campaign.campaign_id)
+        contact_ids = [c.contact_id for c in contact_service.get_contacts(contact_list.list_id)]
+
+        db = Database.get_instance()
+        today = datetime.now().strftime('%Y-%m-%d')
+        for contact_id, status in zip(contact_ids, ['Sent', 'Sent', 'Failed']):
+            db.execute(
+                "INSERT INTO email_logs (campaign_id, contact_id, step_id, subject, status, sent_at) "
+                "VALUES (?, ?, ?, 'Hi', ?, datetime('now', 'localtime'))",
+                (campaign.campaign_id, contact_id, step_id, status)
+            )
+        db.execute(
+            "UPDATE email_logs SET status = 'Bounced' WHERE contact_id = ? AND status = 'Sent'",
+            (contact_ids[1],)
+        )
+        db.execute("""
+            UPDATE campaign_contacts SET status = 'Responded', responded_at = datetime('now', 'localtime')
+            WHERE contact_id = ?
+        """, (contact_ids[0],))
+        db.execute("""
+            UPDATE campaign_contacts SET status = 'Unsubscribed', unsubscribed_at = datetime('now', 'localtime')
+            WHERE contact_id = ?
+        """, (contact_ids[2],))
+
+        report = ReportService().get_campaign_report(campaign.campaign_id)
+        self.assertEqual(report['stats']['emails_sent'], 1)
+        self.assertEqual(report['stats']['emails_failed'], 1)
+        self.assertEqual(report['daily_sends'], [
+            {'date': today, 'sent': 1, 'failed': 1, 'responses': 1, 'unsubscribes': 1}
+        ])
+        self.assertEqual(ReportService().get_dashboard_stats()['emails_sent_30d'], 1)
+
+        snapshot = lambda table: [tuple(row) for row in db.fetchall(f"SELECT * FROM {table} ORDER BY 1, 2, 3, 4")]
+        incremental = (snapshot('daily_send_stats'), snapshot('daily_contact_stats'))
+        self.assertEqual(rebuild_daily_stats(), 5)
+        self.assertEqual((snapshot('daily_send_stats'), snapshot('daily_contact_stats')), incremental)
+
+        # Leaving an outcome status takes the contact off the rollup again
+        db.execute("UPDATE campaign_contacts SET status = 'InProgress' WHERE contact_id = ?", (contact_ids[0],))
+        self.assertEqual(db.fetchall("SELECT status FROM daily_contact_stats")[0]['status'], 'Unsubscribed')
+        self.assertEqual(len(snapshot('daily_contact_stats')), 1)
+
+        # Touching updated_at later does not move the unsubscribe to another day
+        db.execute(
+            "UPDATE campaign_contacts SET updated_at = '2030-01-01 00:00:00' WHERE contact_id = ?",
+            (contact_ids[2],)
+        )
+        self.assertEqual(
+            [(row['day'], row['count']) for row in db.fetchall("SELECT day, count FROM daily_contact_stats")],
+            [(today, 1)]
+        )
+
+    def test_step_performance_attributes_responses(self):
+        """Test that each response counts for the last step sent before it, with its reply latency."""
+        from services.campaign_service import CampaignService
+        from services.contact_service import ContactService
+        from services.report_service import ReportService
+
+        contact_service = ContactService()
+        campaign_service = CampaignService()
+        contact_list = contact_service.create_list("Prospects")
+        contact_service.upsert_contacts(contact_list.list_id, [
+            {'email': f'user{i}@example.com'} for i in range(3)
+        ])
+        campaign = campaign_service.create_campaign({'name': 'Launch', 'contact_list_id': contact_list.list_id})
+        step_ids = [campaign_service._create_step(campaign.campaign_id, n, f'Step {n}', 'Hello') for n in (1, 2)]
+        campaign_service.activate_campaign(campaign.campaign_id)
+        ann, bob, cat = [c.contact_id for c in contact_service.get_contacts(contact_list.list_id)]
+
+        db = Database.get_instance()
+        sends = [
+            (ann, step_ids[0], '2026-01-01 09:00:00'), (ann, step_ids[1], '2026-01-04 09:00:00'),
+            (bob, step_ids[0], '2026-01-01 09:00:00'), (bob, step_ids[1], '2026-01-04 09:00:00'),
+            (cat, step_ids[0], '2026-01-01 09:00:00'),
+        ]
+        for contact_id, step_id, sent_at in sends:
+            db.execute(
+                "INSERT INTO email_logs (campaign_id, contact_id, step_id, subject, status, sent_at) "
+                "VALUES (?, ?, ?, 'Hi', 'Sent', ?)",
+                (campaign.campaign_id, contact_id, step_id, sent_at)
+            )
+        # Ann replied to step 1 (before step 2 went out), Bob to step 2
+        for contact_id, responded_at in [(ann, '2026-01-02 09:00:00'), (bob, '2026-01-04 15:00:00')]:
+            db.execute(
+                "UPDATE campaign_contacts SET status = 'Responded', responded_at = ? WHERE contact_id = ?",
+                (responded_at, contact_id)
+            )
+
+        steps = ReportService()._get_step_performance(campaign.campaign_id)
+        self.assertEqual(
+            [(s['step_number'], s['sent_count'], s['responses'], s['avg_reply_hours']) for s in steps],
+            [(1, 3, 1, 24.0), (2, 2, 1, 6.0)]
+        )
+        self.assertEqual(steps[0]['response_rate'], 33.3)
+
+    def test_dashboard_cache_invalidated_by_events(self):
+        """Test that dashboard results are served from cache until an event that affects them."""
+        from services.campaign_service import CampaignService
+        from services.report_service import ReportService, invalidate_for_event
+
+        campaign_service = CampaignService()
+        report_service = ReportService()
+        campaign = campaign_service.create_campaign({'name': 'Launch'})
+        campaign_service._create_step(campaign.campaign_id, 1, 'Hi', 'Hello')
+
+        stats = report_service.get_dashboard_stats()
+        summaries = report_service.get_campaign_summaries(status_filter=None)
+        self.assertEqual(stats['emails_sent_30d'], 0)
+
+        report_service.db.execute(
+            "INSERT INTO email_logs (campaign_id, subject, status, sent_at) VALUES (?, 'Hi', 'Sent', datetime('now', 'localtime'))",
+            (campaign.campaign_id,)
+        )
+        self.assertIs(report_service.get_dashboard_stats(), stats)
+
+        # An unsubscribe leaves the send counts alone
+        invalidate_for_event('unsubscribe_detected')
+        self.assertIs(report_service.get_dashboard_stats(), stats)
+        self.assertIsNot(report_service.get_campaign_summaries(status_filter=None), summaries)
+
+        invalidate_for_event('email_sent')
+        self.assertEqual(report_service.get_dashboard_stats()['emails_sent_30d'], 1)
+
+    def test_campaign_report_export(self):
+        """Test that report exports quote fields, keep old logs and bundle every campaign."""
+        import csv
+        import shutil
+        import zipfile
+        from services.campaign_service import CampaignService
+        from services.contact_service import ContactService
+        from services.report_service import ReportService
+
+        contact_service = ContactService()
+        campaign_service = CampaignService()
+        report_service = ReportService()
+        contact_list = contact_service.create_list("Prospects")
+        contact = contact_service.create_contact(contact_list.list_id, {
+            'first_name': 'Ann', 'last_name': 'O"Neil, Jr', 'email': 'ann@example.com'
+        })
+        campaigns = [campaign_service.create_campaign({'name': name}) for name in ('Launch', 'Follow/up')]
+
+        db = Database.get_instance()
+        subject = 'Hello, "friend"\nsecond line'
+        for sent_at in ('2020-01-01 09:00:00', '2026-01-01 09:00:00'):
+            db.execute(
+                "INSERT INTO email_logs (campaign_id, contact_id, subject, status, sent_at) VALUES (?, ?, ?, 'Sent', ?)",
+                (campaigns[0].campaign_id, contact.contact_id, subject, sent_at)
+            )
+
+        out_dir = tempfile.mkdtemp()
+        try:
+            report_path = os.path.join(out_dir, 'report.csv')
+            self.assertEqual(report_service.export_campaign_report(campaigns[0].campaign_id, report_path), 2)
+            with open(report_path, newline='', encoding='utf-8') as f:
+                rows = list(csv.reader(f))
+            log = rows[rows.index(['Email Log']) + 1:]
+            self.assertEqual(log[0][0], 'date')
+            self.assertEqual(
+                log[1:],
+                [[sent_at, 'Ann O"Neil, Jr', 'ann@example.com', subject, 'Sent', '']
+                 for sent_at in ('2026-01-01 09:00:00', '2020-01-01 09:00:00')]
+            )
+            self.assertIn(['Emails Sent', '2'], rows)
+
+            zip_path = os.path.join(out_dir, 'reports.zip')
+            self.assertEqual(report_service.export_all_campaign_reports(zip_path, max_workers=2), 2)
+            with zipfile.ZipFile(zip_path) as archive:
+                names = sorted(archive.namelist())
+                self.assertEqual(len(names), 2)
+                self.assertTrue(all(name.endswith('.csv') and '/' not in name for name in names))
+                self.assertIn(campaigns[0].campaign_ref, names[0])
+        finally:
+            shutil.rmtree(out_dir, ignore_errors=True)
+
+    def test_report_export_progress_and_cancel(self):
+        """Test that report exports report progress and remove their file when cancelled or failed."""
+        import shutil
+        from unittest.mock import patch
+        from core.exceptions import JobCancelledError
+        from services import report_service as report_module
+        from services.campaign_service import CampaignService
+        from services.report_service import ReportService
+
+        report_service = ReportService()
+        campaigns = [CampaignService().create_campaign({'name': name}) for name in ('One', 'Two')]
+        db = Database.get_instance()
+        db.executemany(
+            "INSERT INTO email_logs (campaign_id, subject, status, sent_at) VALUES (?, 'Hi', 'Sent', datetime('now'))",
+            [(campaigns[0].campaign_id,)] * 5
+        )
+
+        original_batch_size = report_module.REPORT_EXPORT_BATCH_SIZE
+        report_module.REPORT_EXPORT_BATCH_SIZE = 2
+        out_dir = tempfile.mkdtemp()
+        try:
+            progress = []
+            report_path = os.path.join(out_dir, 'report.csv')
+            report_service.export_campaign_report(
+                campaigns[0].campaign_id, report_path,
+                progress_callback=lambda done, total: progress.append((done, total))
+            )
+            self.assertEqual(progress, [(2, 5), (4, 5), (5, 5)])
+
+            with self.assertRaises(JobCancelledError):
+                report_service.export_campaign_report(
+                    campaigns[0].campaign_id, report_path, should_cancel=lambda: True
+                )
+            self.assertFalse(os.path.exists(report_path))
+
+            progress = []
+            zip_path = os.path.join(out_dir, 'reports.zip')
+            report_service.export_all_campaign_reports(
+                zip_path, max_workers=1, progress_callback=lambda done, total: progress.append((done, total))
+            )
+            self.assertEqual(progress, [(1, 2), (2, 2)])
+
+            with self.assertRaises(JobCancelledError):
+                report_service.export_all_campaign_reports(zip_path, should_cancel=lambda: True)
+            self.assertFalse(os.path.exists(zip_path))
+
+            with patch.object(ReportService, 'export_campaign_report', side_effect=OSError("disk full")):
+                with self.assertRaises(OSError):
+                    report_service.export_all_campaign_reports(zip_path, max_workers=1)
+            self.assertFalse(os.path.exists(zip_path))
+        finally:
+            report_module.REPORT_EXPORT_BATCH_SIZE = original_batch_size
+            shutil.rmtree(out_dir, ignore_errors=True)
+
 
 if __name__ == '__main__':
     unittest.main()
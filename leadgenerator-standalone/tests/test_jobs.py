@@ -0,0 +1,98 @@
+"""Tests for background jobs."""
+
+import os
+import sys
+import tempfile
+import time
+import unittest
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.database import Database, init_database, get_db
+from core.jobs import BackgroundJob
+
+
+class FakeWidget:
+    """Minimal stand-in for a Tk widget: runs after() callbacks on demand."""
+
+    def __init__(self):
+        self.pending = []
+
+    def after(self, delay_ms, callback):
+        self.pending.append(callback)
+
+    def winfo_exists(self):
+        return True
+
+    def run_until_idle(self, timeout=5.0):
+        deadline = time.time() + timeout
+        while self.pending and time.time() < deadline:
+            callback = self.pending.pop(0)
+            callback()
+            time.sleep(0.01)
+
+
+class TestBackgroundJob(unittest.TestCase):
+    """Test cases for BackgroundJob."""
+
+    def setUp(self):
+        """Set up test database."""
+        self.temp_db = tempfile.NamedTemporaryFile(suffix='.db', delete=False)
+        self.temp_db.close()
+        Database.set_path(self.temp_db.name)
+        Database._instance = None
+        init_database(self.temp_db.name)
+
+    def tearDown(self):
+        """Clean up test database."""
+        db = Database.get_instance()
+        db.close()
+        Database._instance = None
+        os.unlink(self.temp_db.name)
+
+    def test_job_reports_progress_and_result(self):
+        """Test that a job can use the database from its thread and report back."""
+        from services.contact_service import ContactService
+
+        service = ContactService()
+        contact_list = service.create_list("Threaded")
+
+        def task(report_progress, token):
+            for i in range(3):
+                service.create_contact(contact_list.list_id, {'email': f'user{i}@example.com'})
+                report_progress(i + 1, 3)
+            return service.get_contact_count(contact_list.list_id)
+
+        widget = FakeWidget()
+        progress, results = [], []
+        BackgroundJob(
+            widget, task,
+            on_progress=lambda done, total, message: progress.append(done),
+            on_done=results.append
+        ).start()
+        widget.run_until_idle()
+
+        self.assertEqual(results, [3])
+        self.assertEqual(progress[-1], 3)
+        self.assertEqual(get_db().fetchone("SELECT COUNT(*) AS n FROM contacts")['n'], 3)
+
+    def test_job_cancel(self):
+        """Test that a cancelled job reports through on_cancelled."""
+        def task(report_progress, token):
+            while True:
+                token.raise_if_cancelled()
+                time.sleep(0.01)
+
+        widget = FakeWidget()
+        cancelled = []
+        job = BackgroundJob(widget, task, on_cancelled=lambda: cancelled.append(True)).start()
+        job.cancel()
+        widget.run_until_idle()
+
+        self.assertEqual(cancelled, [True])
+        self.assertFalse(job.running)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,131 @@
+"""Tests for keyset pagination."""
+
+import os
+import sys
+import tempfile
+import unittest
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.database import Database, init_database
+from core.exceptions import ValidationError
+
+
+class TestKeysetPagination(unittest.TestCase):
+    """Test cases for cursor-based pagination."""
+
+    def setUp(self):
+        """Set up test database."""
+        self.temp_db = tempfile.NamedTemporaryFile(suffix='.db', delete=False)
+        self.temp_db.close()
+        Database.set_path(self.temp_db.name)
+        Database._instance = None
+        init_database(self.temp_db.name)
+
+    def tearDown(self):
+        """Clean up test database."""
+        db = Database.get_instance()
+        db.close()
+        Database._instance = None
+        os.unlink(self.temp_db.name)
+
+    def test_contacts_pages_cover_list_once(self):
+        """Test that walking the cursor visits every contact exactly once, in order."""
+        from services.contact_service import ContactService
+
+        service = ContactService()
+        contact_list = service.create_list("Paged")
+        for i in range(25):
+            service.create_contact(contact_list.list_id, {
+                'first_name': f'First{i % 3}',
+                'last_name': 'Same' if i % 2 else f'Name{i:02d}',
+                'email': f'user{i}@example.com',
+                'company': 'Acme'
+            })
+
+        seen = []
+        cursor = None
+        while True:
+            page = service.get_contacts_page(contact_list.list_id, limit=7, cursor=cursor)
+            seen.extend(page.items)
+            if not page.has_more:
+                break
+            cursor = page.next_cursor
+
+        expected = service.get_contacts(contact_list.list_id)
+        self.assertEqual(len(seen), 25)
+        self.assertEqual(
+            [(c.last_name, c.first_name) for c in seen],
+            [(c.last_name, c.first_name) for c in expected]
+        )
+        self.assertEqual(len({c.contact_id for c in seen}), 25)
+
+    def test_campaign_contacts_pages_read_only_the_campaign(self):
+        """Test that campaign contact pages come in name order from the campaign's rows alone."""
+        from services.campaign_service import CampaignService
+        from services.contact_service import ContactService
+
+        contact_service = ContactService()
+        campaign_service = CampaignService()
+        contact_list = contact_service.create_list("Paged")
+        other_list = contact_service.create_list("Other")
+        for i in range(12):
+            contact_service.create_contact(contact_list.list_id, {
+                'first_name': f'First{i % 3}', 'last_name': f'Name{i % 5}',
+                'email': f'user{i}@example.com', 'company': 'Acme'
+            })
+            contact_service.create_contact(other_list.list_id, {
+                'first_name': 'Out', 'last_name': f'Name{i % 5}',
+                'email': f'user{i}@example.com', 'company': 'Acme'
+            })
+        campaign = campaign_service.create_campaign({'name': 'Paged', 'contact_list_id': contact_list.list_id})
+        campaign_service._create_step(campaign.campaign_id, 1, 'Hi', 'Hello')
+        campaign_service.activate_campaign(campaign.campaign_id)
+
+        seen = []
+        cursor = None
+        while True:
+            page = campaign_service.get_campaign_contacts_page(campaign.campaign_id, limit=5, cursor=cursor)
+            seen.extend(page.items)
+            if not page.has_more:
+                break
+            cursor = page.next_cursor
+
+        keys = [(c.contact.last_name, c.contact.first_name, c.contact_id) for c in seen]
+        self.assertEqual(len(set(keys)), 12)
+        self.assertEqual(keys, sorted(keys))
+        self.assertEqual({c.contact.first_name for c in seen}, {'First0', 'First1', 'First2'})
+
+        statuses = [c.status for c in campaign_service.get_campaign_contacts_page(
+            campaign.campaign_id, status_filter='Pending', limit=20
+        ).items]
+        self.assertEqual(statuses, ['Pending'] * 12)
+        self.assertEqual(
+            campaign_service.get_campaign_contacts_page(campaign.campaign_id, status_filter='Responded').items, []
+        )
+
+        # The walk starts from the campaign's index; contacts are only probed by primary key
+        plan = [row['detail'] for row in Database.get_instance().fetchall(
+            "EXPLAIN QUERY PLAN SELECT cc.contact_id FROM campaign_contacts cc "
+            "CROSS JOIN contacts c ON c.contact_id = cc.contact_id "
+            "WHERE cc.campaign_id = 1 AND cc.status = 'Pending' "
+            "ORDER BY c.last_name, c.first_name, c.contact_id LIMIT 6"
+        )]
+        self.assertTrue(plan[0].startswith('SEARCH cc USING INDEX idx_campaign_contacts_campaign_status'))
+        self.assertIn('SEARCH c USING INTEGER PRIMARY KEY', plan[1])
+        self.assertFalse(any(step.startswith('SCAN') for step in plan))
+
+    def test_invalid_cursor(self):
+        """Test that a malformed cursor is rejected."""
+        from services.contact_service import ContactService
+
+        service = ContactService()
+        contact_list = service.create_list("Paged")
+
+        with self.assertRaises(ValidationError):
+            service.get_contacts_page(contact_list.list_id, cursor='not-a-cursor')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,219 @@
+"""Tests for the in-memory suppression index and bulk suppression import."""
+
+import os
+import sqlite3
+import sys
+import tempfile
+import unittest
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core import suppression_index
+from core.database import Database, init_database
+from core.suppression_index import get_suppression_index
+
+
+class TestSuppressionIndex(unittest.TestCase):
+    """Test cases for SuppressionIndex."""
+
+    def setUp(self):
+        """Set up test database."""
+        from services.suppression_service import SuppressionService
+
+        self.temp_db = tempfile.NamedTemporaryFile(suffix='.db', delete=False)
+        self.temp_db.close()
+        Database.set_path(self.temp_db.name)
+        Database._instance = None
+        init_database(self.temp_db.name)
+
+        self.service = SuppressionService()
+
+    def tearDown(self):
+        """Clean up test database."""
+        db = Database.get_instance()
+        db.close()
+        Database._instance = None
+        os.unlink(self.temp_db.name)
+
+    def _other_process_execute(self, query: str, params: tuple = ()) -> None:
+        """Write through a separate connection, as another process would."""
+        connection = sqlite3.connect(self.temp_db.name)
+        try:
+            connection.execute(query, params)
+            connection.commit()
+        finally:
+            connection.close()
+
+    def test_own_writes_are_visible(self):
+        """Test that adds and removes through the service update the index."""
+        self.assertFalse(self.service.is_suppressed('a@example.com'))
+
+        self.service.add_to_suppression('A@Example.com', 'Manual')
+        self.assertTrue(self.service.is_suppressed('a@example.com'))
+        self.assertEqual(self.service.find_suppressed(['a@example.com', 'b@example.com']), {'a@example.com'})
+
+        again = self.service.add_to_suppression('a@example.com', 'Bounce')
+        self.assertEqual(again.source, 'Manual')
+
+        self.service.remove_from_suppression('a@example.com')
+        self.assertFalse(self.service.is_suppressed('a@example.com'))
+
+    def test_other_connection_writes_are_visible(self):
+        """Test that data_version polling picks up writes from another connection."""
+        interval = suppression_index.DATA_VERSION_POLL_INTERVAL
+        suppression_index.DATA_VERSION_POLL_INTERVAL = 60
+        try:
+            index = get_suppression_index()
+            index.load()
+            self.assertFalse(index.is_suppressed('x@example.com'))
+
+            self._other_process_execute(
+                "INSERT INTO suppression_list (email, source, email_key) VALUES (?, 'Manual', ?)",
+                ('x@example.com', 'x@example.com')
+            )
+            # Not polled again within the interval, unless forced
+            self.assertFalse(index.is_suppressed('x@example.com'))
+            index.refresh(force=True)
+            self.assertTrue(index.is_suppressed('x@example.com', refresh=False))
+
+            suppression_index.DATA_VERSION_POLL_INTERVAL = 0
+            self._other_process_execute("DELETE FROM suppression_list WHERE email = ?", ('x@example.com',))
+            self.assertFalse(index.is_suppressed('x@example.com'))
+        finally:
+            suppression_index.DATA_VERSION_POLL_INTERVAL = interval
+
+    def test_bloom_filter_mode(self):
+        """Test that large lists use a Bloom filter confirmed in SQL."""
+        self.service.import_suppression_list([f'user{i}@example.com' for i in range(50)])
+
+        threshold = suppression_index.BLOOM_FILTER_THRESHOLD
+        suppression_index.BLOOM_FILTER_THRESHOLD = 10
+        try:
+            index = get_suppression_index()
+            index.load()
+            self.assertTrue(index.uses_bloom_filter)
+            self.assertTrue(index.is_suppressed('user7@example.com'))
+            self.assertFalse(index.is_suppressed('nobody@example.com'))
+
+            self.service.remove_from_suppression('user7@example.com')
+            self.assertFalse(index.is_suppressed('user7@example.com'))
+        finally:
+            suppression_index.BLOOM_FILTER_THRESHOLD = threshold
+
+    def test_bulk_import_propagates_to_campaigns(self):
+        """Test that a bulk import unsubscribes contacts and skips their queued emails."""
+        from core.exceptions import JobCancelledError
+        from core.database import get_db
+        from services.campaign_service import CampaignService
+        from services.contact_service import ContactService
+
+        contact_service = ContactService()
+        campaign_service = CampaignService()
+        contact_list = contact_service.create_list("Prospects")
+        contact_service.upsert_contacts(contact_list.list_id, [
+            {'email': f'user{i}@example.com'} for i in range(5)
+        ])
+        campaign = campaign_service.create_campaign({'name': 'Launch', 'contact_list_id': contact_list.list_id})
+        campaign_service._create_step(campaign.campaign_id, 1, 'Hi', 'Hello')
+        campaign_service.activate_campaign(campaign.campaign_id)
+
+        with self.assertRaises(JobCancelledError):
+            self.service.import_suppression_list(['user0@example.com'], should_cancel=lambda: True)
+        self.assertEqual(self.service.get_suppression_count(), 0)
+
+        added = self.service.import_suppression_list(
+            ['USER1@example.com', 'user3@example.com', 'user3@example.com', 'stranger@example.com', '']
+        )
+
+        self.assertEqual(added, 3)
+        self.assertTrue(self.service.is_suppressed('user1@example.com'))
+        db = get_db()
+        unsubscribed = db.fetchall("""
+            SELECT c.email FROM campaign_contacts cc JOIN contacts c ON c.contact_id = cc.contact_id
+            WHERE cc.status = 'Unsubscribed' ORDER BY c.email
+        """)
+        self.assertEqual([row['email'] for row in unsubscribed], ['user1@example.com', 'user3@example.com'])
+        pending = db.fetchone("SELECT COUNT(*) AS count FROM email_queue WHERE status = 'Pending'")
+        self.assertEqual(pending['count'], 3)
+
+        self.assertEqual(self.service.import_suppression_list(['user1@example.com']), 0)
+
+    def test_domain_and_wildcard_rules(self):
+        """Test that rules suppress matching addresses at import, activation and send time."""
+        from core.database import get_db
+        from core.exceptions import SuppressionError, ValidationError
+        from services.campaign_service import CampaignService
+        from services.contact_service import ContactService
+
+        contact_service = ContactService()
+        campaign_service = CampaignService()
+        contact_list = contact_service.create_list("Prospects")
+        contact_service.upsert_contacts(contact_list.list_id, [
+            {'email': email} for email in (
+                'ann@acme.com', 'bob@eu.acme.com', 'sales-1@corp.io', 'cat@corp.io', 'dan@other.org'
+            )
+        ])
+        campaign = campaign_service.create_campaign({'name': 'Launch', 'contact_list_id': contact_list.list_id})
+        campaign_service._create_step(campaign.campaign_id, 1, 'Hi', 'Hello')
+        campaign_service.activate_campaign(campaign.campaign_id)
+
+        rule = self.service.add_rule('@Acme.com')
+        self.assertEqual((rule.rule_type, rule.pattern, rule.reversed_domain), ('Domain', '@acme.com', 'com.acme'))
+        self.assertTrue(self.service.is_suppressed('ann@acme.com'))
+        self.assertFalse(self.service.is_suppressed('bob@eu.acme.com'))
+
+        self.service.add_rule('*.acme.com')
+        self.service.add_rule('sales-*@corp.io')
+        self.assertTrue(self.service.is_suppressed('bob@eu.acme.com'))
+        self.assertFalse(self.service.is_suppressed('bob@notacme.com'))
+        self.assertEqual(
+            self.service.find_suppressed(['sales-2@corp.io', 'cat@corp.io', 'x@a.acme.com']),
+            {'sales-2@corp.io', 'x@a.acme.com'}
+        )
+        self.assertEqual(self.service.get_rule_count(), 3)
+
+        with self.assertRaises(SuppressionError):
+            self.service.add_rule('@acme.com')
+        with self.assertRaises(ValidationError):
+            self.service.add_rule('*@*')
+
+        unsubscribed = get_db().fetchall("""
+            SELECT c.email FROM campaign_contacts cc JOIN contacts c ON c.contact_id = cc.contact_id
+            WHERE cc.status = 'Unsubscribed' ORDER BY c.email
+        """)
+        self.assertEqual(
+            [row['email'] for row in unsubscribed],
+            ['ann@acme.com', 'bob@eu.acme.com', 'sales-1@corp.io']
+        )
+        valid = campaign_service._get_valid_contacts(campaign.campaign_id)
+        self.assertEqual(len(valid), 2)
+
+        for rule in self.service.get_rules():
+            self.service.remove_rule(rule.rule_id)
+        self.assertFalse(self.service.is_suppressed('ann@acme.com'))
+        self.assertEqual(len(campaign_service._get_valid_contacts(campaign.campaign_id)), 5)
+
+    def test_add_without_returning_support(self):
+        """Test that entries and rules are added the same way on SQLite builds without RETURNING."""
+        from unittest import mock
+        from core.exceptions import SuppressionError
+
+        with mock.patch('services.suppression_service.SQLITE_HAS_RETURNING', False):
+            entry = self.service.add_to_suppression('Ann@Example.com', 'Manual', reason='Asked')
+            self.assertEqual((entry.email, entry.reason), ('ann@example.com', 'Asked'))
+            # Already suppressed: the existing entry comes back unchanged
+            again = self.service.add_to_suppression('ann@example.com', 'Bounce')
+            self.assertEqual((again.source, again.reason), ('Manual', 'Asked'))
+
+            rule = self.service.add_rule('@acme.com')
+            self.assertEqual(rule.pattern, '@acme.com')
+            with self.assertRaises(SuppressionError):
+                self.service.add_rule('@acme.com')
+
+        self.assertTrue(self.service.is_suppressed('ann@example.com'))
+        self.assertTrue(self.service.is_suppressed('bob@acme.com'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,241 @@
+"""Tests for compiled merge tag templates."""
+
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.database import Database, init_database
+from core.models import Campaign, Contact, EmailStep
+from core.templating import CompiledTemplate, TemplateCache
+
+
+class TestTemplating(unittest.TestCase):
+    """Test cases for the template compiler and TemplateService rendering."""
+
+    def setUp(self):
+        """Set up test database."""
+        from services.template_service import TemplateService
+
+        self.temp_db = tempfile.NamedTemporaryFile(suffix='.db', delete=False)
+        self.temp_db.close()
+        Database.set_path(self.temp_db.name)
+        Database._instance = None
+        init_database(self.temp_db.name)
+
+        self.files_dir = tempfile.mkdtemp()
+        self.service = TemplateService(attachments_path=self.files_dir)
+
+    def tearDown(self):
+        """Clean up test database."""
+        db = Database.get_instance()
+        db.close()
+        Database._instance = None
+        os.unlink(self.temp_db.name)
+        shutil.rmtree(self.files_dir, ignore_errors=True)
+
+    def test_compiled_template_segments(self):
+        """Test that tags become slots and missing values keep the tag text."""
+        compiled = CompiledTemplate("{{A}}{{B}} and {{A}}!")
+        self.assertEqual(compiled.fields, {'A', 'B'})
+        self.assertEqual(compiled.render({'A': '1', 'B': '2'}), "12 and 1!")
+        self.assertEqual(compiled.render({'A': '1'}), "1{{B}} and 1!")
+        self.assertEqual(CompiledTemplate("plain").render({}), "plain")
+
+    def test_apply_merge_tags_and_render_many(self):
+        """Test rendering of contact, campaign and unknown tags."""
+        campaign = Campaign(campaign_ref="ISIT-250042")
+        contacts = [
+            Contact(first_name="Ann", company="Acme", email="ann@acme.com"),
+            Contact(first_name=None, company="Globex", email="bob@globex.com"),
+        ]
+        template = "Hi {{FirstName}} at {{Company}} ({{CampaignRef}}) {{Unknown}}"
+
+        self.assertEqual(
+            self.service.apply_merge_tags(template, contacts[0], campaign),
+            "Hi Ann at Acme (ISIT-250042) {{Unknown}}"
+        )
+        self.assertEqual(
+            self.service.render_many(template, contacts, campaign),
+            ["Hi Ann at Acme (ISIT-250042) {{Unknown}}", "Hi  at Globex (ISIT-250042) {{Unknown}}"]
+        )
+        self.assertIn("UNSUBSCRIBE", self.service.apply_merge_tags("{{UnsubscribeText}}", contacts[0]))
+
+    def test_step_cache_follows_edits(self):
+        """Test that compiled steps are reused until the step changes."""
+        step = EmailStep(step_id=7, subject_template="S {{FirstName}}", body_template="B", updated_at="t1")
+        subject, body = self.service.compile_step(step)
+        self.assertIs(self.service.compile_step(step)[0], subject)
+
+        # Same updated_at (edited within the same second) but new text
+        step.subject_template = "New {{FirstName}}"
+        self.assertEqual(self.service.compile_step(step)[0].source, "New {{FirstName}}")
+
+        cache = TemplateCache(max_size=2)
+        first = cache.get('a', "x")
+        cache.get('b', "y")
+        cache.get('c', "z")
+        self.assertIsNot(cache.get('a', "x"), first)
+
+    def test_prerendered_messages(self):
+        """Test that activation pre-renders the queue and edits drop stale messages."""
+        from core.database import get_db
+        from services.campaign_service import CampaignService
+        from services.contact_service import ContactService
+        from services.email_service import EmailService
+        from services.message_render_service import MessageRenderService
+
+        contact_service = ContactService()
+        campaign_service = CampaignService()
+        contact_list = contact_service.create_list("Prospects")
+        contact_service.upsert_contacts(contact_list.list_id, [
+            {'email': f'user{i}@example.com', 'first_name': f'User{i}'} for i in range(3)
+        ])
+        campaign = campaign_service.create_campaign({'name': 'Launch', 'contact_list_id': contact_list.list_id})
+        step_id = campaign_service._create_step(campaign.campaign_id, 1, 'Hi {{FirstName}}', 'Same body for all')
+        campaign_service.activate_campaign(campaign.campaign_id)
+
+        db = get_db()
+        db.execute("UPDATE email_queue SET scheduled_at = '2000-01-01 00:00:00'")
+        self.assertEqual(db.fetchone("SELECT COUNT(*) AS count FROM rendered_messages")['count'], 3)
+        self.assertEqual(db.fetchone("SELECT COUNT(*) AS count FROM rendered_contents")['count'], 3)
+
+        queued = {email.contact.email: email for email in EmailService().get_pending_emails(limit=10)}
+        first = queued['user0@example.com']
+        self.assertEqual((first.rendered_subject, first.rendered_body), ('Hi User0', 'Same body for all'))
+        self.assertEqual(MessageRenderService().get_rendered_message(first.queue_id).subject, 'Hi User0')
+
+        # Editing a contact drops its message; the worker renders it at send time instead
+        contact_service.update_contact(first.contact_id, {'first_name': 'Ann'})
+        queued = {email.contact.email: email for email in EmailService().get_pending_emails(limit=10)}
+        self.assertIsNone(queued['user0@example.com'].rendered_subject)
+        self.assertEqual(queued['user1@example.com'].rendered_subject, 'Hi User1')
+
+        # Editing the step drops them all; re-rendering picks up the new text
+        self.service.update_step(step_id, {'subject_template': 'Hello', 'body_template': 'New body'})
+        self.assertEqual(db.fetchone("SELECT COUNT(*) AS count FROM rendered_messages")['count'], 0)
+        self.assertEqual(MessageRenderService().prerender_pending(campaign.campaign_id), 3)
+        self.assertEqual(MessageRenderService().prune_contents(), 3)
+        self.assertEqual(db.fetchone("SELECT COUNT(*) AS count FROM rendered_contents")['count'], 1)
+
+    def test_campaign_attachment_cache(self):
+        """Test that step attachments are cached per campaign, cleared on edit and checked on disk."""
+        from services.campaign_service import CampaignService
+
+        campaign_service = CampaignService()
+        campaign = campaign_service.create_campaign({'name': 'Launch'})
+        step_ids = [campaign_service._create_step(campaign.campaign_id, n, 'Hi', 'Hello') for n in (1, 2)]
+
+        source = os.path.join(self.files_dir, 'brochure.pdf')
+        with open(source, 'wb') as f:
+            f.write(b'%PDF' * 100)
+        attachment = self.service.add_attachment(step_ids[0], source)
+
+        attachments = self.service.get_campaign_attachments(campaign.campaign_id)
+        self.assertEqual([a.file_name for a in attachments[step_ids[0]]], ['brochure.pdf'])
+        self.assertNotIn(step_ids[1], attachments)
+        self.assertIs(self.service.get_campaign_attachments(campaign.campaign_id), attachments)
+        self.assertEqual(
+            [len(step.attachments) for step in self.service.get_steps(campaign.campaign_id)], [1, 0]
+        )
+        self.assertIsNone(self.service.check_attachment(attachments[step_ids[0]][0]))
+
+        # A touched file is still sent; the warning is logged once per modification
+        with self.assertLogs('services.template_service', 'WARNING') as logs:
+            for mtime in (1000000000, 1000000000, 1000000100):
+                os.utime(attachment.file_path, (mtime, mtime))
+                self.assertIsNone(self.service.check_attachment(attachment))
+                self.assertIsNone(self.service.check_attachment(attachment))
+        self.assertEqual(len(logs.output), 2)
+
+        # Stored files are read-only; editing one in place means clearing that first
+        os.chmod(attachment.file_path, 0o644)
+        with open(attachment.file_path, 'ab') as f:
+            f.write(b'extra')
+        self.assertIn('changed size', self.service.check_attachment(attachment))
+        os.unlink(attachment.file_path)
+        self.assertIn('missing', self.service.check_attachment(attachment))
+
+        self.service.remove_attachment(attachment.attachment_id)
+        self.assertEqual(self.service.get_campaign_attachments(campaign.campaign_id), {})
+
+    def test_attachment_blob_store(self):
+        """Test that identical attachments share one stored file and are freed with their last reference."""
+        from core.database import get_db
+        from services.campaign_service import CampaignService
+
+        campaign_service = CampaignService()
+        campaign = campaign_service.create_campaign({'name': 'Launch'})
+        step_ids = [campaign_service._create_step(campaign.campaign_id, n, 'Hi', 'Hello') for n in (1, 2, 3)]
+
+        source = os.path.join(self.files_dir, 'brochure.pdf')
+        with open(source, 'wb') as f:
+            f.write(b'%PDF' * 1000)
+
+        first = self.service.add_attachment(step_ids[0], source)
+        second = self.service.add_attachment(step_ids[1], source)
+        copied, = self.service.copy_attachments(step_ids[0], step_ids[2])
+
+        self.assertEqual(first.content_hash, second.content_hash)
+        self.assertEqual(copied.content_hash, first.content_hash)
+        self.assertEqual(copied.file_name, 'brochure.pdf')
+        blob_path = self.service.blob_store.path_for(first.content_hash)
+        self.assertTrue(blob_path.exists())
+        self.assertFalse(os.stat(blob_path).st_mode & 0o222)
+        if os.stat(blob_path).st_nlink > 1:
+            self.assertTrue(os.path.samefile(blob_path, copied.file_path))
+
+        db = get_db()
+        blob = db.fetchone("SELECT ref_count FROM attachment_blobs WHERE content_hash = ?", (first.content_hash,))
+        self.assertEqual(blob['ref_count'], 3)
+
+        self.service.remove_attachment(first.attachment_id)
+        self.service.delete_step(step_ids[1])
+        self.assertTrue(blob_path.exists())
+        self.assertFalse(os.path.exists(first.file_path))
+
+        self.service.remove_attachment(copied.attachment_id)
+        self.assertFalse(blob_path.exists())
+        self.assertIsNone(db.fetchone("SELECT 1 FROM attachment_blobs"))
+
+    def test_relink_legacy_attachments(self):
+        """Test that attachments from before the blob store are moved into it unless they changed."""
+        from core.database import get_db
+        from services.campaign_service import CampaignService
+
+        campaign_service = CampaignService()
+        campaign = campaign_service.create_campaign({'name': 'Launch'})
+        step_id = campaign_service._create_step(campaign.campaign_id, 1, 'Hi', 'Hello')
+
+        db = get_db()
+        paths = []
+        for name, recorded_size in [('a.pdf', 4000), ('b.pdf', 4000), ('changed.pdf', 10)]:
+            path = os.path.join(self.files_dir, name)
+            with open(path, 'wb') as f:
+                f.write(b'%PDF' * 1000)
+            paths.append(path)
+            db.execute(
+                "INSERT INTO attachments (step_id, file_name, file_path, file_size) VALUES (?, ?, ?, ?)",
+                (step_id, name, path, recorded_size)
+            )
+
+        self.assertEqual(self.service.relink_legacy_attachments(), 2)
+        self.assertEqual(self.service.relink_legacy_attachments(), 0)
+
+        a, b, changed = self.service.get_attachments(step_id)
+        self.assertEqual(a.content_hash, b.content_hash)
+        self.assertIsNone(changed.content_hash)
+        self.assertIsNone(self.service.check_attachment(a))
+        blob = db.fetchone("SELECT ref_count FROM attachment_blobs WHERE content_hash = ?", (a.content_hash,))
+        self.assertEqual(blob['ref_count'], 2)
+        blob_path = self.service.blob_store.path_for(a.content_hash)
+        if os.stat(blob_path).st_nlink > 1:
+            self.assertTrue(os.path.samefile(a.file_path, b.file_path))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -15,6 +15,7 @@ except ImportError:
 from ui.theme import THEME_NAME, WINDOW_SIZES, COLORS, FONTS
 from core.worker import get_worker, EmailWorker
 from outlook.outlook_service import OutlookService
+from services.report_service import invalidate_for_event, invalidate_report_cache
 
 logger = logging.getLogger(__name__)
 
@@ -222,6 +223,9 @@ class MainApplication:
 
     def _show_view(self, view_name: str) -> None:
         """Show a specific view."""
+        # Pick up edits made in the view being left
+        invalidate_report_cache()
+
         # Clear current content
         for widget in self.content_frame.winfo_children():
             widget.destroy()
@@ -318,6 +322,7 @@ class MainApplication:
     def _on_email_sent(self, campaign_id: int, contact_id: int) -> None:
         """Handle email sent callback."""
         logger.info(f"Email sent: campaign={campaign_id}, contact={contact_id}")
+        invalidate_for_event('email_sent')
         # Refresh current view if it's dashboard or campaigns
         if hasattr(self._current_view, 'refresh'):
             self.root.after(100, self._current_view.refresh)
@@ -325,12 +330,14 @@ class MainApplication:
     def _on_reply_detected(self, campaign_id: int, contact_id: int) -> None:
         """Handle reply detected callback."""
         logger.info(f"Reply detected: campaign={campaign_id}, contact={contact_id}")
+        invalidate_for_event('reply_detected')
         if hasattr(self._current_view, 'refresh'):
             self.root.after(100, self._current_view.refresh)
 
     def _on_unsubscribe_detected(self, email: str) -> None:
         """Handle unsubscribe detected callback."""
         logger.info(f"Unsubscribe detected: {email}")
+        invalidate_for_event('unsubscribe_detected')
         if hasattr(self._current_view, 'refresh'):
             self.root.after(100, self._current_view.refresh)
 
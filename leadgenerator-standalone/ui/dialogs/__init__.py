@@ -4,10 +4,12 @@ from .confirm_dialog import ConfirmDialog
 from .csv_import_wizard import CSVImportWizard
 from .campaign_wizard import CampaignWizard
 from .migration_dialog import MigrationDialog
+from .import_jobs_dialog import ImportJobsDialog
 
 __all__ = [
     'ConfirmDialog',
     'CSVImportWizard',
     'CampaignWizard',
     'MigrationDialog',
+    'ImportJobsDialog',
 ]
@@ -4,12 +4,13 @@ import tkinter as tk
 from tkinter import ttk, messagebox
 from typing import Dict, List, Optional
 
+from core.jobs import BackgroundJob
 from ui.theme import FONTS
 from services.csv_service import CSVService
 
 
 class CSVImportWizard(tk.Toplevel):
-    """3-step CSV import wizard dialog."""
+    """4-step CSV import wizard dialog."""
 
     def __init__(self, parent, file_path: str, list_id: int):
         super().__init__(parent)
@@ -24,6 +25,8 @@ class CSVImportWizard(tk.Toplevel):
         self._preview_data: List[List[str]] = []
         self._total_count = 0
         self._field_mapping: Dict[str, str] = {}
+        self._job: Optional[BackgroundJob] = None
+        self._skip_suppressed_var = tk.BooleanVar(value=True)
 
         # Make modal
         self.transient(parent)
@@ -32,6 +35,8 @@ class CSVImportWizard(tk.Toplevel):
         self.geometry("700x500")
         self.resizable(True, True)
 
+        self.protocol("WM_DELETE_WINDOW", self._cancel_import)
+
         self._create_widgets()
         self._load_preview()
 
@@ -42,7 +47,7 @@ class CSVImportWizard(tk.Toplevel):
         self.step_frame.pack(fill=tk.X, padx=20, pady=10)
 
         self.step_labels = []
-        for i, text in enumerate(["1. Preview", "2. Map Fields", "3. Import"], 1):
+        for i, text in enumerate(["1. Preview", "2. Map Fields", "3. Validate", "4. Import"], 1):
             label = ttk.Label(self.step_frame, text=text)
             label.pack(side=tk.LEFT, padx=10)
             self.step_labels.append(label)
@@ -119,6 +124,12 @@ class CSVImportWizard(tk.Toplevel):
 
         ttk.Label(self.content_frame, text="Map Fields", font=FONTS['subheading']).pack(anchor='w', pady=(0, 10))
 
+        ttk.Checkbutton(
+            self.content_frame,
+            text="Skip contacts on the suppression list (otherwise import them, flagged as not to be emailed)",
+            variable=self._skip_suppressed_var
+        ).pack(side=tk.BOTTOM, anchor='w', pady=(10, 0))
+
         # Scrollable mapping area
         canvas = tk.Canvas(self.content_frame)
         scrollbar = ttk.Scrollbar(self.content_frame, orient=tk.VERTICAL, command=canvas.yview)
@@ -157,67 +168,198 @@ class CSVImportWizard(tk.Toplevel):
         canvas.configure(scrollregion=canvas.bbox('all'))
 
         self.back_btn.configure(state='normal')
-        self.next_btn.configure(text="Import")
+        self.next_btn.configure(text="Validate", state='normal')
+        self.cancel_btn.configure(state='normal', command=self.destroy)
+
+    def _save_mapping(self) -> None:
+        """Keep the mapping chosen in step 2 for validation, import and going back."""
+        self._field_mapping = {
+            header: var.get() for header, var in self._mapping_vars.items() if var.get() != '(ignore)'
+        }
 
     def _show_step_3(self) -> None:
-        """Show step 3: Import progress and results."""
+        """Show step 3: Validate the whole file against the mapping."""
+        self._save_mapping()
         self._current_step = 3
         self._update_step_indicators()
         self._clear_content()
 
+        ttk.Label(self.content_frame, text="Validating...", font=FONTS['subheading']).pack(anchor='w', pady=(0, 10))
+
+        self.progress = ttk.Progressbar(self.content_frame, mode='determinate', maximum=100)
+        self.progress.pack(fill=tk.X, pady=10)
+
+        self.status_label = ttk.Label(self.content_frame, text="Checking rows...")
+        self.status_label.pack(anchor='w')
+
+        self.back_btn.configure(state='normal')
+        self.next_btn.configure(text="Import", state='disabled')
+        self.cancel_btn.configure(command=self._cancel_import)
+
+        self._do_validate()
+
+    def _do_validate(self) -> None:
+        """Validate every row on a background thread, without importing anything."""
+        mapping = dict(self._field_mapping)
+
+        def task(report_progress, token):
+            return self.csv_service.validate_csv(
+                self.file_path,
+                mapping,
+                progress_callback=lambda done, total: report_progress(done, total),
+                should_cancel=token
+            )
+
+        # Results of a validation left with Back are dropped
+        def current(callback):
+            return lambda *args: callback(*args) if self._job is job else None
+
+        job = BackgroundJob(
+            self, task,
+            on_progress=current(self._on_validate_progress),
+            on_done=current(self._on_validate_done),
+            on_error=current(self._on_validate_error),
+            on_cancelled=current(self._show_step_2),
+            name="csv-validate"
+        )
+        self._job = job.start()
+
+    def _on_validate_progress(self, processed: int, total: int, message: str = '') -> None:
+        """Show validation progress after each chunk."""
+        if total:
+            self.progress.configure(value=min(processed * 100 / total, 100))
+        self.status_label.configure(text=f"Checked {processed:,} of {total:,} rows...")
+
+    def _on_validate_done(self, summary) -> None:
+        """Show what an import would do, and allow it if any row is valid."""
+        self.progress.pack_forget()
+        self.cancel_btn.configure(state='normal', command=self.destroy)
+
+        if not summary.valid_rows:
+            self.status_label.configure(text="No valid rows to import. Go back and check the mapping.")
+        else:
+            self.status_label.configure(text="Validation complete.")
+            self.next_btn.configure(state='normal')
+
+        summary_text = f"Rows: {summary.total_rows:,}\nValid: {summary.valid_rows:,}\n"
+        if summary.duplicate_rows:
+            summary_text += f"Duplicates in file: {summary.duplicate_rows:,}\n"
+        if summary.suppressed_rows:
+            action = "skipped" if self._skip_suppressed_var.get() else "flagged"
+            summary_text += f"On the suppression list (will be {action}): {summary.suppressed_rows:,}\n"
+        if summary.errors:
+            summary_text += f"Invalid: {summary.invalid_rows - summary.duplicate_rows:,}\n\n"
+            summary_text += "First few errors:\n"
+            for err in summary.errors[:5]:
+                summary_text += f"  Row {err['row']}: {err['error']}\n"
+
+        ttk.Label(self.content_frame, text=summary_text, justify=tk.LEFT).pack(anchor='w', pady=10)
+
+    def _on_validate_error(self, error: Exception) -> None:
+        """Show a validation failure; the mapping can still be changed and validated again."""
+        self.progress.pack_forget()
+        self.status_label.configure(text=f"Error: {error}")
+        self.cancel_btn.configure(state='normal', command=self.destroy)
+
+    def _show_step_4(self) -> None:
+        """Show step 4: Import progress and results."""
+        self._current_step = 4
+        self._update_step_indicators()
+        self._clear_content()
+
         ttk.Label(self.content_frame, text="Importing...", font=FONTS['subheading']).pack(anchor='w', pady=(0, 10))
 
-        self.progress = ttk.Progressbar(self.content_frame, mode='indeterminate')
+        self.progress = ttk.Progressbar(self.content_frame, mode='determinate', maximum=100)
         self.progress.pack(fill=tk.X, pady=10)
-        self.progress.start()
 
         self.status_label = ttk.Label(self.content_frame, text="Processing...")
         self.status_label.pack(anchor='w')
 
         self.back_btn.configure(state='disabled')
         self.next_btn.configure(state='disabled')
+        self.cancel_btn.configure(command=self._cancel_import)
 
-        # Run import
-        self.after(100, self._do_import)
+        self._do_import()
 
     def _do_import(self) -> None:
-        """Perform the actual import."""
-        # Build mapping from vars
-        mapping = {}
-        for header, var in self._mapping_vars.items():
-            value = var.get()
-            if value != '(ignore)':
-                mapping[header] = value
+        """Start the import on a background thread."""
+        mapping = dict(self._field_mapping)
+        skip_suppressed = self._skip_suppressed_var.get()
 
-        try:
-            imported, errors = self.csv_service.import_csv(
+        def task(report_progress, token):
+            return self.csv_service.import_contacts(
                 self.file_path,
                 self.list_id,
-                mapping
+                mapping,
+                skip_suppressed=skip_suppressed,
+                progress_callback=lambda done, total: report_progress(done, total),
+                should_cancel=token
             )
 
-            self.progress.stop()
-            self.progress.pack_forget()
-
-            # Show results
+        self._job = BackgroundJob(
+            self, task,
+            on_progress=self._on_import_progress,
+            on_done=self._on_import_done,
+            on_error=self._on_import_error,
+            name="csv-import"
+        ).start()
+
+    def _on_import_progress(self, processed: int, total: int, message: str = '') -> None:
+        """Show import progress after each chunk."""
+        if total:
+            self.progress.configure(value=min(processed * 100 / total, 100))
+        self.status_label.configure(text=f"Processed {processed:,} of {total:,} rows...")
+
+    def _on_import_done(self, result) -> None:
+        """Show the import summary."""
+        imported, errors = result.imported + result.updated, result.errors
+
+        self.progress.pack_forget()
+
+        # Show results
+        if result.cancelled:
+            self.status_label.configure(
+                text=f"Import cancelled after {result.rows_processed:,} rows. "
+                     f"Resume it later from 'Interrupted Imports'."
+            )
+        else:
             self.status_label.configure(text=f"Import complete!")
 
-            result_text = f"Successfully imported: {imported}\n"
-            if errors:
-                result_text += f"Errors/Skipped: {len(errors)}\n\n"
-                result_text += "First few errors:\n"
-                for err in errors[:5]:
-                    result_text += f"  Row {err['row']}: {err['error']}\n"
-
-            ttk.Label(self.content_frame, text=result_text, justify=tk.LEFT).pack(anchor='w', pady=10)
-
-            self.result = {'imported': imported, 'errors': errors}
-            self.next_btn.configure(text="Close", state='normal', command=self.destroy)
-
-        except Exception as e:
-            self.progress.stop()
-            self.status_label.configure(text=f"Error: {e}")
-            self.next_btn.configure(text="Close", state='normal', command=self.destroy)
+        result_text = f"Successfully imported: {imported}\n"
+        if result.skipped:
+            result_text += f"Duplicates skipped: {result.skipped}\n"
+        if result.suppressed:
+            action = "skipped" if self._skip_suppressed_var.get() else "flagged"
+            result_text += f"Suppressed contacts {action}: {result.suppressed}\n"
+        if errors:
+            result_text += f"Errors: {result.error_count}\n\n"
+            result_text += "First few errors:\n"
+            for err in errors[:5]:
+                result_text += f"  Row {err['row']}: {err['error']}\n"
+
+        ttk.Label(self.content_frame, text=result_text, justify=tk.LEFT).pack(anchor='w', pady=10)
+
+        self.result = {'imported': imported, 'errors': errors}
+        self._finish_import()
+
+    def _on_import_error(self, error: Exception) -> None:
+        """Show an import failure."""
+        self.status_label.configure(text=f"Error: {error}")
+        self._finish_import()
+
+    def _finish_import(self) -> None:
+        """Switch the buttons back once the job has ended."""
+        self.cancel_btn.configure(state='disabled')
+        self.next_btn.configure(text="Close", state='normal', command=self.destroy)
+
+    def _cancel_import(self) -> None:
+        """Stop a running validation or import after the current chunk, or close the wizard."""
+        if self._job and self._job.running:
+            self._job.cancel()
+            self.status_label.configure(text="Cancelling after the current batch...")
+            self.cancel_btn.configure(state='disabled')
+        else:
+            self.destroy()
 
     def _clear_content(self) -> None:
         """Clear content frame."""
@@ -230,10 +372,16 @@ class CSVImportWizard(tk.Toplevel):
             self._show_step_2()
         elif self._current_step == 2:
             self._show_step_3()
+        elif self._current_step == 3:
+            self._show_step_4()
 
     def _prev_step(self) -> None:
         """Go to previous step."""
         if self._current_step == 2:
+            self._save_mapping()
             self._show_step_1()
         elif self._current_step == 3:
+            if self._job and self._job.running:
+                self._job.cancel()
+            self._job = None
             self._show_step_2()
@@ -0,0 +1,195 @@
+"""Interrupted import jobs dialog for Lead Generator Standalone."""
+
+import os
+import tkinter as tk
+from tkinter import ttk, messagebox
+
+from core.jobs import BackgroundJob
+from ui.theme import FONTS
+from ui.widgets.data_table import DataTable
+from services.csv_service import CSVService
+
+
+class ImportJobsDialog(tk.Toplevel):
+    """Dialog listing interrupted contact imports, to resume or discard them."""
+
+    def __init__(self, parent):
+        super().__init__(parent)
+        self.title("Interrupted Imports")
+        self.csv_service = CSVService()
+        self.job_service = self.csv_service.job_service
+        self.result = False  # True once any job was resumed
+        self._job = None
+
+        # Make modal
+        self.transient(parent)
+        self.grab_set()
+
+        self.geometry("700x420")
+        self.minsize(600, 350)
+
+        self.protocol("WM_DELETE_WINDOW", self._close)
+
+        self._create_widgets()
+        self._load_jobs()
+
+    def _create_widgets(self) -> None:
+        """Create dialog widgets."""
+        ttk.Label(self, text="Interrupted Imports", font=FONTS['heading']).pack(padx=20, pady=(20, 5), anchor='w')
+        ttk.Label(
+            self,
+            text="These imports stopped before the end of their file. Resume one to continue "
+                 "after its last saved batch, or discard it (contacts already imported are kept).",
+            wraplength=650
+        ).pack(padx=20, pady=(0, 10), anchor='w')
+
+        columns = [
+            {'key': 'list_name', 'label': 'List', 'width': 120},
+            {'key': 'file_name', 'label': 'File', 'width': 200},
+            {'key': 'progress', 'label': 'Rows Done', 'width': 120, 'anchor': 'e'},
+            {'key': 'status', 'label': 'Status', 'width': 90, 'anchor': 'center'},
+            {'key': 'updated_at', 'label': 'Last Update', 'width': 130},
+        ]
+
+        self.table = DataTable(
+            self,
+            columns=columns,
+            on_select=self._on_select,
+            show_search=False,
+            height=8
+        )
+        self.table.pack(fill=tk.BOTH, expand=True, padx=20)
+
+        self.progress = ttk.Progressbar(self, mode='determinate', maximum=100)
+        self.status_label = ttk.Label(self, text="")
+        self.status_label.pack(padx=20, pady=(10, 0), anchor='w')
+
+        btn_frame = ttk.Frame(self)
+        btn_frame.pack(pady=15)
+
+        self.resume_btn = ttk.Button(btn_frame, text="Resume", command=self._resume, state='disabled')
+        self.resume_btn.pack(side=tk.LEFT, padx=5)
+        self.discard_btn = ttk.Button(btn_frame, text="Discard", command=self._discard, state='disabled')
+        self.discard_btn.pack(side=tk.LEFT, padx=5)
+        self.close_btn = ttk.Button(btn_frame, text="Close", command=self._close)
+        self.close_btn.pack(side=tk.LEFT, padx=5)
+
+    def _load_jobs(self) -> None:
+        """Load interrupted jobs into the table."""
+        data = []
+        for job in self.job_service.get_interrupted_jobs():
+            data.append({
+                'job_id': job.job_id,
+                'list_name': job.list_name or '',
+                'file_name': os.path.basename(job.file_path),
+                'progress': f"{job.rows_committed:,} / {job.rows_total:,}",
+                'status': job.status if job.status != 'Running' else 'Interrupted',
+                'updated_at': job.updated_at or '',
+                'last_error': job.last_error,
+            })
+        self.table.set_data(data)
+        self._on_select(None)
+
+        if not data:
+            self.status_label.configure(text="No interrupted imports.")
+
+    def _on_select(self, item) -> None:
+        """Enable actions for the selected job."""
+        state = 'normal' if item and not (self._job and self._job.running) else 'disabled'
+        self.resume_btn.configure(state=state)
+        self.discard_btn.configure(state=state)
+        if item:
+            error = item.get('last_error')
+            self.status_label.configure(text=f"Last error: {error}" if error else "")
+
+    def _resume(self) -> None:
+        """Resume the selected job in the background."""
+        item = self.table.get_selected_item()
+        if not item or (self._job and self._job.running):
+            return
+
+        job_id = item['job_id']
+
+        def task(report_progress, token):
+            return self.csv_service.resume_import_job(
+                job_id,
+                progress_callback=lambda done, total: report_progress(done, total),
+                should_cancel=token
+            )
+
+        self.resume_btn.configure(state='disabled')
+        self.discard_btn.configure(state='disabled')
+        self.close_btn.configure(text="Cancel")
+        self.progress.configure(value=0)
+        self.progress.pack(fill=tk.X, padx=20, before=self.status_label)
+        self.status_label.configure(text="Resuming import...")
+        self.result = True
+
+        self._job = BackgroundJob(
+            self, task,
+            on_progress=self._on_resume_progress,
+            on_done=self._on_resume_done,
+            on_error=self._on_resume_error,
+            name="csv-import-resume"
+        ).start()
+
+    def _on_resume_progress(self, processed: int, total: int, message: str = '') -> None:
+        """Show resume progress after each batch."""
+        if total:
+            self.progress.configure(value=min(processed * 100 / total, 100))
+        self.status_label.configure(text=f"Processed {processed:,} of {total:,} rows...")
+
+    def _on_resume_done(self, result) -> None:
+        """Report a resumed import that finished or was cancelled again."""
+        self._finish_resume()
+        if result.cancelled:
+            self.status_label.configure(text=f"Import cancelled after {result.rows_processed:,} rows.")
+        else:
+            self.status_label.configure(text="Import complete!")
+            messagebox.showinfo(
+                "Import Complete",
+                f"Imported {result.imported + result.updated} contacts\n"
+                f"{result.skipped} duplicates skipped\n{result.suppressed} suppressed\n"
+                f"{result.error_count} errors",
+                parent=self
+            )
+
+    def _on_resume_error(self, error: Exception) -> None:
+        """Report a resume failure."""
+        self._finish_resume()
+        self.status_label.configure(text=f"Error: {error}")
+        messagebox.showerror("Error", str(error), parent=self)
+
+    def _finish_resume(self) -> None:
+        """Restore the dialog once the job has ended."""
+        self.progress.pack_forget()
+        self.close_btn.configure(text="Close", state='normal')
+        self._load_jobs()
+
+    def _discard(self) -> None:
+        """Forget the selected job."""
+        item = self.table.get_selected_item()
+        if not item:
+            return
+
+        if not messagebox.askyesno(
+            "Discard Import",
+            f"Discard the import of '{item['file_name']}'?\n\nContacts already imported are kept.",
+            parent=self
+        ):
+            return
+
+        try:
+            self.job_service.discard_job(item['job_id'])
+        except Exception as e:
+            messagebox.showerror("Error", str(e), parent=self)
+        self._load_jobs()
+
+    def _close(self) -> None:
+        """Cancel a running resume, or close the dialog."""
+        if self._job and self._job.running:
+            self._job.cancel()
+            self.close_btn.configure(state='disabled')
+            self.status_label.configure(text="Cancelling after the current batch...")
+        else:
+            self.destroy()
@@ -4,6 +4,7 @@ import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
 from typing import List
 
+from core.jobs import BackgroundJob
 from ui.theme import FONTS
 from services.campaign_service import CampaignService
 from migration.exporter import export_to_json
@@ -16,6 +17,7 @@ class MigrationDialog(tk.Toplevel):
         super().__init__(parent)
         self.title("Export for Migration")
         self.campaign_service = CampaignService()
+        self._job = None
 
         # Make modal
         self.transient(parent)
@@ -24,6 +26,8 @@ class MigrationDialog(tk.Toplevel):
         self.geometry("500x400")
         self.resizable(False, False)
 
+        self.protocol("WM_DELETE_WINDOW", self._cancel)
+
         self._create_widgets()
         self._load_campaigns()
 
@@ -55,15 +59,16 @@ class MigrationDialog(tk.Toplevel):
         self.campaign_listbox.configure(yscrollcommand=scrollbar.set)
 
         # Progress
-        self.progress = ttk.Progressbar(self, mode='indeterminate')
+        self.progress = ttk.Progressbar(self, mode='determinate', maximum=100)
         self.status_label = ttk.Label(self, text="")
 
         # Buttons
         btn_frame = ttk.Frame(self)
         btn_frame.pack(pady=20)
 
-        ttk.Button(btn_frame, text="Export", command=self._export).pack(side=tk.LEFT, padx=5)
-        ttk.Button(btn_frame, text="Cancel", command=self.destroy).pack(side=tk.LEFT, padx=5)
+        self.export_btn = ttk.Button(btn_frame, text="Export", command=self._export)
+        self.export_btn.pack(side=tk.LEFT, padx=5)
+        ttk.Button(btn_frame, text="Cancel", command=self._cancel).pack(side=tk.LEFT, padx=5)
 
     def _load_campaigns(self) -> None:
         """Load campaigns into listbox."""
@@ -103,23 +108,59 @@ class MigrationDialog(tk.Toplevel):
                 messagebox.showwarning("Warning", "Please select at least one campaign")
                 return
 
+        if self._job and self._job.running:
+            return
+
         # Show progress
+        self.progress.configure(value=0)
         self.progress.pack(fill=tk.X, padx=20)
-        self.progress.start()
         self.status_label.configure(text="Exporting...")
         self.status_label.pack(padx=20)
-        self.update()
-
-        try:
-            export_to_json(file_path, campaign_ids)
-
-            self.progress.stop()
-            self.progress.pack_forget()
-            self.status_label.configure(text="Export complete!")
-
-            messagebox.showinfo("Success", f"Data exported to:\n{file_path}\n\nUse this file to import into the multi-user version.")
-
-        except Exception as e:
-            self.progress.stop()
-            self.status_label.configure(text=f"Error: {e}")
-            messagebox.showerror("Error", str(e))
+        self.export_btn.configure(state='disabled')
+
+        def task(report_progress, token):
+            return export_to_json(
+                file_path, campaign_ids,
+                progress_callback=report_progress,
+                should_cancel=token
+            )
+
+        self._job = BackgroundJob(
+            self, task,
+            on_progress=self._on_export_progress,
+            on_done=self._on_export_done,
+            on_error=self._on_export_error,
+            on_cancelled=self._on_export_cancelled,
+            name="migration-export"
+        ).start()
+
+    def _on_export_progress(self, done: int, total: int, table: str) -> None:
+        """Show which table was exported last."""
+        self.progress.configure(value=done * 100 / total if total else 0)
+        self.status_label.configure(text=f"Exported {table.replace('_', ' ')} ({done}/{total})")
+
+    def _on_export_done(self, file_path: str) -> None:
+        """Report a finished export."""
+        self.progress.pack_forget()
+        self.status_label.configure(text="Export complete!")
+        self.export_btn.configure(state='normal')
+
+        messagebox.showinfo("Success", f"Data exported to:\n{file_path}\n\nUse this file to import into the multi-user version.")
+
+    def _on_export_error(self, error: Exception) -> None:
+        """Report a failed export."""
+        self.status_label.configure(text=f"Error: {error}")
+        self.export_btn.configure(state='normal')
+        messagebox.showerror("Error", str(error))
+
+    def _on_export_cancelled(self) -> None:
+        """Close the dialog once a cancelled export has stopped."""
+        self.destroy()
+
+    def _cancel(self) -> None:
+        """Cancel a running export, or close the dialog."""
+        if self._job and self._job.running:
+            self._job.cancel()
+            self.status_label.configure(text="Cancelling...")
+        else:
+            self.destroy()
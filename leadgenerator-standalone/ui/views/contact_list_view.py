@@ -4,6 +4,7 @@ import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
 from typing import TYPE_CHECKING, Optional
 
+from core.jobs import BackgroundJob
 from ui.theme import FONTS
 from ui.widgets.data_table import DataTable
 from services.contact_service import ContactService
@@ -12,6 +13,9 @@ from services.csv_service import CSVService
 if TYPE_CHECKING:
     from ui.app import MainApplication
 
+# Contacts loaded per page ("Load More" fetches the next one)
+CONTACTS_PAGE_SIZE = 500
+
 
 class ContactListView(ttk.Frame):
     """Contact lists and contacts management view."""
@@ -23,6 +27,8 @@ class ContactListView(ttk.Frame):
         self.csv_service = CSVService()
         self._selected_list = None
         self._selected_contact = None
+        self._next_cursor = None
+        self._job = None
 
         self._create_widgets()
         self.refresh_lists()
@@ -56,7 +62,8 @@ class ContactListView(ttk.Frame):
         list_btn_frame.pack(fill=tk.X, pady=(10, 0))
 
         ttk.Button(list_btn_frame, text="New List", command=self._new_list).pack(side=tk.LEFT, padx=(0, 5))
-        ttk.Button(list_btn_frame, text="Delete List", command=self._delete_list).pack(side=tk.LEFT)
+        ttk.Button(list_btn_frame, text="Delete List", command=self._delete_list).pack(side=tk.LEFT, padx=(0, 5))
+        ttk.Button(list_btn_frame, text="Interrupted Imports", command=self._show_import_jobs).pack(side=tk.LEFT)
 
         # Right panel - Contacts
         right_frame = ttk.Frame(paned)
@@ -69,6 +76,9 @@ class ContactListView(ttk.Frame):
         self.contacts_title = ttk.Label(header, text="Select a list", font=FONTS['subheading'])
         self.contacts_title.pack(side=tk.LEFT)
 
+        # Shown while an import/export job runs
+        self.cancel_job_btn = ttk.Button(header, text="Cancel", command=self._cancel_job)
+
         btn_frame = ttk.Frame(header)
         btn_frame.pack(side=tk.RIGHT)
 
@@ -105,6 +115,9 @@ class ContactListView(ttk.Frame):
         self.delete_contact_btn = ttk.Button(contact_btn_frame, text="Delete", command=self._delete_contact, state='disabled')
         self.delete_contact_btn.pack(side=tk.LEFT)
 
+        self.load_more_btn = ttk.Button(contact_btn_frame, text="Load More", command=self._load_more_contacts, state='disabled')
+        self.load_more_btn.pack(side=tk.RIGHT)
+
     def refresh_lists(self) -> None:
         """Refresh contact lists."""
         self.lists_listbox.delete(0, tk.END)
@@ -117,23 +130,38 @@ class ContactListView(ttk.Frame):
         self._lists = lists
 
     def refresh_contacts(self) -> None:
-        """Refresh contacts for selected list."""
+        """Refresh contacts for selected list, from the first page."""
+        self._next_cursor = None
         if not self._selected_list:
             self.contacts_table.set_data([])
+            self.load_more_btn.configure(state='disabled')
             return
 
-        contacts = self.contact_service.get_contacts(self._selected_list.list_id)
-        data = []
-        for contact in contacts:
-            data.append({
+        self.contacts_table.set_data(self._fetch_contacts_page())
+
+    def _load_more_contacts(self) -> None:
+        """Append the next page of contacts."""
+        if self._selected_list and self._next_cursor:
+            self.contacts_table.append_data(self._fetch_contacts_page())
+
+    def _fetch_contacts_page(self) -> list:
+        """Fetch the page after the current cursor as table rows and advance the cursor."""
+        page = self.contact_service.get_contacts_page(
+            self._selected_list.list_id, limit=CONTACTS_PAGE_SIZE, cursor=self._next_cursor
+        )
+        self._next_cursor = page.next_cursor
+        self.load_more_btn.configure(state='normal' if page.has_more else 'disabled')
+        return [
+            {
                 'id': contact.contact_id,
                 'first_name': contact.first_name,
                 'last_name': contact.last_name,
                 'email': contact.email,
                 'company': contact.company,
                 'position': contact.position or ''
-            })
-        self.contacts_table.set_data(data)
+            }
+            for contact in page.items
+        ]
 
     def _on_list_select(self, event) -> None:
         """Handle list selection."""
@@ -187,14 +215,19 @@ class ContactListView(ttk.Frame):
             return
 
         file_path = filedialog.askopenfilename(
-            title="Select CSV File",
-            filetypes=[("CSV Files", "*.csv"), ("All Files", "*.*")]
+            title="Select Contacts File",
+            filetypes=[
+                ("CSV Files", "*.csv"), ("Excel Workbooks", "*.xlsx"),
+                ("Parquet Files", "*.parquet"), ("Arrow Files", "*.arrow *.feather"),
+                ("All Files", "*.*")
+            ]
         )
 
         if file_path:
             try:
                 from ui.dialogs.csv_import_wizard import CSVImportWizard
                 wizard = CSVImportWizard(self.winfo_toplevel(), file_path, self._selected_list.list_id)
+                self.wait_window(wizard)
                 if wizard.result:
                     self.refresh_lists()
                     self.refresh_contacts()
@@ -202,23 +235,39 @@ class ContactListView(ttk.Frame):
                 # Simple fallback import
                 self._simple_import(file_path)
 
+    def _show_import_jobs(self) -> None:
+        """List interrupted imports to resume or discard."""
+        from ui.dialogs.import_jobs_dialog import ImportJobsDialog
+        dialog = ImportJobsDialog(self.winfo_toplevel())
+        self.wait_window(dialog)
+        if dialog.result:
+            self.refresh_lists()
+            self.refresh_contacts()
+
     def _simple_import(self, file_path: str) -> None:
         """Simple CSV import without wizard."""
-        try:
+        list_id = self._selected_list.list_id
+
+        def task(report_progress, token):
             headers, preview, total = self.csv_service.read_csv_preview(file_path)
             mapping = self.csv_service.auto_map_fields(headers)
-
-            imported, errors = self.csv_service.import_csv(
-                file_path,
-                self._selected_list.list_id,
-                mapping
+            return self.csv_service.import_contacts(
+                file_path, list_id, mapping,
+                progress_callback=lambda done, total: report_progress(done, total),
+                should_cancel=token
             )
 
+        def on_done(result):
             self.refresh_lists()
             self.refresh_contacts()
-            messagebox.showinfo("Import Complete", f"Imported {imported} contacts\n{len(errors)} errors")
-        except Exception as e:
-            messagebox.showerror("Error", str(e))
+            messagebox.showinfo(
+                "Import Complete",
+                f"Imported {result.imported + result.updated} contacts\n"
+                f"{result.skipped} duplicates skipped\n{result.suppressed} suppressed (skipped)\n"
+                f"{result.error_count} errors"
+            )
+
+        self._start_job(task, on_done, "Importing")
 
     def _export_csv(self) -> None:
         """Export contacts to CSV."""
@@ -227,17 +276,75 @@ class ContactListView(ttk.Frame):
             return
 
         file_path = filedialog.asksaveasfilename(
-            title="Export to CSV",
+            title="Export Contacts",
             defaultextension=".csv",
-            filetypes=[("CSV Files", "*.csv")]
+            filetypes=[
+                ("CSV Files", "*.csv"), ("Gzipped CSV", "*.csv.gz"), ("Zipped CSV", "*.zip"),
+                ("Parquet Files", "*.parquet"), ("Arrow Files", "*.arrow")
+            ]
         )
 
         if file_path:
-            try:
-                count = self.csv_service.export_csv(self._selected_list.list_id, file_path)
+            list_id = self._selected_list.list_id
+
+            def task(report_progress, token):
+                return self.csv_service.export_contacts(
+                    list_id, file_path,
+                    progress_callback=lambda done, total: report_progress(done, total),
+                    should_cancel=token
+                )
+
+            def on_done(count):
+                self.refresh_contacts()
                 messagebox.showinfo("Export Complete", f"Exported {count} contacts")
-            except Exception as e:
-                messagebox.showerror("Error", str(e))
+
+            self._start_job(task, on_done, "Exporting")
+
+    def _start_job(self, task, on_done, verb: str) -> None:
+        """Run an import/export in the background, showing progress in the title."""
+        if self._job and self._job.running:
+            messagebox.showwarning("Busy", "Another import or export is still running")
+            return
+
+        title = f"Contacts in '{self._selected_list.name}'"
+
+        def on_progress(done, total, message):
+            self.contacts_title.configure(text=f"{title} - {verb} {done:,} of {total:,} rows...")
+
+        def reset_title():
+            self.contacts_title.configure(text=title)
+            self.cancel_job_btn.pack_forget()
+            self.cancel_job_btn.configure(state='normal')
+
+        def finish(result):
+            reset_title()
+            on_done(result)
+
+        def on_error(error):
+            reset_title()
+            self.refresh_contacts()
+            messagebox.showerror("Error", str(error))
+
+        def on_cancelled():
+            reset_title()
+            self.refresh_contacts()
+
+        self.contacts_title.configure(text=f"{title} - {verb}...")
+        self.cancel_job_btn.pack(side=tk.LEFT, padx=(10, 0))
+        self._job = BackgroundJob(
+            self, task,
+            on_progress=on_progress,
+            on_done=finish,
+            on_error=on_error,
+            on_cancelled=on_cancelled,
+            name=f"contacts-{verb.lower()}"
+        ).start()
+
+    def _cancel_job(self) -> None:
+        """Stop the running import/export at its next batch."""
+        if self._job and self._job.running:
+            self._job.cancel()
+            self.cancel_job_btn.configure(state='disabled')
 
     def _add_contact(self) -> None:
         """Add new contact."""
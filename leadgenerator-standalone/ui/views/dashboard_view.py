@@ -8,7 +8,6 @@ from ui.theme import FONTS, COLORS
 from ui.widgets.progress_card import ProgressCard
 from ui.widgets.data_table import DataTable
 from services.report_service import ReportService
-from services.campaign_service import CampaignService
 
 if TYPE_CHECKING:
     from ui.app import MainApplication
@@ -21,7 +20,6 @@ class DashboardView(ttk.Frame):
         super().__init__(parent)
         self.app = app
         self.report_service = ReportService()
-        self.campaign_service = CampaignService()
 
         self._create_widgets()
         self.refresh()
@@ -141,7 +139,7 @@ class DashboardView(ttk.Frame):
         self.response_rate_card.set_value(f"{stats['response_rate']:.1f}%")
 
         # Get active campaigns
-        campaigns = self.campaign_service.get_all_campaigns(status_filter='Active')
+        campaigns = self.report_service.get_campaign_summaries(status_filter='Active')
         campaign_data = []
 
         for campaign in campaigns:
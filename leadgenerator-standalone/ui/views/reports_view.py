@@ -4,15 +4,36 @@ import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
 from typing import TYPE_CHECKING, Optional
 
-from ui.theme import FONTS
+from core.jobs import BackgroundJob
+from ui.theme import FONTS, COLORS
 from ui.widgets.progress_card import ProgressCard
 from ui.widgets.data_table import DataTable
 from services.campaign_service import CampaignService
 from services.report_service import ReportService
+from services.analytics_service import AnalyticsService
 
 if TYPE_CHECKING:
     from ui.app import MainApplication
 
+WEEKDAY_NAMES = ('Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun')
+
+# Email log rows loaded per page ("Load More" fetches the next one)
+LOG_PAGE_SIZE = 500
+
+# Reply heatmap cell size and weekday label column width, in pixels
+HEATMAP_CELL = 14
+HEATMAP_LABEL_WIDTH = 32
+
+
+def _shade(color: str, intensity: float) -> str:
+    """Blend a hex color with white; intensity 1 gives the color itself."""
+    red, green, blue = (int(color[i:i + 2], 16) for i in (1, 3, 5))
+
+    def blend(channel: int) -> int:
+        return round(255 - (255 - channel) * max(intensity, 0.15))
+
+    return f"#{blend(red):02x}{blend(green):02x}{blend(blue):02x}"
+
 
 class ReportsView(ttk.Frame):
     """Reports and analytics view."""
@@ -22,7 +43,11 @@ class ReportsView(ttk.Frame):
         self.app = app
         self.campaign_service = CampaignService()
         self.report_service = ReportService()
+        self.analytics_service = AnalyticsService()
         self._selected_campaign_id = None
+        self._next_cursor = None
+        self._job = None
+        self._timing_job = None
 
         self._create_widgets()
         self._load_campaigns()
@@ -69,6 +94,22 @@ class ReportsView(ttk.Frame):
         self.unsub_card = ProgressCard(cards_frame, title="Unsubscribed", value="0", color="warning")
         self.unsub_card.pack(side=tk.LEFT, padx=(10, 0), fill=tk.X, expand=True)
 
+        # Reply timing: replies per weekday and hour, latency and step funnel
+        timing_frame = ttk.LabelFrame(self, text="Reply Timing")
+        timing_frame.pack(fill=tk.X, pady=(0, 10))
+
+        self.heatmap_canvas = tk.Canvas(
+            timing_frame,
+            width=HEATMAP_LABEL_WIDTH + 24 * HEATMAP_CELL,
+            height=7 * HEATMAP_CELL,
+            highlightthickness=0,
+            background=COLORS['bg']
+        )
+        self.heatmap_canvas.pack(side=tk.LEFT, padx=10, pady=10)
+
+        self.timing_label = ttk.Label(timing_frame, text="", font=FONTS['small'], justify=tk.LEFT)
+        self.timing_label.pack(side=tk.LEFT, anchor='n', padx=10, pady=10)
+
         # Email log table
         log_frame = ttk.LabelFrame(self, text="Email Log")
         log_frame.pack(fill=tk.BOTH, expand=True, pady=(0, 10))
@@ -87,10 +128,21 @@ class ReportsView(ttk.Frame):
             show_search=True,
             height=12
         )
-        self.log_table.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+        self.log_table.pack(fill=tk.BOTH, expand=True, padx=10, pady=(10, 5))
 
-        # Export button
-        ttk.Button(self, text="Export Report", command=self._export_report).pack(anchor='e')
+        self.load_more_btn = ttk.Button(log_frame, text="Load More", command=self._load_more_logs, state='disabled')
+        self.load_more_btn.pack(anchor='e', padx=10, pady=(0, 10))
+
+        # Export buttons and progress
+        export_frame = ttk.Frame(self)
+        export_frame.pack(fill=tk.X)
+        ttk.Button(export_frame, text="Export Report", command=self._export_report).pack(side=tk.RIGHT)
+        ttk.Button(export_frame, text="Export All Campaigns", command=self._export_all_reports).pack(side=tk.RIGHT, padx=(0, 10))
+
+        # Shown while an export job runs
+        self.cancel_export_btn = ttk.Button(export_frame, text="Cancel", command=self._cancel_export)
+        self.export_status = ttk.Label(export_frame, text="", font=FONTS['small'])
+        self.export_status.pack(side=tk.RIGHT, padx=(0, 10))
 
     def _load_campaigns(self) -> None:
         """Load campaigns into selector."""
@@ -128,23 +180,90 @@ class ReportsView(ttk.Frame):
         self.bounced_card.set_value(stats.get('bounced', 0))
         self.unsub_card.set_value(stats.get('unsubscribed', 0))
 
-        # Load email logs
-        logs = self.report_service.get_email_logs(campaign_id=campaign_id, days=365)
+        self._load_timing(campaign_id)
+
+        # Load the first page of email logs
+        self._next_cursor = None
+        self.log_table.set_data(self._fetch_logs_page(campaign_id))
 
-        data = []
-        for log in logs:
-            data.append({
+    def _load_more_logs(self) -> None:
+        """Append the next page of the selected campaign's email log."""
+        if self._selected_campaign_id and self._next_cursor:
+            self.log_table.append_data(self._fetch_logs_page(self._selected_campaign_id))
+
+    def _fetch_logs_page(self, campaign_id: int) -> list:
+        """Fetch the page after the current cursor as table rows and advance the cursor."""
+        page = self.report_service.get_email_logs_page(
+            campaign_id=campaign_id, limit=LOG_PAGE_SIZE, cursor=self._next_cursor
+        )
+        self._next_cursor = page.next_cursor
+        self.load_more_btn.configure(state='normal' if page.has_more else 'disabled')
+        return [
+            {
                 'sent_at': log.sent_at[:16] if log.sent_at else '',
                 'contact_name': log.contact_name or '',
                 'contact_email': log.contact_email or '',
                 'subject': log.subject or '',
                 'status': log.status
-            })
+            }
+            for log in page.items
+        ]
 
-        self.log_table.set_data(data)
+    def _load_timing(self, campaign_id: int) -> None:
+        """Compute the campaign's timing analytics in the background, then draw them."""
+        if self._timing_job and self._timing_job.running:
+            self._timing_job.cancel()
+        self.heatmap_canvas.delete('all')
+        self.timing_label.configure(text="Loading reply timing...")
+
+        def task(report_progress, token):
+            return self.analytics_service.get_campaign_analytics(campaign_id)
+
+        # Results for a campaign no longer selected are dropped
+        def on_done(analytics):
+            if self._timing_job is job:
+                self._draw_timing(analytics)
+
+        def on_error(error):
+            if self._timing_job is job:
+                self.timing_label.configure(text=f"Failed to load reply timing: {error}")
+
+        job = BackgroundJob(self, task, on_done=on_done, on_error=on_error, name="reply-timing")
+        self._timing_job = job.start()
+
+    def _draw_timing(self, analytics) -> None:
+        """Draw the reply heatmap and summarize reply latency per step."""
+        canvas = self.heatmap_canvas
+        canvas.delete('all')
+        peak = analytics.reply_heatmap.max() or 1
+        for day, name in enumerate(WEEKDAY_NAMES):
+            canvas.create_text(0, day * HEATMAP_CELL + HEATMAP_CELL / 2, text=name, anchor='w', font=FONTS['small'])
+            for hour in range(24):
+                x = HEATMAP_LABEL_WIDTH + hour * HEATMAP_CELL
+                y = day * HEATMAP_CELL
+                count = analytics.reply_heatmap[day, hour]
+                canvas.create_rectangle(
+                    x, y, x + HEATMAP_CELL - 1, y + HEATMAP_CELL - 1,
+                    fill=_shade(COLORS['primary'], count / peak) if count else COLORS['light'],
+                    outline=''
+                )
+
+        lines = [f"{analytics.replies} replies to {analytics.sends} emails"]
+        if analytics.latency_percentiles:
+            percentiles = analytics.latency_percentiles
+            lines.append(
+                f"Reply after: median {percentiles[50]}h, 90% within {percentiles[90]}h"
+            )
+        for step in analytics.step_funnel:
+            latency = f", median {step['median_reply_hours']}h" if step['median_reply_hours'] is not None else ""
+            lines.append(
+                f"Step {step['step_number']}: {step['reached']} reached, "
+                f"{step['replies']} replies ({step['reply_rate']}%){latency}"
+            )
+        self.timing_label.configure(text="\n".join(lines))
 
     def _export_report(self) -> None:
-        """Export report to CSV."""
+        """Export report to CSV, XLSX or Parquet."""
         if not self._selected_campaign_id:
             messagebox.showwarning("Warning", "Select a campaign first")
             return
@@ -152,12 +271,80 @@ class ReportsView(ttk.Frame):
         file_path = filedialog.asksaveasfilename(
             title="Export Report",
             defaultextension=".csv",
-            filetypes=[("CSV Files", "*.csv")]
+            filetypes=[("CSV Files", "*.csv"), ("Excel Workbooks", "*.xlsx"), ("Parquet Files", "*.parquet")]
         )
 
         if file_path:
-            try:
-                self.report_service.export_campaign_report(self._selected_campaign_id, file_path)
+            campaign_id = self._selected_campaign_id
+
+            def task(report_progress, token):
+                return self.report_service.export_campaign_report(
+                    campaign_id, file_path,
+                    progress_callback=lambda done, total: report_progress(done, total),
+                    should_cancel=token
+                )
+
+            def on_done(count):
                 messagebox.showinfo("Success", f"Report exported to {file_path}")
-            except Exception as e:
-                messagebox.showerror("Error", str(e))
+
+            self._start_export(task, on_done, "rows")
+
+    def _export_all_reports(self) -> None:
+        """Export the report of every campaign into one zip of CSV files."""
+        file_path = filedialog.asksaveasfilename(
+            title="Export All Reports",
+            defaultextension=".zip",
+            filetypes=[("Zip Archives", "*.zip")]
+        )
+
+        if file_path:
+            def task(report_progress, token):
+                return self.report_service.export_all_campaign_reports(
+                    file_path,
+                    progress_callback=lambda done, total: report_progress(done, total),
+                    should_cancel=token
+                )
+
+            def on_done(count):
+                messagebox.showinfo("Success", f"{count} campaign reports exported to {file_path}")
+
+            self._start_export(task, on_done, "reports")
+
+    def _start_export(self, task, on_done, unit: str) -> None:
+        """Run an export in the background, showing progress next to the export buttons."""
+        if self._job and self._job.running:
+            messagebox.showwarning("Busy", "Another export is still running")
+            return
+
+        def on_progress(done, total, message):
+            self.export_status.configure(text=f"Exporting {done:,} of {total:,} {unit}...")
+
+        def reset_status():
+            self.export_status.configure(text="")
+            self.cancel_export_btn.pack_forget()
+            self.cancel_export_btn.configure(state='normal')
+
+        def finish(result):
+            reset_status()
+            on_done(result)
+
+        def on_error(error):
+            reset_status()
+            messagebox.showerror("Error", str(error))
+
+        self.export_status.configure(text="Exporting...")
+        self.cancel_export_btn.pack(side=tk.RIGHT, padx=(0, 10))
+        self._job = BackgroundJob(
+            self, task,
+            on_progress=on_progress,
+            on_done=finish,
+            on_error=on_error,
+            on_cancelled=reset_status,
+            name="report-export"
+        ).start()
+
+    def _cancel_export(self) -> None:
+        """Stop the running export at its next batch."""
+        if self._job and self._job.running:
+            self._job.cancel()
+            self.cancel_export_btn.configure(state='disabled')
@@ -5,7 +5,7 @@ from tkinter import ttk, messagebox
 from typing import TYPE_CHECKING
 
 from ui.theme import FONTS
-from core.database import get_setting, set_setting, get_db
+from core.database import get_setting, set_setting, get_db, rebuild_daily_stats
 
 if TYPE_CHECKING:
     from ui.app import MainApplication
@@ -104,6 +104,13 @@ class SettingsView(ttk.Frame):
         ttk.Label(parent, text="Randomization (min):").grid(row=row, column=0, sticky='w', pady=5)
         self.randomization_var = tk.IntVar(value=15)
         ttk.Spinbox(parent, from_=0, to=60, textvariable=self.randomization_var, width=10).grid(row=row, column=1, sticky='w', pady=5)
+        row += 1
+
+        self.prerender_var = tk.BooleanVar(value=True)
+        ttk.Checkbutton(
+            parent, text="Render emails when they are scheduled (faster sending, reviewable in advance)",
+            variable=self.prerender_var
+        ).grid(row=row, column=0, columnspan=2, sticky='w', pady=5)
 
     def _create_outlook_section(self, parent) -> None:
         """Create Outlook settings."""
@@ -149,6 +156,12 @@ class SettingsView(ttk.Frame):
         ttk.Label(parent, text="Export data for migration to multi-user version:").pack(anchor='w', pady=(5, 10))
         ttk.Button(parent, text="Export Data for Migration", command=self._show_migration).pack(anchor='w')
 
+        # Maintenance section
+        ttk.Separator(parent, orient=tk.HORIZONTAL).pack(fill=tk.X, pady=20)
+        ttk.Label(parent, text="Maintenance", font=FONTS['subheading']).pack(anchor='w')
+        ttk.Label(parent, text="Recompute the daily statistics used by the dashboard and reports:").pack(anchor='w', pady=(5, 10))
+        ttk.Button(parent, text="Rebuild Report Statistics", command=self._rebuild_statistics).pack(anchor='w')
+
     def _load_settings(self) -> None:
         """Load current settings."""
         # Mail account
@@ -163,6 +176,7 @@ class SettingsView(ttk.Frame):
         # Load from settings table
         self.scan_interval_var.set(int(get_setting('outlook_scan_interval_seconds', 60)))
         self.scan_folders_var.set(get_setting('scan_folders', 'Inbox,Unsubscribe'))
+        self.prerender_var.set(get_setting('prerender_messages', '1') == '1')
         self.unsub_en_var.set(get_setting('unsubscribe_keywords_en', 'UNSUBSCRIBE,STOP,REMOVE,OPT OUT,OPT-OUT'))
         self.unsub_fr_var.set(get_setting('unsubscribe_keywords_fr', 'DÉSINSCRIRE,DÉSINSCRIPTION,STOP,ARRÊTER,SUPPRIMER'))
 
@@ -193,6 +207,7 @@ class SettingsView(ttk.Frame):
             # Save other settings
             set_setting('outlook_scan_interval_seconds', self.scan_interval_var.get())
             set_setting('scan_folders', self.scan_folders_var.get())
+            set_setting('prerender_messages', '1' if self.prerender_var.get() else '0')
             set_setting('unsubscribe_keywords_en', self.unsub_en_var.get())
             set_setting('unsubscribe_keywords_fr', self.unsub_fr_var.get())
 
@@ -200,6 +215,14 @@ class SettingsView(ttk.Frame):
         except Exception as e:
             messagebox.showerror("Error", str(e))
 
+    def _rebuild_statistics(self) -> None:
+        """Rebuild the daily report rollups."""
+        try:
+            rows = rebuild_daily_stats()
+            messagebox.showinfo("Maintenance", f"Report statistics rebuilt ({rows} daily rows)")
+        except Exception as e:
+            messagebox.showerror("Error", str(e))
+
     def _show_migration(self) -> None:
         """Show migration dialog."""
         try:
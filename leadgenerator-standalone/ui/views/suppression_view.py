@@ -4,6 +4,7 @@ import tkinter as tk
 from tkinter import ttk, messagebox, filedialog, simpledialog
 from typing import TYPE_CHECKING
 
+from core.jobs import BackgroundJob
 from ui.theme import FONTS
 from ui.widgets.data_table import DataTable
 from services.suppression_service import SuppressionService
@@ -11,6 +12,9 @@ from services.suppression_service import SuppressionService
 if TYPE_CHECKING:
     from ui.app import MainApplication
 
+# Suppression entries loaded per page ("Load More" fetches the next one)
+SUPPRESSION_PAGE_SIZE = 1000
+
 
 class SuppressionView(ttk.Frame):
     """Suppression (unsubscribe) list view."""
@@ -20,6 +24,8 @@ class SuppressionView(ttk.Frame):
         self.app = app
         self.suppression_service = SuppressionService()
         self._selected_entry = None
+        self._next_cursor = None
+        self._job = None
 
         self._create_widgets()
         self.refresh()
@@ -59,6 +65,7 @@ class SuppressionView(ttk.Frame):
         actions_frame.pack(fill=tk.X)
 
         ttk.Button(actions_frame, text="Add Email", command=self._add_email).pack(side=tk.LEFT, padx=(0, 5))
+        ttk.Button(actions_frame, text="Add Domain Rule", command=self._add_rule).pack(side=tk.LEFT, padx=(0, 5))
 
         self.remove_btn = ttk.Button(actions_frame, text="Remove", command=self._remove_email, state='disabled')
         self.remove_btn.pack(side=tk.LEFT, padx=(0, 20))
@@ -66,23 +73,51 @@ class SuppressionView(ttk.Frame):
         ttk.Button(actions_frame, text="Import CSV", command=self._import_csv).pack(side=tk.LEFT, padx=(0, 5))
         ttk.Button(actions_frame, text="Export CSV", command=self._export_csv).pack(side=tk.LEFT)
 
+        self.load_more_btn = ttk.Button(actions_frame, text="Load More", command=self._load_more, state='disabled')
+        self.load_more_btn.pack(side=tk.RIGHT)
+
     def refresh(self) -> None:
-        """Refresh suppression list."""
-        entries = self.suppression_service.get_suppression_list(limit=5000)
+        """Refresh suppression list, from the first page."""
+        self._next_cursor = None
         count = self.suppression_service.get_suppression_count()
+        rules = self.suppression_service.get_rules()
 
+        # Rules first, grouped by domain
         data = []
-        for entry in entries:
+        for rule in rules:
             data.append({
+                'rule_id': rule.rule_id,
+                'email': rule.pattern,
+                'scope': rule.rule_type,
+                'source': rule.source,
+                'reason': rule.reason or '',
+                'created_at': rule.created_at[:10] if rule.created_at else ''
+            })
+        data.extend(self._fetch_page())
+
+        self.table.set_data(data)
+        self.count_label.configure(text=f"{count} entries, {len(rules)} rules")
+
+    def _load_more(self) -> None:
+        """Append the next page of suppression entries."""
+        if self._next_cursor:
+            self.table.append_data(self._fetch_page())
+
+    def _fetch_page(self) -> list:
+        """Fetch the page after the current cursor as table rows and advance the cursor."""
+        page = self.suppression_service.get_suppression_page(limit=SUPPRESSION_PAGE_SIZE, cursor=self._next_cursor)
+        self._next_cursor = page.next_cursor
+        self.load_more_btn.configure(state='normal' if page.has_more else 'disabled')
+        return [
+            {
                 'email': entry.email,
                 'scope': entry.scope,
                 'source': entry.source,
                 'reason': entry.reason or '',
                 'created_at': entry.created_at[:10] if entry.created_at else ''
-            })
-
-        self.table.set_data(data)
-        self.count_label.configure(text=f"{count} entries")
+            }
+            for entry in page.items
+        ]
 
     def _on_select(self, item: dict) -> None:
         """Handle selection."""
@@ -103,15 +138,35 @@ class SuppressionView(ttk.Frame):
             except Exception as e:
                 messagebox.showerror("Error", str(e))
 
+    def _add_rule(self) -> None:
+        """Add a domain or wildcard rule to the suppression list."""
+        pattern = simpledialog.askstring(
+            "Add Suppression Rule",
+            "Domain or pattern:\n"
+            "@acme.com  - this domain\n"
+            "*.acme.com  - this domain and its subdomains\n"
+            "sales-*@acme.com  - matching addresses"
+        )
+        if pattern:
+            try:
+                self.suppression_service.add_rule(pattern, source='Manual')
+                self.refresh()
+            except Exception as e:
+                messagebox.showerror("Error", str(e))
+
     def _remove_email(self) -> None:
-        """Remove email from suppression list."""
+        """Remove email or rule from suppression list."""
         if not self._selected_entry:
             return
 
         email = self._selected_entry['email']
+        rule_id = self._selected_entry.get('rule_id')
         if messagebox.askyesno("Remove", f"Remove '{email}' from suppression list?"):
             try:
-                self.suppression_service.remove_from_suppression(email)
+                if rule_id:
+                    self.suppression_service.remove_rule(rule_id)
+                else:
+                    self.suppression_service.remove_from_suppression(email)
                 self._selected_entry = None
                 self.remove_btn.configure(state='disabled')
                 self.refresh()
@@ -126,7 +181,11 @@ class SuppressionView(ttk.Frame):
         )
 
         if file_path:
-            try:
+            if self._job and self._job.running:
+                messagebox.showwarning("Busy", "Another import or export is still running")
+                return
+
+            def task(report_progress, token):
                 # Read emails from file
                 emails = []
                 with open(file_path, 'r', encoding='utf-8') as f:
@@ -135,14 +194,22 @@ class SuppressionView(ttk.Frame):
                         if email and '@' in email:
                             emails.append(email)
 
-                if emails:
-                    added = self.suppression_service.import_suppression_list(emails)
-                    self.refresh()
-                    messagebox.showinfo("Import Complete", f"Added {added} emails")
-                else:
+                if not emails:
+                    return None
+                return self.suppression_service.import_suppression_list(
+                    emails,
+                    progress_callback=lambda done, total: report_progress(done, total),
+                    should_cancel=token
+                )
+
+            def on_done(added):
+                self.refresh()
+                if added is None:
                     messagebox.showwarning("Warning", "No valid emails found in file")
-            except Exception as e:
-                messagebox.showerror("Error", str(e))
+                else:
+                    messagebox.showinfo("Import Complete", f"Added {added} emails")
+
+            self._start_job(task, on_done, "Importing")
 
     def _export_csv(self) -> None:
         """Export suppression list to CSV."""
@@ -153,8 +220,34 @@ class SuppressionView(ttk.Frame):
         )
 
         if file_path:
-            try:
-                count = self.suppression_service.export_suppression_list(file_path)
+            if self._job and self._job.running:
+                messagebox.showwarning("Busy", "Another import or export is still running")
+                return
+
+            def task(report_progress, token):
+                return self.suppression_service.export_suppression_list(file_path)
+
+            def on_done(count):
+                self.refresh()
                 messagebox.showinfo("Export Complete", f"Exported {count} entries")
-            except Exception as e:
-                messagebox.showerror("Error", str(e))
+
+            self._start_job(task, on_done, "Exporting")
+
+    def _start_job(self, task, on_done, verb: str) -> None:
+        """Run an import/export in the background, showing progress in the count label."""
+        def on_progress(done, total, message):
+            self.count_label.configure(text=f"{verb}... {done:,} of {total:,}")
+
+        def on_error(error):
+            self.refresh()
+            messagebox.showerror("Error", str(error))
+
+        self.count_label.configure(text=f"{verb}...")
+        self._job = BackgroundJob(
+            self, task,
+            on_progress=on_progress,
+            on_done=on_done,
+            on_error=on_error,
+            on_cancelled=self.refresh,
+            name=f"suppression-{verb.lower()}"
+        ).start()
@@ -101,6 +101,11 @@ class DataTable(ttk.Frame):
         self._data = data
         self._refresh_display()
 
+    def append_data(self, data: List[Dict[str, Any]]) -> None:
+        """Add rows after the current data (e.g. the next page of results)."""
+        self._data = self._data + data
+        self._refresh_display()
+
     def get_selected_item(self) -> Optional[Dict[str, Any]]:
         """Get the currently selected item."""
         selection = self.tree.selection()